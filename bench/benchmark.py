@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""Reproducible performance benchmarks for Better Control
+
+Runs the app against fake system tools (see fakes.py) inside a headless
+display and writes a JSON report:
+
+    python bench/benchmark.py --output report.json
+    python bench/benchmark.py --scenario bench/scenarios/large.json --repeat 5
+    python bench/benchmark.py --compare baseline.json --output report.json
+
+Measured, each in a fresh process and repeated --repeat times:
+
+    startup  time to first frame and every span of --profile-startup
+    tabs     each tab's import, constructor, background work, first draw
+             and each periodic refresh it registers
+    tools    the backend read functions refreshes are built from
+
+and how often each fake was called. Runs get an empty config and cache
+directory, a private session bus when dbus-run-session is available, and
+no system bus unless --system-bus is given, so NetworkManager, BlueZ,
+UPower and USBGuard are reached through the fakes instead of whatever
+the host has. The exit status is 1 if a run failed, or with --compare
+when a median got slower by more than --threshold percent or a command
+is spawned more often than in the baseline.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+import fakes  # noqa: E402
+from workload import RESULT_PREFIX  # noqa: E402
+from ui.tabs.registry import TAB_MODULES  # noqa: E402
+
+REPORT_VERSION = 1
+STARTUP_TIMEOUT = 60
+WORKLOAD_TIMEOUT = 120
+# Differences below this are noise whatever the percentage
+NOISE_FLOOR_MS = 1.0
+
+
+def log(message: str) -> None:
+    print(message, file=sys.stderr, flush=True)
+
+
+@contextmanager
+def headless_display(mode: str, env: Dict[str, str]) -> Iterator[str]:
+    """Start Xvfb or broadwayd and point env at it, yields the mode used"""
+    if mode == "auto":
+        if shutil.which("Xvfb"):
+            mode = "xvfb"
+        elif shutil.which("broadwayd"):
+            mode = "broadway"
+        elif os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"):
+            mode = "current"
+        else:
+            raise SystemExit("No Xvfb, broadwayd or display found, install xvfb or use --display")
+
+    if mode == "current":
+        yield mode
+        return
+
+    number = 99
+    while os.path.exists(f"/tmp/.X{number}-lock") or os.path.exists(f"/tmp/.X11-unix/X{number}"):
+        number += 1
+    env.pop("WAYLAND_DISPLAY", None)
+
+    if mode == "xvfb":
+        command = ["Xvfb", f":{number}", "-screen", "0", "1280x800x24", "-nolisten", "tcp"]
+        env.update(DISPLAY=f":{number}", GDK_BACKEND="x11")
+
+        def ready() -> bool:
+            return os.path.exists(f"/tmp/.X11-unix/X{number}")
+    else:
+        command = ["broadwayd", f":{number}"]
+        env.pop("DISPLAY", None)
+        env.update(GDK_BACKEND="broadway", BROADWAY_DISPLAY=f":{number}")
+
+        def ready() -> bool:
+            with socket.socket() as sock:
+                return sock.connect_ex(("127.0.0.1", 8080 + number)) == 0
+
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 10
+        while not ready():
+            if process.poll() is not None or time.monotonic() > deadline:
+                raise SystemExit(f"{command[0]} did not start")
+            time.sleep(0.05)
+        yield mode
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def build_env(scenario: Dict[str, Any], work_dir: str, bin_dir: str, system_bus: bool) -> Dict[str, str]:
+    home = os.path.join(work_dir, "home")
+    for sub in (".config", ".cache"):
+        os.makedirs(os.path.join(home, sub), exist_ok=True)
+
+    env = dict(os.environ)
+    env.update(
+        PATH=f"{bin_dir}{os.pathsep}{env.get('PATH', '')}",
+        HOME=home,
+        XDG_CONFIG_HOME=os.path.join(home, ".config"),
+        XDG_CACHE_HOME=os.path.join(home, ".cache"),
+        LANG="C.UTF-8",
+        GTK_THEME="Adwaita",
+        NO_AT_BRIDGE="1",
+        PYTHONDONTWRITEBYTECODE="1",
+    )
+    for key in ("XDG_CURRENT_DESKTOP", "HYPRLAND_INSTANCE_SIGNATURE", "SWAYSOCK"):
+        env.pop(key, None)
+    if not system_bus:
+        env["DBUS_SYSTEM_BUS_ADDRESS"] = f"unix:path={os.path.join(work_dir, 'no-system-bus')}"
+    env.update({key: str(value) for key, value in scenario.get("environment", {}).items()})
+    return env
+
+
+class Runner:
+    """Runs measurements in fresh processes and collects their results"""
+
+    def __init__(self, env: Dict[str, str], work_dir: str):
+        self.env = env
+        self.work_dir = work_dir
+        self.prefix: List[str] = []
+        if shutil.which("dbus-run-session"):
+            self.prefix = ["dbus-run-session", "--"]
+        else:
+            log("dbus-run-session not found, runs share the real session bus")
+        self.run_count = 0
+
+    def _run_env(self, name: str) -> Dict[str, str]:
+        self.run_count += 1
+        env = dict(self.env)
+        env["BENCH_CALL_LOG"] = os.path.join(self.work_dir, f"calls-{self.run_count}-{name}.log")
+        return env
+
+    def workload(self, args: List[str]) -> Dict[str, Any]:
+        env = self._run_env(args[-1].replace("/", "_"))
+        command = self.prefix + [sys.executable, os.path.join(BENCH_DIR, "workload.py")] + args
+        try:
+            completed = subprocess.run(
+                command, env=env, capture_output=True, text=True, timeout=WORKLOAD_TIMEOUT
+            )
+        except subprocess.TimeoutExpired:
+            return {"error": f"timed out after {WORKLOAD_TIMEOUT}s"}
+
+        for line in completed.stdout.splitlines():
+            if line.startswith(RESULT_PREFIX):
+                result = json.loads(line[len(RESULT_PREFIX):])
+                result["calls"] = fakes.read_calls(env["BENCH_CALL_LOG"])
+                return result
+        error = (completed.stderr.strip().splitlines() or [f"exit status {completed.returncode}"])[-1]
+        return {"error": error}
+
+    def startup(self) -> Dict[str, Any]:
+        """Launch the app with --profile-startup and stop it after the first frame"""
+        env = self._run_env("startup")
+        trace_path = os.path.join(self.work_dir, f"trace-{self.run_count}.json")
+        command = self.prefix + [sys.executable, os.path.join(ROOT_DIR, "src", "better_control.py"),
+                                 "-P", trace_path]
+        process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL, start_new_session=True)
+        trace = None
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        try:
+            while trace is None and time.monotonic() < deadline and process.poll() is None:
+                time.sleep(0.05)
+                try:
+                    with open(trace_path, "r") as f:
+                        trace = json.load(f)
+                except (FileNotFoundError, ValueError):
+                    pass
+        finally:
+            try:
+                os.killpg(process.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                os.killpg(process.pid, signal.SIGKILL)
+                process.wait()
+
+        if trace is None:
+            return {"error": "no first frame" if process.returncode is None else "exited before the first frame"}
+
+        result: Dict[str, Any] = {"spans_ms": {}}
+        for event in trace["traceEvents"]:
+            if event.get("name") == "first frame":
+                result["first_frame_ms"] = round(event["ts"] / 1000, 2)
+            elif event.get("ph") == "X":
+                # Spans with the same name (one per tab, say) add up
+                spans = result["spans_ms"]
+                spans[event["name"]] = round(spans.get(event["name"], 0) + event["dur"] / 1000, 2)
+        result["calls"] = fakes.read_calls(env["BENCH_CALL_LOG"])
+        return result
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge repeated results: numbers become {median, min, max, runs}"""
+    errors = [run["error"] for run in runs if "error" in run]
+    good = [run for run in runs if "error" not in run]
+    summary: Dict[str, Any] = {}
+    if errors:
+        summary["errors"] = errors
+    if not good:
+        return summary
+
+    def merge(values: List[Any]) -> Any:
+        first = values[0]
+        if isinstance(first, bool) or first is None:
+            return first
+        if isinstance(first, (int, float)):
+            numbers = [value for value in values if isinstance(value, (int, float))]
+            return {
+                "median": round(statistics.median(numbers), 2),
+                "min": min(numbers),
+                "max": max(numbers),
+                "runs": numbers,
+            }
+        if isinstance(first, dict):
+            keys = sorted({key for value in values if isinstance(value, dict) for key in value})
+            return {key: merge([value[key] for value in values if isinstance(value, dict) and key in value])
+                    for key in keys}
+        return first
+
+    for key in sorted({key for run in good for key in run}):
+        if key == "calls":
+            # Deterministic, the last run stands for all of them
+            summary[key] = good[-1].get("calls", {})
+        else:
+            summary[key] = merge([run[key] for run in good if key in run])
+    return summary
+
+
+def flatten(report: Dict[str, Any]) -> Dict[str, float]:
+    """Metric path -> value: medians of timings, counts of calls"""
+    metrics: Dict[str, float] = {}
+
+    def walk(prefix: str, value: Any) -> None:
+        if isinstance(value, dict):
+            if "median" in value and "runs" in value:
+                metrics[prefix] = value["median"]
+                return
+            for key, child in value.items():
+                walk(f"{prefix}/{key}" if prefix else key, child)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and "/calls/" in f"/{prefix}":
+            metrics[prefix] = value
+
+    walk("", report.get("results", {}))
+    return metrics
+
+
+def compare(baseline: Dict[str, Any], report: Dict[str, Any], threshold: float) -> List[str]:
+    """Lines describing regressions, empty if there are none"""
+    old, new = flatten(baseline), flatten(report)
+    regressions = []
+    for metric in sorted(set(old) & set(new)):
+        before, after = old[metric], new[metric]
+        if "/calls/" in f"/{metric}":
+            if after > before:
+                regressions.append(f"{metric}: called {after} times, was {before}")
+        elif after - before > NOISE_FLOOR_MS and after > before * (1 + threshold / 100):
+            regressions.append(f"{metric}: {after}ms, was {before}ms (+{(after / before - 1) * 100:.0f}%)"
+                               if before else f"{metric}: {after}ms, was {before}ms")
+    return regressions
+
+
+def git_revision() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT_DIR, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT_DIR,
+                                    capture_output=True, text=True).stdout.strip())
+        return {"commit": commit, "dirty": dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark Better Control against fake system tools")
+    parser.add_argument("--scenario", help="scenario JSON merged over the defaults in fakes.py")
+    parser.add_argument("--display", choices=("auto", "xvfb", "broadway", "current"), default="auto")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (default 3)")
+    parser.add_argument("--only", default="startup,tabs,tools",
+                        help="comma separated: startup, tabs, tools (default all)")
+    parser.add_argument("--tab", action="append", choices=sorted(TAB_MODULES),
+                        help="tab to measure, may be repeated (default all)")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="report to check for regressions against")
+    parser.add_argument("--threshold", type=float, default=20, help="percent slower that counts as a regression")
+    parser.add_argument("--system-bus", action="store_true", help="let runs reach the host's system bus")
+    parser.add_argument("--keep", action="store_true", help="keep the work directory with fakes and logs")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    args = parse_args(argv)
+    only = {part.strip() for part in args.only.split(",") if part.strip()}
+    unknown = only - {"startup", "tabs", "tools"}
+    if unknown:
+        log(f"unknown --only value: {', '.join(sorted(unknown))}")
+        return 2
+    tabs = args.tab or list(TAB_MODULES)
+    scenario = fakes.load_scenario(args.scenario)
+
+    work_dir = tempfile.mkdtemp(prefix="better-control-bench-")
+    try:
+        bin_dir = fakes.install(os.path.join(work_dir, "fakes"), scenario)
+        env = build_env(scenario, work_dir, bin_dir, args.system_bus)
+        runs: Dict[str, List[Dict[str, Any]]] = {}
+
+        with headless_display(args.display, env) as display:
+            runner = Runner(env, work_dir)
+            # Interleaved, so drift on the machine hits every measurement alike
+            for repeat in range(args.repeat):
+                log(f"run {repeat + 1}/{args.repeat}")
+                if "startup" in only:
+                    runs.setdefault("startup", []).append(runner.startup())
+                if "tabs" in only:
+                    for tab_name in tabs:
+                        runs.setdefault(f"tabs/{tab_name}", []).append(runner.workload(["tab", tab_name]))
+                if "tools" in only:
+                    runs.setdefault("tools", []).append(runner.workload(["tools"]))
+
+        results: Dict[str, Any] = {}
+        for key, key_runs in runs.items():
+            section, _, name = key.partition("/")
+            if name:
+                results.setdefault(section, {})[name] = summarize(key_runs)
+            else:
+                results[section] = summarize(key_runs)
+
+        report = {
+            "version": REPORT_VERSION,
+            **git_revision(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "display": display,
+            "repeat": args.repeat,
+            "scenario": scenario,
+            "results": results,
+        }
+    finally:
+        if args.keep:
+            log(f"kept {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+        log(f"wrote {args.output}")
+    else:
+        print(text)
+
+    errors = 0
+    for key, key_runs in runs.items():
+        for run in key_runs:
+            if "error" in run:
+                errors += 1
+                log(f"error in {key}: {run['error']}")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        for line in regressions:
+            log(f"regression: {line}")
+        if regressions:
+            return 1
+        log(f"no regressions against {args.compare}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""Fake system CLIs for reproducible benchmarks
+
+Every tool Better Control shells out to is replaced by a small sh script
+that replays a canned output for each argument list it knows, after a
+fixed delay, and logs the call. Outputs are generated from the scenario's
+sizes in the formats the real tools print, or replayed verbatim from the
+scenario's "outputs". Unknown argument lists (setters, mostly) succeed
+silently.
+
+Run on its own to get a PATH directory for trying the app by hand:
+
+    python bench/fakes.py /tmp/bc-fakes [scenario.json]
+    PATH=/tmp/bc-fakes/bin:$PATH python src/better_control.py
+"""
+
+import copy
+import json
+import os
+import shlex
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+FAKE_COMMANDS = (
+    "pactl", "nmcli", "bluetoothctl", "busctl", "upower", "brightnessctl", "usbguard", "hyprctl",
+    # Not in the original list, but tabs call them and the host's would make runs differ
+    "powerprofilesctl", "xrandr",
+)
+
+DEFAULT_SCENARIO: Dict[str, Any] = {
+    "name": "default",
+    "sizes": {
+        "sinks": 2,
+        "sources": 2,
+        "sink_inputs": 4,
+        "source_outputs": 1,
+        "access_points": 12,
+        "bluetooth_devices": 4,
+        "usb_devices": 8,
+        "batteries": 1,
+        "monitors": 1,
+    },
+    # Milliseconds each call sleeps before answering, "default" for the rest
+    "latency_ms": {"default": 5},
+    # "<command> <args>" -> output, replayed instead of the generated one
+    "outputs": {},
+    # Exported to the app, e.g. to pick the Hyprland code paths
+    "environment": {"XDG_CURRENT_DESKTOP": "Hyprland"},
+}
+
+
+def load_scenario(path: Optional[str]) -> Dict[str, Any]:
+    """DEFAULT_SCENARIO with the keys of a scenario file merged in"""
+    scenario = copy.deepcopy(DEFAULT_SCENARIO)
+    if not path:
+        return scenario
+    with open(path, "r") as f:
+        data = json.load(f)
+    for key, value in data.items():
+        if isinstance(value, dict) and isinstance(scenario.get(key), dict):
+            scenario[key].update(value)
+        else:
+            scenario[key] = value
+    return scenario
+
+
+def _volume_line(percent: int) -> str:
+    raw = round(65536 * percent / 100)
+    return (f"Volume: front-left: {raw} / {percent:3d}% / -12.04 dB,   "
+            f"front-right: {raw} / {percent:3d}% / -12.04 dB")
+
+
+def _pactl(sizes: Dict[str, int]) -> Dict[str, str]:
+    sinks = [(i, f"alsa_output.bench-{i}.analog-stereo", f"Bench Output {i}") for i in range(sizes["sinks"])]
+    sources = [(i, f"alsa_input.bench-{i}.analog-stereo", f"Bench Input {i}") for i in range(sizes["sources"])]
+    default_sink = sinks[0][1] if sinks else ""
+    default_source = sources[0][1] if sources else ""
+
+    def device_list(kind: str, devices) -> str:
+        entries = []
+        for index, name, description in devices:
+            entries.append(
+                f"{kind} #{index}\n"
+                f"\tState: RUNNING\n"
+                f"\tName: {name}\n"
+                f"\tDescription: {description}\n"
+                f"\tDriver: PipeWire\n"
+                f"\tSample Specification: s32le 2ch 48000Hz\n"
+                f"\tChannel Map: front-left,front-right\n"
+                f"\tMute: no\n"
+                f"\t{_volume_line(50)}\n"
+                f"\t        balance 0.00\n"
+                f"\tProperties:\n"
+                f"\t\tdevice.description = \"{description}\"\n"
+                f"\t\tnode.name = \"{name}\"\n"
+            )
+        return "\n".join(entries)
+
+    def stream_list(kind: str, count: int, device_key: str, device_count: int) -> str:
+        entries = []
+        for i in range(count):
+            entries.append(
+                f"{kind} #{100 + i}\n"
+                f"\tDriver: PipeWire\n"
+                f"\tOwner Module: n/a\n"
+                f"\tClient: {200 + i}\n"
+                f"\t{device_key}: {i % max(1, device_count)}\n"
+                f"\tSample Specification: float32le 2ch 48000Hz\n"
+                f"\tMute: no\n"
+                f"\t{_volume_line(40 + i % 60)}\n"
+                f"\tProperties:\n"
+                f"\t\tmedia.name = \"Stream {i}\"\n"
+                f"\t\tapplication.name = \"Bench App {i}\"\n"
+                f"\t\tapplication.process.binary = \"bench-app-{i}\"\n"
+                f"\t\tapplication.icon_name = \"audio-x-generic\"\n"
+            )
+        return "\n".join(entries)
+
+    return {
+        "get-sink-volume @DEFAULT_SINK@": _volume_line(50) + "\n        balance 0.00",
+        "get-sink-mute @DEFAULT_SINK@": "Mute: no",
+        "get-source-volume @DEFAULT_SOURCE@": _volume_line(70) + "\n        balance 0.00",
+        "get-source-mute @DEFAULT_SOURCE@": "Mute: no",
+        "get-default-sink": default_sink,
+        "get-default-source": default_source,
+        "info": (
+            "Server String: /run/user/1000/pulse/native\n"
+            "Server Name: PulseAudio (on PipeWire 1.0.0)\n"
+            f"Default Sink: {default_sink}\n"
+            f"Default Source: {default_source}"
+        ),
+        "list sinks": device_list("Sink", sinks),
+        "list sources": device_list("Source", sources),
+        "list sinks short": "\n".join(
+            f"{index}\t{name}\tPipeWire\ts32le 2ch 48000Hz\tRUNNING" for index, name, _ in sinks
+        ),
+        "list sink-inputs": stream_list("Sink Input", sizes["sink_inputs"], "Sink", sizes["sinks"]),
+        "list short sink-inputs": "\n".join(
+            f"{100 + i}\t{i % max(1, sizes['sinks'])}\t{200 + i}\tPipeWire\tfloat32le 2ch 48000Hz"
+            for i in range(sizes["sink_inputs"])
+        ),
+        "list source-outputs": stream_list("Source Output", sizes["source_outputs"], "Source", sizes["sources"]),
+    }
+
+
+def _nmcli(sizes: Dict[str, int]) -> Dict[str, str]:
+    securities = ("WPA2", "WPA1 WPA2", "WPA3", "")
+    access_points = []
+    for i in range(sizes["access_points"]):
+        access_points.append({
+            "in_use": i == 0,
+            "bssid": "02:00:00:00:{:02X}:{:02X}".format(i // 256, i % 256),
+            "ssid": f"Bench AP {i}",
+            "channel": 1 + (i * 5) % 13,
+            "signal": max(5, 95 - (i * 7) % 90),
+            "security": securities[i % len(securities)],
+        })
+
+    terse = "\n".join(
+        f"{'*' if ap['in_use'] else ' '}:{ap['ssid']}:{ap['signal']}:{ap['security']}" for ap in access_points
+    )
+    table = ["IN-USE  BSSID              SSID          MODE   CHAN  RATE        SIGNAL  BARS  SECURITY"]
+    for ap in access_points:
+        table.append(
+            f"{'*' if ap['in_use'] else ' ':<7} {ap['bssid']:<18} {ap['ssid']:<13} Infra  {ap['channel']:<5} "
+            f"270 Mbit/s  {ap['signal']:<7} ▂▄▆_  {ap['security'] or '--'}"
+        )
+    active = access_points[0]["ssid"] if access_points else ""
+
+    return {
+        "-t -f DEVICE,TYPE device": "wlan0:wifi\nenp3s0:ethernet\nlo:loopback",
+        "-t -f IN-USE,SSID,SIGNAL,SECURITY device wifi list": terse,
+        "-f IN-USE,BSSID,SSID,MODE,CHAN,RATE,SIGNAL,BARS,SECURITY dev wifi list": "\n".join(table),
+        "radio wifi": "enabled",
+        "-t -f NAME,TYPE connection show --active": f"{active}:802-11-wireless\nlo:loopback" if active else "lo:loopback",
+    }
+
+
+def _bluetoothctl(sizes: Dict[str, int]) -> Dict[str, str]:
+    devices = [f"Device 02:00:00:00:00:{i:02X} Bench Device {i}" for i in range(sizes["bluetooth_devices"])]
+    return {
+        "show": (
+            "Controller 02:00:00:00:00:FF (public)\n"
+            "\tName: bench\n"
+            "\tAlias: bench\n"
+            "\tPowered: yes\n"
+            "\tDiscoverable: no\n"
+            "\tPairable: yes\n"
+            "\tDiscovering: no"
+        ),
+        "devices": "\n".join(devices),
+        "devices Paired": "\n".join(devices),
+    }
+
+
+def _upower(sizes: Dict[str, int]) -> Dict[str, str]:
+    paths = [f"/org/freedesktop/UPower/devices/battery_BAT{i}" for i in range(sizes["batteries"])]
+    outputs = {
+        "-e": "\n".join(paths + [
+            "/org/freedesktop/UPower/devices/line_power_AC",
+            "/org/freedesktop/UPower/devices/DisplayDevice",
+        ]),
+    }
+    for i, path in enumerate(paths):
+        outputs[f"-i {path}"] = (
+            f"  native-path:          BAT{i}\n"
+            f"  vendor:               Bench\n"
+            f"  model:                Bench Battery {i}\n"
+            f"  power supply:         yes\n"
+            f"  updated:              Thu 01 Jan 1970 00:00:00 UTC (0 seconds ago)\n"
+            f"  has history:          yes\n"
+            f"  has statistics:       yes\n"
+            f"  battery\n"
+            f"    present:             yes\n"
+            f"    rechargeable:        yes\n"
+            f"    state:               discharging\n"
+            f"    warning-level:       none\n"
+            f"    energy:              40 Wh\n"
+            f"    energy-empty:        0 Wh\n"
+            f"    energy-full:         50 Wh\n"
+            f"    energy-full-design:  57 Wh\n"
+            f"    energy-rate:         8 W\n"
+            f"    voltage:             12.1 V\n"
+            f"    charge-cycles:       120\n"
+            f"    time to empty:       5.0 hours\n"
+            f"    percentage:          80%\n"
+            f"    capacity:            87.7193%\n"
+            f"    technology:          lithium-ion\n"
+            f"    icon-name:          'battery-full-symbolic'"
+        )
+    return outputs
+
+
+def _brightnessctl(sizes: Dict[str, int]) -> Dict[str, str]:
+    return {"g": "48000", "get": "48000", "m": "96000", "max": "96000"}
+
+
+def _usbguard(sizes: Dict[str, int]) -> Dict[str, str]:
+    devices = []
+    for i in range(sizes["usb_devices"]):
+        policy = "block" if i % 5 == 4 else "allow"
+        devices.append(
+            f"{i + 1}: {policy} id 1d6b:{i:04x} serial \"BENCH{i:04d}\" name \"Bench USB Device {i}\" "
+            f"hash \"{'%043d' % i}=\" parent-hash \"{'%043d' % 0}=\" via-port \"1-{i + 1}\" "
+            f"with-interface 03:01:02 with-connect-type \"hotplug\""
+        )
+    rules = [line.replace(" block ", " allow ") for line in devices]
+    return {"list-devices": "\n".join(devices), "list-rules": "\n".join(rules)}
+
+
+def _hyprctl(sizes: Dict[str, int]) -> Dict[str, str]:
+    monitors = []
+    for i in range(sizes["monitors"]):
+        name = "eDP-1" if i == 0 else f"DP-{i}"
+        monitors.append(
+            f"Monitor {name} (ID {i}):\n"
+            f"\t1920x1080@60.00000 at {1920 * i}x0\n"
+            f"\tdescription: Bench Display {i}\n"
+            f"\tmake: Bench\n"
+            f"\tmodel: Display {i}\n"
+            f"\tactive workspace: {i + 1} ({i + 1})\n"
+            f"\treserved: 0 0 0 0\n"
+            f"\tscale: 1.00\n"
+            f"\ttransform: 0\n"
+            f"\tfocused: {'yes' if i == 0 else 'no'}\n"
+            f"\tdpmsStatus: 1\n"
+        )
+    return {"monitors": "\n".join(monitors)}
+
+
+def _powerprofilesctl(sizes: Dict[str, int]) -> Dict[str, str]:
+    return {
+        "get": "balanced",
+        "list": "  performance:\n    Driver:     platform_profile\n\n* balanced:\n    Driver:     platform_profile\n\n"
+                "  power-saver:\n    Driver:     platform_profile",
+    }
+
+
+def _xrandr(sizes: Dict[str, int]) -> Dict[str, str]:
+    lines = ["Screen 0: minimum 320 x 200, current 1920 x 1080, maximum 16384 x 16384"]
+    for i in range(sizes["monitors"]):
+        name = "eDP-1" if i == 0 else f"DP-{i}"
+        lines.append(f"{name} connected {'primary ' if i == 0 else ''}1920x1080+{1920 * i}+0 (normal left inverted "
+                     f"right x axis y axis) 344mm x 194mm")
+        lines.append("   1920x1080     60.00*+  48.00")
+    return {"--query": "\n".join(lines), "--query --verbose": "\n".join(lines)}
+
+
+GENERATORS: Dict[str, Callable[[Dict[str, int]], Dict[str, str]]] = {
+    "pactl": _pactl,
+    "nmcli": _nmcli,
+    "bluetoothctl": _bluetoothctl,
+    "busctl": lambda sizes: {},
+    "upower": _upower,
+    "brightnessctl": _brightnessctl,
+    "usbguard": _usbguard,
+    "hyprctl": _hyprctl,
+    "powerprofilesctl": _powerprofilesctl,
+    "xrandr": _xrandr,
+}
+
+# Argument lists that follow events forever, answered by idling instead
+BLOCKING = {"pactl": ("subscribe",), "busctl": ("monitor",)}
+
+
+def generate_outputs(scenario: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """command -> {"args": output} for every fake, recordings taking precedence"""
+    sizes = dict(DEFAULT_SCENARIO["sizes"], **scenario.get("sizes", {}))
+    outputs = {command: GENERATORS[command](sizes) for command in FAKE_COMMANDS}
+    for key, output in scenario.get("outputs", {}).items():
+        command, _, args = key.partition(" ")
+        outputs.setdefault(command, {})[args] = output
+    return outputs
+
+
+def _sh_quote(value: str) -> str:
+    return "'" + value.replace("'", "'\\''") + "'"
+
+
+def _latency(scenario: Dict[str, Any], command: str) -> float:
+    latency = scenario.get("latency_ms", {})
+    return float(latency.get(command, latency.get("default", 0))) / 1000
+
+
+def install(directory: str, scenario: Dict[str, Any]) -> str:
+    """Write the fakes under directory
+
+    Returns:
+        str: the bin directory to put first on PATH. Calls are appended to
+            calls.log next to it, or to $BENCH_CALL_LOG if set.
+    """
+    bin_dir = os.path.join(directory, "bin")
+    outputs_dir = os.path.join(directory, "outputs")
+    os.makedirs(bin_dir, exist_ok=True)
+    call_log = os.path.join(directory, "calls.log")
+
+    for command, command_outputs in generate_outputs(scenario).items():
+        os.makedirs(os.path.join(outputs_dir, command), exist_ok=True)
+        delay = _latency(scenario, command)
+        sleep = f"sleep {delay:.3f}; " if delay > 0 else ""
+
+        lines = [
+            "#!/bin/sh",
+            f"printf '%s\\n' \"{command} $*\" >> \"${{BENCH_CALL_LOG:-{call_log}}}\"",
+            'case "$*" in',
+        ]
+        for args in BLOCKING.get(command, ()):
+            lines.append(f"  {_sh_quote(args)}) exec sleep 86400 ;;")
+        for i, (args, output) in enumerate(sorted(command_outputs.items())):
+            path = os.path.join(outputs_dir, command, f"{i}.out")
+            with open(path, "w") as f:
+                f.write(output if output.endswith("\n") or not output else output + "\n")
+            lines.append(f"  {_sh_quote(args)}) {sleep}cat {_sh_quote(path)} ;;")
+        lines.append(f"  *) {sleep}: ;;")
+        lines.append("esac")
+
+        path = os.path.join(bin_dir, command)
+        with open(path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        os.chmod(path, 0o755)
+    return bin_dir
+
+
+def read_calls(path: str) -> Dict[str, int]:
+    """Count the calls logged by the fakes, keyed by "<command> <args>" """
+    counts: Dict[str, int] = {}
+    try:
+        with open(path, "r") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if line:
+                    counts[line] = counts.get(line, 0) + 1
+    except FileNotFoundError:
+        pass
+    return dict(sorted(counts.items()))
+
+
+def main(argv: List[str]) -> int:
+    if not argv or argv[0] in ("-h", "--help"):
+        print("usage: fakes.py <directory> [scenario.json]")
+        return 0 if argv else 2
+    bin_dir = install(argv[0], load_scenario(argv[1] if len(argv) > 1 else None))
+    print(f"PATH={shlex.quote(bin_dir)}:$PATH")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
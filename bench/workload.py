@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""One benchmark measurement, run by benchmark.py inside the test display
+
+    workload.py tab <name>   import, construct, first draw and refreshes of a tab
+    workload.py tools        the backend read functions the tabs refresh from
+
+Prints a single line starting with RESULT_PREFIX followed by JSON.
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+RESULT_PREFIX = "BENCH_RESULT "
+# The main loop must have been idle this long, with no command in flight,
+# before the work a call started counts as finished
+QUIET_SECONDS = float(os.environ.get("BENCH_QUIET_MS", "100")) / 1000
+SETTLE_TIMEOUT = 20
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+def settle(runner) -> Tuple[float, bool]:
+    """Run the main loop until the work started so far has landed
+
+    Returns:
+        Tuple[float, bool]: seconds until the last dispatch, and whether
+            the loop never went quiet before SETTLE_TIMEOUT
+    """
+    from gi.repository import GLib  # type: ignore
+
+    context = GLib.MainContext.default()
+    start = last_activity = time.monotonic()
+    while True:
+        now = time.monotonic()
+        if context.iteration(False):
+            last_activity = now
+        elif runner.pending():
+            time.sleep(0.001)
+        elif now - last_activity >= QUIET_SECONDS:
+            return last_activity - start, False
+        else:
+            time.sleep(0.001)
+        if now - start > SETTLE_TIMEOUT:
+            return now - start, True
+
+
+def _setup():
+    import gi  # type: ignore
+
+    gi.require_version("Gtk", "3.0")
+    gi.require_version("Gdk", "3.0")
+    from gi.repository import Gtk  # type: ignore
+
+    from utils.arg_parser import ArgParse
+    from utils.commands import get_command_runner
+    from utils.logger import Logger
+
+    if not Gtk.init_check()[0]:
+        raise RuntimeError("GTK could not open the display")
+    logging = Logger(ArgParse(["better-control"]))
+    return Gtk, logging, get_command_runner(logging)
+
+
+def run_tab(tab_name: str) -> Dict[str, Any]:
+    Gtk, logging, runner = _setup()
+    from gi.repository import GLib  # type: ignore
+
+    from ui.tabs.registry import get_tab_class
+    from utils.scheduler import get_refresh_scheduler
+    from utils.translations import get_translations
+
+    txt = get_translations(logging, "en")
+    scheduler = get_refresh_scheduler(logging)
+    result: Dict[str, Any] = {"tab": tab_name}
+
+    start = time.monotonic()
+    tab_class = get_tab_class(tab_name)
+    result["import_ms"] = _ms(time.monotonic() - start)
+
+    known_jobs = set(scheduler.jobs)
+    start = time.monotonic()
+    tab = tab_class(logging, txt)
+    result["construct_ms"] = _ms(time.monotonic() - start)
+
+    elapsed, timed_out = settle(runner)
+    result["settle_ms"] = _ms(elapsed)
+    if timed_out:
+        result["settle_timeout"] = True
+
+    # First frame with the tab as the only content, like a one tab launch
+    window = Gtk.Window()
+    window.set_default_size(900, 600)
+    window.add(tab)
+    drawn: List[float] = []
+    window.connect("draw", lambda *args: drawn.append(time.monotonic()) and False)
+    start = time.monotonic()
+    window.show_all()
+    context = GLib.MainContext.default()
+    while not drawn and time.monotonic() - start < SETTLE_TIMEOUT:
+        context.iteration(True)
+    result["first_draw_ms"] = _ms(drawn[0] - start) if drawn else None
+    settle(runner)
+
+    # The periodic refreshes the tab registered, one at a time
+    refresh: Dict[str, float] = {}
+    for job_id in sorted(set(scheduler.jobs) - known_jobs):
+        job = scheduler.jobs.get(job_id)
+        if job is None:
+            continue
+        start = time.monotonic()
+        job.callback()
+        called = time.monotonic() - start
+        elapsed, timed_out = settle(runner)
+        refresh[job.name] = _ms(max(called, elapsed))
+    result["refresh_ms"] = refresh
+
+    window.destroy()
+    return result
+
+
+def _tool_calls(logging) -> List[Tuple[str, Callable[[], Any]]]:
+    from tools import display, hyprland, volume, wifi
+
+    return [
+        ("volume.get_volume", lambda: volume.get_volume(logging)),
+        ("volume.get_mute_state", lambda: volume.get_mute_state(logging)),
+        ("volume.get_mic_volume", lambda: volume.get_mic_volume(logging)),
+        ("volume.get_sinks", lambda: volume.get_sinks(logging)),
+        ("volume.get_sources", lambda: volume.get_sources(logging)),
+        ("volume.get_active_sink", lambda: volume.get_active_sink(logging)),
+        ("volume.get_applications", lambda: volume.get_applications(logging)),
+        ("volume.get_source_outputs", lambda: volume.get_source_outputs(logging)),
+        ("wifi.get_wifi_status", lambda: wifi.get_wifi_status(logging)),
+        ("wifi.get_wifi_networks", lambda: wifi.get_wifi_networks(logging)),
+        ("display.get_brightness", lambda: display.get_brightness(logging)),
+        ("hyprland.get_hyprland_displays", lambda: hyprland.get_hyprland_displays(logging)),
+    ]
+
+
+def run_tools() -> Dict[str, Any]:
+    _, logging, _ = _setup()
+    timings: Dict[str, float] = {}
+    for name, call in _tool_calls(logging):
+        start = time.monotonic()
+        call()
+        timings[name] = _ms(time.monotonic() - start)
+    return {"tools_ms": timings}
+
+
+def main(argv: List[str]) -> int:
+    if argv[:1] == ["tab"] and len(argv) == 2:
+        result = run_tab(argv[1])
+    elif argv == ["tools"]:
+        result = run_tools()
+    else:
+        print(__doc__, file=sys.stderr)
+        return 2
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+    # Pool threads and bus connections would only slow the exit down
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
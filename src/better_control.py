@@ -1,26 +1,69 @@
 #!/usr/bin/env python3
 
+import sys
+
+# Headless control for scripts and keybindings, never loads GTK
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "ctl":
+    from utils.ctl import main as ctl_main
+
+    sys.exit(ctl_main(sys.argv[2:]))
+
+# Imported first so its origin is as close to process start as possible
+from utils.profiler import get_startup_profiler
+
+profiler = get_startup_profiler()
+
 import os
-import subprocess
 from typing import Any
-import gi  # type: ignore
-import sys
-from setproctitle import setproctitle
 import signal
+
 from utils.arg_parser import ArgParse
-from utils.logger import LogLevel, Logger
-from utils.settings import load_settings, ensure_config_dir, save_settings
-from utils.translations import get_translations
+
+# The OSD stays resident on its own, without the window, notebook or tabs
+if __name__ == "__main__" and ArgParse(sys.argv).find_arg(("-O", "--osd")) \
+        and not ArgParse(sys.argv).find_arg(("-h", "--help")):
+    from ui.osd import run_osd
+
+    sys.exit(run_osd(ArgParse(sys.argv)))
+
+# Records the autostart entries' startup cost at login, then exits
+if __name__ == "__main__" and ArgParse(sys.argv).find_arg(("-S", "--sample-startup")) \
+        and not ArgParse(sys.argv).find_arg(("-h", "--help")):
+    from tools.startup_profiler import sample_session_startup
+    from utils.logger import Logger
+
+    sample_session_startup(Logger(ArgParse(sys.argv)))
+    sys.exit(0)
+
+# A running daemon takes over before GTK or any tab code is loaded
+if __name__ == "__main__" and not ArgParse(sys.argv).find_arg(("-h", "--help")):
+    from utils.daemon import forward_to_daemon
+
+    if forward_to_daemon(ArgParse(sys.argv)):
+        sys.exit(0)
+
+with profiler.span("import utils"):
+    from setproctitle import setproctitle
+    from utils.capabilities import get_capability_registry
+    from utils.commands import get_command_runner
+    from utils.logger import LogLevel, Logger
+    from utils.settings import load_settings, ensure_config_dir, save_settings
+    from utils.translations import get_translations
 
 # Initialize GTK before imports
-gi.require_version("Gtk", "3.0")
-gi.require_version("Gdk", "3.0")
-from gi.repository import Gtk, GLib  # type: ignore
+with profiler.span("import gi"):
+    import gi  # type: ignore
+    gi.require_version("Gtk", "3.0")
+    gi.require_version("Gdk", "3.0")
+    from gi.repository import Gtk, GLib  # type: ignore
 
-from ui.main_window import BetterControl
-from utils.dependencies import check_all_dependencies
-from tools.bluetooth import restore_last_sink
-from ui.css.animations import load_animations_css
+with profiler.span("import ui.main_window"):
+    from ui.main_window import BetterControl
+
+with profiler.span("import tools"):
+    from utils.dependencies import check_all_dependencies
+    from ui.css.animations import load_animations_css
+    from utils.startup import StartupScheduler
 
 
 def signal_handler(sig, frame):
@@ -61,191 +104,6 @@ def signal_handler(sig, frame):
         sys.exit(0)
 
 
-def main():
-    # Register all critical signals
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    signal.signal(signal.SIGSEGV, signal_handler)
-    signal.signal(signal.SIGABRT, signal_handler)
-    
-    # Initialize GTK safety net
-    Gtk.init_check()
-    if not Gtk.init_check()[0]:
-        sys.stderr.write("Failed to initialize GTK\n")
-        sys.exit(1)
-
-    # Initialize environment
-    os.environ['PYTHONUNBUFFERED'] = '1'
-    os.environ['DBUS_FATAL_WARNINGS'] = '0'
-    os.environ['GST_GL_XINITTHREADS'] = '1'
-    os.environ['G_SLICE'] = 'always-malloc'
-    os.environ['MALLOC_CHECK_'] = '2'
-    os.environ['MALLOC_PERTURB_'] = '0'
-
-    arg_parser = ArgParse(sys.argv)
-
-    if arg_parser.find_arg(("-h", "--help")):
-        arg_parser.print_help_msg(sys.stdout)
-        sys.exit(0)
-
-    logger = Logger(arg_parser)
-    logger.log(LogLevel.Info, "Starting Better Control")
-
-    setup_environment_and_dirs(logger)
-
-    lang, txt = load_language_and_translations(arg_parser, logger)
-
-    load_animations_css()
-    logger.log(LogLevel.Info, "Loaded animations CSS")
-
-    # Start dependency check asynchronously to avoid blocking startup
-    def check_dependencies_async():
-        try:
-            if (
-                not arg_parser.find_arg(("-f", "--force"))
-                and not check_all_dependencies(logger)
-            ):
-                logger.log(
-                    LogLevel.Error,
-                    "Missing required dependencies. Please install them and try again or use -f to force start.",
-                )
-                # Optionally, show a GTK dialog warning here
-        except Exception as e:
-            logger.log(LogLevel.Error, f"Dependency check error: {e}")
-
-    threading.Thread(target=check_dependencies_async, daemon=True).start()
-
-    try:
-        launch_application(arg_parser, logger, txt)
-    except Exception as e:
-        logger.log(LogLevel.Error, f"Fatal error starting application: {e}")
-        import traceback
-
-        traceback.print_exc()
-        sys.exit(1)
-
-
-def setup_environment_and_dirs(logger):
-    ensure_config_dir(logger)
-
-    try:
-        temp_dir = os.path.join("/tmp", "better-control")
-        os.makedirs(temp_dir, exist_ok=True)
-        logger.log(LogLevel.Info, f"Created temporary directory at {temp_dir}")
-    except Exception as e:
-        logger.log(LogLevel.Error, f"Error creating temporary directory: {e}")
-
-
-def load_language_and_translations(arg_parser, logger):
-    settings = load_settings(logger)
-    available_languages = ["en", "es", "pt", "fr", "id"]
-
-    if arg_parser.find_arg(("-L", "--lang")):
-        lang = arg_parser.option_arg(("-L", "--lang"))
-        if lang not in available_languages:
-            print(f"\033[1;31mError: Invalid language code '{lang}'\033[0m")
-            print("Falling back to English (en)")
-            print(f"Available languages: {', '.join(available_languages)}")
-            logger.log(
-                LogLevel.Warn,
-                f"Invalid language code '{lang}'. Falling back to default(en)",
-            )
-            lang = "en"
-        settings["language"] = lang
-        save_settings(settings, logger)
-        logger.log(LogLevel.Info, f"Language set to: {lang}")
-    else:
-        lang = settings.get("language", "default")
-        if lang not in (available_languages + ["default"]):
-            lang = "en"
-            settings["language"] = lang
-            save_settings(settings, logger)
-            logger.log(
-                LogLevel.Warn,
-                f"Invalid language '{lang}' in settings. Falling back to default(en)",
-            )
-    logger.log(LogLevel.Info, f"Loaded language setting from settings: {lang}")
-    # cast to Any to satisfy the argument type diagnostic
-    txt = get_translations(logger, lang)  # type: ignore
-    return lang, txt
-
-
-def launch_application(arg_parser, logger, txt):
-    import time
-
-    time.sleep(0.1)
-
-    logger.log(LogLevel.Info, "Creating main window")
-    win = BetterControl(txt, arg_parser, logger)
-    logger.log(LogLevel.Info, "Main window created successfully")
-
-    setproctitle("better-control")
-
-    def run_audio_operation():
-        restore_last_sink(logger)
-
-    GLib.idle_add(run_audio_operation)
-
-    option: Any = []
-    if arg_parser.find_arg(("-s", "--size")):
-        optarg = arg_parser.option_arg(("-s", "--size"))
-        if optarg is None or 'x' not in optarg:
-            logger.log(LogLevel.Error, "Invalid window size")
-            sys.exit(1)
-        else:
-            option = optarg.split('x')
-    else:
-        option = [900, 600]
-
-    win.set_default_size(int(option[0]), int(option[1]))
-    win.resize(int(option[0]), int(option[1]))
-    win.connect("destroy", Gtk.main_quit)
-    win.show_all()
-
-    xdg = os.environ.get("XDG_CURRENT_DESKTOP", "").lower()
-    sway_sock = os.environ.get("SWAYSOCK", "").lower()
-
-    # Make the window float on hyprland
-    if "hyprland" in xdg:
-        try:
-            subprocess.run(
-                [
-                    "hyprctl",
-                    "keyword",
-                    "windowrule",
-                    "float,class:^(better_control.py)$",
-                ],
-                check=False,
-            )
-        except Exception as e:
-            logger.log(LogLevel.Warn, f"Failed to set hyprland window rule: {e}")
-    # Make the window float on sway
-    elif "sway" in sway_sock:
-        try:
-            subprocess.run(
-                [
-                    "swaymsg",
-                    "for_window",
-                    '[app_id="^better_control.py$"]',
-                    "floating",
-                    "enable",
-                ],
-                check=False,
-            )
-        except Exception as e:
-            logger.log(LogLevel.Warn, f"Failed to set sway window rule: {e}")
-
-    try:
-        Gtk.main()
-    except KeyboardInterrupt:
-        logger.log(LogLevel.Info, "Keyboard interrupt detected, exiting...")
-        Gtk.main_quit()
-        sys.exit(0)
-    except Exception as e:
-        logger.log(LogLevel.Error, f"Error in GTK main loop: {e}")
-        sys.exit(1)
-
-
 def parse_arguments():
     arg_parser = ArgParse(sys.argv)
 
@@ -317,22 +175,7 @@ def apply_environment_variables():
     os.environ['MALLOC_PERTURB_'] = '0'
 
 
-def launch_main_window(arg_parser, logger, txt):
-    import time
-
-    time.sleep(0.1)
-
-    logger.log(LogLevel.Info, "Creating main window")
-    win = BetterControl(txt, arg_parser, logger)
-    logger.log(LogLevel.Info, "Main window created successfully")
-
-    setproctitle("better-control")
-
-    def run_audio_operation():
-        restore_last_sink(logger)
-
-    GLib.idle_add(run_audio_operation)
-
+def get_window_size(arg_parser, logger):
     option: Any = []
     if arg_parser.find_arg(("-s", "--size")):
         optarg = arg_parser.option_arg(("-s", "--size"))
@@ -343,25 +186,29 @@ def launch_main_window(arg_parser, logger, txt):
             option = optarg.split('x')
     else:
         option = [900, 600]
+    return int(option[0]), int(option[1])
 
-    win.set_default_size(int(option[0]), int(option[1]))
-    win.resize(int(option[0]), int(option[1]))
-    win.connect("destroy", Gtk.main_quit)
-    win.show_all()
 
+def check_dependencies(arg_parser, logger):
+    if arg_parser.find_arg(("-f", "--force")):
+        return True
+    return check_all_dependencies(logger)
+
+
+def apply_window_rules(logger):
+    """Make the window float on Hyprland and Sway"""
     xdg = os.environ.get("XDG_CURRENT_DESKTOP", "").lower()
     sway_sock = os.environ.get("SWAYSOCK", "").lower()
 
     if "hyprland" in xdg:
         try:
-            subprocess.run(
+            get_command_runner(logger).run(
                 [
                     "hyprctl",
                     "keyword",
                     "windowrule",
                     "float,class:^(better_control.py)$",
                 ],
-                check=False,
             )
         except Exception as e:
             logger.log(
@@ -369,7 +216,7 @@ def launch_main_window(arg_parser, logger, txt):
             )
     elif "sway" in sway_sock:
         try:
-            subprocess.run(
+            get_command_runner(logger).run(
                 [
                     "swaymsg",
                     "for_window",
@@ -377,13 +224,139 @@ def launch_main_window(arg_parser, logger, txt):
                     "floating",
                     "enable",
                 ],
-                check=False,
             )
         except Exception as e:
             logger.log(
                 LogLevel.Warn, f"Failed to set sway window rule: {e}"
             )
 
+
+def load_css(logger):
+    load_animations_css()
+    logger.log(LogLevel.Info, "Loaded animations CSS")
+
+
+def create_main_window(scheduler, arg_parser, logger):
+    if not scheduler.result("dependencies"):
+        logger.log(
+            LogLevel.Error,
+            "Missing required dependencies. Please install them and try again or use -f to force start.",
+        )
+        sys.exit(1)
+
+    width, height = get_window_size(arg_parser, logger)
+
+    logger.log(LogLevel.Info, "Creating main window")
+    txt = scheduler.result("translations")
+    with profiler.span("BetterControl.__init__"):
+        win = BetterControl(txt, arg_parser, logger)
+    logger.log(LogLevel.Info, "Main window created successfully")
+
+    win.set_default_size(width, height)
+    win.resize(width, height)
+    win.connect("destroy", Gtk.main_quit)
+    return win
+
+
+def restore_audio_sink(logger):
+    # tools.bluetooth loads dbus, keep it off the import path of the window
+    from tools.bluetooth import restore_last_sink
+
+    restore_last_sink(logger)
+
+
+def build_startup_graph(arg_parser, logger):
+    """Declare the init tasks and what each of them needs
+
+    Only CSS and window construction need the GTK thread, everything that
+    touches the disk or spawns processes runs in the background.
+    """
+    scheduler = StartupScheduler(logger)
+    scheduler.add("config-dirs", lambda: setup_temp_directory(logger), background=True)
+    scheduler.add(
+        "translations",
+        lambda: process_language(arg_parser, logger),
+        deps=("config-dirs",),
+        background=True,
+    )
+    scheduler.add("dependencies", lambda: check_dependencies(arg_parser, logger), background=True)
+    scheduler.add("window-rules", lambda: apply_window_rules(logger), background=True)
+    scheduler.add("css", lambda: load_css(logger))
+    scheduler.add(
+        "window",
+        lambda: create_main_window(scheduler, arg_parser, logger),
+        deps=("css", "translations", "dependencies"),
+    )
+    # Audio routing callbacks are registered by the tabs, so this waits for the window
+    scheduler.add("sink-restore", lambda: restore_audio_sink(logger), deps=("window",), background=True)
+    # Refreshes the cached hardware and command probes for the next launch
+    scheduler.add(
+        "capabilities",
+        lambda: get_capability_registry(logger).revalidate(),
+        deps=("window",),
+        background=True,
+    )
+    return scheduler
+
+
+def report_startup_profile(arg_parser, logger):
+    """Print the startup breakdown and optionally write a Chrome trace"""
+    profiler.print_report(sys.stdout)
+    get_command_runner(logger).print_stats(sys.stdout)
+
+    trace_path = arg_parser.option_arg(("-P", "--profile-startup"))
+    if trace_path:
+        try:
+            profiler.write_chrome_trace(trace_path)
+            print(f"Wrote startup trace to {trace_path}")
+        except Exception as e:
+            logger.log(LogLevel.Error, f"Failed to write startup trace: {e}")
+
+
+def start_daemon(win, logger):
+    """Keep the process resident and let later launches raise the window"""
+    from tools.startup_profiler import start_session_sampler
+    from utils.daemon import start_daemon_service
+
+    def quit_daemon():
+        win.daemon_mode = False
+        win.save_snapshots()
+        Gtk.main_quit()
+
+    service = start_daemon_service(
+        logger,
+        show=lambda tab_name: win.present_tab(tab_name or None),
+        hide=win.hide,
+        quit=quit_daemon,
+    )
+    if service is None:
+        # Could not claim the bus name, behave like a normal instance
+        win.daemon_mode = False
+    else:
+        # The daemon is usually started with the session
+        start_session_sampler(logger)
+    return service
+
+
+def launch_main_window(scheduler, arg_parser, logger):
+    win = scheduler.result("window")
+
+    daemon = None
+    if arg_parser.find_arg(("-D", "--daemon")):
+        daemon = start_daemon(win, logger)
+
+    if arg_parser.find_arg(("-P", "--profile-startup")):
+        profiler.watch_first_draw(win, lambda: report_startup_profile(arg_parser, logger))
+
+    # The float rule has to be in place before the window is mapped, it
+    # has been running alongside window construction so this rarely waits
+    scheduler.wait("window-rules", timeout=0.5)
+    if daemon is not None and not arg_parser.get_requested_tab():
+        # Start warm but hidden, the first launch shows the window
+        win.hide()
+    else:
+        win.show_all()
+
     try:
         Gtk.main()
     except KeyboardInterrupt:
@@ -406,25 +379,17 @@ def initialize_and_start():
 
     logger = setup_logging(arg_parser)
 
-    setup_temp_directory(logger)
-
-    txt = process_language(arg_parser, logger)
-
-    load_animations_css()
-    logger.log(LogLevel.Info, "Loaded animations CSS")
-
-    if (
-        not arg_parser.find_arg(("-f", "--force"))
-        and not check_all_dependencies(logger)
-    ):
-        logger.log(
-            LogLevel.Error,
-            "Missing required dependencies. Please install them and try again or use -f to force start.",
-        )
+    if not Gtk.init_check()[0]:
+        sys.stderr.write("Failed to initialize GTK\n")
         sys.exit(1)
 
+    setproctitle("better-control")
+
     try:
-        launch_main_window(arg_parser, logger, txt)
+        scheduler = build_startup_graph(arg_parser, logger)
+        scheduler.run()
+        scheduler.log_timings()
+        launch_main_window(scheduler, arg_parser, logger)
     except Exception as e:
         logger.log(LogLevel.Error, f"Fatal error starting application: {e}")
         import traceback
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+import glob
+import os
+from pathlib import Path
+from typing import Dict
+
+from utils.logger import LogLevel, Logger
+from tools.globals import get_current_session
+from tools.hyprland import get_hyprland_startup_apps
+from tools.swaywm import get_sway_startup_apps
+
+USER_AUTOSTART_DIR = Path.home() / ".config/autostart"
+SYSTEM_AUTOSTART_DIRS = [Path("/etc/xdg/autostart")]
+
+
+def get_autostart_apps(logging: Logger, include_system: bool = False, include_hidden: bool = True) -> Dict[str, Dict]:
+    """Get XDG autostart entries and the compositor's exec lines
+
+    Args:
+        include_system (bool): also read the system autostart directories
+        include_hidden (bool): keep entries marked Hidden=true
+
+    Returns:
+        Dict[str, Dict]: autostart entries keyed by name
+    """
+    autostart_dirs = [USER_AUTOSTART_DIR]
+    if include_system:
+        autostart_dirs.extend(SYSTEM_AUTOSTART_DIRS)
+
+    startup_apps = {}
+
+    for autostart_dir in autostart_dirs:
+        if autostart_dir.exists():
+            for desktop_file in glob.glob(str(autostart_dir / "*.desktop")):
+                if desktop_file.endswith(".desktop.disabled"):
+                    continue
+
+                app_name = os.path.basename(desktop_file).replace(".desktop", "")
+
+                is_hidden = False
+                try:
+                    with open(desktop_file, 'r') as f:
+                        for line in f:
+                            if line.strip() == "Hidden=true":
+                                is_hidden = True
+                                break
+                except Exception as e:
+                    logging.log(LogLevel.Warn, f"Could not read desktop file {desktop_file}: {e}")
+
+                if is_hidden and not include_hidden:
+                    continue
+                startup_apps[app_name] = {
+                    "type": "desktop",
+                    "path": desktop_file,
+                    "name": app_name,
+                    "enabled": True,
+                    "hidden": is_hidden
+                    }
+
+            for desktop_file in glob.glob(str(autostart_dir / "*.desktop.disabled")):
+                app_name = os.path.basename(desktop_file).replace(".desktop.disabled", "")
+                startup_apps[app_name] = {
+                    "type": "desktop",
+                    "path": desktop_file,
+                    "name": app_name,
+                    "enabled": False,
+                    "hidden": False
+                    }
+
+    # Add hyprland and sway apps according to session
+    if get_current_session() == "Hyprland":
+        startup_apps.update(get_hyprland_startup_apps())
+    if get_current_session() == "sway":
+        startup_apps.update(get_sway_startup_apps())
+
+    logging.log(LogLevel.Debug, f"Found {len(startup_apps)} autostart apps")
+    return startup_apps
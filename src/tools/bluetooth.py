@@ -1,26 +1,21 @@
 #!/usr/bin/env python3
 
 import dbus
-import dbus.mainloop.glib
 from gi.repository import GLib  # type: ignore
-import subprocess
 import threading
 from typing import Dict, List, Optional, Callable
 import time  # For proper sleep handling
 import os
 
+from tools.notify import notify_send
+from utils.bus import DBUS_PROP_IFACE, get_object_manager, get_system_bus
+from utils.commands import get_command_runner
 from utils.logger import LogLevel, Logger
 
 BLUEZ_SERVICE_NAME = "org.bluez"
 BLUEZ_ADAPTER_INTERFACE = "org.bluez.Adapter1"
 BLUEZ_DEVICE_INTERFACE = "org.bluez.Device1"
-DBUS_OM_IFACE = "org.freedesktop.DBus.ObjectManager"
-DBUS_PROP_IFACE = "org.freedesktop.DBus.Properties"
-BLUEZ_SERVICE_NAME = 'org.bluez'
-BLUEZ_ADAPTER_INTERFACE = 'org.bluez.Adapter1'
-BLUEZ_DEVICE_INTERFACE = 'org.bluez.Device1'
-DBUS_OM_IFACE = 'org.freedesktop.DBus.ObjectManager'
-DBUS_PROP_IFACE = 'org.freedesktop.DBus.Properties'
+BLUEZ_BATTERY_INTERFACE = "org.bluez.Battery1"
 DEFAULT_NOTIFY_SUBJECT='Better Control'
 
 
@@ -30,14 +25,15 @@ class BluetoothManager:
         self.adapter = None
         self.adapter_path = None
         self.bus = None
+        self.objects = None
         self.audio_routing_callbacks = []
         self.current_audio_sink = None
 
         try:
-            # Initialize DBus with mainloop
-            dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
-            self.bus = dbus.SystemBus()
-            self.mainloop = GLib.MainLoop()
+            self.bus = get_system_bus()
+            # BlueZ exports adapters and devices through ObjectManager, the
+            # mirror answers listing and status reads without a round trip
+            self.objects = get_object_manager(self.logging, BLUEZ_SERVICE_NAME)
 
             # Find the adapter
             self.adapter_path = self.find_adapter()
@@ -54,8 +50,6 @@ class BluetoothManager:
         except Exception as e:
             self.logging.log(LogLevel.Error, f"Error initializing Bluetooth: {e}")
 
-    BATTERY_INTERFACE = "org.bluez.Battery1"
-
     def __del__(self):
         """Cleanup resources"""
         try:
@@ -67,31 +61,30 @@ class BluetoothManager:
             pass  # Ignore errors during cleanup
 
     def get_device_battery(self, device_path: str) -> Optional[int]:
-        """Retrieve battery percentage for a Bluetooth device using busctl."""
+        """Retrieve battery percentage for a Bluetooth device from the BlueZ mirror."""
         try:
-            cmd = [
-                "busctl",
-                "get-property",
-                "org.bluez",
-                device_path,
-                "org.bluez.Battery1",
-                "Percentage",
-            ]
-
-            # Run the command and capture the output
-            output = subprocess.run(
-                cmd, capture_output=True, text=True
-            )
-
-            if output.returncode != 0:
+            if self.objects is None:
                 return None
-            else:
-                return int(output.stdout.strip().split()[-1])
+            battery = self.objects.get_properties(device_path, BLUEZ_BATTERY_INTERFACE)
+            if battery is None or "Percentage" not in battery:
+                return None
+            return int(battery["Percentage"])
 
         except Exception as e:
             self.logging.log(LogLevel.Error, f"Failed retrieving battery info: {e}")
             return -1  # Indicate battery info is unavailable
 
+    def notify_device(self, device_path: str, body: str) -> None:
+        """Show a device's connection state, replacing its previous notification"""
+        notify_send(
+            self.logging,
+            app_name=DEFAULT_NOTIFY_SUBJECT,
+            app_icon="bluetooth",
+            summary=DEFAULT_NOTIFY_SUBJECT,
+            body=body,
+            key=f"bluetooth:{device_path}",
+        )
+
     def find_adapter(self) -> str:
         """Find the first available Bluetooth adapter"""
         try:
@@ -99,14 +92,8 @@ class BluetoothManager:
                 self.logging.log(LogLevel.Error, "D-Bus connection not initialized")
                 return ""
 
-            remote_om = dbus.Interface(
-                self.bus.get_object(BLUEZ_SERVICE_NAME, "/"), DBUS_OM_IFACE
-            )
-            objects = remote_om.GetManagedObjects()
-
-            for o, props in objects.items():
-                if BLUEZ_ADAPTER_INTERFACE in props:
-                    return o
+            for path, _ in self.objects.find(BLUEZ_ADAPTER_INTERFACE):
+                return path
 
             self.logging.log(LogLevel.Warn, "No Bluetooth adapter found")
             return ""
@@ -122,8 +109,8 @@ class BluetoothManager:
         try:
             if not self.adapter or self.bus is None:
                 return False
-            powered = self.adapter.Get(BLUEZ_ADAPTER_INTERFACE, "Powered")
-            return bool(powered)
+            adapter = self.objects.get_properties(self.adapter_path, BLUEZ_ADAPTER_INTERFACE)
+            return bool(adapter and adapter.get("Powered", False))
         except dbus.DBusException as e:
             self.logging.log(LogLevel.Error, f"DBus error getting Bluetooth status: {e}")
             return False
@@ -131,14 +118,21 @@ class BluetoothManager:
             self.logging.log(LogLevel.Error, f"Failed getting Bluetooth status: {e}")
             return False
 
-    def set_bluetooth_power(self, enabled: bool) -> None:
-        """Set Bluetooth power state"""
+    def set_bluetooth_power(self, enabled: bool) -> bool:
+        """Set Bluetooth power state
+
+        Returns:
+            bool: False if there is no adapter or BlueZ refused the change
+        """
         try:
             if not self.adapter or self.bus is None:
-                return
+                self.logging.log(LogLevel.Warn, "Can't set Bluetooth power, no adapter")
+                return False
             self.adapter.Set(BLUEZ_ADAPTER_INTERFACE, "Powered", dbus.Boolean(enabled))
+            return True
         except Exception as e:
             self.logging.log(LogLevel.Error, f"Failed setting Bluetooth power: {e}")
+            return False
 
     def get_devices(self) -> List[Dict[str, str]]:
         """Get list of all known Bluetooth devices"""
@@ -146,16 +140,8 @@ class BluetoothManager:
             if not self.adapter or self.bus is None:
                 return []
 
-            remote_om = dbus.Interface(
-                self.bus.get_object(BLUEZ_SERVICE_NAME, "/"), DBUS_OM_IFACE
-            )
-            objects = remote_om.GetManagedObjects()
             devices = []
-            for path, interfaces in objects.items():
-                if BLUEZ_DEVICE_INTERFACE not in interfaces:
-                    continue
-
-                properties = interfaces[BLUEZ_DEVICE_INTERFACE]
+            for path, properties in self.objects.find(BLUEZ_DEVICE_INTERFACE):
                 if not properties.get("Name", None):
                     continue
 
@@ -233,8 +219,7 @@ class BluetoothManager:
             else:
                 battery_info = f"Battery: {battery_percentage}%"
 
-            subprocess.run(["notify-send", DEFAULT_NOTIFY_SUBJECT,
-                            f"{device_name} connected.\n{battery_info}"])
+            self.notify_device(device_path, f"{device_name} connected.\n{battery_info}")
 
             return True
         except Exception as e:
@@ -303,17 +288,16 @@ class BluetoothManager:
                     battery_info = f"Battery: {battery_percentage}%"
 
                 # Send notification
-                subprocess.run(["notify-send", DEFAULT_NOTIFY_SUBJECT,
-                                f"{device_name} connected.\n{battery_info}"])
+                self.notify_device(local_path, f"{device_name} connected.\n{battery_info}")
                 
                 # Automatically switch to Bluetooth audio sink
                 try:
                     # Get list of available sinks
-                    sinks_output = subprocess.getoutput("pactl list sinks short")
+                    sinks_output = get_command_runner(self.logging).getoutput(["pactl", "list", "sinks", "short"])
                     for line in sinks_output.splitlines():
                         if "bluez" in line.lower():
                             sink_name = line.split()[1]
-                            subprocess.run(["pactl", "set-default-sink", sink_name], check=True)
+                            get_command_runner(self.logging).run(["pactl", "set-default-sink", sink_name], check=True)
                             self.current_audio_sink = sink_name
                             for cb in self.audio_routing_callbacks:
                                 try:
@@ -356,7 +340,7 @@ class BluetoothManager:
             device_name = properties.Get(BLUEZ_DEVICE_INTERFACE, "Name")
             device.Disconnect()
 
-            subprocess.run(["notify-send", DEFAULT_NOTIFY_SUBJECT, f"{device_name} disconnected."])
+            self.notify_device(device_path, f"{device_name} disconnected.")
 
             return True
         except Exception as e:
@@ -409,16 +393,16 @@ class BluetoothManager:
                 time.sleep(1)
 
                 # Send notification
-                subprocess.run(["notify-send", DEFAULT_NOTIFY_SUBJECT, f"{device_name} disconnected."])
+                self.notify_device(local_path, f"{device_name} disconnected.")
                 
                 # Automatically switch back to default non-Bluetooth sink
                 try:
                     # Get list of available sinks
-                    sinks_output = subprocess.getoutput("pactl list sinks short")
+                    sinks_output = get_command_runner(self.logging).getoutput(["pactl", "list", "sinks", "short"])
                     for line in sinks_output.splitlines():
                         if "bluez" not in line.lower():
                             sink_name = line.split()[1]
-                            subprocess.run(["pactl", "set-default-sink", sink_name], check=True)
+                            get_command_runner(self.logging).run(["pactl", "set-default-sink", sink_name], check=True)
                             self.current_audio_sink = sink_name
                             for cb in self.audio_routing_callbacks:
                                 try:
@@ -486,22 +470,40 @@ def get_current_audio_sink(logging: Logger) -> Optional[str]:
         str :Name of current audio sink or None if not available
     """
     try:
-        output = subprocess.getoutput("pactl get-default-sink")
+        output = get_command_runner(logging).getoutput(["pactl", "get-default-sink"])
         return output.strip() if output else None
     except Exception as e:
         logging.log(LogLevel.Error, f"Failed getting current audio sink: {e}")
         return None
 
+def wait_for_sound_server(logging: Logger, timeout: float = 1.0) -> bool:
+    """Wait until pactl can reach the sound server
+
+    Returns immediately when it is already up, which is the usual case
+    outside of login-time autostart.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            result = get_command_runner(logging).run(["pactl", "info"], timeout=timeout)
+            if result.returncode == 0:
+                return True
+        except FileNotFoundError:
+            return False
+        if time.monotonic() >= deadline:
+            logging.log(LogLevel.Debug, "Sound server not ready")
+            return False
+        time.sleep(0.1)
+
+
 def restore_last_sink(logging: Logger):
     """Restore the last used audio sink device after startup.
 
     This function attempts to restore the last used audio sink, typically
-    a Bluetooth device, if one was previously connected.
+    a Bluetooth device, if one was previously connected. It blocks on
+    pactl, so call it off the main thread.
     """
     try:
-        # Wait for PA to fully initialize
-        time.sleep(1.0)
-
         # Get PulseAudio settings directory
         pa_dir = os.path.expanduser("~/.config/pulse")
 
@@ -531,12 +533,12 @@ def restore_last_sink(logging: Logger):
                 logging.log(LogLevel.Debug, "Saved sink is not a Bluetooth device")
                 return
 
+            if not wait_for_sound_server(logging):
+                return
+
             # Get current sinks
-            process = subprocess.run(
-                ["pactl", "list", "sinks", "short"],
-                capture_output=True,
-                text=True,
-                check=False
+            process = get_command_runner(logging).run(
+                ["pactl", "list", "sinks", "short"]
             )
 
             # Check for the presence of the saved device in currently available devices
@@ -554,19 +556,22 @@ def restore_last_sink(logging: Logger):
 
             # Set the sink as default if it was found
             logging.log(LogLevel.Info, f"Restoring Bluetooth sink: {saved_sink}")
-            subprocess.run(
-                ["pactl", "set-default-sink", saved_sink],
-                check=False
+            get_command_runner(logging).run(
+                ["pactl", "set-default-sink", saved_sink]
             )
             
             # Update current sink and notify callbacks
-            manager = get_bluetooth_manager(logging)
-            manager.current_audio_sink = saved_sink
-            for callback in manager.audio_routing_callbacks:
-                try:
-                    callback(saved_sink)
-                except Exception as e:
-                    logging.log(LogLevel.Error, f"Error in audio routing callback: {e}")
+            def notify_callbacks():
+                manager = get_bluetooth_manager(logging)
+                manager.current_audio_sink = saved_sink
+                for callback in manager.audio_routing_callbacks:
+                    try:
+                        callback(saved_sink)
+                    except Exception as e:
+                        logging.log(LogLevel.Error, f"Error in audio routing callback: {e}")
+                return False
+
+            GLib.idle_add(notify_callbacks)
 
         except Exception as e:
             logging.log(LogLevel.Error, f"Error restoring Bluetooth sink: {e}")
@@ -583,8 +588,8 @@ def get_bluetooth_status(logging: Logger) -> bool:
     return get_bluetooth_manager(logging).get_bluetooth_status()
 
 
-def set_bluetooth_power(enabled: bool, logging: Logger) -> None:
-    get_bluetooth_manager(logging).set_bluetooth_power(enabled)
+def set_bluetooth_power(enabled: bool, logging: Logger) -> bool:
+    return get_bluetooth_manager(logging).set_bluetooth_power(enabled)
 
 
 def get_devices(logging: Logger) -> List[Dict[str, str]]:
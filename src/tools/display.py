@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
 import subprocess
-from typing import Dict, List
+from typing import Callable, Dict, List
 
+from utils.commands import get_command_runner
 from utils.logger import LogLevel, Logger
 from tools.globals import get_current_session
 from tools.hyprland import get_hyprland_displays, set_hyprland_transform
@@ -14,8 +15,8 @@ def get_brightness(logging: Logger) -> int:
         int: current brightness percentage
     """
     try:
-        output = subprocess.getoutput("brightnessctl g")
-        max_brightness = int(subprocess.getoutput("brightnessctl m"))
+        output = get_command_runner(logging).getoutput(["brightnessctl", "g"])
+        max_brightness = int(get_command_runner(logging).getoutput(["brightnessctl", "m"]))
         current_brightness = int(output)
         return int((current_brightness / max_brightness) * 100)
     except Exception as e:
@@ -23,6 +24,32 @@ def get_brightness(logging: Logger) -> int:
         return 0
 
 
+def get_brightness_async(logging: Logger, callback: Callable[[int], None]) -> None:
+    """get_brightness without blocking
+
+    The current and maximum brightness are read in parallel, the
+    percentage is passed to callback on the main thread. A failed read
+    gives 0, like get_brightness.
+    """
+    results = {}
+
+    def on_result(result, field):
+        results[field] = result
+        if len(results) < 2:
+            return
+        try:
+            current_brightness = int(results["current"].stdout)
+            max_brightness = int(results["max"].stdout)
+            callback(int((current_brightness / max_brightness) * 100))
+        except (ValueError, ZeroDivisionError) as e:
+            logging.log(LogLevel.Error, f"Failed getting brightness: {e}")
+            callback(0)
+
+    runner = get_command_runner(logging)
+    runner.run_async(["brightnessctl", "g"], lambda result: on_result(result, "current"))
+    runner.run_async(["brightnessctl", "m"], lambda result: on_result(result, "max"))
+
+
 def set_brightness(value: int, logging: Logger) -> None:
     """Set the brightness level
 
@@ -30,7 +57,7 @@ def set_brightness(value: int, logging: Logger) -> None:
         value (int): brightness percentage to set
     """
     try:
-        subprocess.run(["brightnessctl", "s", f"{value}%"], check=True, stdout=subprocess.DEVNULL)
+        get_command_runner(logging).run(["brightnessctl", "s", f"{value}%"], check=True)
     except subprocess.CalledProcessError as e:
         logging.log(LogLevel.Error, f"Failed setting brightness: {e}")
 
@@ -42,7 +69,7 @@ def get_displays(logging: Logger) -> List[str]:
         List[str]: List of display names
     """
     try:
-        output = subprocess.getoutput("xrandr --query")
+        output = get_command_runner(logging).getoutput(["xrandr", "--query"])
         displays = []
         for line in output.split("\n"):
             if " connected" in line:
@@ -65,7 +92,7 @@ def get_display_info(display: str, logging: Logger) -> Dict[str, str]:
     try:
         session = get_current_session()
         if "Hyprland" in session:
-            displays = get_hyprland_displays()
+            displays = get_hyprland_displays(logging)
             transform_map = {
                 0: "normal",
                 1: "right",
@@ -75,11 +102,10 @@ def get_display_info(display: str, logging: Logger) -> Dict[str, str]:
             if display in displays:
                 return {"rotation": transform_map.get(displays[display], "normal")}
         
-        output = subprocess.run(f"xrandr --query --verbose | grep -A10 {display}", capture_output=True,text=True)
-        lines = output.stdout.split("\n")
-        
-        for i, line in enumerate(lines):
-            if display in line and " connected" in line:
+        output = get_command_runner(logging).run(["xrandr", "--query", "--verbose"])
+
+        for line in output.stdout.split("\n"):
+            if line.startswith(f"{display} ") and " connected" in line:
                 parts = line.split()
                 for idx, part in enumerate(parts):
                     if part.startswith("(") and part.endswith(")"):
@@ -87,7 +113,7 @@ def get_display_info(display: str, logging: Logger) -> Dict[str, str]:
                         return {"rotation": orientation}
     except Exception as e:
         logging.log(LogLevel.Error, f"Failed getting display info: {e}")
-        return {"rotation": "normal"}
+    return {"rotation": "normal"}
 
 def rotate_display(display: str, desktop_env: str, orientation: str, logging: Logger) -> None:
     """Change the orientation of the display
@@ -119,7 +145,7 @@ def rotate_display(display: str, desktop_env: str, orientation: str, logging: Lo
                 "active", 
                 "true"
             ]
-            subprocess.run(cmd, check=True)
+            get_command_runner(logging).run(cmd, check=True)
 
             # Apply the rotation to the specific monitor
             cmd = [
@@ -129,7 +155,7 @@ def rotate_display(display: str, desktop_env: str, orientation: str, logging: Lo
                 "--rotate",
                 rotation
             ]
-            subprocess.run(cmd, check=True)
+            get_command_runner(logging).run(cmd, check=True)
         return True
     except Exception as err:
         logging.log(LogLevel.Error, f"Failed to change display orientation for {display}: {err}")
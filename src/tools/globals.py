@@ -1,13 +1,8 @@
 #!/usr/bin/env python3
 import os
-import subprocess
-import gi
 
-from tools.bluetooth import get_bluetooth_manager
-from tools.wifi import wifi_supported
-from utils.logger import LogLevel
-gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk, Gdk # type: ignore
+from utils.commands import get_command_runner
+from utils.logger import LogLevel, Logger
 
 def get_current_session():  
     if "hyprland" in os.environ.get("XDG_CURRENT_DESKTOP", "").lower():
@@ -20,8 +15,10 @@ def get_current_session():
     
 # css for wifi_tab
 def get_wifi_css():
-    css_provider = Gtk.CssProvider()
-    css_provider.load_from_data(b"""
+    from gi.repository import Gtk  # type: ignore
+    from ui.css.style_manager import get_style_manager
+
+    get_style_manager().set_css("wifi", """
         .qr-button{
             background-color: transparent;
         }
@@ -49,47 +46,33 @@ def get_wifi_css():
             border-top-left-radius: 0px;
             padding: 10px;
         }
-    """)
-    
-    Gtk.StyleContext.add_provider_for_screen(
-        Gdk.Screen.get_default(),
-        css_provider,
-        Gtk.STYLE_PROVIDER_PRIORITY_USER
-    )
+    """, Gtk.STYLE_PROVIDER_PRIORITY_USER)
 
 # check for battery suppoert 
-def battery_supported() -> bool:
+def battery_supported(logging: Logger) -> bool:
     try:
-        result = subprocess.run(
-            "upower -e", shell=True, capture_output=True, text=True
-        )
+        result = get_command_runner(logging).run(["upower", "-e"])
         if result.returncode == 0 and "/battery_" in result.stdout:
             return True
     except Exception:
         return False
     
 def check_hardware_support(self, visibility, logging):
-    """Check if wifi, bluetooth, battery is supported or not"""
-    
-    bluetooth_manager = get_bluetooth_manager(logging)
-    hardware_checks = {
-        "Wi-Fi": {
-            "check": wifi_supported,
-            "log_message": "No Wi-Fi adapter found, skipping Wi-Fi tab",
-        },
-        "Battery": {
-            "check": battery_supported,
-            "log_message": "No battery found, skipping Battery tab",
-        },
-        "Bluetooth": {
-            "check": bluetooth_manager.bluetooth_supported,
-            "log_message": "No Bluetooth adapter found, skipping Bluetooth tab",
-        },
+    """Check if wifi, bluetooth, battery is supported or not
+
+    Answers from the capability cache, the probes themselves run in the
+    background after startup. Hardware that was never probed counts as
+    present.
+    """
+    from utils.capabilities import get_capability_registry
+
+    registry = get_capability_registry(logging)
+    log_messages = {
+        "Wi-Fi": "No Wi-Fi adapter found, skipping Wi-Fi tab",
+        "Battery": "No battery found, skipping Battery tab",
+        "Bluetooth": "No Bluetooth adapter found, skipping Bluetooth tab",
     }
-    for tab_name, check_info in hardware_checks.items():
-        try:
-            if not check_info["check"]():
-                logging.log(LogLevel.Warn, check_info["log_message"])
-                visibility[tab_name] = False
-        except Exception as e:
-            logging.log(LogLevel.Error, f"Error checking {tab_name} support: {e}")
\ No newline at end of file
+    for tab_name, log_message in log_messages.items():
+        if registry.has_hardware(tab_name) is False:
+            logging.log(LogLevel.Warn, log_message)
+            visibility[tab_name] = False
@@ -1,8 +1,7 @@
 #!/usr/bin/env python3
 
 from pathlib import Path
-import subprocess
-
+from utils.commands import get_command_runner
 from utils.logger import LogLevel, Logger
 
 CONFIG_FILES = [
@@ -42,7 +41,7 @@ def get_hyprland_startup_apps():
                     }
     return startup_apps
 
-def toggle_hyprland_startup(command):
+def toggle_hyprland_startup(command, logging: Logger):
     """Toggle the startup state of command in Hyprland config"""
     apps = get_hyprland_startup_apps()
     if command not in apps:
@@ -68,15 +67,15 @@ def toggle_hyprland_startup(command):
         f.writelines(lines)
     
     # Reload hyprland
-    subprocess.run(["hyprctl", "reload"])
+    get_command_runner(logging).run(["hyprctl", "reload"])
     
-def get_hyprland_displays() -> dict:
+def get_hyprland_displays(logging: Logger) -> dict:
     """Get current displays and their transforms from hyprctl monitors
     Returns:
         dict: Dictionary with display names as keys and transforms as values for each display
     """
     try:
-        result = subprocess.run(["hyprctl", "monitors"], capture_output=True, text=True)
+        result = get_command_runner(logging).run(["hyprctl", "monitors"])
         if result.returncode != 0:
             return {}
             
@@ -126,7 +125,7 @@ def set_hyprland_transform(logging: Logger, display: str, orientation: str) -> b
         bool: True if successful, False otherwise
     """
     try:
-        displays = get_hyprland_displays()
+        displays = get_hyprland_displays(logging)
         if display not in displays:
             logging.log(LogLevel.Error, f"Display '{display}' not found")
             return False
@@ -172,7 +171,7 @@ def set_hyprland_transform(logging: Logger, display: str, orientation: str) -> b
         ]        
         
         logging.log(LogLevel.Info, f"Running command: {' '.join(cmd)}")
-        result = subprocess.run(cmd, check=True)
+        result = get_command_runner(logging).run(cmd, check=True)
         
         if result.returncode != 0:
             logging.log(LogLevel.Error, f"Command failed with: {result.stderr}")
@@ -184,9 +183,9 @@ def set_hyprland_transform(logging: Logger, display: str, orientation: str) -> b
         return False
 
 
-def get_hyprland_rotation():
+def get_hyprland_rotation(logging: Logger):
     try:
-        result = subprocess.run(["hyprctl", "monitors"], capture_output=True, text=True)
+        result = get_command_runner(logging).run(["hyprctl", "monitors"])
         output = result.stdout
 
         for line in output.splitlines():
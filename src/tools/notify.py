@@ -1,6 +1,212 @@
-import subprocess
+import threading
+from typing import Callable, Dict, List, Optional
+
 from utils.logger import Logger, LogLevel
 
+NOTIFICATIONS_SERVICE = "org.freedesktop.Notifications"
+NOTIFICATIONS_PATH = "/org/freedesktop/Notifications"
+NOTIFICATIONS_INTERFACE = "org.freedesktop.Notifications"
+DEFAULT_APP_NAME = "Better Control"
+
+URGENCY_LEVELS = {"low": 0, "normal": 1, "critical": 2}
+
+
+class _Request:
+    __slots__ = ("app_name", "app_icon", "summary", "body", "actions", "hints", "timeout", "on_action")
+
+    def __init__(self, app_name, app_icon, summary, body, actions, hints, timeout, on_action):
+        self.app_name = app_name
+        self.app_icon = app_icon
+        self.summary = summary
+        self.body = body
+        self.actions = actions
+        self.hints = hints
+        self.timeout = timeout
+        self.on_action = on_action
+
+
+class NotificationClient:
+    """Desktop notifications over org.freedesktop.Notifications
+
+    Notify is called asynchronously on the shared session bus, so sending
+    never blocks the caller and costs no process. Notifications sent with
+    the same key replace each other: the id the server handed out for the
+    last one is passed as replaces_id, so a device connecting and
+    disconnecting repeatedly updates one popup instead of stacking them.
+    A notification sent while the previous one with its key is still
+    waiting for its id is held back, and only the newest of those is sent
+    once the id arrives.
+
+    Action callbacks are called with the action id on the main loop when
+    the server emits ActionInvoked.
+    """
+
+    def __init__(self, logging: Logger):
+        self.logging = logging
+        self._proxy = None
+        self._ids: Dict[str, int] = {}
+        self._pending: Dict[str, Optional[_Request]] = {}
+        self._actions: Dict[int, Callable[[str], None]] = {}
+        self._lock = threading.Lock()
+
+        try:
+            from utils.bus import get_session_bus
+
+            bus = get_session_bus()
+            self._proxy = bus.get_object(NOTIFICATIONS_SERVICE, NOTIFICATIONS_PATH, introspect=False)
+            bus.add_signal_receiver(
+                self._on_action_invoked, "ActionInvoked", NOTIFICATIONS_INTERFACE, NOTIFICATIONS_SERVICE, NOTIFICATIONS_PATH
+            )
+            bus.add_signal_receiver(
+                self._on_closed, "NotificationClosed", NOTIFICATIONS_INTERFACE, NOTIFICATIONS_SERVICE, NOTIFICATIONS_PATH
+            )
+        except Exception as e:
+            self.logging.log(LogLevel.Warn, f"Notifications unavailable, session bus not reachable: {e}")
+            self._proxy = None
+
+    def notify(
+        self,
+        summary: str,
+        body: str = "",
+        key: Optional[str] = None,
+        app_name: str = DEFAULT_APP_NAME,
+        app_icon: str = "settings",
+        icon: str = "",
+        urgency: str = "normal",
+        actions: Optional[List[Dict[str, str]]] = None,
+        on_action: Optional[Callable[[str], None]] = None,
+        timeout: int = -1,
+    ) -> None:
+        """Show a notification, replacing the last one sent with the same key
+
+        Args:
+            summary: Summary of notification
+            body: Body of notification
+            key: Notifications with the same key replace each other
+            app_name: Application name
+            app_icon: Application icon
+            icon: Custom path/to/icon to display
+            urgency: low, normal or critical
+            actions: list of actions to display in notification with {id, label}
+            on_action: called with the id of the action the user picked
+            timeout: milliseconds before it expires, -1 for the server default
+        """
+        if self._proxy is None:
+            return
+
+        import dbus
+
+        hints = {"urgency": dbus.Byte(URGENCY_LEVELS.get(urgency, 1))}
+        if icon:
+            hints["image-path"] = dbus.String(icon)
+        flat_actions: List[str] = []
+        for action in actions or []:
+            flat_actions += [action["id"], action["label"]]
+
+        request = _Request(app_name, app_icon, summary, body, flat_actions, hints, timeout, on_action)
+        if key is not None:
+            with self._lock:
+                if key in self._pending:
+                    # Still waiting for the id of the last one, send this after it
+                    self._pending[key] = request
+                    return
+                self._pending[key] = None
+        self._send(key, request)
+
+    def close(self, key: str) -> None:
+        """Close the notification last sent with key"""
+        with self._lock:
+            notification_id = self._ids.pop(key, None)
+        if notification_id is None or self._proxy is None:
+            return
+        self._proxy.CloseNotification(
+            notification_id,
+            dbus_interface=NOTIFICATIONS_INTERFACE,
+            reply_handler=lambda: None,
+            error_handler=lambda e: self.logging.log(LogLevel.Debug, f"Closing notification failed: {e}"),
+        )
+
+    def _send(self, key: Optional[str], request: _Request) -> None:
+        import dbus
+
+        with self._lock:
+            replaces_id = self._ids.get(key, 0) if key is not None else 0
+
+        try:
+            self._proxy.Notify(
+                request.app_name,
+                dbus.UInt32(replaces_id),
+                request.app_icon,
+                request.summary,
+                request.body,
+                dbus.Array(request.actions, signature="s"),
+                dbus.Dictionary(request.hints, signature="sv"),
+                dbus.Int32(request.timeout),
+                dbus_interface=NOTIFICATIONS_INTERFACE,
+                reply_handler=lambda notification_id: self._on_sent(key, request, int(notification_id)),
+                error_handler=lambda e: self._on_error(key, e),
+            )
+        except Exception as e:
+            self._on_error(key, e)
+
+    def _on_sent(self, key: Optional[str], request: _Request, notification_id: int) -> None:
+        with self._lock:
+            if request.on_action is not None:
+                self._actions[notification_id] = request.on_action
+            else:
+                # A replaced notification's actions are gone
+                self._actions.pop(notification_id, None)
+            if key is not None:
+                self._ids[key] = notification_id
+        self._send_queued(key)
+
+    def _on_error(self, key: Optional[str], error) -> None:
+        self.logging.log(LogLevel.Error, f"Error sending notification: {error}")
+        self._send_queued(key)
+
+    def _send_queued(self, key: Optional[str]) -> None:
+        """Send what was held back while key's last notification was in flight"""
+        if key is None:
+            return
+        with self._lock:
+            queued = self._pending.get(key)
+            if queued is None:
+                self._pending.pop(key, None)
+            else:
+                self._pending[key] = None
+        if queued is not None:
+            self._send(key, queued)
+
+    def _on_action_invoked(self, notification_id, action_key) -> None:
+        with self._lock:
+            callback = self._actions.get(int(notification_id))
+        if callback is None:
+            return
+        try:
+            callback(str(action_key))
+        except Exception as e:
+            self.logging.log(LogLevel.Error, f"Error in notification action {action_key}: {e}")
+
+    def _on_closed(self, notification_id, reason) -> None:
+        notification_id = int(notification_id)
+        with self._lock:
+            self._actions.pop(notification_id, None)
+            for key, known_id in list(self._ids.items()):
+                if known_id == notification_id:
+                    del self._ids[key]
+
+
+_notification_client = None
+
+
+def get_notification_client(logging: Logger) -> NotificationClient:
+    """Get or create the global NotificationClient instance"""
+    global _notification_client
+    if _notification_client is None:
+        _notification_client = NotificationClient(logging)
+    return _notification_client
+
+
 def notify_send(
     logging:Logger,
     app_name="",
@@ -9,10 +215,12 @@ def notify_send(
     icon="",
     summary="",
     body="",
-    actions_array=None
+    actions_array=None,
+    key=None,
+    on_action=None,
 ):
-    """ Send notification using notify-send
-    
+    """ Send a notification through the notification server
+
     args:
         app_name: Applicarion name
         urgency: Specifies the notification urgency level (low, normal, critical).
@@ -22,23 +230,18 @@ def notify_send(
         summary: Summary of notification
         body: Body of notification
         actions: list of actions to display in notification with {id, label}
-    
-    """
-    actions_array = actions_array or []
+        key: notifications sent with the same key replace each other
+        on_action: called with the id of the action the user picked
 
-    command = [
-        "notify-send",
-        "-u", urgency,
-        "-i", app_icon,
+    """
+    get_notification_client(logging).notify(
         summary,
         body,
-        "-a", app_name,
-        *[f'--action={v["id"]}={v["label"]}' for v in actions_array]
-    ]
-
-    command = [arg for arg in command if arg]
-
-    try:
-        subprocess.run(command, check=True)
-    except subprocess.SubprocessError as err:
-        logging.log(LogLevel.Error, f"Error sending notification: {err}")
+        key=key,
+        app_name=app_name or DEFAULT_APP_NAME,
+        app_icon=app_icon,
+        icon=icon,
+        urgency=urgency,
+        actions=actions_array,
+        on_action=on_action,
+    )
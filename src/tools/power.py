@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+import os
+import shlex
+import subprocess
+import threading
+from typing import Callable, Dict, Optional
+
+import dbus
+
+from utils.bus import get_system_bus
+from utils.logger import LogLevel, Logger
+
+LOGIND_SERVICE_NAME = "org.freedesktop.login1"
+LOGIND_OBJECT_PATH = "/org/freedesktop/login1"
+LOGIND_MANAGER_INTERFACE = "org.freedesktop.login1.Manager"
+LOGIND_SESSION_INTERFACE = "org.freedesktop.login1.Session"
+DBUS_PROP_IFACE = "org.freedesktop.DBus.Properties"
+
+DEFAULT_COMMANDS = {
+    "lock": "loginctl lock-session",
+    "logout": "loginctl terminate-user $USER",
+    "suspend": "systemctl suspend",
+    "hibernate": "systemctl hibernate",
+    "reboot": "systemctl reboot",
+    "shutdown": "systemctl poweroff",
+}
+
+# Actions that depend on logind Can* checks, mapped to the method name
+CAPABILITY_CHECKS = {
+    "suspend": "CanSuspend",
+    "hibernate": "CanHibernate",
+}
+
+
+def build_command(command: str) -> list:
+    """Split a configured command into an argument list
+
+    $USER is substituted with the current user (quoted), everything else is
+    split with shell quoting rules so quoted arguments survive intact.
+    """
+    username = os.environ.get("USER", os.environ.get("USERNAME", ""))
+    command = command.replace("$USER", shlex.quote(username))
+    return shlex.split(command)
+
+
+class PowerActionExecutor:
+    """Runs power actions through logind, falling back to configured commands"""
+
+    def __init__(self, logging: Logger):
+        self.logging = logging
+        self.bus = None
+        self.manager = None
+
+        try:
+            self.bus = get_system_bus()
+            self.manager = dbus.Interface(
+                self.bus.get_object(LOGIND_SERVICE_NAME, LOGIND_OBJECT_PATH),
+                LOGIND_MANAGER_INTERFACE,
+            )
+        except dbus.DBusException as e:
+            self.logging.log(LogLevel.Warn, f"logind not available, using commands: {e}")
+        except Exception as e:
+            self.logging.log(LogLevel.Error, f"Error connecting to logind: {e}")
+
+    def check_capabilities_async(self, callback: Callable[[Dict[str, bool]], None]) -> None:
+        """Ask logind which optional actions are supported
+
+        The callback is invoked from the GLib main loop once per checked
+        action with a dict of {action_id: supported}. Actions are treated as
+        supported when logind cannot be asked.
+        """
+        if self.manager is None:
+            return
+
+        for action_id, method_name in CAPABILITY_CHECKS.items():
+            def on_reply(result, action_id=action_id):
+                # "challenge" means polkit will ask for authentication
+                supported = str(result) in ("yes", "challenge")
+                self.logging.log(LogLevel.Debug, f"logind {action_id} support: {result}")
+                callback({action_id: supported})
+
+            def on_error(error, action_id=action_id):
+                self.logging.log(LogLevel.Warn, f"Failed checking {action_id} support: {error}")
+
+            try:
+                getattr(self.manager, method_name)(
+                    reply_handler=on_reply, error_handler=on_error
+                )
+            except Exception as e:
+                self.logging.log(LogLevel.Warn, f"Failed checking {action_id} support: {e}")
+
+    def execute(self, action_id: str, command: Optional[str] = None,
+                on_done: Optional[Callable[[], None]] = None) -> None:
+        """Execute a power action without blocking the caller
+
+        Args:
+            action_id (str): one of lock, logout, suspend, hibernate, reboot, shutdown
+            command (Optional[str]): user configured command. logind is only used
+                when this is empty or still the default command
+            on_done (Optional[Callable[[], None]]): called from the main loop once
+                logind replied, or once the command was started if logind
+                failed or wasn't used
+        """
+        default = DEFAULT_COMMANDS.get(action_id, "")
+        command = (command or "").strip() or default
+
+        def done():
+            if on_done is not None:
+                on_done()
+
+        if command == default and self.manager is not None:
+            def on_reply(*args):
+                self.logging.log(LogLevel.Debug, f"logind {action_id} completed")
+                done()
+
+            def on_error(error):
+                self.logging.log(LogLevel.Warn, f"logind {action_id} failed, running command: {error}")
+                self._run_command(command)
+                done()
+
+            try:
+                self._call_logind(action_id, on_reply, on_error)
+                self.logging.log(LogLevel.Info, f"Requested {action_id} through logind")
+                return
+            except Exception as e:
+                self.logging.log(LogLevel.Warn, f"logind {action_id} failed, running command: {e}")
+
+        self._run_command(command)
+        done()
+
+    def _call_logind(self, action_id: str, on_reply: Callable, on_error: Callable) -> None:
+        """Dispatch the logind method call for an action asynchronously"""
+        handlers = {"reply_handler": on_reply, "error_handler": on_error}
+
+        if action_id == "shutdown":
+            self.manager.PowerOff(True, **handlers)
+        elif action_id == "reboot":
+            self.manager.Reboot(True, **handlers)
+        elif action_id == "suspend":
+            self.manager.Suspend(True, **handlers)
+        elif action_id == "hibernate":
+            self.manager.Hibernate(True, **handlers)
+        elif action_id == "lock":
+            self.manager.LockSessions(**handlers)
+        elif action_id == "logout":
+            self.manager.TerminateSession(self._get_session_id(), **handlers)
+        else:
+            raise ValueError(f"Unknown power action: {action_id}")
+
+    def _get_session_id(self) -> str:
+        """Get the logind session id this process belongs to"""
+        session_id = os.environ.get("XDG_SESSION_ID")
+        if session_id:
+            return session_id
+
+        session_path = self.manager.GetSessionByPID(dbus.UInt32(os.getpid()))
+        session = dbus.Interface(
+            self.bus.get_object(LOGIND_SERVICE_NAME, session_path), DBUS_PROP_IFACE
+        )
+        return str(session.Get(LOGIND_SESSION_INTERFACE, "Id"))
+
+    def _run_command(self, command: str) -> None:
+        """Spawn a configured command directly, without a shell"""
+        try:
+            args = build_command(command)
+            if not args:
+                self.logging.log(LogLevel.Warn, "Empty power command, nothing to run")
+                return
+            self.logging.log(LogLevel.Info, f"Executing command: {args}")
+            process = subprocess.Popen(
+                args,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            # Reap the child in the background so it does not linger as a zombie
+            threading.Thread(target=process.wait, daemon=True).start()
+        except Exception as e:
+            self.logging.log(LogLevel.Error, f"Failed to execute command: {e}")
+
+
+_executor = None
+
+
+def get_power_executor(logging: Logger) -> PowerActionExecutor:
+    """Get or create the global PowerActionExecutor instance"""
+    global _executor
+    if _executor is None:
+        _executor = PowerActionExecutor(logging)
+    return _executor
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import shlex
+import threading
+import time
+from typing import Dict, List, Optional
+
+import psutil
+
+from utils.logger import LogLevel, Logger
+from tools.autostart import get_autostart_apps
+from tools.globals import get_current_session
+
+CONFIG_DIR = os.path.join(
+    os.environ.get("XDG_CONFIG_HOME", os.path.expanduser("~/.config")),
+    "better-control"
+)
+HISTORY_FILE = os.path.join(CONFIG_DIR, "startup_history.json")
+
+# Only the first N seconds of a process lifetime count as its startup cost
+SAMPLE_WINDOW = 30
+# Seconds between samples while autostart entries are starting
+SAMPLE_INTERVAL = 3
+# Number of login sessions kept per autostart entry
+MAX_SESSIONS = 10
+
+COMPOSITOR_PROCESSES = {
+    "Hyprland": ("Hyprland", "hyprland"),
+    "sway": ("sway",),
+}
+
+
+def get_exec_command(app: Dict) -> str:
+    """Get the command line an autostart entry launches
+
+    Args:
+        app (Dict): autostart entry as returned by get_startup_apps
+
+    Returns:
+        str: the command, or an empty string if it cannot be determined
+    """
+    if app.get("type") != "desktop":
+        return str(app.get("name", ""))
+
+    try:
+        with open(app["path"], "r") as f:
+            for line in f:
+                if line.startswith("Exec="):
+                    return line[5:].strip()
+    except Exception:
+        pass
+    return ""
+
+
+def get_executable(command: str) -> str:
+    """Extract the executable name from an Exec line or exec-once command
+
+    Leading `env` invocations, environment assignments and desktop entry
+    field codes (%U, %f, ...) are skipped.
+    """
+    try:
+        parts = shlex.split(command)
+    except ValueError:
+        parts = command.split()
+
+    for part in parts:
+        if part == "env" or part.startswith("%") or ("=" in part and not part.startswith("/")):
+            continue
+        return os.path.basename(part)
+    return ""
+
+
+def get_session_start(logging: Logger) -> float:
+    """Get the session start time as a unix timestamp
+
+    Uses the compositor process start time when running under Hyprland or
+    Sway, and falls back to the oldest process owned by the user.
+    """
+    names = COMPOSITOR_PROCESSES.get(get_current_session() or "", ())
+    uid = os.getuid()
+    oldest: Optional[float] = None
+
+    for proc in psutil.process_iter(["name", "uids", "create_time"]):
+        try:
+            info = proc.info
+            if info["uids"] is None or info["uids"].real != uid:
+                continue
+            if info["name"] in names:
+                return info["create_time"]
+            if oldest is None or info["create_time"] < oldest:
+                oldest = info["create_time"]
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+    if oldest is None:
+        logging.log(LogLevel.Warn, "Could not determine session start, using boot time")
+        return psutil.boot_time()
+    return oldest
+
+
+def sample_processes(apps: Dict[str, Dict], session_start: float) -> Dict[str, Dict]:
+    """Sample /proc for processes matching each autostart entry
+
+    Args:
+        apps (Dict[str, Dict]): autostart entries keyed by name
+        session_start (float): session start timestamp
+
+    Returns:
+        Dict[str, Dict]: per entry spawn delay, cpu time and rss of the
+            earliest matching process started after the session began
+    """
+    wanted: Dict[str, str] = {}
+    for app_name, app in apps.items():
+        if not app.get("enabled", True):
+            continue
+        executable = get_executable(get_exec_command(app))
+        if executable:
+            wanted[app_name] = executable
+
+    if not wanted:
+        return {}
+
+    by_executable: Dict[str, psutil.Process] = {}
+    for proc in psutil.process_iter(["name", "cmdline", "create_time"]):
+        try:
+            info = proc.info
+            if info["create_time"] < session_start:
+                continue
+            cmdline = info["cmdline"] or []
+            names = {info["name"]}
+            if cmdline:
+                names.add(os.path.basename(cmdline[0]))
+            for name in names:
+                current = by_executable.get(name)
+                if current is None or info["create_time"] < current.info["create_time"]:
+                    by_executable[name] = proc
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+    now = time.time()
+    samples = {}
+    for app_name, executable in wanted.items():
+        # /proc/<pid>/comm is truncated to 15 characters
+        proc = by_executable.get(executable) or by_executable.get(executable[:15])
+        if proc is None:
+            continue
+        try:
+            with proc.oneshot():
+                cpu = proc.cpu_times()
+                samples[app_name] = {
+                    "spawn_delay": round(proc.info["create_time"] - session_start, 3),
+                    "cpu_time": round(cpu.user + cpu.system, 3),
+                    "rss": proc.memory_info().rss,
+                    "in_window": now - proc.info["create_time"] <= SAMPLE_WINDOW,
+                }
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return samples
+
+
+def load_history(logging: Logger) -> Dict[str, List[Dict]]:
+    """Load startup cost history from disk"""
+    try:
+        if os.path.exists(HISTORY_FILE):
+            with open(HISTORY_FILE, "r") as f:
+                data = json.load(f)
+                if isinstance(data, dict):
+                    return data
+    except Exception as e:
+        logging.log(LogLevel.Warn, f"Error loading startup history: {e}")
+    return {}
+
+
+def save_history(history: Dict[str, List[Dict]], logging: Logger) -> None:
+    """Save startup cost history atomically"""
+    try:
+        os.makedirs(CONFIG_DIR, exist_ok=True)
+        temp_path = HISTORY_FILE + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(history, f)
+        os.replace(temp_path, HISTORY_FILE)
+    except Exception as e:
+        logging.log(LogLevel.Error, f"Error saving startup history: {e}")
+
+
+def sample_session_startup(logging: Logger) -> int:
+    """Sample autostart processes while the session is starting
+
+    Meant to run at login, from `--sample-startup` or next to `--daemon`
+    and `--osd`, and does nothing later in the session. Samples every
+    SAMPLE_INTERVAL seconds until each entry that started within the first
+    SAMPLE_WINDOW seconds is past its own window, then writes the history
+    once. Each pass is a single walk over /proc.
+
+    Returns:
+        int: number of entries recorded for this session
+    """
+    session_start = get_session_start(logging)
+    if time.time() - session_start > SAMPLE_WINDOW:
+        logging.log(LogLevel.Debug, "Session started too long ago to sample autostart apps")
+        return 0
+
+    apps = get_autostart_apps(logging, include_system=True, include_hidden=False)
+    collected: Dict[str, Dict] = {}
+    while True:
+        starting = False
+        for app_name, sample in sample_processes(apps, session_start).items():
+            # Whatever starts later isn't part of the login cost
+            if sample["spawn_delay"] > SAMPLE_WINDOW or not sample.pop("in_window"):
+                continue
+            starting = True
+            previous = collected.get(app_name)
+            if previous is not None:
+                sample["rss"] = max(previous["rss"], sample["rss"])
+            collected[app_name] = sample
+
+        if not starting and time.time() - session_start > SAMPLE_WINDOW:
+            break
+        time.sleep(SAMPLE_INTERVAL)
+
+    if collected:
+        history = load_history(logging)
+        merge_session(history, str(int(session_start)), collected)
+        save_history(history, logging)
+    logging.log(LogLevel.Info, f"Recorded startup cost of {len(collected)} autostart apps")
+    return len(collected)
+
+
+def start_session_sampler(logging: Logger) -> None:
+    """Run sample_session_startup on a background thread"""
+
+    def sample():
+        try:
+            sample_session_startup(logging)
+        except Exception as e:
+            logging.log(LogLevel.Warn, f"Failed to profile autostart apps: {e}")
+
+    threading.Thread(target=sample, name="startup-sampler", daemon=True).start()
+
+
+def merge_session(history: Dict[str, List[Dict]], session_key: str, samples: Dict[str, Dict]) -> None:
+    """Add one session's samples to the history, keeping MAX_SESSIONS per entry
+
+    A session that is already recorded, e.g. by a second sampler started at
+    the same login, keeps the larger cpu time and rss.
+    """
+    for app_name, sample in samples.items():
+        sessions = history.setdefault(app_name, [])
+        current = next((s for s in sessions if s.get("session") == session_key), None)
+
+        if current is None:
+            sessions.append({"session": session_key, **sample})
+            del sessions[:-MAX_SESSIONS]
+        else:
+            current["cpu_time"] = max(current.get("cpu_time", 0), sample["cpu_time"])
+            current["rss"] = max(current.get("rss", 0), sample["rss"])
+
+
+def get_startup_costs(logging: Logger) -> Dict[str, Dict]:
+    """Startup cost summary for each entry with recorded sessions"""
+    return summarize_history(load_history(logging))
+
+
+def summarize_history(history: Dict[str, List[Dict]]) -> Dict[str, Dict]:
+    """Average each entry's recorded sessions
+
+    The "cost" field is spawn delay plus cpu time, and is what the
+    autostart tab sorts by.
+    """
+    summary = {}
+    for app_name, sessions in history.items():
+        if not sessions:
+            continue
+        count = len(sessions)
+        spawn_delay = sum(s.get("spawn_delay", 0) for s in sessions) / count
+        cpu_time = sum(s.get("cpu_time", 0) for s in sessions) / count
+        rss = sum(s.get("rss", 0) for s in sessions) / count
+        summary[app_name] = {
+            "spawn_delay": spawn_delay,
+            "cpu_time": cpu_time,
+            "rss": rss,
+            "sessions": count,
+            "cost": spawn_delay + cpu_time,
+        }
+    return summary
+
+
+def format_startup_cost(cost: Dict) -> str:
+    """Format a startup cost summary for display"""
+    return (
+        f"+{cost['spawn_delay']:.1f}s · "
+        f"CPU {cost['cpu_time']:.2f}s · "
+        f"{cost['rss'] / (1024 * 1024):.0f} MB"
+    )
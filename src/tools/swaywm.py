@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 
 from pathlib import Path
-import subprocess
+
+from utils.commands import get_command_runner
+from utils.logger import Logger
 
 CONFIG_FILES = [
     Path.home() / ".config/sway/config",
@@ -42,7 +44,7 @@ def get_sway_startup_apps():
                         }
     return startup_apps
 
-def toggle_sway_startup(command):
+def toggle_sway_startup(command, logging: Logger):
     """Toggle the startup app in sway"""
     apps  = get_sway_startup_apps()
     if command not in apps:
@@ -66,4 +68,4 @@ def toggle_sway_startup(command):
     with open(config_path, "w") as f:
         f.writelines(lines)
     
-    subprocess.run(["swaymsg", "reload"], check=True)
\ No newline at end of file
+    get_command_runner(logging).run(["swaymsg", "reload"], check=True)
\ No newline at end of file
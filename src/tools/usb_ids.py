@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+import mmap
+import os
+import re
+import sys
+from typing import Dict, Optional
+
+# A copy shipped next to the sources wins over the system hwdata database
+USB_IDS_PATHS = [
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "usb.ids"),
+    "/usr/share/hwdata/usb.ids",
+    "/usr/share/misc/usb.ids",
+    "/usr/share/usb.ids",
+    "/var/lib/usbutils/usb.ids",
+]
+
+# Used when no usb.ids file is installed
+FALLBACK_VENDORS = {
+    "8086": "Intel",
+    "8087": "Intel",
+    "045e": "Microsoft",
+    "046d": "Logitech",
+    "04f2": "Chicony",
+    "05ac": "Apple",
+    "093a": "Pixart",
+    "0b05": "ASUS",
+    "0cf3": "Qualcomm",
+    "1532": "Razer",
+    "2109": "VIA Labs",
+}
+
+VENDOR_LINE = re.compile(rb"^([0-9a-f]{4})  ", re.MULTILINE)
+PRODUCT_LINE = re.compile(rb"\t([0-9a-f]{4})  ([^\n]*)\n")
+
+
+class USBIds:
+    """Vendor/product name lookup backed by a memory-mapped usb.ids
+
+    The file is mapped on the first lookup and only an offset index of
+    vendor lines is built; product names are read straight from the map
+    when a vendor is first asked about. Resolved names are interned and
+    cached, so repeated renders of the same devices cost a dict lookup.
+    """
+
+    def __init__(self, paths=None):
+        self.paths = paths or USB_IDS_PATHS
+        self._map: Optional[mmap.mmap] = None
+        self._index: Optional[Dict[str, int]] = None
+        self._vendors: Dict[str, Optional[str]] = {}
+        self._products: Dict[str, Dict[str, str]] = {}
+
+    def _load(self) -> None:
+        if self._index is not None:
+            return
+        self._index = {}
+
+        for path in self.paths:
+            try:
+                with open(path, "rb") as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                break
+            except (OSError, ValueError):
+                continue
+
+        if self._map is None:
+            return
+
+        # Vendors come first, the class/HID/language tables follow
+        end = self._map.find(b"\nC ")
+        if end == -1:
+            end = len(self._map)
+        for match in VENDOR_LINE.finditer(self._map, 0, end):
+            self._index[match.group(1).decode()] = match.start()
+
+    def _read_line(self, offset: int) -> bytes:
+        end = self._map.find(b"\n", offset)
+        return self._map[offset:end if end != -1 else len(self._map)]
+
+    def vendor_name(self, vendor_id: str) -> Optional[str]:
+        """Get the vendor name for a 4 digit hex vendor id"""
+        vendor_id = vendor_id.lower()
+        if vendor_id in self._vendors:
+            return self._vendors[vendor_id]
+
+        self._load()
+        name = FALLBACK_VENDORS.get(vendor_id)
+        offset = self._index.get(vendor_id)
+        if offset is not None:
+            line = self._read_line(offset)
+            name = line[6:].decode("utf-8", "replace").strip() or name
+
+        if name is not None:
+            name = sys.intern(name)
+        self._vendors[vendor_id] = name
+        return name
+
+    def product_name(self, vendor_id: str, product_id: str) -> Optional[str]:
+        """Get the product name for a vendor/product id pair"""
+        vendor_id = vendor_id.lower()
+        products = self._products.get(vendor_id)
+        if products is None:
+            products = self._read_products(vendor_id)
+            self._products[vendor_id] = products
+        return products.get(product_id.lower())
+
+    def _read_products(self, vendor_id: str) -> Dict[str, str]:
+        self._load()
+        offset = self._index.get(vendor_id)
+        if offset is None:
+            return {}
+
+        products = {}
+        position = self._map.find(b"\n", offset) + 1
+        while 0 < position < len(self._map) and self._map[position:position + 1] == b"\t":
+            match = PRODUCT_LINE.match(self._map, position)
+            if match:
+                products[match.group(1).decode()] = sys.intern(
+                    match.group(2).decode("utf-8", "replace").strip()
+                )
+            # Interface lines (two tabs) and comments are skipped
+            next_line = self._map.find(b"\n", position)
+            if next_line == -1:
+                break
+            position = next_line + 1
+        return products
+
+
+_usb_ids = None
+
+
+def get_usb_ids() -> USBIds:
+    """Get or create the global USBIds instance"""
+    global _usb_ids
+    if _usb_ids is None:
+        _usb_ids = USBIds()
+    return _usb_ids
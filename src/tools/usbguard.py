@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+
+import shutil
+from typing import Callable, Dict, List, Optional
+
+import dbus
+from gi.repository import GLib  # type: ignore
+
+from utils.bus import get_system_bus
+from utils.commands import get_command_runner
+from utils.logger import LogLevel, Logger
+
+# usbguard >= 1.0 uses the versioned names, older daemons the plain ones
+USBGUARD_BUS_NAMES = [
+    ("org.usbguard1", "/org/usbguard1/Devices", "org.usbguard.Devices1",
+     "/org/usbguard1/Policy", "org.usbguard.Policy1"),
+    ("org.usbguard", "/org/usbguard/Devices", "org.usbguard.Devices",
+     "/org/usbguard/Policy", "org.usbguard.Policy"),
+]
+
+TARGETS = {"allow": 0, "block": 1, "reject": 2}
+TARGET_NAMES = {value: name for name, value in TARGETS.items()}
+
+# DevicePresenceChanged event codes
+PRESENCE_PRESENT = 0
+PRESENCE_INSERT = 1
+PRESENCE_UPDATE = 2
+PRESENCE_REMOVE = 3
+
+
+class USBGuardManager:
+    """USBGuard backend using the daemon's D-Bus interface
+
+    Keeps a mirror of the device list that is filled once and then kept up
+    to date from DevicePresenceChanged/DevicePolicyChanged signals. Every
+    call falls back to the usbguard CLI in a worker thread when the D-Bus
+    interface is unavailable or denied, and all callbacks run on the GLib
+    main loop.
+    """
+
+    def __init__(self, logging: Logger):
+        self.logging = logging
+        self.bus = None
+        self.bus_name = None
+        self.devices_iface = None
+        self.policy_iface = None
+        self._devices: Optional[Dict[str, str]] = None
+        self._listeners: List[Callable[[str, str], None]] = []
+        self._service_listeners: List[Callable[[bool], None]] = []
+        self._signals_connected = False
+
+        try:
+            self.bus = get_system_bus()
+            self.bus_name = USBGUARD_BUS_NAMES[0][0]
+            for bus_name, *_ in USBGUARD_BUS_NAMES:
+                if self.bus.name_has_owner(bus_name):
+                    self.bus_name = bus_name
+                    break
+            self.bus.watch_name_owner(self.bus_name, self._on_name_owner_changed)
+        except Exception as e:
+            self.logging.log(LogLevel.Warn, f"USBGuard D-Bus unavailable, using CLI: {e}")
+            self.bus = None
+
+    def _names(self):
+        return next(n for n in USBGUARD_BUS_NAMES if n[0] == self.bus_name)
+
+    def _connect_interfaces(self) -> bool:
+        """Resolve the Devices/Policy interfaces and hook up signals"""
+        if self.bus is None:
+            return False
+        if self.devices_iface is not None:
+            return True
+
+        try:
+            bus_name, devices_path, devices_iface, policy_path, policy_iface = self._names()
+            self.devices_iface = dbus.Interface(
+                self.bus.get_object(bus_name, devices_path), devices_iface
+            )
+            self.policy_iface = dbus.Interface(
+                self.bus.get_object(bus_name, policy_path), policy_iface
+            )
+            if not self._signals_connected:
+                self.bus.add_signal_receiver(
+                    self._on_presence_changed, "DevicePresenceChanged",
+                    devices_iface, bus_name, devices_path,
+                )
+                self.bus.add_signal_receiver(
+                    self._on_policy_changed, "DevicePolicyChanged",
+                    devices_iface, bus_name, devices_path,
+                )
+                self._signals_connected = True
+            return True
+        except Exception as e:
+            self.logging.log(LogLevel.Warn, f"Failed connecting to USBGuard D-Bus: {e}")
+            self.devices_iface = None
+            self.policy_iface = None
+            return False
+
+    @staticmethod
+    def is_installed() -> bool:
+        return shutil.which("usbguard") is not None
+
+    @property
+    def live(self) -> bool:
+        """True when the device list is kept current by D-Bus signals"""
+        return self._signals_connected and self._devices is not None
+
+    # Service state
+
+    def _on_name_owner_changed(self, owner: str) -> None:
+        active = bool(owner)
+        self.logging.log(LogLevel.Debug, f"USBGuard service active: {active}")
+        if not active:
+            # Drop proxies and the mirror, they are stale once the daemon restarts
+            self.devices_iface = None
+            self.policy_iface = None
+            self._devices = None
+        for callback in list(self._service_listeners):
+            try:
+                callback(active)
+            except Exception as e:
+                self.logging.log(LogLevel.Error, f"Error in USBGuard service callback: {e}")
+
+    def watch_service(self, callback: Callable[[bool], None]) -> None:
+        """Get notified whenever the USBGuard daemon starts or stops"""
+        if callback not in self._service_listeners:
+            self._service_listeners.append(callback)
+
+    def unwatch_service(self, callback: Callable[[bool], None]) -> None:
+        if callback in self._service_listeners:
+            self._service_listeners.remove(callback)
+
+    def is_service_active_async(self, callback: Callable[[bool], None]) -> None:
+        """Check whether the daemon is running"""
+        if self.bus is not None:
+            try:
+                active = bool(self.bus.name_has_owner(self.bus_name))
+                GLib.idle_add(lambda: callback(active) and False)
+                return
+            except Exception as e:
+                self.logging.log(LogLevel.Warn, f"Failed querying USBGuard bus name: {e}")
+
+        get_command_runner(self.logging).run_async(
+            ["systemctl", "is-active", "usbguard"],
+            lambda result: callback(result.stdout.strip() == "active"),
+        )
+
+    # Device list
+
+    def subscribe(self, callback: Callable[[str, str], None]) -> None:
+        """Get notified about device changes
+
+        The callback receives the event ("insert", "remove", "update" or
+        "policy") and the device id.
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, str], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, event: str, device_id: str) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(event, device_id)
+            except Exception as e:
+                self.logging.log(LogLevel.Error, f"Error in USBGuard device callback: {e}")
+
+    def _on_presence_changed(self, device_id, event, target, device_rule, attributes) -> None:
+        device_id = str(int(device_id))
+        event = int(event)
+        if self._devices is not None:
+            if event == PRESENCE_REMOVE:
+                self._devices.pop(device_id, None)
+            else:
+                self._devices[device_id] = f"{device_id}: {device_rule}"
+        name = {PRESENCE_INSERT: "insert", PRESENCE_REMOVE: "remove"}.get(event, "update")
+        self.logging.log(LogLevel.Debug, f"USBGuard device {device_id} {name}")
+        self._notify(name, device_id)
+
+    def _on_policy_changed(self, device_id, target_old, target_new, device_rule, rule_id, attributes) -> None:
+        device_id = str(int(device_id))
+        if self._devices is not None:
+            self._devices[device_id] = f"{device_id}: {device_rule}"
+        self.logging.log(
+            LogLevel.Debug,
+            f"USBGuard device {device_id} policy {TARGET_NAMES.get(int(target_old))} -> "
+            f"{TARGET_NAMES.get(int(target_new))}",
+        )
+        self._notify("policy", device_id)
+
+    def get_devices(self) -> Optional[List[str]]:
+        """Get the mirrored device list in `usbguard list-devices` format"""
+        if self._devices is None:
+            return None
+        return [self._devices[k] for k in sorted(self._devices, key=int)]
+
+    def list_devices_async(
+        self,
+        callback: Callable[[Optional[List[str]], str], None],
+        force: bool = False,
+    ) -> None:
+        """List devices as `usbguard list-devices` lines
+
+        Served from the signal-maintained mirror unless force is set. The
+        callback receives (lines, "") on success or (None, error message).
+        """
+        if not force and self.live:
+            devices = self.get_devices()
+            GLib.idle_add(lambda: callback(devices, "") and False)
+            return
+
+        if self._connect_interfaces():
+            def on_reply(result):
+                self._devices = {
+                    str(int(device_id)): f"{int(device_id)}: {rule}"
+                    for device_id, rule in result
+                }
+                callback(self.get_devices(), "")
+
+            def on_error(error):
+                self.logging.log(LogLevel.Warn, f"USBGuard D-Bus listDevices failed, using CLI: {error}")
+                self._list_devices_cli(callback)
+
+            try:
+                self.devices_iface.listDevices("match", reply_handler=on_reply, error_handler=on_error)
+                return
+            except Exception as e:
+                self.logging.log(LogLevel.Warn, f"USBGuard D-Bus listDevices failed, using CLI: {e}")
+
+        self._list_devices_cli(callback)
+
+    def _list_devices_cli(self, callback: Callable[[Optional[List[str]], str], None]) -> None:
+        def on_result(result):
+            if result.returncode == 127:
+                callback(None, "USBGuard not installed")
+            elif result.returncode != 0:
+                callback(None, result.stderr or "Unknown error")
+            else:
+                callback([line for line in result.stdout.splitlines() if line.strip()], "")
+
+        get_command_runner(self.logging).run_async(["usbguard", "list-devices"], on_result, timeout=10)
+
+    # Policy
+
+    def apply_policy_async(
+        self,
+        device_id: str,
+        target: str,
+        permanent: bool,
+        callback: Optional[Callable[[bool, str], None]] = None,
+    ) -> None:
+        """Allow, block or reject a device
+
+        Args:
+            device_id (str): numeric USBGuard device id
+            target (str): "allow", "block" or "reject"
+            permanent (bool): also store the decision in the policy
+            callback: called with (success, error message)
+        """
+        def done(success: bool, error: str = "") -> None:
+            if callback:
+                callback(success, error)
+
+        if self._connect_interfaces():
+            def on_error(error):
+                self.logging.log(LogLevel.Warn, f"USBGuard D-Bus applyDevicePolicy failed, using CLI: {error}")
+                self._apply_policy_cli(device_id, target, permanent, done)
+
+            try:
+                self.devices_iface.applyDevicePolicy(
+                    dbus.UInt32(int(device_id)), dbus.UInt32(TARGETS[target]), dbus.Boolean(permanent),
+                    reply_handler=lambda *args: done(True),
+                    error_handler=on_error,
+                )
+                return
+            except Exception as e:
+                self.logging.log(LogLevel.Warn, f"USBGuard D-Bus applyDevicePolicy failed, using CLI: {e}")
+
+        self._apply_policy_cli(device_id, target, permanent, done)
+
+    def _apply_policy_cli(self, device_id: str, target: str, permanent: bool, done: Callable) -> None:
+        command = ["usbguard", f"{target}-device"]
+        if permanent:
+            command.append("-p")
+        command.append(str(device_id))
+
+        def on_result(result):
+            success = result.returncode == 0
+            done(success, "" if success else (result.stderr or "Unknown error"))
+
+        get_command_runner(self.logging).run_async(command, on_result, timeout=10, dedupe=False)
+
+    def list_rules_async(self, callback: Callable[[Optional[str], str], None]) -> None:
+        """Get the policy as `usbguard list-rules` text"""
+        if self._connect_interfaces():
+            def on_reply(result):
+                callback("\n".join(f"{int(rule_id)}: {rule}" for rule_id, rule in result), "")
+
+            def on_error(error):
+                self.logging.log(LogLevel.Warn, f"USBGuard D-Bus listRules failed, using CLI: {error}")
+                self._list_rules_cli(callback)
+
+            try:
+                self.policy_iface.listRules("", reply_handler=on_reply, error_handler=on_error)
+                return
+            except Exception as e:
+                self.logging.log(LogLevel.Warn, f"USBGuard D-Bus listRules failed, using CLI: {e}")
+
+        self._list_rules_cli(callback)
+
+    def _list_rules_cli(self, callback: Callable[[Optional[str], str], None]) -> None:
+        def on_result(result):
+            if result.returncode == -9:
+                callback(None, "Policy retrieval timed out")
+            elif result.returncode != 0:
+                callback(None, result.stderr or "Unknown error")
+            else:
+                callback(result.stdout.strip(), "")
+
+        get_command_runner(self.logging).run_async(["usbguard", "list-rules"], on_result)
+
+
+_manager = None
+
+
+def get_usbguard_manager(logging: Logger) -> USBGuardManager:
+    """Get or create the global USBGuardManager instance"""
+    global _manager
+    if _manager is None:
+        _manager = USBGuardManager(logging)
+    return _manager
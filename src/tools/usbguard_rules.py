@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+
+import sys
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from tools.usb_ids import get_usb_ids
+
+RULE_TARGETS = ("allow", "block", "reject", "match", "device")
+SET_OPERATORS = ("all-of", "one-of", "none-of", "equals", "equals-ordered", "match-all")
+STRING_ESCAPES = {'"': '"', "\\": "\\", "n": "\n", "t": "\t", "a": "\a"}
+# Rule keywords that describe the device, with the USBDevice field they fill
+DEVICE_ATTRIBUTES = {
+    "id": "usb_id",
+    "serial": "serial",
+    "name": "name",
+    "hash": "hash",
+    "parent-hash": "parent_hash",
+    "via-port": "via_port",
+    "with-interface": "interfaces",
+    "with-connect-type": "connect_type",
+}
+
+
+def _id_matches(pattern: str, value: str) -> bool:
+    """`vvvv:pppp` against a device id, `vvvv:*` and `*:*` match any product"""
+    vendor, _, product = pattern.partition(":")
+    device_vendor, _, device_product = value.partition(":")
+    if vendor == "*":
+        return True
+    return vendor == device_vendor and product in ("*", device_product)
+
+
+def _interface_matches(pattern: str, value: str) -> bool:
+    """`cc:ss:pp` against an interface, `cc:*:*` and `cc:ss:*` are wildcards"""
+    pattern_fields, value_fields = pattern.split(":"), value.split(":")
+    if len(pattern_fields) != len(value_fields):
+        return False
+    return all(p == "*" or p == v for p, v in zip(pattern_fields, value_fields))
+
+
+def _apply_operator(
+    operator: Optional[str],
+    patterns: Tuple[str, ...],
+    values: List[str],
+    match: Callable[[str, str], bool],
+) -> bool:
+    """Evaluate a rule attribute the way USBGuard does
+
+    Without an operator a rule attribute means `equals`. An operator this
+    parser doesn't know counts as matching, so a policy that allows a
+    device is never read as blocking it.
+    """
+    def covered(pattern: str) -> bool:
+        return any(match(pattern, value) for value in values)
+
+    def allowed(value: str) -> bool:
+        return any(match(pattern, value) for pattern in patterns)
+
+    if operator is None or operator == "equals":
+        return all(covered(pattern) for pattern in patterns) and all(allowed(value) for value in values)
+    if operator == "all-of":
+        return all(covered(pattern) for pattern in patterns)
+    if operator == "one-of":
+        return any(covered(pattern) for pattern in patterns)
+    if operator == "none-of":
+        return not any(covered(pattern) for pattern in patterns)
+    if operator == "match-all":
+        return all(allowed(value) for value in values)
+    if operator == "equals-ordered":
+        return len(patterns) == len(values) and all(match(p, v) for p, v in zip(patterns, values))
+    return True
+
+
+class USBDevice:
+    """A device or policy rule parsed from the USBGuard rule language"""
+
+    __slots__ = (
+        "device_id", "target", "vendor_id", "product_id", "serial", "name",
+        "hash", "parent_hash", "via_port", "interfaces", "connect_type", "rule", "conditions",
+    )
+
+    def __init__(self, device_id: str, target: str, rule: str):
+        self.device_id = device_id
+        self.target = target
+        self.rule = rule
+        self.vendor_id = ""
+        self.product_id = ""
+        self.serial = ""
+        self.name = ""
+        self.hash = ""
+        self.parent_hash = ""
+        self.via_port = ""
+        self.interfaces: Tuple[str, ...] = ()
+        self.connect_type = ""
+        # Rule keyword -> (set operator or None, values) as written in the rule
+        self.conditions: Dict[str, Tuple[Optional[str], Tuple[str, ...]]] = {}
+
+    def __repr__(self):
+        return f"USBDevice({self.device_id}: {self.target} {self.usb_id} {self.name!r})"
+
+    @property
+    def usb_id(self) -> str:
+        if not self.vendor_id:
+            return ""
+        return f"{self.vendor_id}:{self.product_id}"
+
+    @property
+    def vendor_name(self) -> Optional[str]:
+        if not self.vendor_id or self.vendor_id == "*":
+            return None
+        return get_usb_ids().vendor_name(self.vendor_id)
+
+    @property
+    def product_name(self) -> Optional[str]:
+        if not self.vendor_id or self.product_id in ("", "*"):
+            return None
+        return get_usb_ids().product_name(self.vendor_id, self.product_id)
+
+    @property
+    def display_name(self) -> str:
+        """Best human readable name: device name, usb.ids product, vendor"""
+        if self.name:
+            return self.name
+        product = self.product_name
+        if product:
+            return product
+        vendor = self.vendor_name
+        if vendor:
+            return f"{vendor} {self.usb_id}"
+        return self.usb_id or "Unknown Device"
+
+    def interface_classes(self) -> List[str]:
+        """Interface class codes (first byte of each cc:ss:pp triple)"""
+        return [interface.split(":")[0] for interface in self.interfaces]
+
+    def matches(self, rule: "USBDevice") -> bool:
+        """Whether a policy rule's attributes all match this device
+
+        Follows USBGuard: `*` wildcards in ids and interfaces, and the
+        all-of/one-of/none-of/equals/equals-ordered/match-all set operators.
+        """
+        for keyword, (operator, patterns) in rule.conditions.items():
+            if keyword == "id":
+                values, match = ([self.usb_id] if self.usb_id else []), _id_matches
+            elif keyword == "with-interface":
+                values, match = list(self.interfaces), _interface_matches
+            else:
+                # An empty attribute is still a value, `serial ""` matches no serial
+                values, match = [getattr(self, DEVICE_ATTRIBUTES[keyword])], str.__eq__
+            if not _apply_operator(operator, patterns, values, match):
+                return False
+        return True
+
+
+def tokenize(rule: str) -> Iterator[str]:
+    """Split a rule into words, quoted strings and braces
+
+    Quoted strings are yielded with their quotes so they can be told apart
+    from keywords, escape sequences are decoded.
+    """
+    i, length = 0, len(rule)
+    while i < length:
+        char = rule[i]
+        if char.isspace():
+            i += 1
+        elif char in "{}":
+            yield char
+            i += 1
+        elif char == '"':
+            i += 1
+            value = []
+            while i < length and rule[i] != '"':
+                if rule[i] == "\\" and i + 1 < length:
+                    escape = rule[i + 1]
+                    if escape == "x" and i + 3 < length:
+                        try:
+                            value.append(chr(int(rule[i + 2:i + 4], 16)))
+                            i += 4
+                            continue
+                        except ValueError:
+                            pass
+                    value.append(STRING_ESCAPES.get(escape, escape))
+                    i += 2
+                else:
+                    value.append(rule[i])
+                    i += 1
+            yield '"' + "".join(value) + '"'
+            i += 1
+        else:
+            start = i
+            while i < length and not rule[i].isspace() and rule[i] not in '{}"':
+                i += 1
+            yield rule[start:i]
+
+
+def _read_values(tokens: List[str], position: int) -> Tuple[Optional[str], List[str], int]:
+    """Read a single value or a (possibly operator prefixed) { ... } set
+
+    Returns:
+        Tuple[Optional[str], List[str], int]: the set operator if one was
+            given, the values and the position after them
+    """
+    operator = None
+    if position < len(tokens) and (
+        tokens[position] in SET_OPERATORS
+        or (tokens[position] != "{" and position + 1 < len(tokens) and tokens[position + 1] == "{")
+    ):
+        # An unknown word before a set is still its operator
+        operator = tokens[position]
+        position += 1
+    if position < len(tokens) and tokens[position] == "{":
+        values = []
+        position += 1
+        while position < len(tokens) and tokens[position] != "}":
+            values.append(tokens[position])
+            position += 1
+        return operator, values, position + 1
+    if position < len(tokens):
+        return operator, [tokens[position]], position + 1
+    return operator, [], position
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+        return value[1:-1]
+    return value
+
+
+def parse_rule(rule: str, device_id: str = "") -> Optional[USBDevice]:
+    """Parse a rule such as `allow id 1d6b:0002 serial "..." name "..."`
+
+    Returns:
+        Optional[USBDevice]: the parsed record, or None if the rule has no target
+    """
+    tokens = list(tokenize(rule))
+    if not tokens or tokens[0] not in RULE_TARGETS:
+        return None
+
+    device = USBDevice(device_id, sys.intern(tokens[0]), rule)
+    position = 1
+    while position < len(tokens):
+        keyword = tokens[position]
+        if keyword == "if":
+            # Conditions don't describe the device
+            break
+        operator, values, position = _read_values(tokens, position + 1)
+        if not values:
+            break
+
+        if keyword == "id":
+            values = [value.lower() for value in values]
+            vendor, _, product = values[0].partition(":")
+            device.vendor_id = sys.intern(vendor)
+            device.product_id = sys.intern(product)
+        elif keyword == "with-interface":
+            values = [sys.intern(value.lower()) for value in values]
+            device.interfaces = tuple(values)
+        elif keyword in DEVICE_ATTRIBUTES:
+            values = [_unquote(value) for value in values]
+            setattr(device, DEVICE_ATTRIBUTES[keyword], values[0])
+        else:
+            continue
+        device.conditions[keyword] = (operator, tuple(values))
+    return device
+
+
+def parse_device_line(line: str) -> Optional[USBDevice]:
+    """Parse a `usbguard list-devices`/`list-rules` line (`<id>: <rule>`)"""
+    device_id, separator, rule = line.strip().partition(":")
+    if not separator or not device_id.isdigit():
+        return None
+    return parse_rule(rule.strip(), device_id)
+
+
+def parse_device_lines(lines) -> List[USBDevice]:
+    """Parse every valid line of a device or rule listing"""
+    devices = []
+    for line in lines:
+        device = parse_device_line(line)
+        if device is not None:
+            devices.append(device)
+    return devices
+
+
+def is_permanently_allowed(device: USBDevice, rules: List[USBDevice]) -> bool:
+    """Whether an allow rule in the policy matches the device"""
+    return any(rule.target == "allow" and device.matches(rule) for rule in rules)
+
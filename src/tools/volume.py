@@ -1,21 +1,53 @@
 #!/usr/bin/env python3
 
 import subprocess
-from typing import List, Dict, Optional
+from typing import Any, Callable, List, Dict, Optional
 import re
 
+from utils.commands import get_command_runner
 from utils.logger import LogLevel, Logger
 
 
+def _get_list_entry(list_args: List[str], header: str, logging: Logger) -> str:
+    """One entry of a pactl list: its header line and the 15 lines after it"""
+    lines = get_command_runner(logging).getoutput(list_args).split("\n")
+    for i, line in enumerate(lines):
+        if line.strip() == header:
+            return "\n".join(lines[i:i + 16])
+    return ""
+
+
+def _query_async(args: List[str], parse: Callable[[str], Any], logging: Logger,
+                 callback: Callable[[Any], None]) -> None:
+    """Run a pactl query on the command pool and pass the parsed output to callback
+
+    The callback runs on the main thread. A command that failed, timed out
+    or doesn't exist is parsed as empty output.
+    """
+    def on_result(result):
+        callback(parse(result.stdout if result.returncode == 0 else ""))
+
+    get_command_runner(logging).run_async(args, on_result)
+
+
 def get_volume(logging: Logger) -> int:
     """Get current volume level
 
     Returns:
         int: Volume percentage
     """
-    try:
-        output = subprocess.getoutput("pactl get-sink-volume @DEFAULT_SINK@")
+    output = get_command_runner(logging).getoutput(["pactl", "get-sink-volume", "@DEFAULT_SINK@"])
+    return _parse_volume(output, logging)
+
 
+def get_volume_async(logging: Logger, callback: Callable[[int], None]) -> None:
+    """get_volume without blocking, the volume is passed to callback"""
+    _query_async(["pactl", "get-sink-volume", "@DEFAULT_SINK@"],
+                 lambda output: _parse_volume(output, logging), logging, callback)
+
+
+def _parse_volume(output: str, logging: Logger) -> int:
+    try:
         if output == "":
             logging.log(LogLevel.Error, "pactl couldnt get volume!")
             return 0
@@ -34,7 +66,7 @@ def set_volume(value: int, logging: Logger) -> None:
         value (int): Volume percentage
     """
     try:
-        subprocess.run(
+        get_command_runner(logging).run(
             ["pactl", "set-sink-volume", "@DEFAULT_SINK@", f"{value}%"], check=True
         )
     except subprocess.CalledProcessError as e:
@@ -48,17 +80,32 @@ def get_mute_state(logging: Logger) -> bool:
         bool: True if muted, False otherwise
     """
     try:
-        output = subprocess.getoutput("pactl get-sink-mute @DEFAULT_SINK@")
+        output = get_command_runner(logging).getoutput(["pactl", "get-sink-mute", "@DEFAULT_SINK@"])
         return "yes" in output.lower()
     except Exception as e:
         logging.log(LogLevel.Error, f"Failed getting mute state: {e}")
         return False
 
 
+def get_mute_state_async(logging: Logger, callback: Callable[[bool], None]) -> None:
+    """get_mute_state without blocking, the state is passed to callback"""
+    _query_async(["pactl", "get-sink-mute", "@DEFAULT_SINK@"], lambda output: "yes" in output.lower(),
+                 logging, callback)
+
+
+def get_default_device_async(device: str, logging: Logger, callback: Callable[[str], None]) -> None:
+    """Name of the default sink or source, without blocking
+
+    Args:
+        device (str): "sink" or "source"
+    """
+    _query_async(["pactl", f"get-default-{device}"], str.strip, logging, callback)
+
+
 def toggle_mute(logging: Logger) -> None:
     """Toggle mute state"""
     try:
-        subprocess.run(
+        get_command_runner(logging).run(
             ["pactl", "set-sink-mute", "@DEFAULT_SINK@", "toggle"], check=True
         )
     except subprocess.CalledProcessError as e:
@@ -71,8 +118,17 @@ def get_sources(logging: Logger) -> List[Dict[str, str]]:
     Returns:
         List[Dict[str, str]]: List of source dictionaries
     """
+    output = get_command_runner(logging).getoutput(["pactl", "list", "sources"])
+    return _parse_sources(output, logging)
+
+
+def get_sources_async(logging: Logger, callback: Callable[[List[Dict[str, str]]], None]) -> None:
+    """get_sources without blocking, the list is passed to callback"""
+    _query_async(["pactl", "list", "sources"], lambda output: _parse_sources(output, logging), logging, callback)
+
+
+def _parse_sources(output: str, logging: Logger) -> List[Dict[str, str]]:
     try:
-        output = subprocess.getoutput("pactl list sources")
         sources = []
         current_source = {}
         for line in output.split("\n"):
@@ -104,13 +160,23 @@ def get_applications(logging: Logger) -> List[Dict[str, str]]:
     Returns:
         List[Dict[str, str]]: List of application dictionaries
     """
-    output = subprocess.getoutput("pactl list sink-inputs")
+    output = get_command_runner(logging).getoutput(["pactl", "list", "sink-inputs"])
+    return _parse_applications(output, logging)
+
+
+def get_applications_async(logging: Logger, callback: Callable[[List[Dict[str, str]]], None]) -> None:
+    """get_applications without blocking, the list is passed to callback"""
+    _query_async(["pactl", "list", "sink-inputs"], lambda output: _parse_applications(output, logging),
+                 logging, callback)
+
+
+def _parse_applications(output: str, logging: Logger) -> List[Dict[str, str]]:
     apps = []
     current_app = {}
 
     for line in output.split("\n"):
         line = line.strip()
-        logging.log(LogLevel.Debug, f"Parsing Line: {line}")
+        logging.log(LogLevel.Debug, "Parsing Line: %s", line)
 
         # Handle new application entry
         if line.startswith("Sink Input #"):
@@ -120,27 +186,27 @@ def get_applications(logging: Logger) -> List[Dict[str, str]]:
             # Start new app entry
             current_app = {"id": line.split("#")[1].strip()}
             logging.log(
-                LogLevel.Debug, f"New app detected with ID: {current_app['id']}"
+                LogLevel.Debug, "New app detected with ID: %s", current_app['id']
             )
 
         # Handle application name
         elif "application.name" in line:
             current_app["name"] = line.split("=", 1)[1].strip().strip('"')
             logging.log(
-                LogLevel.Debug, f"Detected & Stored App Name: {current_app['name']}"
+                LogLevel.Debug, "Detected & Stored App Name: %s", current_app['name']
             )
 
         # Handle media name as fallback
         elif "media.name" in line and "name" not in current_app:
             current_app["name"] = line.split("=", 1)[1].strip().strip('"')
-            logging.log(LogLevel.Debug, f"Using Media Name: {current_app['name']}")
+            logging.log(LogLevel.Debug, "Using Media Name: %s", current_app['name'])
 
         # Handle binary information
         elif "application.process.binary" in line:
             current_app["binary"] = line.split("=", 1)[1].strip().strip('"')
             logging.log(
                 LogLevel.Debug,
-                f"Detected & Stored Process Binary: {current_app['binary']}",
+                "Detected & Stored Process Binary: %s", current_app['binary'],
             )
 
             # Try to determine an appropriate icon name based on the binary
@@ -152,27 +218,31 @@ def get_applications(logging: Logger) -> List[Dict[str, str]]:
         elif "application.icon_name" in line:
             current_app["icon"] = line.split("=", 1)[1].strip().strip('"')
             logging.log(
-                LogLevel.Debug, f"Detected & Stored App Icon: {current_app['icon']}"
+                LogLevel.Debug, "Detected & Stored App Icon: %s", current_app['icon']
             )
 
         # Handle volume info
         elif "Volume:" in line:
-            logging.log(LogLevel.Debug, f"Found Volume Line: {line}")
+            logging.log(LogLevel.Debug, "Found Volume Line: %s", line)
             match = re.search(r"(\d+)%", line)
             if match:
                 current_app["volume"] = int(match.group(1))  # type: ignore
                 logging.log(
-                    LogLevel.Debug, f"Detected & Stored Volume: {current_app['volume']}"
+                    LogLevel.Debug, "Detected & Stored Volume: %s", current_app['volume']
                 )
             else:
-                logging.log(LogLevel.Debug, f"Failed to parse volume from: {line}")
+                logging.log(LogLevel.Debug, "Failed to parse volume from: %s", line)
+
+        # Handle mute state
+        elif line.startswith("Mute:"):
+            current_app["muted"] = "yes" in line.lower()  # type: ignore
 
         # Handle sink info
         elif "Sink:" in line:
             sink_id = line.split(":")[1].strip()
             current_app["sink"] = sink_id
             logging.log(
-                LogLevel.Debug, f"Detected & Stored Sink ID: {current_app['sink']}"
+                LogLevel.Debug, "Detected & Stored Sink ID: %s", current_app['sink']
             )
 
     # Process the final app entry
@@ -183,7 +253,7 @@ def get_applications(logging: Logger) -> List[Dict[str, str]]:
 
     logging.log(
         LogLevel.Debug,
-        f"Parsed Applications: {apps}",
+        "Parsed Applications: %s", apps,
     )
     return apps
 
@@ -193,7 +263,7 @@ def _finalize_app(current_app: Dict[str, str], apps: List[Dict[str, str]], loggi
     if not current_app:
         return
 
-    logging.log(LogLevel.Debug, f"Finalizing app: {current_app}")
+    logging.log(LogLevel.Debug, "Finalizing app: %s", current_app)
 
     if "name" in current_app and "volume" in current_app:
         apps.append(current_app)
@@ -225,7 +295,7 @@ def get_sink_name_by_id(sink_id: str, logging: Logger) -> str:
         str: The sink name
     """
     try:
-        output = subprocess.getoutput("pactl list sinks short")
+        output = get_command_runner(logging).getoutput(["pactl", "list", "sinks", "short"])
         for line in output.split("\n"):
             parts = line.split()
             if parts and parts[0] == sink_id:
@@ -244,7 +314,7 @@ def set_application_volume(app_id: str, value: int, logging: Logger) -> None:
         value (int): Volume percentage
     """
     try:
-        subprocess.run(
+        get_command_runner(logging).run(
             ["pactl", "set-sink-input-volume", app_id, f"{value}%"], check=True
         )
     except subprocess.CalledProcessError as e:
@@ -259,21 +329,21 @@ def move_application_to_sink(app_id: str, sink_name: str, logging: Logger) -> No
         sink_name (str): Name of the sink to move the application to
     """
     try:
-        subprocess.run(["pactl", "move-sink-input", app_id, sink_name], check=True)
+        get_command_runner(logging).run(["pactl", "move-sink-input", app_id, sink_name], check=True)
     except subprocess.CalledProcessError as e:
         logging.log(LogLevel.Error, f"Failed moving application to sink: {e}")
 
 
 def set_default_sink(sink_name: str, logging: Logger) -> None:
     try:
-        subprocess.run(["pactl", "set-default-sink", sink_name], check=True)
+        get_command_runner(logging).run(["pactl", "set-default-sink", sink_name], check=True)
 
         # Move all running apps to the new sink
-        output = subprocess.getoutput("pactl list short sink-inputs")
+        output = get_command_runner(logging).getoutput(["pactl", "list", "short", "sink-inputs"])
         for line in output.split("\n"):
             if line.strip():
                 app_id = line.split()[0]
-                subprocess.run(
+                get_command_runner(logging).run(
                     ["pactl", "move-sink-input", app_id, sink_name], check=True
                 )
 
@@ -297,8 +367,17 @@ def get_sinks(logging: Logger) -> List[Dict[str, str]]:
     Returns:
         List[Dict[str, str]]: List of sinks with keys: id, name, description
     """
+    output = get_command_runner(logging).getoutput(["pactl", "list", "sinks"])
+    return _parse_sinks(output, logging)
+
+
+def get_sinks_async(logging: Logger, callback: Callable[[List[Dict[str, str]]], None]) -> None:
+    """get_sinks without blocking, the list is passed to callback"""
+    _query_async(["pactl", "list", "sinks"], lambda output: _parse_sinks(output, logging), logging, callback)
+
+
+def _parse_sinks(output: str, logging: Logger) -> List[Dict[str, str]]:
     try:
-        output = subprocess.getoutput("pactl list sinks")
         sinks = []
         current_sink = {}
 
@@ -332,7 +411,7 @@ def set_default_source(source_name: str, logging: Logger) -> None:
         source_name (str): Source name
     """
     try:
-        subprocess.run(["pactl", "set-default-source", source_name], check=True)
+        get_command_runner(logging).run(["pactl", "set-default-source", source_name], check=True)
     except subprocess.CalledProcessError as e:
         logging.log(LogLevel.Error, f"Failed setting default source: {e}")
 
@@ -343,8 +422,18 @@ def get_mic_volume(logging: Logger) -> int:
     Returns:
         int: Volume percentage
     """
+    output = get_command_runner(logging).getoutput(["pactl", "get-source-volume", "@DEFAULT_SOURCE@"])
+    return _parse_mic_volume(output, logging)
+
+
+def get_mic_volume_async(logging: Logger, callback: Callable[[int], None]) -> None:
+    """get_mic_volume without blocking, the volume is passed to callback"""
+    _query_async(["pactl", "get-source-volume", "@DEFAULT_SOURCE@"],
+                 lambda output: _parse_mic_volume(output, logging), logging, callback)
+
+
+def _parse_mic_volume(output: str, logging: Logger) -> int:
     try:
-        output = subprocess.getoutput("pactl get-source-volume @DEFAULT_SOURCE@")
         volume = int(output.split("/")[1].strip().strip("%"))
         return volume
     except Exception as e:
@@ -359,7 +448,7 @@ def set_mic_volume(value: int, logging: Logger) -> None:
         value (int): Volume percentage
     """
     try:
-        subprocess.run(
+        get_command_runner(logging).run(
             ["pactl", "set-source-volume", "@DEFAULT_SOURCE@", f"{value}%"], check=True
         )
     except subprocess.CalledProcessError as e:
@@ -373,17 +462,23 @@ def get_mic_mute_state(logging: Logger) -> bool:
         bool: True if muted, False otherwise
     """
     try:
-        output = subprocess.getoutput("pactl get-source-mute @DEFAULT_SOURCE@")
+        output = get_command_runner(logging).getoutput(["pactl", "get-source-mute", "@DEFAULT_SOURCE@"])
         return "yes" in output.lower()
     except Exception as e:
         logging.log(LogLevel.Error, f"Failed getting mic mute state: {e}")
         return False
 
 
+def get_mic_mute_state_async(logging: Logger, callback: Callable[[bool], None]) -> None:
+    """get_mic_mute_state without blocking, the state is passed to callback"""
+    _query_async(["pactl", "get-source-mute", "@DEFAULT_SOURCE@"], lambda output: "yes" in output.lower(),
+                 logging, callback)
+
+
 def toggle_mic_mute(logging: Logger) -> None:
     """Toggle microphone mute state"""
     try:
-        subprocess.run(
+        get_command_runner(logging).run(
             ["pactl", "set-source-mute", "@DEFAULT_SOURCE@", "toggle"], check=True
         )
     except subprocess.CalledProcessError as e:
@@ -400,9 +495,7 @@ def get_application_mute_state(app_id: str, logging: Logger) -> bool:
         bool: True if muted, False otherwise
     """
     try:
-        output = subprocess.getoutput(
-            f"pactl list sink-inputs | grep -A 15 'Sink Input #{app_id}'"
-        )
+        output = _get_list_entry(["pactl", "list", "sink-inputs"], f"Sink Input #{app_id}", logging)
         return "Mute: yes" in output
     except Exception as e:
         logging.log(LogLevel.Error, f"Failed getting application mute state: {e}")
@@ -416,7 +509,7 @@ def toggle_application_mute(app_id: str, logging: Logger) -> None:
         app_id (str): Application sink input ID
     """
     try:
-        subprocess.run(["pactl", "set-sink-input-mute", app_id, "toggle"], check=True)
+        get_command_runner(logging).run(["pactl", "set-sink-input-mute", app_id, "toggle"], check=True)
     except subprocess.CalledProcessError as e:
         logging.log(LogLevel.Error, f"Failed toggling application mute: {e}")
 
@@ -428,13 +521,19 @@ def get_source_outputs(logging: Logger) -> List[Dict[str, str]]:
         List[Dict[str, str]]: List of source output dictionaries
     """
     try:
-        output = subprocess.getoutput("pactl list source-outputs")
+        output = get_command_runner(logging).getoutput(["pactl", "list", "source-outputs"])
         return _parse_source_outputs(output, logging)
     except Exception as e:
         logging.log(LogLevel.Error, f"Failed getting source outputs: {e}")
         return []
 
 
+def get_source_outputs_async(logging: Logger, callback: Callable[[List[Dict[str, str]]], None]) -> None:
+    """get_source_outputs without blocking, the list is passed to callback"""
+    _query_async(["pactl", "list", "source-outputs"], lambda output: _parse_source_outputs(output, logging),
+                 logging, callback)
+
+
 def _parse_source_outputs(output: str, logging: Logger) -> List[Dict[str, str]]:
     """Parse source outputs from pactl output
 
@@ -452,14 +551,14 @@ def _parse_source_outputs(output: str, logging: Logger) -> List[Dict[str, str]]:
 
     for line in output.split("\n"):
         line = line.strip()
-        logging.log(LogLevel.Debug, f"Parsing source output line: {line}")
+        logging.log(LogLevel.Debug, "Parsing source output line: %s", line)
 
         if line.startswith("Source Output #"):
             _process_current_output(current_output, outputs, logging)
             current_output = {"id": line.split("#")[1].strip()}
             logging.log(
                 LogLevel.Debug,
-                f"New source output detected with ID: {current_output['id']}",
+                "New source output detected with ID: %s", current_output['id'],
             )
 
         elif "application.name" in line:
@@ -475,22 +574,31 @@ def _parse_source_outputs(output: str, logging: Logger) -> List[Dict[str, str]]:
             current_output["icon"] = line.split("=", 1)[1].strip().strip('"')
             logging.log(
                 LogLevel.Debug,
-                f"Detected & Stored Source Output Icon: {current_output['icon']}",
+                "Detected & Stored Source Output Icon: %s", current_output['icon'],
             )
 
         elif "Mute:" in line:
             current_output["muted"] = "yes" in line.lower()  # type: ignore
             logging.log(
                 LogLevel.Debug,
-                f"Detected & Stored Source Output Mute State: {current_output['muted']}",
+                "Detected & Stored Source Output Mute State: %s", current_output['muted'],
             )
 
+        elif line.startswith("Volume:") and "volume" not in current_output:
+            match = re.search(r"(\d+)%", line)
+            if match:
+                current_output["volume"] = int(match.group(1))  # type: ignore
+                logging.log(
+                    LogLevel.Debug,
+                    "Detected & Stored Source Output Volume: %s", current_output['volume'],
+                )
+
         elif "Source:" in line:
             source_id = line.split(":")[1].strip()
             current_output["source"] = source_id
             logging.log(
                 LogLevel.Debug,
-                f"Detected & Stored Source ID: {current_output['source']}",
+                "Detected & Stored Source ID: %s", current_output['source'],
             )
 
     # Process final output
@@ -499,7 +607,7 @@ def _parse_source_outputs(output: str, logging: Logger) -> List[Dict[str, str]]:
     # Ensure all outputs have icon information
     _ensure_output_icons(outputs)
 
-    logging.log(LogLevel.Debug, f"Parsed Source Outputs: {outputs}")
+    logging.log(LogLevel.Debug, "Parsed Source Outputs: %s", outputs)
     return outputs
 
 
@@ -508,14 +616,14 @@ def _process_current_output(current_output: Dict, outputs: List[Dict], logging:
     if not current_output:
         return
 
-    logging.log(LogLevel.Debug, f"Finalizing source output: {current_output}")
+    logging.log(LogLevel.Debug, "Finalizing source output: %s", current_output)
     if "id" in current_output and "name" in current_output:
         # Add current output to the list
         outputs.append(current_output)
     else:
         logging.log(
             LogLevel.Debug,
-            f"Skipping source output due to missing id or name: {current_output}",
+            "Skipping source output due to missing id or name: %s", current_output,
         )
 
 
@@ -530,14 +638,14 @@ def _process_app_name(current_output: Dict, line: str, seen_apps: Dict, logging:
         current_output["name"] = f"{app_name} ({seen_apps[app_name]})"
         logging.log(
             LogLevel.Debug,
-            f"Multiple instances detected, renamed to: {current_output['name']}",
+            "Multiple instances detected, renamed to: %s", current_output['name'],
         )
     else:
         seen_apps[app_name] = 1
         current_output["name"] = app_name
         logging.log(
             LogLevel.Debug,
-            f"Detected & Stored Source Output Name: {current_output['name']}",
+            "Detected & Stored Source Output Name: %s", current_output['name'],
         )
 
     # Store original name for icon lookup
@@ -555,14 +663,14 @@ def _process_media_name(current_output: Dict, line: str, seen_apps: Dict, loggin
         current_output["name"] = f"{media_name} ({seen_apps[media_name]})"
         logging.log(
             LogLevel.Debug,
-            f"Multiple instances detected, renamed to: {current_output['name']}",
+            "Multiple instances detected, renamed to: %s", current_output['name'],
         )
     else:
         seen_apps[media_name] = 1
         current_output["name"] = media_name
         logging.log(
             LogLevel.Debug,
-            f"Using Media Name for Source Output: {current_output['name']}",
+            "Using Media Name for Source Output: %s", current_output['name'],
         )
 
     # Store original name for icon lookup
@@ -574,7 +682,7 @@ def _process_binary(current_output: Dict, line: str, logging: Logger) -> None:
     current_output["binary"] = line.split("=", 1)[1].strip().strip('"')
     logging.log(
         LogLevel.Debug,
-        f"Detected & Stored Source Output Process Binary: {current_output['binary']}",
+        "Detected & Stored Source Output Process Binary: %s", current_output['binary'],
     )
 
     # Try to determine an appropriate icon name based on the binary
@@ -607,9 +715,7 @@ def get_application_mic_mute_state(app_id: str, logging: Logger) -> bool:
         bool: True if muted, False otherwise
     """
     try:
-        output = subprocess.getoutput(
-            f"pactl list source-outputs | grep -A 15 'Source Output #{app_id}'"
-        )
+        output = _get_list_entry(["pactl", "list", "source-outputs"], f"Source Output #{app_id}", logging)
         return "Mute: yes" in output
     except Exception as e:
         logging.log(LogLevel.Error, f"Failed getting application mic mute state: {e}")
@@ -623,7 +729,7 @@ def toggle_application_mic_mute(app_id: str, logging: Logger) -> None:
         app_id (str): Application source output ID
     """
     try:
-        subprocess.run(
+        get_command_runner(logging).run(
             ["pactl", "set-source-output-mute", app_id, "toggle"], check=True
         )
     except subprocess.CalledProcessError as e:
@@ -640,9 +746,7 @@ def get_application_mic_volume(app_id: str, logging: Logger) -> int:
         int: Volume percentage
     """
     try:
-        output = subprocess.getoutput(
-            f"pactl list source-outputs | grep -A 15 'Source Output #{app_id}'"
-        )
+        output = _get_list_entry(["pactl", "list", "source-outputs"], f"Source Output #{app_id}", logging)
 
         # Find volume line
         for line in output.split("\n"):
@@ -667,7 +771,7 @@ def set_application_mic_volume(app_id: str, value: int, logging: Logger) -> None
         value (int): Volume percentage
     """
     try:
-        subprocess.run(
+        get_command_runner(logging).run(
             ["pactl", "set-source-output-volume", app_id, f"{value}%"], check=True
         )
     except subprocess.CalledProcessError as e:
@@ -680,7 +784,7 @@ def get_active_sink(logging: Logger) -> Optional[Dict[str, str]]:
         Optional[Dict[str, str]]: Active sink info or None if not available
     """
     try:
-        sink_name = subprocess.getoutput("pactl get-default-sink").strip()
+        sink_name = get_command_runner(logging).getoutput(["pactl", "get-default-sink"]).strip()
         if not sink_name:
             return None
             
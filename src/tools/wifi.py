@@ -1,15 +1,25 @@
 #!/usr/bin/env python3
 
-from pathlib import Path
-import qrcode
+from collections import OrderedDict
+import hashlib
 import subprocess
-from typing import List, Dict
+from typing import Callable, List, Dict, Tuple
 
-import qrcode.constants
+from utils.commands import get_command_runner
 from utils.logger import LogLevel, Logger
 import time
 import threading
 
+# nmcli itself gives up on activating a connection after 90s
+CONNECT_TIMEOUT = 95
+
+NM_SERVICE = "org.freedesktop.NetworkManager"
+NM_SETTINGS_INTERFACE = "org.freedesktop.NetworkManager.Settings"
+NM_CONNECTION_INTERFACE = "org.freedesktop.NetworkManager.Settings.Connection"
+# Pixels per QR module, and how many rendered codes are kept
+QR_BOX_SIZE = 6
+QR_CACHE_SIZE = 8
+
 
 def get_wifi_status(logging: Logger) -> bool:
     """Get WiFi power status
@@ -18,8 +28,8 @@ def get_wifi_status(logging: Logger) -> bool:
         bool: True if WiFi is enabled, False otherwise
     """
     try:
-        result = subprocess.run(
-            ["nmcli", "radio", "wifi"], capture_output=True, text=True
+        result = get_command_runner(logging).run(
+            ["nmcli", "radio", "wifi"]
         )
         return result.stdout.strip().lower() == "enabled"
     except Exception as e:
@@ -35,7 +45,7 @@ def set_wifi_power(enabled: bool, logging: Logger) -> None:
     """
     try:
         state = "on" if enabled else "off"
-        subprocess.run(["nmcli", "radio", "wifi", state], check=True)
+        get_command_runner(logging).run(["nmcli", "radio", "wifi", state], check=True)
     except subprocess.CalledProcessError as e:
         logging.log(LogLevel.Error, f"Failed setting WiFi power: {e}")
 
@@ -48,10 +58,8 @@ def get_wifi_networks(logging: Logger) -> List[Dict[str, str]]:
     """
     try:
         # Check if WiFi is supported on this system
-        result = subprocess.run(
+        result = get_command_runner(logging).run(
             ["nmcli", "-t", "-f", "DEVICE,TYPE", "device"],
-            capture_output=True,
-            text=True,
         )
         wifi_interfaces = [line for line in result.stdout.split("\n") if "wifi" in line]
         if not wifi_interfaces:
@@ -59,7 +67,7 @@ def get_wifi_networks(logging: Logger) -> List[Dict[str, str]]:
             return []
 
         # Use --terse mode and specific fields for more reliable parsing
-        result = subprocess.run(
+        result = get_command_runner(logging).run(
             [
                 "nmcli",
                 "-t",
@@ -69,8 +77,8 @@ def get_wifi_networks(logging: Logger) -> List[Dict[str, str]]:
                 "wifi",
                 "list",
             ],
-            capture_output=True,
-            text=True,
+            # Listing can trigger a rescan
+            timeout=15,
         )
         output = result.stdout
         networks = []
@@ -110,8 +118,8 @@ def get_connection_info(ssid: str, logging: Logger) -> Dict[str, str]:
         Dict[str, str]: Dictionary containing connection information
     """
     try:
-        result = subprocess.run(
-            ["nmcli", "-t", "--show-secrets", "connection", "show", ssid], capture_output=True, text=True
+        result = get_command_runner(logging).run(
+            ["nmcli", "-t", "--show-secrets", "connection", "show", ssid]
         )
         output = result.stdout
         info = {}
@@ -158,8 +166,7 @@ def _connect_with_password(ssid: str, password: str, remember: bool, logging: Lo
 
         # First, try to delete any existing connection with this name to avoid conflicts
         try:
-            delete_cmd = f'nmcli connection delete "{ssid}"'
-            subprocess.run(delete_cmd, shell=True, capture_output=True, text=True)
+            get_command_runner(logging).run(["nmcli", "connection", "delete", ssid])
             logging.log(LogLevel.Debug, f"Removed any existing connection named '{ssid}'")
         except Exception as e:
             # It's fine if this fails - might not exist yet
@@ -169,10 +176,13 @@ def _connect_with_password(ssid: str, password: str, remember: bool, logging: Lo
         conn_name = f"{ssid}-temp" if not remember else ssid
 
         # Create new connection with explicit security settings
-        cmd_str = f'nmcli connection add con-name "{conn_name}" type wifi ssid "{ssid}" wifi-sec.key-mgmt wpa-psk wifi-sec.psk "{password}"'
+        cmd = [
+            "nmcli", "connection", "add", "con-name", conn_name, "type", "wifi", "ssid", ssid,
+            "wifi-sec.key-mgmt", "wpa-psk", "wifi-sec.psk", password,
+        ]
         logging.log(LogLevel.Debug, f"Creating connection with command (password masked): nmcli connection add con-name \"{conn_name}\" type wifi ssid \"{ssid}\" wifi-sec.key-mgmt wpa-psk wifi-sec.psk ********")
 
-        result = subprocess.run(cmd_str, capture_output=True, text=True, shell=True)
+        result = get_command_runner(logging).run(cmd)
 
         # Log the result
         if result.stdout:
@@ -197,8 +207,9 @@ def _activate_connection(conn_name: str, ssid: str, remember: bool, logging: Log
     logging.log(LogLevel.Info, f"Created connection profile for {ssid}, now connecting...")
 
     # Connect to the newly created connection
-    up_cmd = f'nmcli connection up "{conn_name}"'
-    up_result = subprocess.run(up_cmd, capture_output=True, text=True, shell=True)
+    up_result = get_command_runner(logging).run(
+        ["nmcli", "connection", "up", conn_name], timeout=CONNECT_TIMEOUT
+    )
 
     # Log the connection result
     if up_result.stdout:
@@ -223,8 +234,7 @@ def _schedule_connection_cleanup(conn_name: str, logging: Logger) -> None:
     def delete_later():
         try:
             time.sleep(2)  # Give it a moment to connect fully
-            delete_cmd = f'nmcli connection delete "{conn_name}"'
-            subprocess.run(delete_cmd, shell=True)
+            get_command_runner(logging).run(["nmcli", "connection", "delete", conn_name])
             logging.log(LogLevel.Debug, f"Removed temporary connection {conn_name}")
         except Exception as e:
             logging.log(LogLevel.Error, f"Failed to remove temporary connection: {e}")
@@ -236,12 +246,12 @@ def _schedule_connection_cleanup(conn_name: str, logging: Logger) -> None:
 
 def _try_fallback_connection(ssid: str, password: str, remember: bool, logging: Logger) -> bool:
     """Try the simpler device wifi connect approach as fallback"""
-    fallback_cmd = f'nmcli device wifi connect "{ssid}" password "{password}"'
+    fallback_cmd = ["nmcli", "device", "wifi", "connect", ssid, "password", password]
     if not remember:
-        fallback_cmd += " --temporary"
+        fallback_cmd.append("--temporary")
 
     logging.log(LogLevel.Debug, f"Trying fallback connection method (password masked): nmcli device wifi connect \"{ssid}\" password ********")
-    fallback_result = subprocess.run(fallback_cmd, capture_output=True, text=True, shell=True)
+    fallback_result = get_command_runner(logging).run(fallback_cmd, timeout=CONNECT_TIMEOUT)
 
     if fallback_result.returncode == 0:
         logging.log(LogLevel.Info, f"Connected to {ssid} using fallback method")
@@ -254,9 +264,7 @@ def _try_fallback_connection(ssid: str, password: str, remember: bool, logging:
 def _connect_without_password(ssid: str, remember: bool, logging: Logger) -> bool:
     """Connect to a network without providing a password (using saved credentials)"""
     try:
-        # Use shell=True with quoted SSID
-        cmd_str = f'nmcli con up "{ssid}"'
-        result = subprocess.run(cmd_str, capture_output=True, text=True, shell=True)
+        result = get_command_runner(logging).run(["nmcli", "con", "up", ssid], timeout=CONNECT_TIMEOUT)
 
         # Log all output
         if result.stdout:
@@ -286,12 +294,12 @@ def _connect_without_password(ssid: str, remember: bool, logging: Logger) -> boo
 
 def _try_direct_connection(ssid: str, remember: bool, logging: Logger) -> bool:
     """Try connecting directly to a network"""
-    cmd_str = f'nmcli device wifi connect "{ssid}"'
+    cmd = ["nmcli", "device", "wifi", "connect", ssid]
     if not remember:
-        cmd_str += " --temporary"
+        cmd.append("--temporary")
 
-    logging.log(LogLevel.Debug, f"Attempting direct connection using command: {cmd_str}")
-    result = subprocess.run(cmd_str, capture_output=True, text=True, shell=True)
+    logging.log(LogLevel.Debug, f"Attempting direct connection using command: {' '.join(cmd)}")
+    result = get_command_runner(logging).run(cmd, timeout=CONNECT_TIMEOUT)
 
     # Log all output
     if result.stdout:
@@ -318,7 +326,7 @@ def disconnect_network(ssid: str, logging: Logger) -> bool:
         bool: True if disconnection successful, False otherwise
     """
     try:
-        subprocess.run(["nmcli", "connection", "down", ssid], check=True)
+        get_command_runner(logging).run(["nmcli", "connection", "down", ssid], check=True)
         return True
     except subprocess.CalledProcessError as e:
         logging.log(LogLevel.Error, f"Failed disconnecting from network: {e}")
@@ -335,7 +343,7 @@ def forget_network(ssid: str, logging: Logger) -> bool:
         bool: True if removal successful, False otherwise
     """
     try:
-        subprocess.run(["nmcli", "connection", "delete", ssid], check=True)
+        get_command_runner(logging).run(["nmcli", "connection", "delete", ssid], check=True)
         return True
     except subprocess.CalledProcessError as e:
         logging.log(LogLevel.Error, f"Failed removing network: {e}")
@@ -350,10 +358,8 @@ def get_network_speed(logging: Logger) -> Dict[str, float]:
     """
     try:
         # Get WiFi interface name
-        result = subprocess.run(
+        result = get_command_runner(logging).run(
             ["nmcli", "-t", "-f", "DEVICE,TYPE", "device"],
-            capture_output=True,
-            text=True,
         )
         output = result.stdout
         wifi_lines = [line for line in output.split("\n") if "wifi" in line]
@@ -375,54 +381,163 @@ def get_network_speed(logging: Logger) -> Dict[str, float]:
         logging.log(LogLevel.Error, f"Failed getting network speed: {e}")
         return {"rx_bytes": 0, "tx_bytes": 0, "wifi_supported": False}
 
-def generate_wifi_qrcode(ssid: str, password: str, security: str, logging:Logger) -> str:
-    """Generate qr_code for the wifi
+class WifiShareCache:
+    """Connection secrets and QR codes for the share dialog
 
-    Returns:
-        str: path to generated qr code image
+    QR codes are rendered straight to a GdkPixbuf and kept in a small LRU
+    keyed by (ssid, security, password hash), so a changed password can
+    never be served an old code. Connection info from nmcli --show-secrets
+    is kept per SSID, but only while NetworkManager's profile change
+    signals are being watched: any Updated or removed profile drops both
+    caches, so reopening the dialog after editing a network shows the new
+    password.
     """
-    # Define temp_dir at the beginning to avoid 'possibly unbound' error
-    temp_dir = Path("/tmp/better-control")
 
-    try:
-        temp_dir.mkdir(parents=True, exist_ok=True)
+    def __init__(self, logging: Logger):
+        self.logging = logging
+        self._infos: Dict[str, Dict[str, str]] = {}
+        self._pixbufs: "OrderedDict[Tuple[str, str, str], object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._watching = self._watch_profiles()
+
+    def _watch_profiles(self) -> bool:
+        try:
+            from utils.bus import get_system_bus
+
+            bus = get_system_bus()
+            bus.add_signal_receiver(
+                lambda *args: self.invalidate(), "Updated", NM_CONNECTION_INTERFACE, NM_SERVICE
+            )
+            bus.add_signal_receiver(
+                lambda *args: self.invalidate(), "ConnectionRemoved", NM_SETTINGS_INTERFACE, NM_SERVICE
+            )
+            return True
+        except Exception as e:
+            self.logging.log(LogLevel.Warn, f"Not watching connection profiles, share info won't be cached: {e}")
+            return False
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._infos.clear()
+            self._pixbufs.clear()
+
+    def get_connection_info(self, ssid: str) -> Dict[str, str]:
+        with self._lock:
+            info = self._infos.get(ssid)
+        if info is not None:
+            return dict(info)
+
+        info = get_connection_info(ssid, self.logging)
+        if info and self._watching:
+            with self._lock:
+                self._infos[ssid] = info
+        return dict(info)
+
+    def get_qr_pixbuf(self, ssid: str, password: str, security: str):
+        """QR code for joining the network, None if it couldn't be rendered"""
+        key = (ssid, security, hashlib.sha256(password.encode()).hexdigest())
+        with self._lock:
+            pixbuf = self._pixbufs.get(key)
+            if pixbuf is not None:
+                self._pixbufs.move_to_end(key)
+                return pixbuf
+
+        pixbuf = generate_wifi_qrcode(ssid, password, security, self.logging)
+        if pixbuf is not None:
+            with self._lock:
+                self._pixbufs[key] = pixbuf
+                while len(self._pixbufs) > QR_CACHE_SIZE:
+                    self._pixbufs.popitem(last=False)
+        return pixbuf
+
+    def load_async(self, ssid: str, security: str,
+                   callback: Callable[[Dict[str, str], object], None]) -> None:
+        """Fetch the connection info and QR code off the main thread
+
+        callback(info, pixbuf) is called on the main thread.
+        """
+        from gi.repository import GLib  # type: ignore
+
+        def load():
+            try:
+                info = self.get_connection_info(ssid)
+                pixbuf = self.get_qr_pixbuf(ssid, info.get("password", ""), security)
+            except Exception as e:
+                self.logging.log(LogLevel.Error, f"Failed loading share info for {ssid}: {e}")
+                info, pixbuf = {}, None
+            GLib.idle_add(callback, info, pixbuf)
+
+        threading.Thread(target=load, daemon=True).start()
+
+
+_wifi_share_cache = None
+
+
+def get_wifi_share_cache(logging: Logger) -> WifiShareCache:
+    """Get or create the global WifiShareCache instance"""
+    global _wifi_share_cache
+    if _wifi_share_cache is None:
+        _wifi_share_cache = WifiShareCache(logging)
+    return _wifi_share_cache
+
+
+def _escape_qr_field(value: str) -> str:
+    """Escape the characters the WIFI: QR format reserves"""
+    for char in ("\\", ";", ",", ":", '"'):
+        value = value.replace(char, "\\" + char)
+    return value
+
+
+def generate_wifi_qrcode(ssid: str, password: str, security: str, logging:Logger):
+    """Generate qr_code for the wifi
 
-        qr_code_path = temp_dir / f"{ssid}.png"
-        if qr_code_path.exists():
-            logging.log(LogLevel.Info, f"found qr code for {ssid} at {qr_code_path}")
-            return str(qr_code_path)
+    Rendered in memory, nothing is written to disk. Use
+    WifiShareCache.get_qr_pixbuf to reuse codes already rendered.
 
+    Returns:
+        Optional[GdkPixbuf.Pixbuf]: the qr code image, None on failure
+    """
+    try:
         security_type = "WPA" if security.lower() != "none" else "nopass"
-        wifi_string = f"WIFI:T:{security_type};S:{ssid};P:{password};;"
+        wifi_string = f"WIFI:T:{security_type};S:{_escape_qr_field(ssid)};P:{_escape_qr_field(password)};;"
+
+        # qrcode is only needed once a code is actually shown
+        import qrcode
+        import qrcode.constants
+        from gi.repository import GdkPixbuf, GLib  # type: ignore
 
         # generate the qr code
         qr_code = qrcode.QRCode(
             version=1,
             error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=6,
+            box_size=QR_BOX_SIZE,
             border=2,
         )
         qr_code.add_data(wifi_string)
         qr_code.make(fit=True)
 
-        # create qr code image
-        qr_code_image = qr_code.make_image(fill_color="black", back_color="white")
-        # Open the file in binary write mode instead of passing a string
-        with open(qr_code_path, "wb") as f:
-            qr_code_image.save(f)
-
-        logging.log(LogLevel.Info, f"generated qr code for {ssid} at {qr_code_path}")
-        return str(qr_code_path)
+        # Modules straight to RGB rows, no PIL image or PNG round trip
+        black = b"\x00\x00\x00" * QR_BOX_SIZE
+        white = b"\xff\xff\xff" * QR_BOX_SIZE
+        rows = []
+        for matrix_row in qr_code.get_matrix():
+            row = b"".join(black if module else white for module in matrix_row)
+            rows.extend([row] * QR_BOX_SIZE)
+        size = len(rows)
+
+        pixbuf = GdkPixbuf.Pixbuf.new_from_bytes(
+            GLib.Bytes.new(b"".join(rows)), GdkPixbuf.Colorspace.RGB, False, 8, size, size, size * 3
+        )
+        logging.log(LogLevel.Info, f"generated qr code for {ssid}")
+        return pixbuf
 
     except Exception as e:
         logging.log(LogLevel.Error, f"Failed to generate qr code for {ssid} : {e}")
-        # Fix: create an error.png path using correct Path object usage
-        error_path = temp_dir / "error.png"
-        return str(error_path)
+        return None
 
-def wifi_supported() -> bool:
+def wifi_supported(logging: Logger) -> bool:
     try:
-        result = subprocess.run(["nmcli", "-t", "-f", "DEVICE,TYPE", "device"], capture_output=True, text=True)
+        result = get_command_runner(logging).run(["nmcli", "-t", "-f", "DEVICE,TYPE", "device"])
         wifi_interfaces = [line for line in result.stdout.split('\n') if "wifi" in line]
         return bool(wifi_interfaces)
     except Exception:
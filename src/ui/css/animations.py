@@ -1,7 +1,8 @@
 import os
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, Gdk, GLib #type: ignore
+from gi.repository import GLib #type: ignore
+from ui.css.style_manager import get_style_manager
 
 def get_animations_css_path():
     return os.path.join(os.path.dirname(__file__), "animations.css")
@@ -13,18 +14,7 @@ def animate_widget_show(widget, duration=200):
     GLib.timeout_add(duration, lambda: style_context.remove_class("animate-show"))
 
 def load_animations_css():
-    css_provider = Gtk.CssProvider()
-    css_provider.load_from_path(get_animations_css_path())
-
-    try:
-        screen = Gdk.Screen.get_default()
-        if screen is not None:
-            Gtk.StyleContext.add_provider_for_screen(
-                screen,
-                css_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
-        else:
-            print("Warning: No display available for CSS animations")
-    except Exception as e:
-        print(f"Warning: Could not load CSS animations: {str(e)}")
+    """Install the animations stylesheet, parsing it only on the first call"""
+    return get_style_manager().set_css_from_path(
+        "animations", get_animations_css_path()
+    )
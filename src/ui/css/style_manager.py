@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+from typing import Dict, Optional
+
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk, Gdk  # type: ignore
+
+
+class StyleManager:
+    """Owns one screen-wide CSS provider per styling concern
+
+    Each concern (base window rules, animations, power button colours, ...)
+    gets its own provider that is created once and only reloaded when its
+    CSS actually changes, so changing a single colour re-parses one small
+    rule instead of every stylesheet.
+    """
+
+    def __init__(self):
+        self._providers: Dict[str, Gtk.CssProvider] = {}
+        self._loaded: Dict[str, str] = {}
+
+    def _get_provider(self, key: str, priority: int) -> Optional[Gtk.CssProvider]:
+        provider = self._providers.get(key)
+        if provider is not None:
+            return provider
+
+        screen = Gdk.Screen.get_default()
+        if screen is None:
+            print(f"Warning: No display available for CSS '{key}'")
+            return None
+
+        provider = Gtk.CssProvider()
+        Gtk.StyleContext.add_provider_for_screen(screen, provider, priority)
+        self._providers[key] = provider
+        return provider
+
+    def set_css(
+        self,
+        key: str,
+        css: str,
+        priority: int = Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+    ) -> Optional[Gtk.CssProvider]:
+        """Install or update the CSS for a concern
+
+        Args:
+            key (str): concern name, one provider exists per key
+            css (str): stylesheet for that concern
+            priority (int): provider priority, only used when the provider is created
+
+        Returns:
+            Optional[Gtk.CssProvider]: the provider, or None without a display
+        """
+        provider = self._get_provider(key, priority)
+        if provider is None or self._loaded.get(key) == css:
+            return provider
+
+        try:
+            provider.load_from_data(css.encode())
+            self._loaded[key] = css
+        except Exception as e:
+            print(f"Warning: Could not load CSS '{key}': {e}")
+        return provider
+
+    def set_css_from_path(
+        self,
+        key: str,
+        path: str,
+        priority: int = Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+    ) -> Optional[Gtk.CssProvider]:
+        """Install a stylesheet file for a concern, loading it only once"""
+        provider = self._get_provider(key, priority)
+        if provider is None or self._loaded.get(key) == path:
+            return provider
+
+        try:
+            provider.load_from_path(path)
+            self._loaded[key] = path
+        except Exception as e:
+            print(f"Warning: Could not load CSS '{key}' from {path}: {e}")
+        return provider
+
+    def set_rule(
+        self,
+        key: str,
+        selector: str,
+        declarations: Dict[str, str],
+        priority: int = Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+    ) -> Optional[Gtk.CssProvider]:
+        """Install a single rule as its own concern
+
+        Rules that change at runtime (e.g. a button colour) should use a
+        dedicated key so updating them leaves every other provider untouched.
+        """
+        body = " ".join(f"{name}: {value};" for name, value in declarations.items())
+        return self.set_css(key, f"{selector} {{ {body} }}", priority)
+
+
+_manager = None
+
+
+def get_style_manager() -> StyleManager:
+    """Get or create the global StyleManager instance"""
+    global _manager
+    if _manager is None:
+        _manager = StyleManager()
+    return _manager
@@ -5,39 +5,77 @@ import traceback
 import gi  # type: ignore
 import threading
 import sys
-import json
-import os
-from datetime import datetime
 
-from tools.bluetooth import BluetoothManager
 from utils.arg_parser import ArgParse
 
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk, GLib, Gdk  # type: ignore
 
-from ui.tabs.autostart_tab import AutostartTab
-from ui.tabs.battery_tab import BatteryTab
-from ui.tabs.bluetooth_tab import BluetoothTab
-from ui.tabs.display_tab import DisplayTab
-from ui.tabs.power_tab import PowerTab
-from ui.tabs.volume_tab import VolumeTab
-from ui.tabs.wifi_tab import WiFiTab
-from ui.tabs.settings_tab import SettingsTab
-from ui.tabs.usbguard_tab import USBGuardTab
-from utils.settings import load_settings, save_settings
+from ui.tabs.loader import TabLoader
+from ui.tabs.registry import TAB_MODULES, get_tab_class, is_loaded
+from ui.widgets.snapshot_view import SnapshotView
+from utils.commands import get_command_runner
+from utils.settings import get_settings_store, load_settings, save_settings
 from utils.logger import LogLevel, Logger
+from utils.plugins import get_plugin_host
 from ui.css.animations import load_animations_css  # animate_widget_show not used
+from ui.css.style_manager import get_style_manager
+from utils.profiler import get_startup_profiler
+from utils.scheduler import get_refresh_scheduler
+from utils.snapshots import get_snapshot_cache
 from utils.translations import Translation, get_translations
-from tools.globals import check_hardware_support
+
+
+BASE_CSS = """
+    button {
+        outline: none;
+        -gtk-outline-radius: 0;
+        border: none;
+    }
+    button:focus, button:hover, button:active {
+        outline: none;
+        box-shadow: none;
+        border: none;
+    }
+    notebook tab {
+        outline: none;
+    }
+    notebook tab:focus {
+        outline: none;
+    }
+    /* Make selections invisible */
+    selection {
+        background-color: transparent;
+        color: inherit;
+    }
+    *:selected {
+        background-color: transparent;
+        color: inherit;
+    }
+    textview text selection {
+        background-color: transparent;
+    }
+    entry selection {
+        background-color: transparent;
+    }
+    label selection {
+        background-color: transparent;
+    }
+    treeview:selected {
+        background-color: transparent;
+    }
+    menuitem:selected {
+        background-color: transparent;
+    }
+    listbox row:selected {
+        background-color: transparent;
+    }
+"""
 
 
 class BetterControl(Gtk.Window):
 
     def __init__(self, txt: Translation, arg_parser: ArgParse, logging: Logger) -> None:
-        # Initialize cache directory
-        self.cache_dir = os.path.expanduser("~/.cache/better-control")
-        os.makedirs(self.cache_dir, exist_ok=True)
-        
         # Preload frequently used icons
         self._icon_cache = {
             name: Gtk.IconTheme.get_default().load_icon(name, 16, 0)
@@ -49,7 +87,6 @@ class BetterControl(Gtk.Window):
         self._initialized = False
         self._is_destroyed = False
         self._init_lock = threading.Lock()
-        self._tab_creation_lock = threading.RLock()
         self._destroy_lock = threading.Lock()
 
         # Safe GTK initialization
@@ -58,8 +95,10 @@ class BetterControl(Gtk.Window):
                 # Initialize GTK window
                 super().__init__(title="Better Control")
                 self._initialized = True
-                # Show window immediately for faster perceived startup
-                self.show_all()
+                # Show window immediately for faster perceived startup,
+                # a daemon started without a tab stays hidden instead
+                if not arg_parser.find_arg(("-D", "--daemon")) or arg_parser.get_requested_tab():
+                    self.show_all()
             except Exception as e:
                 logging.log(LogLevel.Error, f"Window initialization failed: {e}")
                 raise
@@ -71,72 +110,25 @@ class BetterControl(Gtk.Window):
         # Initialize important instance variables to prevent segfaults
         self.tabs = {}
         self.tab_pages = {}
-        self.tabs_thread_running = False
 
         # Check if minimal mode is enabled
         self.minimal_mode = arg_parser.find_arg(("-m", "--minimal"))
         if self.minimal_mode:
             self.logging.log(LogLevel.Info, "Minimal mode enabled")
 
+        # In daemon mode closing only hides the window so the next launch is instant
+        self.daemon_mode = arg_parser.find_arg(("-D", "--daemon"))
+
         # Apply custom CSS to remove button focus/selection outline
-        css_provider = Gtk.CssProvider()
-        css = b"""
-            button {
-                outline: none;
-                -gtk-outline-radius: 0;
-                border: none;
-            }
-            button:focus, button:hover, button:active {
-                outline: none;
-                box-shadow: none;
-                border: none;
-            }
-            notebook tab {
-                outline: none;
-            }
-            notebook tab:focus {
-                outline: none;
-            }
-            /* Make selections invisible */
-            selection {
-                background-color: transparent;
-                color: inherit;
-            }
-            *:selected {
-                background-color: transparent;
-                color: inherit;
-            }
-            textview text selection {
-                background-color: transparent;
-            }
-            entry selection {
-                background-color: transparent;
-            }
-            label selection {
-                background-color: transparent;
-            }
-            treeview:selected {
-                background-color: transparent;
-            }
-            menuitem:selected {
-                background-color: transparent;
-            }
-            listbox row:selected {
-                background-color: transparent;
-            }
-        """
-        css_provider.load_from_data(css)
-        screen = Gdk.Screen.get_default()
-        style_context = Gtk.StyleContext()
-        style_context.add_provider_for_screen(
-            screen, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        get_style_manager().set_css("base", BASE_CSS)
 
-        # Load animations CSS
+        # Load animations CSS (already parsed at startup, this reuses the provider)
         self.animations_css_provider = load_animations_css()
 
-        # Load settings and ensure we have the latest language setting
+        # Shared with every tab, served from memory and kept in sync with
+        # edits made to the file while the window is open
         self.settings = load_settings(logging)
+        get_settings_store(logging).watch()
         lang = self.settings.get("language", "en")
         self.logging.log(LogLevel.Info, f"Main window loaded language setting: {lang}")
         self.txt = get_translations(logging, lang)
@@ -163,27 +155,56 @@ class BetterControl(Gtk.Window):
         # Store arg_parser before creating tabs
         self.arg_parser = arg_parser
 
-        self.create_lazy_tabs()
+        self.snapshots = get_snapshot_cache(logging)
+
+        with get_startup_profiler().span("create_lazy_tabs"):
+            self.create_lazy_tabs()
         self.create_settings_button()
 
         self.connect("destroy", self.on_destroy)
+        self.connect("delete-event", self.on_delete_event)
         self.notebook.connect("switch-page", self.on_tab_switched)
 
+        # Periodic tab refreshes only run for the current page of an active window
+        self.refresh_scheduler = get_refresh_scheduler(logging)
+        self.refresh_scheduler.set_current_page(
+            self.notebook.get_nth_page(self.notebook.get_current_page())
+        )
+        self.connect("notify::is-active", self.on_window_activity_changed)
+        self.connect("map", self.on_window_activity_changed)
+        self.connect("unmap", self.on_window_activity_changed)
+
+    def on_window_activity_changed(self, *args):
+        self.refresh_scheduler.set_window_active(self.is_active() and self.get_mapped())
+
+    def present_tab(self, tab_name=None):
+        """Show the window, switching to a tab if one is given"""
+        if tab_name and tab_name in self.tab_pages:
+            # switch-page takes care of loading the tab if it is still a placeholder
+            self.notebook.set_current_page(self.tab_pages[tab_name])
+        self.present()
+
+    def close_window(self):
+        """Quit, or hide when running as a daemon"""
+        self.save_snapshots()
+        if self.daemon_mode:
+            self.hide()
+        else:
+            Gtk.main_quit()
+
+    def on_delete_event(self, widget, event):
+        if self.daemon_mode:
+            self.save_snapshots()
+            self.hide()
+            return True
+        return False
+
     def create_lazy_tabs(self):
         """Create placeholder tabs with loading indicators that will be replaced with real content"""
         self.logging.log(LogLevel.Info, "Initializing lazy tab loading")
 
-        # Map tab names to classes
-        self.tab_classes = {
-            "Volume": VolumeTab,
-            "Wi-Fi": WiFiTab,
-            "Bluetooth": BluetoothTab,
-            "Battery": BatteryTab,
-            "Display": DisplayTab,
-            "Power": PowerTab,
-            "Autostart": AutostartTab,
-            "USBGuard": USBGuardTab,
-        }
+        # Map tab names to their modules, imported when first instantiated
+        self.tab_classes = TAB_MODULES
 
         # Map tab names to translated labels
         self.tab_name_mapping = {
@@ -202,51 +223,24 @@ class BetterControl(Gtk.Window):
         self.tab_pages = {}
 
         # Define tab order from user settings or default
-        tab_order = self.settings.get("tab_order", ["Volume", "Wi-Fi", "Bluetooth", "Battery", "Display", "Power", "Autostart", "USBGuard"])
-
-        # Default initial tab to first in saved tab order
-        requested_tab = tab_order[0] if tab_order else "Volume"
-
-        # Override with command-line args if specified
-        if self.arg_parser.find_arg(("-V", "--volume")) or self.arg_parser.find_arg(("-v", "")):
-            requested_tab = "Volume"
-        elif self.arg_parser.find_arg(("-w", "--wifi")):
-            requested_tab = "Wi-Fi"
-        elif self.arg_parser.find_arg(("-a", "--autostart")):
-            requested_tab = "Autostart"
-        elif self.arg_parser.find_arg(("-b", "--bluetooth")):
-            requested_tab = "Bluetooth"
-        elif self.arg_parser.find_arg(("-B", "--battery")):
-            requested_tab = "Battery"
-        elif self.arg_parser.find_arg(("-d", "--display")):
-            requested_tab = "Display"
-        elif self.arg_parser.find_arg(("-p", "--power")):
-            requested_tab = "Power"
-        elif self.arg_parser.find_arg(("-u", "--usbguard")):
-            requested_tab = "USBGuard"
+        tab_order = list(self.settings.get("tab_order", ["Volume", "Wi-Fi", "Bluetooth", "Battery", "Display", "Power", "Autostart", "USBGuard"]))
+
+        # Plugin tabs come from their manifests, no plugin code runs until
+        # a plugin's tab is first shown
+        self.plugin_host = get_plugin_host(self.logging)
+        for manifest in self.plugin_host.discover():
+            if manifest.name in TAB_MODULES:
+                self.logging.log(LogLevel.Warn, f"Ignoring plugin {manifest.name}, it clashes with a built-in tab")
+                continue
+            self.tab_name_mapping[manifest.name] = manifest.label
+            if manifest.name not in tab_order:
+                tab_order.append(manifest.name)
 
         # Load saved tab visibility settings
         visibility = self.settings.get("visibility", {})
 
         # Determine active tab (command line args > first visible)
-        active_tab = None
-        # Check command line args first
-        if self.arg_parser.find_arg(("-V", "--volume")) or self.arg_parser.find_arg(("-v", "")):
-            active_tab = "Volume"
-        elif self.arg_parser.find_arg(("-w", "--wifi")):
-            active_tab = "Wi-Fi"
-        elif self.arg_parser.find_arg(("-a", "--autostart")):
-            active_tab = "Autostart"
-        elif self.arg_parser.find_arg(("-b", "--bluetooth")):
-            active_tab = "Bluetooth"
-        elif self.arg_parser.find_arg(("-B", "--battery")):
-            active_tab = "Battery"
-        elif self.arg_parser.find_arg(("-d", "--display")):
-            active_tab = "Display"
-        elif self.arg_parser.find_arg(("-p", "--power")):
-            active_tab = "Power"
-        elif self.arg_parser.find_arg(("-u", "--usbguard")):
-            active_tab = "USBGuard"
+        active_tab = self.arg_parser.get_requested_tab()
         
         # If no args specified, use first visible tab
         if active_tab is None:
@@ -259,8 +253,12 @@ class BetterControl(Gtk.Window):
             if not visibility.get(tab_name, True):
                 continue
                 
-            # Create empty placeholder
-            placeholder = Gtk.Box()
+            # Show the last known state until the real tab is built
+            snapshot = self.snapshots.load(tab_name)
+            if snapshot:
+                placeholder = SnapshotView(snapshot, getattr(self.txt, 'updating', 'Updating...'))
+            else:
+                placeholder = Gtk.Box()
             placeholder.show_all()
             
             # Add tab with label but empty content
@@ -270,252 +268,87 @@ class BetterControl(Gtk.Window):
             )
             self.tabs[tab_name] = placeholder
             self.tab_pages[tab_name] = page_num
-            
-            # Load active tab content immediately
-            if tab_name == active_tab and tab_name in self.tab_classes:
-                tab_instance = self.tab_classes[tab_name](self.logging, self.txt)
-                tab_instance.show_all()
-                self.notebook.remove_page(page_num)
-                page_num = self.notebook.insert_page(
-                    tab_instance,
-                    self.create_tab_label(tab_name, self.get_icon_for_tab(tab_name)),
-                    page_num
-                )
-                self.tabs[tab_name] = tab_instance
-                self.tab_pages[tab_name] = page_num
-                self.notebook.set_current_page(page_num)
-
-        # Determine active tab (command line args > first visible)
-        active_tab = None
-        # Check command line args first
-        if self.arg_parser.find_arg(("-V", "--volume")) or self.arg_parser.find_arg(("-v", "")):
-            active_tab = "Volume"
-        elif self.arg_parser.find_arg(("-w", "--wifi")):
-            active_tab = "Wi-Fi"
-        elif self.arg_parser.find_arg(("-a", "--autostart")):
-            active_tab = "Autostart"
-        elif self.arg_parser.find_arg(("-b", "--bluetooth")):
-            active_tab = "Bluetooth"
-        elif self.arg_parser.find_arg(("-B", "--battery")):
-            active_tab = "Battery"
-        elif self.arg_parser.find_arg(("-d", "--display")):
-            active_tab = "Display"
-        elif self.arg_parser.find_arg(("-p", "--power")):
-            active_tab = "Power"
-        elif self.arg_parser.find_arg(("-u", "--usbguard")):
-            active_tab = "USBGuard"
-        
-        # If no args specified, use first visible tab
-        if active_tab is None:
-            visible_tabs = [name for name in tab_order if visibility.get(name, True)]
-            if visible_tabs:
-                active_tab = visible_tabs[0]
 
-        # Load active tab immediately if found
+        # Build the active tab first, then the rest in tab order, all from idle
+        # time on the main thread. switch-page only reorders the queue.
+        self.tab_loader = TabLoader(self.logging, self.build_tab, self.install_tab)
         if active_tab and active_tab in self.tab_pages:
-            page_num = self.tab_pages[active_tab]
-            self.notebook.set_current_page(page_num)
-            GLib.idle_add(lambda: self.lazy_load_tab(self.notebook, None, page_num))
+            self.notebook.set_current_page(self.tab_pages[active_tab])
+            self.tab_loader.prioritize(active_tab)
+        # Plugins are only built once switched to, a slow one can't hold up the rest
+        self.tab_loader.enqueue([
+            name for name in tab_order
+            if name in self.tab_pages and not self.plugin_host.is_plugin(name)
+        ])
 
-        # Connect switch-page to lazy load other tabs
         self.notebook.connect("switch-page", self.lazy_load_tab)
 
-        # Start background threads to preload other tabs asynchronously
-        def preload_tab(tab_name):
-            def worker():
-                try:
-                    tab_class = self.tab_classes.get(tab_name)
-                    if not tab_class:
-                        return
-                    tab_instance = tab_class(self.logging, self.txt)
-                    tab_instance.show_all()
-
-                    def replace_placeholder():
-                        # Double-check placeholder still exists
-                        current_widget = self.tabs.get(tab_name)
-                        from ui.tabs.bluetooth_tab import BluetoothTab
-                        from ui.tabs.wifi_tab import WiFiTab
-                        from ui.tabs.display_tab import DisplayTab
-                        from ui.tabs.battery_tab import BatteryTab
-                        from ui.tabs.power_tab import PowerTab
-                        from ui.tabs.autostart_tab import AutostartTab
-                        from ui.tabs.usbguard_tab import USBGuardTab
-                        from ui.tabs.volume_tab import VolumeTab
-
-                        real_tab_classes = (BluetoothTab, WiFiTab, DisplayTab, BatteryTab, PowerTab, AutostartTab, USBGuardTab, VolumeTab)
-
-                        if isinstance(current_widget, real_tab_classes):
-                            return False  # Already replaced
-
-                        # Replace placeholder with real tab
-                        page_num = self.tab_pages.get(tab_name)
-                        if page_num is None:
-                            return False
-                        try:
-                            self.notebook.remove_page(page_num)
-                            new_page_num = self.notebook.insert_page(
-                                tab_instance,
-                                self.create_tab_label(tab_name, self.get_icon_for_tab(tab_name)),
-                                page_num
-                            )
-                            self.tabs[tab_name] = tab_instance
-                            self.tab_pages[tab_name] = new_page_num
-                            self.logging.log(LogLevel.Info, f"Preloaded tab: {tab_name}")
-                            self.show_all()
-                        except Exception as e:
-                            self.logging.log(LogLevel.Error, f"Failed to preload tab {tab_name}: {e}")
-                        return False  # Only run once
-
-                    GLib.idle_add(replace_placeholder)
-                except Exception as e:
-                    self.logging.log(LogLevel.Error, f"Error preloading tab {tab_name}: {e}")
-
-            thread = threading.Thread(target=worker, daemon=True)
-            thread.start()
-
-        def delayed_preload():
-            # Load all other tabs after 3 second delay
-            visible_tabs = [name for name in tab_order 
-                          if visibility.get(name, True) and name != active_tab]
-            
-            def load_tab(tab_name):
-                if tab_name in self.tab_classes and tab_name in self.tab_pages:
-                    # Get existing page number for this tab
-                    page_num = self.tab_pages[tab_name]
-                    
-                    # Load from cache if available
-                    cached_state = self.load_from_cache(tab_name)
-                    
-                    # Create tab instance in background thread
-                    def create_tab():
-                        tab_instance = self.tab_classes[tab_name](self.logging, self.txt)
-                        if cached_state and hasattr(tab_instance, 'load_state'):
-                            tab_instance.load_state(cached_state)
-                        return tab_instance
-                    
-                    # Replace placeholder with real content
-                    tab_instance = create_tab()
-                    tab_instance.show_all()
-                    self.notebook.remove_page(page_num)
-                    new_page_num = self.notebook.insert_page(
-                        tab_instance,
-                        self.create_tab_label(tab_name, self.get_icon_for_tab(tab_name)),
-                        page_num
-                    )
-                    self.tabs[tab_name] = tab_instance
-                    self.tab_pages[tab_name] = new_page_num
-            
-            # Load other tabs with staggered delays (100ms, 200ms, 300ms...)
-            for i, tab_name in enumerate(visible_tabs, start=1):
-                GLib.timeout_add(100 * i, lambda name=tab_name: load_tab(name) or False)
-        
-        # Start the delayed loading process
-        GLib.idle_add(delayed_preload)
-
         # Show all widgets
         self.show_all()
 
-    def get_cache_file(self, tab_name):
-        """Get cache file path for a tab"""
-        return os.path.join(self.cache_dir, f"{tab_name}.json")
-
-    def load_from_cache(self, tab_name):
-        """Load tab data from cache if valid"""
-        cache_file = self.get_cache_file(tab_name)
-        if not os.path.exists(cache_file):
-            return None
-            
-        try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-                # Check if cache is expired (1 hour)
-                cache_time = datetime.fromisoformat(data['timestamp'])
-                if (datetime.now() - cache_time).total_seconds() > 3600:
-                    return None
-                return data['state']
-        except Exception:
-            return None
-
-    def save_to_cache(self, tab_name, state):
-        """Save tab state to cache"""
-        try:
-            cache_file = self.get_cache_file(tab_name)
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'timestamp': datetime.now().isoformat(),
-                    'state': state
-                }, f)
-        except Exception as e:
-            self.logging.log(LogLevel.Warning, f"Failed to cache {tab_name} state: {e}")
+    def create_tab_instance(self, tab_name):
+        """Construct a tab, timing the constructor for --profile-startup"""
+        if self.plugin_host.is_plugin(tab_name):
+            return self.plugin_host.create(tab_name, self.arg_parser)
+        with get_startup_profiler().span(f"{tab_name} tab", "tab"):
+            return get_tab_class(tab_name)(self.logging, self.txt)
 
     def lazy_load_tab(self, notebook, page, page_num):
-        """Instantiate tab on first switch if not yet created, using cache if available"""
-        # Determine tab name by page_num
-        tab_name = None
+        """Move a placeholder tab to the front of the load queue when switched to"""
         for name, num in self.tab_pages.items():
             if num == page_num:
-                tab_name = name
+                # Never build inside switch-page, the loader does it from idle
+                self.tab_loader.prioritize(name)
                 break
-        if not tab_name:
-            return
 
-        # If already created (not a placeholder), do nothing
-        current_widget = self.tabs.get(tab_name)
-        from ui.tabs.bluetooth_tab import BluetoothTab
-        from ui.tabs.wifi_tab import WiFiTab
-        from ui.tabs.display_tab import DisplayTab
-        from ui.tabs.battery_tab import BatteryTab
-        from ui.tabs.power_tab import PowerTab
-        from ui.tabs.autostart_tab import AutostartTab
-        from ui.tabs.usbguard_tab import USBGuardTab
-        from ui.tabs.volume_tab import VolumeTab
+    def build_tab(self, tab_name):
+        """Construct a tab for the loader, seeding it with its last snapshot"""
+        tab_instance = self.create_tab_instance(tab_name)
 
-        real_tab_classes = (BluetoothTab, WiFiTab, DisplayTab, BatteryTab, PowerTab, AutostartTab, USBGuardTab, VolumeTab)
-
-        if isinstance(current_widget, real_tab_classes):
-            return
+        snapshot = self.snapshots.load(tab_name)
+        if snapshot and hasattr(tab_instance, 'restore_snapshot'):
+            try:
+                tab_instance.restore_snapshot(snapshot)
+            except Exception as e:
+                self.logging.log(LogLevel.Warn, f"Failed to restore {tab_name} snapshot: {e}")
+        return tab_instance
 
-        # Defer real tab creation to avoid segfault during switch-page
-        def replace_placeholder():
+    def save_snapshots(self):
+        """Store the view model of every built tab for the next launch"""
+        for tab_name, tab in self.tabs.items():
+            if not self.tab_loader.is_ready(tab_name) or not hasattr(tab, 'get_snapshot'):
+                continue
             try:
-                tab_class = self.tab_classes.get(tab_name)
-                if not tab_class:
-                    return False
-                # Try loading from cache first
-                cached_state = self.load_from_cache(tab_name)
-                tab_instance = tab_class(self.logging, self.txt)
-                
-                if cached_state and hasattr(tab_instance, 'load_state'):
-                    try:
-                        tab_instance.load_state(cached_state)
-                    except Exception as e:
-                        self.logging.log(LogLevel.Warning, f"Failed to load {tab_name} from cache: {e}")
-                
-                tab_instance.show_all()
-                self.notebook.remove_page(page_num)
-                new_page_num = self.notebook.insert_page(
-                    tab_instance,
-                    self.create_tab_label(tab_name, self.get_icon_for_tab(tab_name)),
-                    page_num
-                )
-                self.tabs[tab_name] = tab_instance
-                self.tab_pages[tab_name] = new_page_num
-                # Save to cache if tab supports it
-                if hasattr(tab_instance, 'get_state'):
-                    try:
-                        self.save_to_cache(tab_name, tab_instance.get_state())
-                    except Exception as e:
-                        self.logging.log(LogLevel.Warning, f"Failed to cache {tab_name} state: {e}")
-                
-                self.logging.log(LogLevel.Info, f"Lazily created tab: {tab_name}")
-                self.show_all()
-                # Activate the newly created tab immediately
-                self.notebook.set_current_page(new_page_num)
+                snapshot = tab.get_snapshot()
             except Exception as e:
-                self.logging.log(LogLevel.Error, f"Failed to lazily create tab {tab_name}: {e}")
-            return False  # Only run once
+                self.logging.log(LogLevel.Warn, f"Failed to snapshot {tab_name}: {e}")
+                continue
+            if snapshot:
+                self.snapshots.save(tab_name, snapshot)
+
+    def install_tab(self, tab_name, tab_instance):
+        """Swap a tab's placeholder page for the constructed tab"""
+        placeholder = self.tabs.get(tab_name)
+        self.tabs[tab_name] = tab_instance
+        if placeholder is None:
+            return
+
+        page_num = self.notebook.page_num(placeholder)
+        if page_num == -1:
+            # Hidden while it was queued, unhide_tab adds it back
+            return
 
-        GLib.idle_add(replace_placeholder)
+        was_current = self.notebook.get_current_page() == page_num
+        tab_instance.show_all()
+        self.notebook.remove_page(page_num)
+        self.notebook.insert_page(
+            tab_instance,
+            self.create_tab_label(tab_name, self.get_icon_for_tab(tab_name)),
+            page_num
+        )
+        self.tab_pages[tab_name] = page_num
+        if was_current:
+            self.notebook.set_current_page(page_num)
 
     def _add_tab_to_ui(self, tab_name, tab):
         """Add a tab to the UI (called from main thread)"""
@@ -788,26 +621,17 @@ class BetterControl(Gtk.Window):
 
     def unhide_tab(self, tab_name):
         """Unhide a previously hidden tab"""
-        # Always create a fresh real tab instance when unhiding
+        # Reuse the tab if it was built before it got hidden
         try:
-            tab_classes = {
-                "Bluetooth": BluetoothTab,
-                "Volume": VolumeTab,
-                "Wi-Fi": WiFiTab,
-                "Battery": BatteryTab,
-                "Display": DisplayTab,
-                "Power": PowerTab,
-                "Autostart": AutostartTab,
-                "USBGuard": USBGuardTab
-            }
-
-            if tab_name in tab_classes:
+            if tab_name in TAB_MODULES or self.plugin_host.is_plugin(tab_name):
                 self.logging.log(LogLevel.Info, f"Creating or unhiding tab: {tab_name}")
-                tab = tab_classes[tab_name](self.logging, self.txt)
-                self.tabs[tab_name] = tab
+                was_ready = self.tab_loader.is_ready(tab_name)
+                tab = self.tab_loader.load_now(tab_name)
+                if tab is None:
+                    return
 
                 # Special handling for Power tab
-                if tab_name == "Power":
+                if tab_name == "Power" and not was_ready:
                     self.connect("key-press-event", tab.on_key_press)
                     tab.is_visible = self.minimal_mode
             else:
@@ -995,6 +819,8 @@ class BetterControl(Gtk.Window):
             "Autostart": "system-run-symbolic",
             "USBGuard": "drive-removable-media-symbolic",
         }
+        if hasattr(self, 'plugin_host') and self.plugin_host.is_plugin(tab_name):
+            icons[tab_name] = self.plugin_host.manifests[tab_name].icon
         icon_name = icons.get(tab_name, "application-x-executable-symbolic")
         if hasattr(self, '_icon_cache'):
             self._icon_cache[tab_name.lower()] = icon_name
@@ -1044,6 +870,7 @@ class BetterControl(Gtk.Window):
             dialog.set_size_request(600, 540)
             dialog.set_position(Gtk.WindowPosition.CENTER_ON_PARENT)
             # Create a fresh instance of the settings tab to use in the dialog
+            from ui.tabs.settings_tab import SettingsTab
             settings_tab = SettingsTab(self.logging, self.txt)
             settings_tab.connect(
                 "tab-visibility-changed", self.on_tab_visibility_changed
@@ -1137,6 +964,7 @@ class BetterControl(Gtk.Window):
 
     def on_tab_switched(self, notebook, page, page_num):
         """Handle tab switching"""
+        self.refresh_scheduler.set_current_page(page)
 
         # Apply animation to the new tab
         current_page = notebook.get_nth_page(page_num)
@@ -1186,8 +1014,7 @@ class BetterControl(Gtk.Window):
         # Check if Power tab exists and handle its keys globally
         if "Power" in self.tabs:
             power_tab = self.tabs["Power"]
-            from ui.tabs.power_tab import PowerTab
-            if isinstance(power_tab, PowerTab):
+            if is_loaded("Power") and isinstance(power_tab, get_tab_class("Power")):
                 # Always let Power tab handle keys first, regardless of which tab is active
                 if power_tab.on_key_press(widget, event):
                     return True
@@ -1216,7 +1043,7 @@ class BetterControl(Gtk.Window):
         #  ctrl + q or q will quit the application
         if keyval in (113, 81) or  (keyval == 113 and state & Gdk.ModifierType.CONTROL_MASK):
             self.logging.log(LogLevel.Info, "Application quitted")
-            Gtk.main_quit()
+            self.close_window()
         return False  # Let other handlers process the event
 
     def on_destroy(self, window):
@@ -1230,9 +1057,17 @@ class BetterControl(Gtk.Window):
 
             # Phase 1: Stop background operations
             try:
-                if hasattr(self, '_tab_creation_lock') and hasattr(self, 'tabs_thread_running'):
-                    with self._tab_creation_lock:
-                        self.tabs_thread_running = False
+                if hasattr(self, 'tab_loader'):
+                    self.tab_loader.cancel()
+                    # Before the children are destroyed below
+                    self.save_snapshots()
+            except:
+                pass
+
+            try:
+                runner = get_command_runner(self.logging)
+                runner.log_stats()
+                runner.shutdown()
             except:
                 pass
 
@@ -1267,13 +1102,7 @@ class BetterControl(Gtk.Window):
                         tab_order.append(tab_name)
             self.settings["tab_order"] = tab_order
 
-        # Always load the latest settings from disk to ensure we have the most recent language setting
-        latest_settings = load_settings(self.logging)
-        if "language" in latest_settings:
-            # Update our in-memory settings with the latest language setting from disk
-            self.logging.log(LogLevel.Info, f"Using latest language setting from disk: {latest_settings['language']}")
-            self.settings["language"] = latest_settings["language"]
-        elif "language" in self.settings:
+        if "language" in self.settings:
             self.logging.log(LogLevel.Info, f"Using language setting from memory: {self.settings['language']}")
         else:
             self.logging.log(LogLevel.Warn, "No language setting found in memory or on disk")
@@ -1310,6 +1139,7 @@ class BetterControl(Gtk.Window):
             # Use a direct call to save_settings instead of a thread to ensure it completes
             self.logging.log(LogLevel.Info, "Saving settings directly to ensure completion")
             save_settings(self.settings, self.logging)
+            get_settings_store(self.logging).flush()
         except Exception as e:
             self.logging.log(LogLevel.Error, f"Error saving settings: {e}")
 
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+
+import glob
+import os
+from typing import Dict, Optional, Tuple
+
+import gi  # type: ignore
+
+gi.require_version("Gtk", "3.0")
+from gi.repository import Gdk, Gio, GLib, Gtk  # type: ignore
+
+# Optional, Wayland compositors ignore move(), type hints and focus hints
+try:
+    gi.require_version("GtkLayerShell", "0.1")
+    from gi.repository import GtkLayerShell  # type: ignore
+except (ValueError, ImportError):
+    GtkLayerShell = None
+
+from ui.css.style_manager import get_style_manager
+from utils.commands import get_command_runner
+from utils.logger import LogLevel, Logger
+
+# How long the popup stays up after the last change
+OSD_TIMEOUT_MS = 1500
+# Nothing signals backlight writes, sysfs is read this often (no process spawned)
+BRIGHTNESS_POLL_MS = 500
+# Wait before restarting pactl subscribe after the sound server went away
+SUBSCRIBE_RETRY_S = 2
+# Distance from the bottom of the monitor
+OSD_MARGIN = 80
+# Window rules target the title, the main window has the same class
+OSD_TITLE = "Better Control OSD"
+
+# The theme's .osd class does the colours, this only adds the shape
+OSD_CSS = """
+    window.better-control-osd {
+        background-color: transparent;
+    }
+    .better-control-osd-box {
+        border-radius: 16px;
+        padding: 14px 20px;
+    }
+    .better-control-osd-box levelbar block.filled {
+        border-radius: 3px;
+    }
+"""
+
+
+def _volume_icon(value: int, muted: bool) -> str:
+    if muted or value == 0:
+        return "audio-volume-muted-symbolic"
+    if value < 34:
+        return "audio-volume-low-symbolic"
+    if value < 67:
+        return "audio-volume-medium-symbolic"
+    return "audio-volume-high-symbolic"
+
+
+def _icon_for(kind: str, value: int, muted: bool) -> str:
+    if kind == "volume":
+        return _volume_icon(value, muted)
+    if kind == "mic":
+        return "microphone-sensitivity-muted-symbolic" if muted else "microphone-sensitivity-high-symbolic"
+    return "display-brightness-symbolic"
+
+
+class OsdWindow(Gtk.Window):
+    """Small transient overlay showing one level
+
+    Built and realized once at startup and then only shown and hidden, so
+    a change is on screen in the next frame. Takes no focus and stays out
+    of the taskbar.
+    """
+
+    def __init__(self):
+        super().__init__(type=Gtk.WindowType.TOPLEVEL)
+        self.set_title(OSD_TITLE)
+        self.set_decorated(False)
+        self.set_resizable(False)
+        self.set_accept_focus(False)
+        self.set_focus_on_map(False)
+        self.set_keep_above(True)
+        self.set_skip_taskbar_hint(True)
+        self.set_skip_pager_hint(True)
+        self.set_type_hint(Gdk.WindowTypeHint.NOTIFICATION)
+        self.get_style_context().add_class("better-control-osd")
+
+        screen = self.get_screen()
+        visual = screen.get_rgba_visual() if screen is not None else None
+        if visual is not None:
+            self.set_visual(visual)
+            self.set_app_paintable(True)
+
+        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        box.get_style_context().add_class("osd")
+        box.get_style_context().add_class("better-control-osd-box")
+
+        self.icon = Gtk.Image.new_from_icon_name("audio-volume-high-symbolic", Gtk.IconSize.DND)
+        self.level = Gtk.LevelBar.new_for_interval(0, 100)
+        self.level.set_size_request(200, -1)
+        self.level.set_valign(Gtk.Align.CENTER)
+        self.label = Gtk.Label(label="0%")
+        self.label.set_width_chars(4)
+
+        box.pack_start(self.icon, False, False, 0)
+        box.pack_start(self.level, True, True, 0)
+        box.pack_start(self.label, False, False, 0)
+        self.add(box)
+        box.show_all()
+
+        self.hide_source: Optional[int] = None
+        self.layer_shell = GtkLayerShell is not None and GtkLayerShell.is_supported()
+        if self.layer_shell:
+            self._init_layer_shell()
+        self.realize()
+
+    def _init_layer_shell(self) -> None:
+        GtkLayerShell.init_for_window(self)
+        GtkLayerShell.set_namespace(self, "better-control-osd")
+        GtkLayerShell.set_layer(self, GtkLayerShell.Layer.OVERLAY)
+        GtkLayerShell.set_anchor(self, GtkLayerShell.Edge.BOTTOM, True)
+        GtkLayerShell.set_margin(self, GtkLayerShell.Edge.BOTTOM, OSD_MARGIN)
+        if hasattr(GtkLayerShell, "set_keyboard_mode"):
+            GtkLayerShell.set_keyboard_mode(self, GtkLayerShell.KeyboardMode.NONE)
+        else:
+            GtkLayerShell.set_keyboard_interactivity(self, False)
+
+    def show_level(self, kind: str, value: int, muted: bool = False) -> None:
+        value = max(0, min(100, int(value)))
+        self.icon.set_from_icon_name(_icon_for(kind, value, muted), Gtk.IconSize.DND)
+        self.level.set_value(0 if muted else value)
+        self.label.set_text("—" if muted and kind == "mic" else f"{value}%")
+
+        if not self.get_visible():
+            if not self.layer_shell:
+                self._place()
+            self.show()
+        if self.hide_source is not None:
+            GLib.source_remove(self.hide_source)
+        self.hide_source = GLib.timeout_add(OSD_TIMEOUT_MS, self._on_timeout)
+
+    def _place(self) -> None:
+        display = Gdk.Display.get_default()
+        if display is None:
+            return
+        monitor = display.get_primary_monitor() or display.get_monitor(0)
+        if monitor is None:
+            return
+        geometry = monitor.get_geometry()
+        size = self.get_preferred_size()[1]
+        self.move(geometry.x + (geometry.width - size.width) // 2, geometry.y + geometry.height - size.height - OSD_MARGIN)
+
+    def _on_timeout(self) -> bool:
+        self.hide_source = None
+        self.hide()
+        return False
+
+
+class OsdService:
+    """Shows the OSD when volume, mic mute or brightness change
+
+    Audio follows `pactl subscribe`: a change to a sink, source or the
+    server's defaults re-reads the default sink and source, and the popup
+    only appears if volume, mute or mic mute actually changed. Brightness
+    is read from sysfs. `better-control ctl` also pushes the new level
+    over D-Bus right after changing it, which is what key bindings use.
+    """
+
+    def __init__(self, logging: Logger):
+        self.logging = logging
+        self.window = OsdWindow()
+        self.audio: Dict[str, Tuple[int, bool]] = {}
+        self.brightness: Optional[int] = None
+        self.subscribe_process: Optional[Gio.Subprocess] = None
+        # Audio queries still running, and whether to show the result of
+        # another round once they are done (None: no round queued)
+        self.audio_pending = 0
+        self.audio_requeued: Optional[bool] = None
+        self.backlight = self._find_backlight()
+
+    def start(self) -> None:
+        get_style_manager().set_css("osd", OSD_CSS)
+        self._refresh_audio(show=False)
+        self._start_subscribe()
+        if self.backlight is not None:
+            self.brightness = self._read_brightness()
+            GLib.timeout_add(BRIGHTNESS_POLL_MS, self._poll_brightness)
+
+    def show(self, kind: str, value: int, muted: bool = False) -> None:
+        """Show a level that is already known, e.g. pushed by ctl"""
+        if kind in ("volume", "mic"):
+            self.audio[kind] = (int(value), bool(muted))
+        elif kind == "brightness":
+            self.brightness = int(value)
+        self.window.show_level(kind, value, muted)
+
+    def _start_subscribe(self) -> bool:
+        try:
+            self.subscribe_process = Gio.Subprocess.new(
+                ["pactl", "subscribe"], Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_SILENCE
+            )
+        except GLib.Error as e:
+            self.logging.log(LogLevel.Warn, f"Can't follow audio changes: {e.message}")
+            GLib.timeout_add_seconds(SUBSCRIBE_RETRY_S, self._start_subscribe)
+            return False
+
+        stream = Gio.DataInputStream.new(self.subscribe_process.get_stdout_pipe())
+        stream.read_line_async(GLib.PRIORITY_DEFAULT, None, self._on_event_line)
+        return False
+
+    def _on_event_line(self, stream, result) -> None:
+        try:
+            line, _ = stream.read_line_finish_utf8(result)
+        except GLib.Error:
+            line = None
+        if line is None:
+            # pactl exited, e.g. the sound server restarted
+            self.logging.log(LogLevel.Info, "pactl subscribe ended, restarting")
+            GLib.timeout_add_seconds(SUBSCRIBE_RETRY_S, self._start_subscribe)
+            return
+
+        if line.startswith("Event 'change' on") and (" sink #" in line or " source #" in line or " server" in line):
+            self._refresh_audio(show=True)
+        stream.read_line_async(GLib.PRIORITY_DEFAULT, None, self._on_event_line)
+
+    def _refresh_audio(self, show: bool) -> None:
+        if self.audio_pending:
+            # The queries in flight may have started before this change,
+            # read once more when they are done
+            self.audio_requeued = self.audio_requeued or show
+            return
+        self.audio_pending = 4
+        self.audio_requeued = None
+
+        runner = get_command_runner(self.logging)
+        queries = {
+            "volume": (["pactl", "get-sink-volume", "@DEFAULT_SINK@"], ["pactl", "get-sink-mute", "@DEFAULT_SINK@"]),
+            "mic": (["pactl", "get-source-volume", "@DEFAULT_SOURCE@"], ["pactl", "get-source-mute", "@DEFAULT_SOURCE@"]),
+        }
+        for kind, (volume_args, mute_args) in queries.items():
+            state = {}
+
+            def on_result(result, kind=kind, state=state, field="volume"):
+                self.audio_pending -= 1
+                state[field] = result
+                if len(state) == 2:
+                    self._on_audio_state(kind, state["volume"], state["mute"], show)
+                if not self.audio_pending and self.audio_requeued is not None:
+                    self._refresh_audio(self.audio_requeued)
+
+            # Not shared with identical queries in flight, those can predate the change.
+            # A burst of events costs one extra round instead
+            runner.run_async(volume_args, on_result, dedupe=False)
+            runner.run_async(
+                mute_args, lambda result, on_result=on_result: on_result(result, field="mute"), dedupe=False
+            )
+
+    def _on_audio_state(self, kind: str, volume_result, mute_result, show: bool) -> None:
+        try:
+            value = int(volume_result.stdout.split("/")[1].strip().strip("%"))
+        except (IndexError, ValueError):
+            return
+        muted = "yes" in mute_result.stdout.lower()
+
+        previous = self.audio.get(kind)
+        self.audio[kind] = (value, muted)
+        if not show or previous is None:
+            return
+        if kind == "volume" and previous != (value, muted):
+            self.window.show_level(kind, value, muted)
+        elif kind == "mic" and previous[1] != muted:
+            self.window.show_level(kind, value, muted)
+
+    def _find_backlight(self) -> Optional[str]:
+        devices = sorted(glob.glob("/sys/class/backlight/*"))
+        return devices[0] if devices else None
+
+    def _read_brightness(self) -> Optional[int]:
+        try:
+            with open(os.path.join(self.backlight, "brightness")) as f:
+                current = int(f.read())
+            with open(os.path.join(self.backlight, "max_brightness")) as f:
+                maximum = int(f.read())
+            return round(current * 100 / maximum) if maximum else None
+        except (OSError, ValueError):
+            return None
+
+    def _poll_brightness(self) -> bool:
+        value = self._read_brightness()
+        if value is not None and self.brightness is not None and value != self.brightness:
+            self.window.show_level("brightness", value)
+        if value is not None:
+            self.brightness = value
+        return True
+
+
+def apply_osd_window_rules(logging: Logger) -> None:
+    """Float the OSD without focus on Hyprland and Sway when layer shell is missing"""
+    xdg = os.environ.get("XDG_CURRENT_DESKTOP", "").lower()
+    sway_sock = os.environ.get("SWAYSOCK", "").lower()
+    runner = get_command_runner(logging)
+
+    if "hyprland" in xdg:
+        target = f"title:^({OSD_TITLE})$"
+        rules = [
+            "float", "nofocus", "noinitialfocus", "pin", "noanim",
+            f"move (monitor_w*0.5-window_w*0.5) (monitor_h-window_h-{OSD_MARGIN})",
+        ]
+        try:
+            for rule in rules:
+                runner.run(["hyprctl", "keyword", "windowrule", f"{rule},{target}"])
+        except Exception as e:
+            logging.log(LogLevel.Warn, f"Failed to set hyprland OSD window rules: {e}")
+    elif "sway" in sway_sock:
+        target = f'[title="^{OSD_TITLE}$"]'
+        try:
+            runner.run(["swaymsg", "no_focus", target])
+            runner.run([
+                "swaymsg", "for_window", target,
+                "floating enable, sticky enable, move position center, move down 35 ppt",
+            ])
+        except Exception as e:
+            logging.log(LogLevel.Warn, f"Failed to set sway OSD window rules: {e}")
+
+
+def run_osd(arg_parser) -> int:
+    """Run as a resident OSD, without the main window or any tab"""
+    from tools.startup_profiler import start_session_sampler
+    from utils.daemon import start_osd_service
+
+    logging = Logger(arg_parser)
+    logging.log(LogLevel.Info, "Starting OSD")
+    if not Gtk.init_check()[0]:
+        logging.log(LogLevel.Error, "Failed to initialize GTK")
+        return 1
+
+    osd = OsdService(logging)
+    if not osd.window.layer_shell:
+        apply_osd_window_rules(logging)
+    service = start_osd_service(logging, osd.show)
+    if service is None:
+        return 1
+    osd.start()
+    # Started with the session, so it also records autostart startup cost
+    start_session_sampler(logging)
+
+    try:
+        Gtk.main()
+    except KeyboardInterrupt:
+        pass
+    get_command_runner(logging).shutdown()
+    return 0
@@ -5,14 +5,15 @@ import gi
 
 from utils.translations import Translation  # type: ignore
 gi.require_version('Gtk', '3.0')
-import glob
 import os
-from pathlib import Path
 from gi.repository import Gtk, GLib, Gdk, Pango # type: ignore
 from utils.logger import LogLevel, Logger
+from utils.scheduler import get_refresh_scheduler
+from tools.autostart import get_autostart_apps
 from tools.hyprland import get_hyprland_startup_apps, toggle_hyprland_startup
 from tools.globals import get_current_session
-from tools.swaywm import get_sway_startup_apps, toggle_sway_startup
+from tools.swaywm import toggle_sway_startup
+from tools.startup_profiler import format_startup_cost, get_startup_costs
 
 class AutostartTab(Gtk.Box):
     """Autostart settings tab"""
@@ -22,6 +23,7 @@ class AutostartTab(Gtk.Box):
                 self.txt = txt
                 self.logging = logging
                 self.startup_apps = {}
+                self.startup_costs = {}
 
                 self.update_timeout_id = None
                 self.update_interval = 100  # in ms
@@ -196,7 +198,7 @@ class AutostartTab(Gtk.Box):
                 self.connect('key-press-event', self.on_key_press)
 
                 # Set up timer check for external changes
-                GLib.timeout_add(4000, self.check_external_changes)
+                get_refresh_scheduler(self.logging).add(self, 4, self.check_external_changes)
 
                 self.connect("realize", self.on_realize)
 
@@ -219,66 +221,9 @@ class AutostartTab(Gtk.Box):
         self.refresh_list()
 
     def get_startup_apps(self):
-            autostart_dirs = [
-                Path.home() / ".config/autostart"
-            ]
-
-            # Add system directories
-            if hasattr(self, 'toggle1_switch') and self.toggle1_switch.get_active():
-                autostart_dirs.extend([
-                    Path("/etc/xdg/autostart"),
-                ])
-
-            startup_apps = {}
-
-            for autostart_dir in autostart_dirs:
-                if autostart_dir.exists():
-                    for desktop_file in glob.glob(str(autostart_dir / "*.desktop")):
-                        if desktop_file.endswith(".desktop.disabled"):
-                            continue
-
-                        app_name = os.path.basename(desktop_file).replace(".desktop", "")
-
-                        is_hidden = False
-                        try:
-                            with open(desktop_file, 'r') as f:
-                                for line in f:
-                                    if line.strip() == "Hidden=true":
-                                        is_hidden = True
-                                        break
-                        except Exception as e:
-                            self.logging.log(LogLevel.Warn, f"Could not read desktop file {desktop_file}: {e}")
-
-                        if is_hidden and hasattr(self, 'toggle2_switch') and not self.toggle2_switch.get_active():
-                            continue
-                        startup_apps[app_name] = {
-                            "type": "desktop",
-                            "path": desktop_file,
-                            "name": app_name,
-                            "enabled": True,
-                            "hidden": is_hidden
-                            }
-
-                    for desktop_file in glob.glob(str(autostart_dir / "*.desktop.disabled")):
-                        app_name = os.path.basename(desktop_file).replace(".desktop.disabled", "")
-                        startup_apps[app_name] = {
-                            "type": "desktop",
-                            "path": desktop_file,
-                            "name": app_name,
-                            "enabled": False,
-                            "hidden": False
-                            }
-
-            # Add hyprland and sway apps according to session
-            if get_current_session() == "Hyprland":
-                hypr_apps = get_hyprland_startup_apps()
-                startup_apps.update(hypr_apps)
-            if get_current_session() == "sway":
-                sway_apps = get_sway_startup_apps()
-                startup_apps.update(sway_apps)
-
-            self.logging.log(LogLevel.Debug, f"Found {len(startup_apps)} autostart apps")
-            return startup_apps
+            include_system = hasattr(self, 'toggle1_switch') and self.toggle1_switch.get_active()
+            include_hidden = not hasattr(self, 'toggle2_switch') or self.toggle2_switch.get_active()
+            return get_autostart_apps(self.logging, include_system, include_hidden)
 
     def refresh_list(self, widget=None):
         """Clear and repopulate the list of autostart apps
@@ -297,11 +242,20 @@ class AutostartTab(Gtk.Box):
         apps = self.get_startup_apps()
         self.startup_apps = apps
 
+        # Recorded at login by the startup sampler, this only reads the history
+        self.startup_costs = get_startup_costs(self.logging)
+
+        # Most expensive entries first, entries without history keep their order
+        ordered = sorted(
+            apps.items(),
+            key=lambda item: -self.startup_costs.get(item[0], {}).get("cost", -1)
+        )
+
         # Clear list in main thread
         GLib.idle_add(self.clear_list)
 
         # Add each app in main thread
-        for app_name, app in apps.items():
+        for app_name, app in ordered:
             GLib.idle_add(self.add_app_to_list, app_name, app)
 
     def clear_list(self):
@@ -377,6 +331,19 @@ class AutostartTab(Gtk.Box):
             path_label.get_style_context().add_class(Gtk.STYLE_CLASS_DIM_LABEL)
             info_box.pack_start(path_label, False, False, 0)
 
+        # Startup cost measured at previous logins
+        cost = self.startup_costs.get(app_name)
+        if cost:
+            cost_label = Gtk.Label(label=format_startup_cost(cost), xalign=0)
+            cost_label.set_tooltip_text(
+                getattr(self.txt, 'autostart_startup_cost_tooltip',
+                        'Average spawn delay after login, CPU time and memory during startup')
+                + f" ({cost['sessions']})"
+            )
+            cost_label.get_style_context().add_class(Gtk.STYLE_CLASS_DIM_LABEL)
+            cost_label.get_style_context().add_class("startup-cost-label")
+            info_box.pack_start(cost_label, False, False, 0)
+
         hbox.pack_start(info_box, True, True, 0)
 
         # Toggle button with better styling
@@ -423,7 +390,7 @@ class AutostartTab(Gtk.Box):
 
         elif app["type"] == "hyprland":
             # hyprland specific case
-            toggle_hyprland_startup(app_name)
+            toggle_hyprland_startup(app_name, self.logging)
 
             app["enabled"] = not app["enabled"]
             button.set_label(self.txt.disable if app["enabled"] else self.txt.enable)
@@ -440,7 +407,7 @@ class AutostartTab(Gtk.Box):
         # for sway
         elif app["type"] == "sway":
             # sway specific case
-            toggle_sway_startup(app_name)
+            toggle_sway_startup(app_name, self.logging)
 
             app["enabled"] = not app["enabled"]
             button.set_label(self.txt.disable if app["enabled"] else self.txt.enable)
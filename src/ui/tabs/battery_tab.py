@@ -4,12 +4,12 @@ import gi
 
 from utils.translations import English, Spanish  # type: ignore
 gi.require_version('Gtk', '3.0')
-import subprocess
 import os
-import threading
 from datetime import datetime
-from gi.repository import Gtk, GLib,Gdk  # type: ignore
+from gi.repository import Gtk, Gdk  # type: ignore
+from utils.commands import get_command_runner
 from utils.logger import LogLevel, Logger
+from utils.scheduler import get_refresh_scheduler
 
 
 class BatteryTab(Gtk.Box):
@@ -21,6 +21,8 @@ class BatteryTab(Gtk.Box):
         self.last_refresh_time = datetime.now()
         # Dictionary to track expanded state of battery cards
         self.expanded_batteries = {}
+        # Header of each battery card, kept for the snapshot cache
+        self.battery_summary = []
 
         self.__load_gui(parent)
 
@@ -38,9 +40,7 @@ class BatteryTab(Gtk.Box):
         saved_mode = ''
         try:
             # Get current power plan using powerprofilesctl
-            result = subprocess.run(
-                "powerprofilesctl get", shell=True, capture_output=True, text=True
-            )
+            result = get_command_runner(self.logging).run(["powerprofilesctl", "get"])
             if result.returncode == 0:
                 current_plan = result.stdout.strip()
 
@@ -83,7 +83,7 @@ class BatteryTab(Gtk.Box):
         self.connect('key-press-event', self.on_key_press)
 
         self.refresh_battery_info()
-        GLib.timeout_add_seconds(10, self.refresh_battery_info)
+        get_refresh_scheduler(self.logging).add(self, 10, self.refresh_battery_info)
         
     # keybinds for battery tab
     def on_key_press(self, widget, event):
@@ -103,57 +103,37 @@ class BatteryTab(Gtk.Box):
             # Disable dropdown while processing
             self.power_mode_dropdown.set_sensitive(False)
 
-            # Create and start thread for async operation
-            def run_power_change():
-                try:
-                    command = f"powerprofilesctl set {mode_value}"
-                    result = subprocess.run(
-                        command, shell=True, capture_output=True, text=True
+            def on_power_changed(result):
+                self.power_mode_dropdown.set_sensitive(True)
+
+                if result.returncode == 127:
+                    error_message = "powerprofilesctl is missing. Please check our GitHub page to see all dependencies and install them."
+                    self.logging.log(LogLevel.Error, error_message)
+                    if self.parent:
+                        self.parent.show_error_dialog(error_message)
+                elif result.returncode != 0:
+                    error_message = f"Failed to set power mode: {result.stderr.strip()}"
+                    self.logging.log(LogLevel.Error, error_message)
+                    if self.parent:
+                        self.parent.show_error_dialog(error_message)
+                else:
+                    self.logging.log(
+                        LogLevel.Info,
+                        f"Power mode changed to: {selected_mode} ({mode_value})",
                     )
+                    # Refresh the UI to update button styles
+                    self.refresh_battery_info()
 
-                    # Use GLib.idle_add to update UI from the main thread
-                    def update_ui():
-                        self.power_mode_dropdown.set_sensitive(True)
-
-                        if result.returncode != 0:
-                            error_message = "powerprofilesctl is missing. Please check our GitHub page to see all dependencies and install them."
-                            self.logging.log(LogLevel.Error, error_message)
-                            if self.parent:
-                                self.parent.show_error_dialog(error_message)
-                        else:
-                            self.logging.log(
-                                LogLevel.Info,
-                                f"Power mode changed to: {selected_mode} ({mode_value})",
-                            )
-                            # Refresh the UI to update button styles
-                            self.refresh_battery_info()
-                        return False
-
-                    GLib.idle_add(update_ui)
-
-                except Exception as e:
-                    def handle_error(e=e):  # Capture the exception in the closure
-                        self.power_mode_dropdown.set_sensitive(True)
-                        error_message = f"Failed to set power mode: {e}"
-                        self.logging.log(LogLevel.Error, error_message)
-                        if self.parent:
-                            self.parent.show_error_dialog(error_message)
-                        return False
-
-                    GLib.idle_add(handle_error)
-
-            # Start the thread
-            thread = threading.Thread(target=run_power_change, daemon=True)
-            thread.start()
+            get_command_runner(self.logging).run_async(
+                ["powerprofilesctl", "set", mode_value], on_power_changed
+            )
 
     def get_battery_devices(self):
         """Get list of battery devices from UPower."""
         devices = []
         try:
             # List all UPower devices
-            result = subprocess.run(
-                "upower -e", shell=True, capture_output=True, text=True
-            )
+            result = get_command_runner(self.logging).run(["upower", "-e"])
             if result.returncode == 0:
                 for line in result.stdout.strip().split("\n"):
                     # Only include battery devices
@@ -488,6 +468,7 @@ class BatteryTab(Gtk.Box):
 
         # Get battery devices
         battery_devices = self.get_battery_devices()
+        self.battery_summary = []
 
         if not battery_devices:
             # Create styled "no battery" message
@@ -525,18 +506,21 @@ class BatteryTab(Gtk.Box):
             for device_path in battery_devices:
                 try:
                     # Run upower command for this battery
-                    result = subprocess.run(
-                        f"upower -i {device_path}",
-                        shell=True,
-                        capture_output=True,
-                        text=True,
-                    )
+                    result = get_command_runner(self.logging).run(["upower", "-i", device_path])
                     if result.returncode == 0:
                         battery_info = self.parse_upower_output(result.stdout)
 
                         # Create a styled card for this battery
                         battery_card = self.create_battery_card(battery_info, device_path)
                         batteries_container.pack_start(battery_card, False, False, 0)
+
+                        charge_percentage = self._get_charge_percentage(battery_info)
+                        state_text = battery_info.get("State", "Unknown")
+                        self.battery_summary.append({
+                            "icon": self._get_battery_icon(charge_percentage, state_text),
+                            "title": self._get_battery_title(battery_info, device_path),
+                            "subtitle": f"{charge_percentage}% • {state_text}",
+                        })
                 except Exception as e:
                     self.logging.log(
                         LogLevel.Error, f"Error processing battery {device_path}: {e}"
@@ -553,6 +537,12 @@ class BatteryTab(Gtk.Box):
 
         return True
 
+    def get_snapshot(self):
+        """View model for the snapshot cache: one row per battery card"""
+        if not self.battery_summary:
+            return None
+        return {"summary": self.battery_summary}
+
     def on_power_mode_button_clicked(self, button, mode):
         """Handle click on power mode button."""
         # Disable all mode buttons while processing
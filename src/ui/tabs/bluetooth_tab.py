@@ -3,6 +3,7 @@
 import gi  # type: ignore
 
 from utils.logger import LogLevel, Logger
+from utils.scheduler import get_refresh_scheduler
 from utils.translations import English, Spanish
 
 gi.require_version("Gtk", "3.0")
@@ -160,7 +161,7 @@ class BluetoothTab(Gtk.Box):
         self.connect('key-press-event', self.on_key_press)
 
         # Set up periodic device list updates
-        GLib.timeout_add(2000, self.periodic_update)
+        get_refresh_scheduler(self.logging).add(self, 2, self.periodic_update)
 
 
     def on_refresh_enter(self, widget, event):
@@ -225,6 +226,25 @@ class BluetoothTab(Gtk.Box):
 
         self.devices_box.show_all()
 
+    def get_snapshot(self):
+        """View model for the snapshot cache: the devices last listed"""
+        summary = []
+        for row in self.devices_box.get_children():
+            if not isinstance(row, BluetoothDeviceRow):
+                continue
+            if row.is_connected:
+                subtitle = self.txt.connected
+                if row.battery_percentage is not None:
+                    subtitle += f" • {row.battery_percentage}%"
+            else:
+                subtitle = row.get_friendly_device_type()
+            summary.append({
+                "icon": row.get_icon_name_for_device(),
+                "title": row.device_name,
+                "subtitle": subtitle,
+            })
+        return {"summary": summary} if summary else None
+
     def periodic_update(self):
         """Update the device list periodically"""
         try:
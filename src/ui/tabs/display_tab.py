@@ -3,14 +3,16 @@
 import gi  # type: ignore
 import subprocess
 
+from utils.commands import get_command_runner
 from utils.logger import LogLevel, Logger
+from utils.scheduler import get_refresh_scheduler
 from utils.translations import Translation
 
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk, GLib  # type: ignore
+from gi.repository import Gtk  # type: ignore
 
-from utils.settings import load_settings, save_settings
-from tools.display import get_brightness, get_display_info, get_displays, rotate_display, set_brightness
+from utils.settings import get_settings_store
+from tools.display import get_brightness, get_brightness_async, get_display_info, get_displays, rotate_display, set_brightness
 from tools.hyprland import get_hyprland_displays, set_hyprland_transform, get_hyprland_rotation
 from tools.globals import get_current_session
 from ui.dialogs.rotation_dialog import RotationConfirmDialog
@@ -22,8 +24,7 @@ class DisplayTab(Gtk.Box):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=10)
         self.txt = txt
         self.logging = logging
-        self.update_timeout_id = None
-        self.update_interval = 500  # milliseconds
+        self.update_interval = 1  # seconds, ticks of the refresh scheduler
         self.is_visible = False
         self.session = get_current_session()
         displays = get_displays(self.logging)
@@ -108,7 +109,7 @@ class DisplayTab(Gtk.Box):
         # Get displays according to current session
         displays = []
         if "Hyprland" in self.session:
-            hypr_displays = get_hyprland_displays()
+            hypr_displays = get_hyprland_displays(self.logging)
             displays = list(hypr_displays.keys())
         else:
             displays = get_displays(self.logging)
@@ -198,8 +199,8 @@ class DisplayTab(Gtk.Box):
         self.bluelight_scale = Gtk.Scale.new_with_range(
             Gtk.Orientation.HORIZONTAL, 0, 100, 1
         )
-        settings = load_settings(self.logging)
-        saved_gamma = settings.get("gamma", 6500)
+        self.settings_store = get_settings_store(self.logging)
+        saved_gamma = self.settings_store.get("gamma", 6500)
         # Convert temperature to percentage
         percentage = (saved_gamma - 2500) / 40  # (6500-2500)/100 = 40
         self.bluelight_scale.set_value(percentage)
@@ -225,17 +226,16 @@ class DisplayTab(Gtk.Box):
         scroll_window.add(content_box)
         self.pack_start(scroll_window, True, True, 0)
 
-        # Connect destroy signal to cleanup
-        self.connect("destroy", self.on_destroy)
-
         # Connect visibility signals
         self.connect("map", self.on_mapped)
         self.connect("unmap", self.on_unmapped)
+        self.is_visible = self.get_mapped()
 
-        # Only start auto-refresh when the tab becomes visible
-        if self.get_mapped():
-            self.is_visible = True
-            self.start_auto_update()
+        # Auto-refresh only runs while this is the current page
+        get_refresh_scheduler(self.logging).add(self, self.update_interval, self.refresh_display_settings)
+        # The blue light slider follows the setting instead of polling it
+        self.settings_store.connect("gamma", self.on_gamma_setting_changed)
+        self.connect("destroy", self.on_destroy)
         
         self.previous_orientation = "normal"
     
@@ -248,13 +248,13 @@ class DisplayTab(Gtk.Box):
             
             # Get orientation if in hyprland
             if "Hyprland" in self.session:
-                current_orientation = get_hyprland_rotation()
+                current_orientation = get_hyprland_rotation(self.logging)
             else:
                 current_orientation = self.get_current_orientation()
             
             # Skip if trying to rotate to current orientation
             if rotation.lower() == current_orientation.lower():
-                self.logging.log(LogLevel.Info, f"Already in {get_hyprland_rotation()}")
+                self.logging.log(LogLevel.Info, f"Already in {get_hyprland_rotation(self.logging)}")
                 return
             
             self.previous_orientation = current_orientation
@@ -282,7 +282,7 @@ class DisplayTab(Gtk.Box):
         """Get current display orientation"""
         try:
             if "Hyprland" in self.session:
-                displays = get_hyprland_displays()
+                displays = get_hyprland_displays(self.logging)
                 # mapped according to hyprctl display -> transform: 0 
                 transform_map = {
                     0: "normal",
@@ -310,16 +310,10 @@ class DisplayTab(Gtk.Box):
     def set_bluelight(self, temperature):
         """Set blue light level"""
         temperature = int(temperature)
-        settings = load_settings(self.logging)
-        settings["gamma"] = temperature
-        save_settings(settings, self.logging)
+        self.settings_store.set("gamma", temperature)
 
         # Kill any existing gammastep process
-        subprocess.run(
-            ["pkill", "-f", "gammastep"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        get_command_runner(self.logging).run(["pkill", "-f", "gammastep"])
         # Start new gammastep process with new temperature
         subprocess.Popen(
             ["gammastep", "-O", str(temperature)],
@@ -343,65 +337,43 @@ class DisplayTab(Gtk.Box):
     def refresh_display_settings(self, *args):
         """Refresh display settings"""
         self.logging.log(LogLevel.Info, "Refreshing display settings")
+        get_brightness_async(self.logging, self._show_brightness)
+
+        # Return True to keep the timer running if this was called by the timer
+        return True
 
+    def _show_brightness(self, current_brightness):
+        """Move the brightness slider without setting the brightness again"""
         # Block the value-changed signal before updating the brightness slider
         self.brightness_scale.disconnect_by_func(self.on_brightness_changed)
 
         # Update brightness slider with current value
-        current_brightness = get_brightness(self.logging)
         self.brightness_scale.set_value(current_brightness)
 
         # Reconnect the value-changed signal
         self.brightness_scale.connect("value-changed", self.on_brightness_changed)
 
-        # Reload settings from file
-        settings = load_settings(self.logging)
-        saved_gamma = settings.get("gamma", 6500)
-        # Convert temperature to percentage (non-inverted: 2500K = 0%, 6500K = 100%)
-        percentage = (saved_gamma - 2500) / 40  # (6500-2500)/100 = 40
+    def on_gamma_setting_changed(self, key, temperature):
+        """Move the blue light slider when gamma is changed elsewhere"""
+        percentage = (temperature - 2500) / 40
+        if self.bluelight_scale.get_value() == percentage:
+            return
 
         # Block the value-changed signal before updating the blue light filter slider
         self.bluelight_scale.disconnect_by_func(self.on_bluelight_changed)
-
-        # Update blue light filter slider with saved value
         self.bluelight_scale.set_value(percentage)
-
-        # Reconnect the value-changed signal
         self.bluelight_scale.connect("value-changed", self.on_bluelight_changed)
 
-        # Return True to keep the timer running if this was called by the timer
-        return True
+    def on_destroy(self, widget):
+        self.settings_store.disconnect("gamma", self.on_gamma_setting_changed)
 
     def on_mapped(self, widget):
         """Called when the widget becomes visible"""
         self.is_visible = True
-        self.start_auto_update()
-        self.logging.log(LogLevel.Info, "Display tab became visible, starting auto-update")
 
     def on_unmapped(self, widget):
         """Called when the widget is hidden"""
         self.is_visible = False
-        self.stop_auto_update()
-        self.logging.log(LogLevel.Info, "Display tab hidden, stopping auto-update")
-
-    def start_auto_update(self):
-        """Start auto-updating display settings"""
-        if self.update_timeout_id is None and self.is_visible:
-            self.update_timeout_id = GLib.timeout_add(
-                self.update_interval, self.refresh_display_settings
-            )
-            self.logging.log(LogLevel.Info, f"Auto-update started with {self.update_interval}ms interval")
-
-    def stop_auto_update(self):
-        """Stop auto-updating display settings"""
-        if self.update_timeout_id is not None:
-            GLib.source_remove(self.update_timeout_id)
-            self.update_timeout_id = None
-            self.logging.log(LogLevel.Info, "Auto-update stopped")
-
-    def on_destroy(self, widget):
-        """Clean up resources when widget is destroyed"""
-        self.stop_auto_update()
 
     def create_rotation_controls(self):
         """Create rotation controls with hyprland's transform options"""
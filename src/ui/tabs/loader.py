@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+import time
+from enum import Enum
+from typing import Callable, Dict, List, Optional
+
+from gi.repository import GLib, Gtk  # type: ignore
+
+from utils.logger import LogLevel, Logger
+
+
+class TabState(Enum):
+    PLACEHOLDER = 0
+    LOADING = 1
+    READY = 2
+    FAILED = 3
+
+
+class TabLoader:
+    """Builds tabs on the main thread in idle time, one state machine per tab
+
+    Every tab starts as a PLACEHOLDER, moves to LOADING while its constructor
+    runs and ends up READY (or FAILED). Queued tabs are built from a single
+    idle source running below GTK's redraw and input priorities, each pass
+    builds tabs until its time budget is spent and then yields so a frame can
+    be drawn. A tab is only ever constructed once, whoever asks for it.
+    """
+
+    # Time one idle pass may spend constructing tabs, about half a 60Hz frame
+    FRAME_BUDGET = 0.008
+
+    def __init__(self, logging: Logger, build: Callable[[str], Gtk.Widget],
+                 install: Callable[[str, Gtk.Widget], None]):
+        """
+        Args:
+            logging (Logger): logger
+            build (Callable[[str], Gtk.Widget]): constructs the tab widget
+            install (Callable[[str, Gtk.Widget], None]): swaps the
+                placeholder for the constructed tab
+        """
+        self.logging = logging
+        self.build = build
+        self.install = install
+        self.states: Dict[str, TabState] = {}
+        self.widgets: Dict[str, Gtk.Widget] = {}
+        self.queue: List[str] = []
+        self.source_id: Optional[int] = None
+
+    def add(self, tab_name: str) -> None:
+        """Track a tab as a placeholder, without queueing it"""
+        self.states.setdefault(tab_name, TabState.PLACEHOLDER)
+
+    def state(self, tab_name: str) -> Optional[TabState]:
+        return self.states.get(tab_name)
+
+    def is_ready(self, tab_name: str) -> bool:
+        return self.states.get(tab_name) == TabState.READY
+
+    def get_widget(self, tab_name: str) -> Optional[Gtk.Widget]:
+        """The constructed tab, or None if it isn't READY"""
+        return self.widgets.get(tab_name)
+
+    def enqueue(self, tab_names: List[str]) -> None:
+        """Queue tabs for background construction, in the given order"""
+        for tab_name in tab_names:
+            self.add(tab_name)
+            if self.states[tab_name] == TabState.PLACEHOLDER and tab_name not in self.queue:
+                self.queue.append(tab_name)
+        self._schedule()
+
+    def prioritize(self, tab_name: str) -> None:
+        """Move a tab to the front of the queue, e.g. because it was switched to
+
+        Construction still happens from the idle source, never from inside
+        the signal emission that asked for it.
+        """
+        self.add(tab_name)
+        if self.states[tab_name] != TabState.PLACEHOLDER:
+            return
+        if tab_name in self.queue:
+            self.queue.remove(tab_name)
+        self.queue.insert(0, tab_name)
+        self._schedule()
+
+    def load_now(self, tab_name: str) -> Optional[Gtk.Widget]:
+        """Construct a tab synchronously if needed and return it
+
+        Only for callers that aren't inside a notebook signal, like the
+        settings dialog unhiding a tab.
+        """
+        self.add(tab_name)
+        if self.states[tab_name] == TabState.PLACEHOLDER:
+            if tab_name in self.queue:
+                self.queue.remove(tab_name)
+            self._load(tab_name)
+        return self.widgets.get(tab_name)
+
+    def cancel(self) -> None:
+        """Drop the queue and stop the idle source"""
+        self.queue.clear()
+        if self.source_id is not None:
+            GLib.source_remove(self.source_id)
+            self.source_id = None
+
+    def _schedule(self) -> None:
+        if self.queue and self.source_id is None:
+            # DEFAULT_IDLE sits below event dispatch and redraw (HIGH_IDLE + 20)
+            self.source_id = GLib.idle_add(self._run_chunk, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _run_chunk(self) -> bool:
+        deadline = time.monotonic() + self.FRAME_BUDGET
+        # Always build at least one tab, a single constructor can exceed the budget
+        while self.queue:
+            self._load(self.queue.pop(0))
+            if time.monotonic() >= deadline:
+                break
+
+        if self.queue:
+            return True
+        self.source_id = None
+        return False
+
+    def _load(self, tab_name: str) -> None:
+        if self.states.get(tab_name) != TabState.PLACEHOLDER:
+            return
+
+        self.states[tab_name] = TabState.LOADING
+        try:
+            widget = self.build(tab_name)
+            self.widgets[tab_name] = widget
+            self.install(tab_name, widget)
+        except Exception as e:
+            self.states[tab_name] = TabState.FAILED
+            self.logging.log(LogLevel.Error, f"Failed to create tab {tab_name}: {e}")
+            return
+
+        self.states[tab_name] = TabState.READY
+        self.logging.log(LogLevel.Info, f"Created tab: {tab_name}")
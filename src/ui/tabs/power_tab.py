@@ -4,11 +4,42 @@ import gi # type: ignore
 
 from utils.translations import Translation  # type: ignore
 gi.require_version('Gtk', '3.0')
-import subprocess
 import json
 import os
+import threading
 from gi.repository import Gtk, GLib, Gdk  # type: ignore
 from utils.logger import LogLevel, Logger
+from tools.power import DEFAULT_COMMANDS, get_power_executor
+from ui.css.style_manager import get_style_manager
+
+POWER_CSS = """
+.power-button {
+    border-radius: 12px;
+    transition: all 200ms ease;
+}
+
+.power-button:hover {
+    opacity: 0.9;
+}
+
+.power-button-label {
+    color: white;
+    font-weight: bold;
+    font-size: 14px;
+    text-shadow: 0px 1px 2px rgba(0, 0, 0, 0.5);
+}
+
+.power-button-icon {
+    color: white;
+    -gtk-icon-shadow: 0px 1px 2px rgba(0, 0, 0, 0.5);
+}
+
+.preview-button {
+    color: white;
+    font-weight: bold;
+    border-radius: 6px;
+}
+"""
 
 class PowerTab(Gtk.Box):
     """Power management tab with suspend, shutdown and reboot options"""
@@ -31,6 +62,10 @@ class PowerTab(Gtk.Box):
             self.custom_shortcuts = self.active_buttons.get("shortcuts", {})
             self.show_keybinds = self.active_buttons.get("show_keybinds", True)
 
+            # Actions logind reports as unsupported are hidden from the grid
+            self.executor = get_power_executor(logging)
+            self.unsupported_actions = set()
+
             # Connect visibility signals
             self.connect("map", self.on_mapped)
             self.connect("unmap", self.on_unmapped)
@@ -170,6 +205,9 @@ class PowerTab(Gtk.Box):
             self._build_power_grid()
             self.pack_start(self.grid_container, True, True, 0)
 
+            # Ask logind asynchronously which actions are available
+            self.executor.check_capabilities_async(self._on_capabilities_checked)
+
             # Create settings popover
             self.settings_popover = Gtk.Popover()
             self.settings_popover.set_position(Gtk.PositionType.BOTTOM)
@@ -211,6 +249,17 @@ class PowerTab(Gtk.Box):
                     self.logging.log(LogLevel.Info, "Power tab in minimal mode, keybindings always active")
         return False  # Don't call again
 
+    def _on_capabilities_checked(self, capabilities):
+        """Hide actions that logind reports as unsupported"""
+        changed = False
+        for action_id, supported in capabilities.items():
+            if not supported and action_id not in self.unsupported_actions:
+                self.logging.log(LogLevel.Info, f"Hiding unsupported power action: {action_id}")
+                self.unsupported_actions.add(action_id)
+                changed = True
+        if changed:
+            self._build_power_grid()
+
     def on_mapped(self, widget):
         """Called when the widget becomes visible"""
         self.is_visible = True
@@ -242,7 +291,7 @@ class PowerTab(Gtk.Box):
 
         for option in self.power_options:
             option_id = option["id"]
-            if not self.active_buttons.get(option_id, True):
+            if not self.active_buttons.get(option_id, True) or option_id in self.unsupported_actions:
                 continue
 
             shortcut = self.custom_shortcuts.get(option_id, option["default_shortcut"]).lower()
@@ -250,7 +299,6 @@ class PowerTab(Gtk.Box):
             if keychar == shortcut:
                 self.logging.log(LogLevel.Info, f"Shortcut triggered for {option['label']}")
                 option["callback"](None)
-                self._close_application()
                 return True
 
         return False
@@ -275,14 +323,7 @@ class PowerTab(Gtk.Box):
             "hibernate": True,
             "reboot": True,
             "shutdown": True,
-            "commands": {
-                "lock": "loginctl lock-session",
-                "logout": "loginctl terminate-user $USER",
-                "suspend": "systemctl suspend",
-                "hibernate": "systemctl hibernate",
-                "reboot": "systemctl reboot",
-                "shutdown": "systemctl poweroff"
-            },
+            "commands": dict(DEFAULT_COMMANDS),
             "colors": {
                 "lock": "#4A90D9",
                 "logout": "#729FCF",
@@ -296,9 +337,6 @@ class PowerTab(Gtk.Box):
         }
 
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-
             if os.path.exists(self.config_file):
                 with open(self.config_file, 'r') as f:
                     settings = json.load(f)
@@ -317,22 +355,31 @@ class PowerTab(Gtk.Box):
 
                     return settings
             else:
-                # Create default settings file
-                with open(self.config_file, 'w') as f:
-                    json.dump(default_settings, f, indent=2)
+                # Create default settings file off the main thread
+                self.active_buttons = default_settings
+                self._save_settings()
                 return default_settings
         except Exception as e:
             self.logging.log(LogLevel.Error, f"Failed to load power settings: {e}")
             return default_settings
 
     def _save_settings(self):
-        """Save power menu button settings"""
-        try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.active_buttons, f, indent=2)
-            self.logging.log(LogLevel.Info, "Power menu settings saved")
-        except Exception as e:
-            self.logging.log(LogLevel.Error, f"Failed to save power settings: {e}")
+        """Save power menu button settings in a background thread"""
+        # Serialize on the caller's thread so later edits don't race the writer
+        data = json.dumps(self.active_buttons, indent=2)
+
+        def write():
+            try:
+                os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+                temp_path = self.config_file + ".tmp"
+                with open(temp_path, 'w') as f:
+                    f.write(data)
+                os.replace(temp_path, self.config_file)
+                self.logging.log(LogLevel.Info, "Power menu settings saved")
+            except Exception as e:
+                self.logging.log(LogLevel.Error, f"Failed to save power settings: {e}")
+
+        threading.Thread(target=write, daemon=True).start()
 
     def _build_power_grid(self):
         """Build the power buttons grid based on active buttons"""
@@ -353,7 +400,8 @@ class PowerTab(Gtk.Box):
 
         # Filter and add only active buttons
         active_options = [option for option in self.power_options
-                          if self.active_buttons.get(option["id"], True)]
+                          if self.active_buttons.get(option["id"], True)
+                          and option["id"] not in self.unsupported_actions]
 
         # Calculate optimal grid dimensions to make it as square as possible
         num_buttons = len(active_options)
@@ -391,6 +439,7 @@ class PowerTab(Gtk.Box):
                 label_with_shortcut = f"{option['label']} [{shortcut}]"
 
             button = self._create_power_button(
+                option["id"],
                 label_with_shortcut,
                 option["icon"],
                 option["tooltip"],
@@ -573,16 +622,7 @@ class PowerTab(Gtk.Box):
                 for idx, option in enumerate(self.power_options):
                     option_id = option["id"]
 
-                    # determine default
-                    defaults_map = {
-                        "lock": "loginctl lock-session",
-                        "logout": "loginctl terminate-user $USER",
-                        "suspend": "systemctl suspend",
-                        "hibernate": "systemctl hibernate",
-                        "reboot": "systemctl reboot",
-                        "shutdown": "systemctl poweroff",
-                    }
-                    default_cmd = defaults_map.get(option_id, "")
+                    default_cmd = DEFAULT_COMMANDS.get(option_id, "")
 
                     current_cmd = self.active_buttons.get("commands", {}).get(option_id, default_cmd)
 
@@ -701,14 +741,9 @@ class PowerTab(Gtk.Box):
 
                     preview_button = Gtk.Button(label=option["label"])
                     preview_button.set_size_request(120, 30)
-
-                    style_provider = Gtk.CssProvider()
-                    css = f".preview-button {{ background-color: {current_color}; color: white; font-weight: bold; border-radius: 6px; }}"
-                    style_provider.load_from_data(css.encode())
                     preview_button.get_style_context().add_class("preview-button")
-                    preview_button.get_style_context().add_provider(
-                        style_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                    )
+                    preview_button.get_style_context().add_class(f"preview-button-{option_id}")
+                    self._set_preview_color(option_id, current_color)
 
                     setattr(color_button, "preview_button", preview_button)
                     setattr(color_button, "preview_color", current_color)
@@ -828,54 +863,36 @@ class PowerTab(Gtk.Box):
 
     def _add_css(self):
         """Add CSS styling for power buttons"""
-        css_provider = Gtk.CssProvider()
-        css = """
-        .power-button {
-            border-radius: 12px;
-            transition: all 200ms ease;
-        }
-
-        .power-button:hover {
-            opacity: 0.9;
-        }
-
-        .power-button-label {
-            color: white;
-            font-weight: bold;
-            font-size: 14px;
-            text-shadow: 0px 1px 2px rgba(0, 0, 0, 0.5);
-        }
-
-        .power-button-icon {
-            color: white;
-            -gtk-icon-shadow: 0px 1px 2px rgba(0, 0, 0, 0.5);
-        }
-        """
-        css_provider.load_from_data(css.encode())
+        get_style_manager().set_css("power", POWER_CSS)
+
+    def _set_button_color(self, option_id, color):
+        """Update the background rule of one power button"""
+        get_style_manager().set_rule(
+            f"power-color-{option_id}",
+            f".power-button.power-button-{option_id}",
+            {"background-color": color},
+        )
 
-        Gtk.StyleContext.add_provider_for_screen(
-            Gdk.Screen.get_default(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+    def _set_preview_color(self, option_id, color):
+        """Update the background rule of one colour preview button"""
+        get_style_manager().set_rule(
+            f"power-preview-{option_id}",
+            f".preview-button.preview-button-{option_id}",
+            {"background-color": color},
         )
 
-    def _create_power_button(self, label_text, icon_name, tooltip, callback, color, size=120):
+    def _create_power_button(self, option_id, label_text, icon_name, tooltip, callback, color, size=120):
         """Create a styled power button with icon and label"""
         button = Gtk.Button()
         button.set_tooltip_text(tooltip)
         button.connect("clicked", callback)
         button.set_size_request(size, size)
 
-        # Apply CSS class
+        # Apply CSS classes, the colour rule is shared per action and only
+        # reloaded when the colour actually changes
         button.get_style_context().add_class("power-button")
-
-        # Add custom background color
-        button_style = f".power-button {{ background-color: {color}; }}"
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(button_style.encode())
-        button.get_style_context().add_provider(
-            css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        button.get_style_context().add_class(f"power-button-{option_id}")
+        self._set_button_color(option_id, color)
 
         # Set up button contents
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
@@ -896,74 +913,50 @@ class PowerTab(Gtk.Box):
 
         return button
 
-    def _execute_command(self, command):
-        """Execute a custom command"""
-        try:
-            # Handle special case for USER substitution
-            if "$USER" in command:
-                import os
-                username = os.environ.get('USER', os.environ.get('USERNAME', ''))
-                command = command.replace("$USER", username)
-
-            self.logging.log(LogLevel.Info, f"Executing command: {command}")
-            subprocess.Popen(command.split())
-        except Exception as e:
-            self.logging.log(LogLevel.Error, f"Failed to execute command: {e}")
+    def _execute_action(self, action_id):
+        """Execute a power action through logind or the configured command"""
+        # Closing earlier would end the process before logind answered,
+        # losing the command fallback and any polkit prompt
+        self.executor.execute(
+            action_id, self.custom_commands.get(action_id), on_done=self._close_application
+        )
 
     def _close_application(self):
         """Close the application"""
         window = self.get_toplevel()
         if isinstance(window, Gtk.Window):
             self.logging.log(LogLevel.Info, "Closing application after power action")
-            GLib.timeout_add(100, window.close)
+            window.close()
 
     def on_lock_clicked(self, widget):
         """Handle lock button click"""
-        command = self.custom_commands.get("lock", "loginctl lock-session")
-        self.logging.log(LogLevel.Info, f"Lock button clicked, running: {command}")
-        self._execute_command(command)
-        # Close application after executing command
-        self._close_application()
+        self.logging.log(LogLevel.Info, "Lock button clicked")
+        self._execute_action("lock")
 
     def on_logout_clicked(self, widget):
         """Handle logout button click"""
-        command = self.custom_commands.get("logout", "loginctl terminate-user $USER")
-        self.logging.log(LogLevel.Info, f"Logout button clicked, running: {command}")
-        self._execute_command(command)
-        # Close application after executing command
-        self._close_application()
+        self.logging.log(LogLevel.Info, "Logout button clicked")
+        self._execute_action("logout")
 
     def on_suspend_clicked(self, widget):
         """Handle suspend button click"""
-        command = self.custom_commands.get("suspend", "systemctl suspend")
-        self.logging.log(LogLevel.Info, f"Suspend button clicked, running: {command}")
-        self._execute_command(command)
-        # Close application after executing command
-        self._close_application()
+        self.logging.log(LogLevel.Info, "Suspend button clicked")
+        self._execute_action("suspend")
 
     def on_hibernate_clicked(self, widget):
         """Handle hibernate button click"""
-        command = self.custom_commands.get("hibernate", "systemctl hibernate")
-        self.logging.log(LogLevel.Info, f"Hibernate button clicked, running: {command}")
-        self._execute_command(command)
-        # Close application after executing command
-        self._close_application()
+        self.logging.log(LogLevel.Info, "Hibernate button clicked")
+        self._execute_action("hibernate")
 
     def on_reboot_clicked(self, widget):
         """Handle reboot button click"""
-        command = self.custom_commands.get("reboot", "systemctl reboot")
-        self.logging.log(LogLevel.Info, f"Reboot button clicked, running: {command}")
-        self._execute_command(command)
-        # Close application after executing command
-        self._close_application()
+        self.logging.log(LogLevel.Info, "Reboot button clicked")
+        self._execute_action("reboot")
 
     def on_shutdown_clicked(self, widget):
         """Handle shutdown button click"""
-        command = self.custom_commands.get("shutdown", "systemctl poweroff")
-        self.logging.log(LogLevel.Info, f"Shutdown button clicked, running: {command}")
-        self._execute_command(command)
-        # Close application after executing command
-        self._close_application()
+        self.logging.log(LogLevel.Info, "Shutdown button clicked")
+        self._execute_action("shutdown")
 
     def _hex_to_rgba(self, hex_color):
         """Convert hex color to RGBA color"""
@@ -999,19 +992,7 @@ class PowerTab(Gtk.Box):
         setattr(color_button, "preview_color", hex_color)
 
         # Update preview button style
-        preview_button = getattr(color_button, "preview_button")
-        style_provider = Gtk.CssProvider()
-        css = f".preview-button {{ background-color: {hex_color}; color: white; font-weight: bold; border-radius: 6px; }}"
-        style_provider.load_from_data(css.encode())
-
-        # Remove old provider and add new one
-        style_context = preview_button.get_style_context()
-        for provider in style_context.list_providers():
-            style_context.remove_provider(provider)
-
-        style_context.add_provider(
-            style_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        self._set_preview_color(option_id, hex_color)
 
     def on_update_color_entry(self, color_button, entry):
         """Update color entry when color button changes"""
@@ -1027,19 +1008,7 @@ class PowerTab(Gtk.Box):
 
         # Update preview button
         setattr(color_button, "preview_color", default_color)
-        preview_button = getattr(color_button, "preview_button")
-        style_provider = Gtk.CssProvider()
-        css = f".preview-button {{ background-color: {default_color}; color: white; font-weight: bold; border-radius: 6px; }}"
-        style_provider.load_from_data(css.encode())
-
-        # Remove old provider and add new one
-        style_context = preview_button.get_style_context()
-        for provider in style_context.list_providers():
-            style_context.remove_provider(provider)
-
-        style_context.add_provider(
-            style_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        self._set_preview_color(option_id, default_color)
 
     def on_shortcut_key_press(self, entry, event, option_id):
         """Handle key press in shortcut entry"""
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+import importlib
+from typing import Dict, Tuple, Type
+
+from gi.repository import Gtk  # type: ignore
+
+from utils.profiler import get_startup_profiler
+
+# Tab name -> (module path, class name). Modules are imported on first use so
+# opening a single tab doesn't pay for the imports of every other tab.
+TAB_MODULES: Dict[str, Tuple[str, str]] = {
+    "Volume": ("ui.tabs.volume_tab", "VolumeTab"),
+    "Wi-Fi": ("ui.tabs.wifi_tab", "WiFiTab"),
+    "Bluetooth": ("ui.tabs.bluetooth_tab", "BluetoothTab"),
+    "Battery": ("ui.tabs.battery_tab", "BatteryTab"),
+    "Display": ("ui.tabs.display_tab", "DisplayTab"),
+    "Power": ("ui.tabs.power_tab", "PowerTab"),
+    "Autostart": ("ui.tabs.autostart_tab", "AutostartTab"),
+    "USBGuard": ("ui.tabs.usbguard_tab", "USBGuardTab"),
+}
+
+_loaded: Dict[str, Type[Gtk.Widget]] = {}
+
+
+def get_tab_class(tab_name: str) -> Type[Gtk.Widget]:
+    """Import a tab's module if needed and return its class
+
+    Raises:
+        KeyError: if tab_name is not a known tab
+    """
+    tab_class = _loaded.get(tab_name)
+    if tab_class is None:
+        module_path, class_name = TAB_MODULES[tab_name]
+        with get_startup_profiler().span(f"import {module_path}", "import"):
+            module = importlib.import_module(module_path)
+        tab_class = getattr(module, class_name)
+        _loaded[tab_name] = tab_class
+    return tab_class
+
+
+def is_loaded(tab_name: str) -> bool:
+    """Whether a tab's module has already been imported"""
+    return tab_name in _loaded
+
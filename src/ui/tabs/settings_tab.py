@@ -294,15 +294,6 @@ class SettingsTab(Gtk.Box):
 
         save_settings(self.settings, self.logging)
 
-        saved_settings = load_settings(self.logging)
-        if saved_settings.get("language") == lang:
-            self.logging.log(LogLevel.Info, f"Language setting verified: {saved_settings.get('language')}")
-        else:
-            self.logging.log(LogLevel.Error, f"Language setting not saved correctly. Expected: {lang}, Got: {saved_settings.get('language')}")
-            self.logging.log(LogLevel.Info, "Forcing language setting in configuration file")
-            saved_settings["language"] = lang
-            save_settings(saved_settings, self.logging)
-
         parent_window = self.get_toplevel()
         if hasattr(parent_window, 'settings'):
             parent_window.settings["language"] = lang
@@ -2,11 +2,15 @@
 
 import gi
 import logging
-import subprocess
-import threading
 from gi.repository import Gtk, GLib , Gdk # type: ignore
+from tools.usbguard import get_usbguard_manager
+from tools.usbguard_rules import is_permanently_allowed, parse_device_lines
+from utils.commands import get_command_runner
 from utils.logger import LogLevel
-from utils.translations import get_translations
+from utils.scheduler import get_refresh_scheduler
+
+# pkexec waits for the user to authenticate
+PKEXEC_TIMEOUT = 120
 
 class USBGuardTab(Gtk.Box):
     def __init__(self, logging, txt):
@@ -17,6 +21,9 @@ class USBGuardTab(Gtk.Box):
         from utils.hidden_devices import HiddenDevices
         self.hidden_devices = HiddenDevices(logging)
         self.manual_operations = set()  # Track devices being manually allowed/blocked
+        self.usbguard = get_usbguard_manager(logging)
+        self.refresh_pending = False
+        self.poll_job_id = None
         self.set_margin_start(10)
         self.set_margin_end(10)
         self.set_margin_top(10)
@@ -135,7 +142,7 @@ class USBGuardTab(Gtk.Box):
         self.manage_button.connect("clicked", self.show_manage_dialog)
         button_box.pack_start(self.manage_button, False, False, 0)
         
-        self.policy_button = Gtk.Button(label=get_translations().policy)
+        self.policy_button = Gtk.Button(label=self.txt.policy)
         self.policy_button.connect("clicked", self.show_policy_dialog)
         button_box.pack_start(self.policy_button, False, False, 0)
         
@@ -143,13 +150,14 @@ class USBGuardTab(Gtk.Box):
         
         self.connect('key-press-event', self.on_key_press)
         
+        # Device and service changes are pushed by the USBGuard daemon
+        self.usbguard.subscribe(self.on_device_event)
+        self.usbguard.watch_service(self.on_service_changed)
+        self.connect("destroy", self.on_destroy)
+
         # Initial refresh
         self.refresh_devices(None)
         
-        # Auto-refresh thread
-        self.refresh_thread_running = True
-        threading.Thread(target=self.auto_refresh_devices, daemon=True).start()
-        
      # keybinds for usbguard tab
     def on_key_press(self, widget, event):
         keyval = event.keyval
@@ -164,65 +172,74 @@ class USBGuardTab(Gtk.Box):
                 return True
 
     
-    def auto_refresh_devices(self):
-        while self.refresh_thread_running:
-            GLib.idle_add(self.refresh_devices, None)
-            threading.Event().wait(5)  # Refresh every 5 seconds
-    
+    def on_device_event(self, event, device_id):
+        """Coalesce bursts of device signals into a single refresh"""
+        if self.refresh_pending:
+            return
+        self.refresh_pending = True
+
+        def run():
+            self.refresh_pending = False
+            self.refresh_devices(None)
+            return False
+
+        GLib.idle_add(run)
+
+    def on_service_changed(self, active):
+        self.update_service_status(active)
+        self.refresh_devices(None)
+
+    def poll_devices(self):
+        """Fallback refresh when the daemon cannot push device signals"""
+        if self.usbguard.live:
+            self.poll_job_id = None
+            return False
+        self.refresh_devices(None)
+        return True
+
     def refresh_devices(self, widget):
-        try:
-            # First check if USBGuard is installed
-            try:
-                subprocess.run(["which", "usbguard"], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            except subprocess.CalledProcessError:
-                self.status_label.set_markup(
-                    "<span foreground='red'>"
-                    "USBGuard is not installed. Please install it first."
-                    "</span>"
-                )
-                return
-                
-            # Then check service status
-            self.check_service_status()
-            
-            if not self.power_switch.get_active():
-                self.status_label.set_markup(
-                    "<span foreground='orange'>"
-                    "USBGuard service is not running. Enable it to manage devices."
-                    "</span>"
-                )
-                return
-                
-            # Get device list excluding hidden devices
-            result = subprocess.run(["usbguard", "list-devices"],
-                                 stdout=subprocess.PIPE,
-                                 stderr=subprocess.PIPE,
-                                 check=True)
-            current_devices = "\n".join(
-                line for line in result.stdout.decode('utf-8').splitlines()
-                if line.strip() and not self.hidden_devices.contains(line.split()[0].split(':')[0])
+        # First check if USBGuard is installed
+        if not self.usbguard.is_installed():
+            self.status_label.set_markup(
+                "<span foreground='red'>"
+                "USBGuard is not installed. Please install it first."
+                "</span>"
             )
-            
-            # Force state update on manual refresh
-            if widget:
-                self.previous_devices = None
-                self.manual_operations.clear()
-                
-            self.check_device_changes(current_devices)
-            self.update_device_list(current_devices)
-            self.status_label.set_text("")
-            
-            # Show loading spinner on refresh button
-            if widget:
-                spinner = Gtk.Spinner()
-                spinner.start()
-                widget.set_image(spinner)
-                GLib.timeout_add(1000, self.reset_refresh_button, widget)
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.decode('utf-8') if e.stderr else "Unknown error"
-            
+            return
+
+        # Show loading spinner on refresh button
+        if widget:
+            spinner = Gtk.Spinner()
+            spinner.start()
+            widget.set_image(spinner)
+            GLib.timeout_add(1000, self.reset_refresh_button, widget)
+
+        # Then check service status
+        self.usbguard.is_service_active_async(
+            lambda active: self.on_service_checked(active, widget)
+        )
+
+    def on_service_checked(self, active, widget):
+        self.update_service_status(active)
+
+        if not active:
+            self.status_label.set_markup(
+                "<span foreground='orange'>"
+                "USBGuard service is not running. Enable it to manage devices."
+                "</span>"
+            )
+            return
+
+        # A manual refresh skips the signal-maintained device list
+        self.usbguard.list_devices_async(
+            lambda devices, error: self.on_devices_listed(devices, error, widget),
+            force=widget is not None,
+        )
+
+    def on_devices_listed(self, devices, error, widget):
+        if devices is None:
             # Handle specific permission denied error
-            if "Operation not permitted" in error_msg:
+            if "Operation not permitted" in error:
                 error_display = (
                     "<b>USBGuard Permission Required</b>\n\n"
                     "- USBGuard requires your user to have access to it to avoid running Better Control with sudo.\n\n"
@@ -231,122 +248,102 @@ class USBGuardTab(Gtk.Box):
                     'https://github.com/qunatumvoid0/better-control/blob/main/src/utils/usbguard_permissions.sh</a>\n\n'
                     "- You can run the script or manually apply the commands. Check the source if you're skeptical - we got nothing to hide."
                 )
-
+            elif error == "USBGuard not installed":
+                error_display = self.txt.usbguard_not_installed
             else:
-                error_display = get_translations().usbguard_error
-            
-            if hasattr(self.logging, 'log_error'):
-                self.logging.log_error(f"USBGuard error: {error_msg}")
-            else:
-                print(f"USBGuard error: {error_msg}")
+                error_display = self.txt.usbguard_error
+
+            self.logging.log(LogLevel.Error, f"USBGuard error: {error}")
             self.show_error(error_display)
-        except FileNotFoundError:
-            if hasattr(self.logging, 'log_error'):
-                self.logging.log_error("USBGuard not installed")
-            else:
-                print("USBGuard not installed")
-            self.show_error(get_translations().usbguard_not_installed)
-
-    # Common vendor and product mappings
-    VENDOR_MAP = {
-        "0x8086": "Intel",
-        "0x8087": "Intel",
-        "0x045e": "Microsoft",
-        "0x046d": "Logitech",
-        "0x04f2": "Chicony",
-        "0x05ac": "Apple",
-        "0x093a": "Pixart",
-        "0x0b05": "ASUS",
-        "0x0cf3": "Qualcomm",
-        "0x1532": "Razer",
-        "0x2109": "VIA Labs"
-    }
-
-    PRODUCT_TYPE_MAP = {
-        "0x0001": "Keyboard",
-        "0x0002": "Mouse",
-        "0x0003": "Combo Keyboard/Mouse",
-        "0x0004": "Game Controller",
-        "0x0005": "Pen Tablet",
-        "0x0006": "Scanner",
-        "0x0007": "Camera",
-        "0x0008": "Printer",
-        "0x0009": "Storage",
-        "0x000a": "Audio",
-        "0x000b": "Network"
-    }
-
-    def update_device_list(self, devices_str):
+            return
+
+        # Exclude hidden devices
+        devices = [
+            device for device in parse_device_lines(devices)
+            if not self.hidden_devices.contains(device.device_id)
+        ]
+
+        # Force state update on manual refresh
+        if widget:
+            self.previous_devices = None
+            self.manual_operations.clear()
+
+        self.check_device_changes(devices)
+        self.update_device_list(devices)
+        self.status_label.set_text("")
+
+        # Without D-Bus signals the list can only be kept current by polling
+        # New devices are acted on as they appear, so this isn't tied to the
+        # tab being the current page, only to the window being active
+        if not self.usbguard.live and self.poll_job_id is None:
+            self.poll_job_id = get_refresh_scheduler(self.logging).add(None, 5, self.poll_devices)
+
+    # Interface class codes mapped to icons, checked in order
+    INTERFACE_ICONS = (
+        ("08", "drive-harddisk-symbolic"),
+        ("0e", "camera-web-symbolic"),
+        ("07", "printer-symbolic"),
+        ("01", "audio-headphones-symbolic"),
+        ("02", "network-wired-symbolic"),
+        ("0a", "network-wired-symbolic"),
+        ("e0", "bluetooth-symbolic"),
+    )
+
+    # Keywords in the device name mapped to icons
+    NAME_ICONS = (
+        ("keyboard", "input-keyboard-symbolic"),
+        ("mouse", "input-mouse-symbolic"),
+        ("storage", "drive-harddisk-symbolic"),
+        ("disk", "drive-harddisk-symbolic"),
+        ("audio", "audio-headphones-symbolic"),
+        ("headphone", "audio-headphones-symbolic"),
+        ("network", "network-wired-symbolic"),
+        ("printer", "printer-symbolic"),
+        ("camera", "camera-web-symbolic"),
+    )
+
+    def get_device_icon(self, device):
+        """Pick an icon from the device's interfaces, then its name"""
+        # HID boot protocol 1 is a keyboard, 2 a mouse
+        if "03:01:01" in device.interfaces:
+            return "input-keyboard-symbolic"
+        if "03:01:02" in device.interfaces:
+            return "input-mouse-symbolic"
+
+        classes = device.interface_classes()
+        for interface_class, icon_name in self.INTERFACE_ICONS:
+            if interface_class in classes:
+                return icon_name
+
+        name = device.display_name.lower()
+        for keyword, icon_name in self.NAME_ICONS:
+            if keyword in name:
+                return icon_name
+        return "drive-removable-media-symbolic"
+
+    def update_device_list(self, devices):
         # Clear existing devices
         for child in self.device_list.get_children():
             self.device_list.remove(child)
         
         # Filter out hidden devices
         visible_devices = []
-        for line in devices_str.splitlines():
-            if not line.strip():
-                continue
-            device_id = line.split()[0].split(':')[0]
-            if not self.hidden_devices.contains(device_id):
-                visible_devices.append(line)
+        for device in devices:
+            if not self.hidden_devices.contains(device.device_id):
+                visible_devices.append(device)
             else:
-                self.logging.log_info(f"Filtering out hidden device: {device_id}")
+                self.logging.log(LogLevel.Info, f"Filtering out hidden device: {device.device_id}")
         
         if not visible_devices:
-            self.show_error(get_translations().no_devices)
+            self.show_error(self.txt.no_devices)
             return
         
         # Add new devices (only non-hidden ones)
-        for line in visible_devices:
-            if not line.strip():
-                continue
-                
-            parts = line.split()
-            if len(parts) < 3:
-                continue
-                
-            device_id = parts[0].split(":")[0]
-            status = parts[1]
-            device_info = " ".join(parts[2:])
-            
-            # Parse device info for displa
-            try:
-                device_name = "Device name cannot be retrieved"
-                
-                
-                name_start = device_info.find('name "')
-                if name_start != -1:
-                    name_end = device_info.find('"', name_start + 6)
-                    if name_end != -1:
-                        device_name = device_info[name_start+6:name_end].strip()
-                        if not device_name:  # If name is empty
-                            device_name = "Device name cannot be retrieved"
-                
-                # get gud looking stuff
-                status_text = {
-                    "allow": "✅ Allowed",
-                    "block": "❌ Blocked",
-                    "reject": "🚫 Rejected"
-                }.get(status.lower(), f"({status})")
-                
-                # Create formatted display text with device name as primary identfier
-                display_text = f"""
-<b>{device_name}</b>
-ID: {device_id}
-Status: {status_text}
-"""
-                if "serial=" in device_info:
-                    serial = device_info.split("serial=")[1].split()[0]
-                    display_text += f"Serial: {serial}\n"
-                
-                # Add any additional info with proper line wrapping
-                display_text += f"\n<small>{device_info.replace(' ', '&#160;')}</small>"
-                
-            except Exception as e:
-                display_text = f"{device_info} ({status})"
-                if hasattr(self.logging, 'log_error'):
-                    self.logging.log_error(f"Failed to parse device info: {e}")
-            
+        for device in visible_devices:
+            device_id = device.device_id
+            status = device.target
+            device_name = device.display_name
+
             # Create device row with compact layout
             row = Gtk.ListBoxRow()
             row.set_margin_start(5)
@@ -361,22 +358,7 @@ Status: {status_text}
             box.set_margin_top(5)
             box.set_margin_bottom(5)
             
-            # Simple icon selection based on device name
-            icon_name = "drive-removable-media-symbolic"
-            if "keyboard" in device_name.lower():
-                icon_name = "input-keyboard-symbolic"
-            elif "mouse" in device_name.lower():
-                icon_name = "input-mouse-symbolic"
-            elif "storage" in device_name.lower() or "disk" in device_name.lower():
-                icon_name = "drive-harddisk-symbolic"
-            elif "audio" in device_name.lower() or "headphone" in device_name.lower():
-                icon_name = "audio-headphones-symbolic"
-            elif "network" in device_name.lower():
-                icon_name = "network-wired-symbolic"
-            elif "printer" in device_name.lower():
-                icon_name = "printer-symbolic"
-            elif "camera" in device_name.lower():
-                icon_name = "camera-web-symbolic"
+            icon_name = self.get_device_icon(device)
             
             icon = Gtk.Image.new_from_icon_name(icon_name, Gtk.IconSize.DIALOG)
             icon.set_margin_end(10)
@@ -387,17 +369,29 @@ Status: {status_text}
             
             # Device name and status
             name_label = Gtk.Label()
-            name_label.set_markup(f"<b>{device_name}</b>")
+            name_label.set_markup(f"<b>{GLib.markup_escape_text(device_name)}</b>")
             name_label.set_halign(Gtk.Align.START)
             name_label.set_xalign(0)
             info_box.pack_start(name_label, False, False, 0)
+
+            # Vendor and vendor:product id
+            vendor_name = device.vendor_name
+            details = " · ".join(part for part in (vendor_name, device.usb_id) if part)
+            if details:
+                details_label = Gtk.Label(label=details)
+                details_label.set_halign(Gtk.Align.START)
+                details_label.set_xalign(0)
+                details_label.get_style_context().add_class("dim-label")
+                if device.serial:
+                    details_label.set_tooltip_text(f"Serial: {device.serial}")
+                info_box.pack_start(details_label, False, False, 0)
             
             # Status indicator
             status_label = Gtk.Label()
             status_label.set_markup({
-                "allow": f"<span foreground='green'>✓ {get_translations().allowed}</span>",
-                "block": f"<span foreground='red'>✗ {get_translations().blocked}</span>",
-                "reject": f"<span foreground='orange'>⚠ {get_translations().rejected}</span>"
+                "allow": f"<span foreground='green'>✓ {self.txt.allowed}</span>",
+                "block": f"<span foreground='red'>✗ {self.txt.blocked}</span>",
+                "reject": f"<span foreground='orange'>⚠ {self.txt.rejected}</span>"
             }.get(status.lower(), status))
             status_label.set_halign(Gtk.Align.START)
             status_label.set_xalign(0)
@@ -414,7 +408,7 @@ Status: {status_text}
                 allow_btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
                 allow_icon = Gtk.Image.new_from_icon_name("emblem-ok-symbolic", Gtk.IconSize.BUTTON)
                 allow_btn_box.pack_start(allow_icon, False, False, 0)
-                allow_label = Gtk.Label(label=get_translations().allow)
+                allow_label = Gtk.Label(label=self.txt.allow)
                 allow_revealer = Gtk.Revealer()
                 allow_revealer.set_transition_type(Gtk.RevealerTransitionType.SLIDE_RIGHT)
                 allow_revealer.set_transition_duration(150)
@@ -422,7 +416,7 @@ Status: {status_text}
                 allow_revealer.set_reveal_child(False)
                 allow_btn_box.pack_start(allow_revealer, False, False, 0)
                 allow_btn.add(allow_btn_box)
-                allow_btn.set_tooltip_text(get_translations().allow)
+                allow_btn.set_tooltip_text(self.txt.allow)
                 allow_btn.connect("clicked", self.on_allow_device, device_id)
                 
                 allow_btn.set_events(Gdk.EventMask.ENTER_NOTIFY_MASK | Gdk.EventMask.LEAVE_NOTIFY_MASK)
@@ -435,7 +429,7 @@ Status: {status_text}
                 perm_allow_btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
                 perm_allow_icon = Gtk.Image.new_from_icon_name("emblem-default-symbolic", Gtk.IconSize.BUTTON)
                 perm_allow_btn_box.pack_start(perm_allow_icon, False, False, 0)
-                perm_allow_label = Gtk.Label(label=get_translations().permanent_allow)
+                perm_allow_label = Gtk.Label(label=self.txt.permanent_allow)
                 perm_allow_revealer = Gtk.Revealer()
                 perm_allow_revealer.set_transition_type(Gtk.RevealerTransitionType.SLIDE_RIGHT)
                 perm_allow_revealer.set_transition_duration(150)
@@ -443,7 +437,7 @@ Status: {status_text}
                 perm_allow_revealer.set_reveal_child(False)
                 perm_allow_btn_box.pack_start(perm_allow_revealer, False, False, 0)
                 perm_allow_btn.add(perm_allow_btn_box)
-                perm_allow_btn.set_tooltip_text(get_translations().permanent_allow_tooltip)
+                perm_allow_btn.set_tooltip_text(self.txt.permanent_allow_tooltip)
                 perm_allow_btn.connect("clicked", self.on_permanent_allow_device, device_id)
                 
                 perm_allow_btn.set_events(Gdk.EventMask.ENTER_NOTIFY_MASK | Gdk.EventMask.LEAVE_NOTIFY_MASK)
@@ -456,7 +450,7 @@ Status: {status_text}
                 block_btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
                 block_icon = Gtk.Image.new_from_icon_name("action-unavailable-symbolic", Gtk.IconSize.BUTTON)
                 block_btn_box.pack_start(block_icon, False, False, 0)
-                block_label = Gtk.Label(label=get_translations().block)
+                block_label = Gtk.Label(label=self.txt.block)
                 block_revealer = Gtk.Revealer()
                 block_revealer.set_transition_type(Gtk.RevealerTransitionType.SLIDE_RIGHT)
                 block_revealer.set_transition_duration(150)
@@ -464,7 +458,7 @@ Status: {status_text}
                 block_revealer.set_reveal_child(False)
                 block_btn_box.pack_start(block_revealer, False, False, 0)
                 block_btn.add(block_btn_box)
-                block_btn.set_tooltip_text(get_translations().block)
+                block_btn.set_tooltip_text(self.txt.block)
                 block_btn.connect("clicked", self.on_block_device, device_id)
                 
                 block_btn.set_events(Gdk.EventMask.ENTER_NOTIFY_MASK | Gdk.EventMask.LEAVE_NOTIFY_MASK)
@@ -479,121 +473,66 @@ Status: {status_text}
         self.device_list.show_all()
     
     def on_allow_device(self, widget, device_id):
-        try:
-            self.manual_operations.add(device_id)
-            # Temporary allow (won't persist after unplug/restart)
-            subprocess.run(["usbguard", "allow-device", device_id], check=True)
-            
-            result = subprocess.run(["usbguard", "list-devices"],
-                                 stdout=subprocess.PIPE,
-                                 stderr=subprocess.PIPE,
-                                 check=True)
-            devices = result.stdout.decode('utf-8').splitlines()
-            device_info = next((d for d in devices if d.startswith(device_id)), "")
-            device_name = self.get_device_name(device_info)
-            
-            #subprocess.run([
-                #"notify-send",
-                #"-i", "emblem-ok-symbolic",
-                #f"Better Control",
-                #f"{device_name} has been temporarily allowed (will block after unplug)"
-            #])
-            
-            self.refresh_devices(None)
-            self.manual_operations.discard(device_id)
-            
-        except subprocess.CalledProcessError as e:
-            if hasattr(self.logging, 'log_error'):
-                self.logging.log_error(f"Failed to allow device: {e}")
-            else:
-                print(f"Failed to allow device: {e}")
-            self.show_error(get_translations().operation_failed)
+        # Temporary allow (won't persist after unplug/restart)
+        self.apply_device_policy(device_id, "allow", False)
 
     def on_permanent_allow_device(self, widget, device_id):
         """Handle permanently allowing a USB device by adding to policy"""
-        try:
-            self.manual_operations.add(device_id)
-            
-            subprocess.run(["usbguard", "allow-device", "-p", device_id], check=True)
-            
-            result = subprocess.run(["usbguard", "list-devices"],
-                                 stdout=subprocess.PIPE,
-                                 stderr=subprocess.PIPE,
-                                 check=True)
-            devices = result.stdout.decode('utf-8').splitlines()
-            device_info = next((d for d in devices if d.startswith(device_id)), "")
-            device_name = self.get_device_name(device_info)
-            
-            #subprocess.run([
-#                "notify-send",
-                #"-i", "emblem-default-symbolic",
-                #f"Better Control",
-                #f"{device_name} has been permanently allowed (added to policy)."
-            #])
-            
-            self.refresh_devices(None)
-            self.manual_operations.discard(device_id)
-            
-        except subprocess.CalledProcessError as e:
-            if hasattr(self.logging, 'log_error'):
-                self.logging.log_error(f"Failed to permanently allow device: {e}")
-            else:
-                print(f"Failed to permanently allow device: {e}")
-            self.show_error(get_translations().operation_failed)
-    
+        self.apply_device_policy(device_id, "allow", True)
+
     def on_block_device(self, widget, device_id):
-        try:
-            self.manual_operations.add(device_id)
-            
-            # Block permanently with -p flag
-            subprocess.run(["usbguard", "block-device", "-p", device_id], check=True)
-            
-            # Also remove from hidden devices if present
-            self.hidden_devices.remove(device_id)
-            
-            # Get device info for notification
-            result = subprocess.run(["usbguard", "list-devices"],
-                                 stdout=subprocess.PIPE,
-                                 stderr=subprocess.PIPE,
-                                 check=True)
-            devices = result.stdout.decode('utf-8').splitlines()
-            device_info = next((d for d in devices if d.startswith(device_id)), "")
-            device_name = self.get_device_name(device_info)
-            
-            #subprocess.run([
-                #"notify-send",
-                #"-i", "action-unavailable-symbolic",
-                #f"Better Control",
-                #f"{device_name} has been permanently blocked"
-            #])
-            
-            self.refresh_devices(None)
-            self.manual_operations.discard(device_id)
-            
-        except subprocess.CalledProcessError as e:
-            if hasattr(self.logging, 'log_error'):
-                self.logging.log_error(f"Failed to block device: {e}")
+        # Block permanently
+        self.apply_device_policy(device_id, "block", True)
+
+        # Also remove from hidden devices if present
+        self.hidden_devices.remove(device_id)
+
+    def apply_device_policy(self, device_id, target, permanent):
+        """Change a device's policy without blocking the UI
+
+        The DevicePolicyChanged signal refreshes the list once the daemon
+        has applied the change.
+        """
+        self.manual_operations.add(device_id)
+
+        def on_done(success, error):
+            if success:
+                self.logging.log(
+                    LogLevel.Info,
+                    f"Device {device_id} set to {target}{' permanently' if permanent else ''}",
+                )
             else:
-                print(f"Failed to block device: {e}")
-            self.show_error(get_translations().operation_failed)
-        
+                self.logging.log(LogLevel.Error, f"Failed to {target} device {device_id}: {error}")
+                self.show_error(self.txt.operation_failed)
+            if success and not self.usbguard.live:
+                self.refresh_devices(None)
+            self.manual_operations.discard(device_id)
+
+        self.usbguard.apply_policy_async(device_id, target, permanent, on_done)
 
     def show_manage_dialog(self, widget):
         """Show dialog to manage hidden devices"""
+        # Get ALL devices (including hidden ones) for management dialog
+        self.usbguard.list_devices_async(self.on_manage_devices_listed)
+
+    def on_manage_devices_listed(self, devices, error):
+        if devices is None:
+            self.show_error(f"Failed to get device list:\n{error}")
+            return
+
         dialog = None
         try:
-            # Get ALL devices (including hidden ones) for management dialog
-            result = subprocess.run(["usbguard", "list-devices"],
-                                 stdout=subprocess.PIPE,
-                                 stderr=subprocess.PIPE,
-                                 check=True)
-            devices = result.stdout.decode('utf-8').splitlines()
+            entries = [
+                (device.device_id, self.get_device_name(device))
+                for device in parse_device_lines(devices)
+            ]
             # Also include any hidden devices that might be currently disconnected
+            connected = set(device_id for device_id, _ in entries)
             for device_id in self.hidden_devices:
-                if not any(d.startswith(device_id) for d in devices):
-                    devices.append(f"{device_id}: hidden (disconnected)")
+                if device_id not in connected:
+                    entries.append((device_id, device_id))
             
-            if not devices:
+            if not entries:
                 self.show_error("No USB devices found")
                 return
             
@@ -630,11 +569,7 @@ Status: {status_text}
             listbox = Gtk.ListBox()
             listbox.set_selection_mode(Gtk.SelectionMode.NONE)
 
-            for device in devices:
-                if not device.strip():
-                    continue
-                    
-                device_id = device.split()[0].split(':')[0]
+            for device_id, device_name in entries:
                 row = Gtk.ListBoxRow()
                 box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
                 box.set_margin_start(10)
@@ -648,7 +583,7 @@ Status: {status_text}
                 check.connect("toggled", lambda b, d=device_id: self.on_device_toggled(b, not b.get_active(), d))
                 box.pack_start(check, False, False, 0)
                 
-                label = Gtk.Label(label=self.get_device_name(device))
+                label = Gtk.Label(label=device_name)
                 label.set_halign(Gtk.Align.START)
                 box.pack_start(label, True, True, 0)
                 
@@ -664,9 +599,8 @@ Status: {status_text}
             if response == Gtk.ResponseType.OK:
                 self.refresh_devices(None)
             
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.decode('utf-8') if e.stderr else str(e)
-            self.show_error(f"Failed to get device list:\n{error_msg}")
+        except Exception as e:
+            self.logging.log(LogLevel.Error, f"Error showing device manager: {e}")
         finally:
             if dialog:
                 dialog.destroy()
@@ -693,109 +627,62 @@ Status: {status_text}
             self.logging.log(LogLevel.Error, f"Error in device toggle handler: {e}")
 
     def show_policy_dialog(self, widget):
+        self.usbguard.list_rules_async(self.on_policy_listed)
+
+    def on_policy_listed(self, policy, error):
+        if policy is None:
+            self.show_error(f"Failed to get policy:\n{error}")
+            self.logging.log(LogLevel.Error, f"Policy error: {error}")
+            return
+
         # Store current selection
         current_selection = self.device_list.get_selected_row()
-        
+
+        # Insert this block to show instructions if no rules exist
+        if not policy:
+            policy = (
+                "⚠️⚠️ No USBGuard policy rules found ⚠️⚠️.\n\n"
+                "please run this to generate policy rules\n\n"
+                "sudo usbguard generate-policy > rules.conf\n"
+                "sudo cp rules.conf /etc/usbguard/rules.conf\n"
+                "sudo systemctl restart usbguard"
+
+            )
+
         dialog = Gtk.Dialog(title="USBGuard Policy", 
                         parent=self.get_toplevel(),
                         flags=Gtk.DialogFlags.MODAL)
         dialog.add_button("Close", Gtk.ResponseType.CLOSE)
-        
-        try:
-            # Get policy with timeout
-            policy = subprocess.check_output(
-                ["usbguard", "list-rules"],
-                timeout=5
-            ).decode('utf-8').strip()
-
-            # Insert this block to show instructions if no rules exist
-            if not policy:
-                policy = (
-                    "⚠️⚠️ No USBGuard policy rules found ⚠️⚠️.\n\n"
-                    "please run this to generate policy rules\n\n"
-                    "sudo usbguard generate-policy > rules.conf\n"
-                    "sudo cp rules.conf /etc/usbguard/rules.conf\n"
-                    "sudo systemctl restart usbguard"
-
-                )
-
-            # Create text view with monospace font
-            textview = Gtk.TextView()
-            textview.set_editable(False)
-            textview.set_cursor_visible(False)
-            textview.set_monospace(True)
-            textview.get_buffer().set_text(policy)
-
-            # Configure scrolling
-            scrolled = Gtk.ScrolledWindow()
-            scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
-            scrolled.add(textview)
-
-            # Add to dialog
-            content = dialog.get_content_area()
-            content.pack_start(scrolled, True, True, 0)
-            content.set_margin_start(10)
-            content.set_margin_end(10)
-            content.set_margin_top(10)
-            content.set_margin_bottom(10)
-
-            dialog.set_default_size(600, 400)
-            dialog.show_all()
-
-            # Run dialog and restore selection
-            dialog.run()
-            dialog.destroy()
 
-            if current_selection:
-                self.device_list.select_row(current_selection)
+        # Create text view with monospace font
+        textview = Gtk.TextView()
+        textview.set_editable(False)
+        textview.set_cursor_visible(False)
+        textview.set_monospace(True)
+        textview.get_buffer().set_text(policy)
 
-        except subprocess.TimeoutExpired:
-            self.show_error("Policy retrieval timed out")
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.decode('utf-8') if e.stderr else str(e)
-            self.show_error(f"Failed to get policy:\n{error_msg}")
-            if hasattr(self.logging, 'log_error'):
-                self.logging.log_error(f"Policy error: {error_msg}")
-
-
-            # Create text view with monospace font
-            textview = Gtk.TextView()
-            textview.set_editable(False)
-            textview.set_cursor_visible(False)
-            textview.set_monospace(True)
-            textview.get_buffer().set_text(policy)
-
-            # Configure scrolling
-            scrolled = Gtk.ScrolledWindow()
-            scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
-            scrolled.add(textview)
-
-            # Add to dialog
-            content = dialog.get_content_area()
-            content.pack_start(scrolled, True, True, 0)
-            content.set_margin_start(10)
-            content.set_margin_end(10)
-            content.set_margin_top(10)
-            content.set_margin_bottom(10)
-
-            dialog.set_default_size(600, 400)
-            dialog.show_all()
+        # Configure scrolling
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
+        scrolled.add(textview)
 
-            # Run dialog and restore selection
-            dialog.run()
-            dialog.destroy()
+        # Add to dialog
+        content = dialog.get_content_area()
+        content.pack_start(scrolled, True, True, 0)
+        content.set_margin_start(10)
+        content.set_margin_end(10)
+        content.set_margin_top(10)
+        content.set_margin_bottom(10)
 
-            if current_selection:
-                self.device_list.select_row(current_selection)
+        dialog.set_default_size(600, 400)
+        dialog.show_all()
 
-        except subprocess.TimeoutExpired:
-            self.show_error("Policy retrieval timed out")
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.decode('utf-8') if e.stderr else str(e)
-            self.show_error(f"Failed to get policy:\n{error_msg}")
-            if hasattr(self.logging, 'log_error'):
-                self.logging.log_error(f"Policy error: {error_msg}")
+        # Run dialog and restore selection
+        dialog.run()
+        dialog.destroy()
 
+        if current_selection:
+            self.device_list.select_row(current_selection)
 
     
     def show_error(self, message):
@@ -822,152 +709,93 @@ Status: {status_text}
         self.device_list.show_all()
 
         
-    def get_device_name(self, device_info):
-        """Helper method to extract device name from info string"""
-        if not device_info:
-            return "Unknown Device"
-            
-        # If we got just a device ID, try to get full info
-        if len(device_info.split()) == 1 and ':' in device_info:
-            try:
-                result = subprocess.run(["usbguard", "list-devices", device_info],
-                                     stdout=subprocess.PIPE,
-                                     stderr=subprocess.PIPE,
-                                     check=True)
-                device_info = result.stdout.decode('utf-8').strip()
-            except subprocess.CalledProcessError:
-                pass
-
-        try:
-            parts = device_info.split()
-            if len(parts) < 3:
-                return "Unknown Device"
-                
-            device_info = " ".join(parts[2:])
-            name_start = device_info.find('name "')
-            if name_start != -1:
-                name_end = device_info.find('"', name_start + 6)
-                if name_end != -1:
-                    device_name = device_info[name_start+6:name_end].strip()
-                    if device_name:  # Only return if name is not empty
-                        return device_name
-            
-            # Fallback to device ID if name can't be determined
-            return parts[0].split(":")[0]
-            
-        except Exception:
+    def get_device_name(self, device):
+        """Helper method to get a display name for a parsed device"""
+        if device is None:
             return "Unknown Device"
+        return device.display_name
 
     def check_device_changes(self, current_devices):
         """Block new devices unless permanently allowed"""
-        current_set = set(device.strip() for device in current_devices.splitlines() if device.strip())
-        
+        current = {device.device_id: device for device in current_devices}
+
         # Skip first refresh (initial device list)
         if self.previous_devices is None:
-            self.previous_devices = current_set
+            self.previous_devices = set(current)
             return
-            
-        # Handle reconnected devices
-        for device in current_set:
-            device_id = device.split()[0].split(":")[0]
-            if device_id in self.manual_operations:
-                # Skip recently modified devices
-                continue
-            
+
+        # Handle new devices, skipping recently modified ones
+        new_devices = [
+            device for device_id, device in current.items()
+            if device_id not in self.previous_devices and device_id not in self.manual_operations
+        ]
+        self.previous_devices = set(current)
+        if not new_devices:
+            return
+
         # Get permanent allow rules
-        try:
-            policy_check = subprocess.run(
-                ["usbguard", "list-rules"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True
-            )
-            policy_rules = policy_check.stdout.decode('utf-8')
-        except subprocess.CalledProcessError:
-            policy_rules = ""
-            
-        # Handle new devices
-        for device in current_set - self.previous_devices:
-            device_id = device.split()[0].split(":")[0]
-            if device_id not in self.manual_operations:
-                # Check if device is in permanent allow policy
-                try:
-                    allow_check = subprocess.run(
-                        ["usbguard", "list-rules"],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        check=True
-                    )
-                    allow_rules = allow_check.stdout.decode('utf-8')
-                    
-                    # Skip if device is permanently allowed
-                    if f"allow id {device_id}" in allow_rules.lower():
-                        continue
-                        
-                    # Block permanently if not allowed
-                    subprocess.run(["usbguard", "block-device", "-p", device_id], check=True)
-                    device_name = self.get_device_name(device)
-                    #subprocess.run([
-                        #"notify-send",
-                        #"-i", "action-unavailable-symbolic",
-                        ##f"{device_name} was permanently blocked"
-                    #])
-                    # Log the blocking
-                    if hasattr(self.logging, 'info'):
-                        self.logging.info(f"Permanently blocked device {device_id} ({device_name})")
-                except subprocess.CalledProcessError as e:
-                    if hasattr(self.logging, 'error'):
-                        self.logging.error(f"Failed to block device {device_id}: {e}")
-                    # Retry blocking if first attempt failed
-                    try:
-                        subprocess.run(["usbguard", "block-device", device_id], check=True)
-                    except subprocess.CalledProcessError as e:
-                        if hasattr(self.logging, 'error'):
-                            self.logging.error(f"Failed to block device {device_id} on retry: {e}")
-        
-        # Removed devices
-        for device in self.previous_devices - current_set:
-            device_id = device.split()[0].split(":")[0]
-            if device_id not in self.manual_operations:
-                device_name = self.get_device_name(device)
-        
-        self.previous_devices = current_set
+        def on_rules(policy_rules, error):
+            rules = parse_device_lines((policy_rules or "").splitlines())
+            for device in new_devices:
+                # Skip if device is permanently allowed
+                if is_permanently_allowed(device, rules):
+                    continue
+                self.block_new_device(device.device_id)
+
+        self.usbguard.list_rules_async(on_rules)
+
+    def block_new_device(self, device_id):
+        """Block permanently, retrying without -p if the policy can't be written"""
+        def on_permanent(success, error):
+            if success:
+                self.logging.log(LogLevel.Info, f"Permanently blocked device {device_id}")
+                return
+            self.logging.log(LogLevel.Error, f"Failed to block device {device_id}: {error}")
+            self.usbguard.apply_policy_async(device_id, "block", False, on_retry)
+
+        def on_retry(success, error):
+            if not success:
+                self.logging.log(LogLevel.Error, f"Failed to block device {device_id} on retry: {error}")
+
+        self.usbguard.apply_policy_async(device_id, "block", True, on_permanent)
 
     def check_service_status(self):
         """Check and update USBGuard service status"""
-        try:
-            output = subprocess.check_output(["systemctl", "is-active", "usbguard"]).decode('utf-8').strip()
-            is_active = output == "active"
-
-            # Temporarily block signal so we don’t trigger on_power_switched
-            self.power_switch.handler_block_by_func(self.on_power_switched)
-            self.power_switch.set_active(is_active)
-            self.power_switch.handler_unblock_by_func(self.on_power_switched)
-
-            self.status_indicator.set_markup(
-                f"<span foreground='{'green' if is_active else 'red'}'>"
-                f"{'● Active' if is_active else '○ Inactive'}"
-                f"</span>"
-            )
-        except subprocess.CalledProcessError:
-            self.power_switch.handler_block_by_func(self.on_power_switched)
-            self.power_switch.set_active(False)
-            self.power_switch.handler_unblock_by_func(self.on_power_switched)
+        self.usbguard.is_service_active_async(self.update_service_status)
 
-            self.status_indicator.set_markup("<span foreground='red'>○ Service Error</span>")
+    def update_service_status(self, is_active):
+        # Temporarily block signal so we don’t trigger on_power_switched
+        self.power_switch.handler_block_by_func(self.on_power_switched)
+        self.power_switch.set_active(is_active)
+        self.power_switch.handler_unblock_by_func(self.on_power_switched)
+
+        self.status_indicator.set_markup(
+            f"<span foreground='{'green' if is_active else 'red'}'>"
+            f"{'● Active' if is_active else '○ Inactive'}"
+            f"</span>"
+        )
 
     def on_power_switched(self, switch, gparam):
-        """Handle USBGuard service power switch changes"""
-        try:
-            if switch.get_active():
-                subprocess.run(["pkexec", "systemctl", "start", "usbguard"], check=True)
-            else:
-                subprocess.run(["pkexec", "systemctl", "stop", "usbguard"], check=True)
+        """Start or stop the USBGuard service, pkexec runs off the main thread"""
+        action = "start" if switch.get_active() else "stop"
+        # Held until the polkit prompt is answered, so it can't be toggled twice
+        switch.set_sensitive(False)
+
+        def on_result(result):
+            switch.set_sensitive(True)
+            if result.returncode != 0:
+                error = (result.stderr or "").strip() or f"exit status {result.returncode}"
+                self.logging.log(LogLevel.Error, f"Failed to {action} USBGuard service: {error}")
+                self.power_switch.handler_block_by_func(self.on_power_switched)
+                switch.set_active(action != "start")
+                self.power_switch.handler_unblock_by_func(self.on_power_switched)
+                self.check_service_status()
+                return
             GLib.timeout_add(500, self.check_service_status)
-        except subprocess.CalledProcessError as e:
-            self.logging.log_error(f"Failed to change USBGuard service state: {e}")
-            self.check_service_status()
 
+        get_command_runner(self.logging).run_async(
+            ["pkexec", "systemctl", action, "usbguard"], on_result, timeout=PKEXEC_TIMEOUT, dedupe=False
+        )
 
     def reset_refresh_button(self, button):
         """Reset refresh button after operation"""
@@ -994,7 +822,10 @@ Status: {status_text}
         return False
 
     def on_destroy(self, widget):
-        self.refresh_thread_running = False
+        self.usbguard.unsubscribe(self.on_device_event)
+        self.usbguard.unwatch_service(self.on_service_changed)
+        get_refresh_scheduler(self.logging).remove(self.poll_job_id)
+        self.poll_job_id = None
 
     def on_refresh_enter(self, widget, event):
         alloc = widget.get_allocation()
@@ -1,11 +1,9 @@
 #!/usr/bin/env python3
 
 import gi  # type: ignore
-import subprocess
-import threading
-import time
 
 from utils.logger import LogLevel, Logger
+from utils.scheduler import get_refresh_scheduler
 from utils.translations import English, Spanish
 
 gi.require_version("Gtk", "3.0")
@@ -13,27 +11,27 @@ from gi.repository import Gtk, GLib  # type: ignore
 
 from tools.volume import (
     get_volume,
+    get_volume_async,
     set_volume,
-    get_mute_state,
+    get_mute_state_async,
     toggle_mute,
-    get_sinks,
-    get_sources,
+    get_default_device_async,
+    get_sinks_async,
+    get_sources_async,
     get_applications,
+    get_applications_async,
     set_application_volume,
     move_application_to_sink,
     set_default_sink,
     set_default_source,
     get_mic_volume,
+    get_mic_volume_async,
     set_mic_volume,
-    get_mic_mute_state,
+    get_mic_mute_state_async,
     toggle_mic_mute,
-    get_sink_name_by_id,
-    get_application_mute_state,
     toggle_application_mute,
-    get_source_outputs,
-    get_application_mic_mute_state,
+    get_source_outputs_async,
     toggle_application_mic_mute,
-    get_application_mic_volume,
     set_application_mic_volume,
 )
 
@@ -56,9 +54,6 @@ class VolumeTab(Gtk.Box):
         self.set_visible(True)
         self.set_no_show_all(False)
 
-        # Create lock for thread safety
-        self._lock = threading.RLock()
-
         self.is_visible = False  # Track tab visibility
 
         # Initialize flags and references to prevent segfaults
@@ -68,7 +63,7 @@ class VolumeTab(Gtk.Box):
         self._app_mic_volume_timeouts = {}
         self._pending_app_volumes = {}
         self._pending_app_mic_volumes = {}
-        self.pulse_thread = None
+        self._refresh_counter = 0
         self._is_being_destroyed = False
 
         # Get the default icon theme
@@ -118,9 +113,6 @@ class VolumeTab(Gtk.Box):
 
         self.pack_start(self.notebook, True, True, 0)
 
-        # Initialize pulse audio monitoring variables
-        self.should_monitor = False  # Don't start monitoring until tab is visible
-
         # Initialize UI state
         self.update_device_lists()
         self.update_mute_buttons()
@@ -128,12 +120,10 @@ class VolumeTab(Gtk.Box):
         # Start with initial data refresh
         self.update_volumes()
 
-        # Always start monitoring on initialization to ensure the app works
-        # even if map signal doesn't fire correctly
-        self.should_monitor = True
-        self.start_pulse_monitoring()
+        # Audio state is polled only while this is the current page
+        get_refresh_scheduler(self.logging).add(self, 1, self.refresh_tick)
 
-        # Connect map/unmap signals for smart monitoring when tab becomes visible/hidden
+        # Connect map/unmap signals to track when the tab becomes visible/hidden
         self.connect("map", self.on_tab_shown)
         self.connect("unmap", self.on_tab_hidden)
 
@@ -476,118 +466,19 @@ class VolumeTab(Gtk.Box):
 
         self.update_volumes()
 
-        # Only start monitoring if not already active
-        if (
-            not self.should_monitor
-            or not self.pulse_thread
-            or not self.pulse_thread.is_alive()
-        ):
-            self.should_monitor = True
-            self.start_pulse_monitoring()
-
     def on_tab_hidden(self, widget):
         """Called when the tab is hidden"""
         self.is_visible = False
 
-    def start_pulse_monitoring(self):
-        """Start the PulseAudio monitoring thread for real-time updates"""
-        # Only start if not already monitoring
-        if self.pulse_thread is None or not self.pulse_thread.is_alive():
-            self.should_monitor = True
-            self.pulse_thread = threading.Thread(
-                target=self.monitor_pulse_events, daemon=True
-            )
-            self.pulse_thread.start()
-            self.logging.log(LogLevel.Info, "Started periodic (500ms) audio monitoring")
-        else:
-            self.logging.log(LogLevel.Info, "Audio monitoring already active")
-
-    def stop_pulse_monitoring(self):
-        """Stop monitoring pulse events"""
-        # Set flag to indicate we should stop
-        self.should_monitor = False
-
-        # Use lock to safely access thread data
-        with self._lock:
-            # Make sure thread terminates properly
-            thread_ref = self.pulse_thread
-            if thread_ref is not None and thread_ref.is_alive():
-                try:
-                    # Wait a short time for the thread to exit naturally
-                    # Don't join in the main thread, as that could block UI
-                    def join_thread_safe():
-                        try:
-                            thread_ref.join(timeout=0.3)
-                        except Exception as e:
-                            self.logging.log(LogLevel.Error, f"Error joining pulse thread: {e}")
-                        return False  # Don't repeat
-
-                    # Schedule joining the thread
-                    GLib.timeout_add(100, join_thread_safe)
-                except Exception as e:
-                    self.logging.log(LogLevel.Error, f"Error stopping pulse thread: {e}")
-
-            # Clear the reference regardless
-            self.pulse_thread = None
-
-    def monitor_pulse_events(self):
-        """Background thread for monitoring pulse audio state"""
-        counter = 0
-        last_error_time = 0
-        error_count = 0
-
-        while self.should_monitor:
-            try:
-                # Check if we're being destroyed or monitoring should stop
-                if not self.should_monitor or hasattr(self, '_is_being_destroyed') and self._is_being_destroyed:
-                    break
-
-                # Use locks to prevent race conditions with the main thread
-                with self._lock:
-                    # Every 10th iteration (roughly 1 second), do a deeper refresh
-                    if counter % 10 == 0:
-                        if self.is_visible:
-                            # Use GLib.idle_add to ensure UI updates happen on the main thread
-                            GLib.idle_add(self.refresh_audio_state, counter)
-
-                # Sleep a bit to prevent high CPU usage
-                # Use smaller sleep increments and check should_monitor regularly
-                for _ in range(5):
-                    if not self.should_monitor or hasattr(self, '_is_being_destroyed') and self._is_being_destroyed:
-                        break
-                    time.sleep(0.02)  # 20ms * 5 = 100ms
-
-                counter += 1
-
-            except RuntimeError as e:
-                # Handle RuntimeError separately (often due to thread issues)
-                self.logging.log(LogLevel.Error, f"Runtime error in pulse monitoring thread: {e}")
-                # Exit the thread if we're having serious issues
-                if "object at has been deleted" in str(e):
-                    self.logging.log(LogLevel.Error, "Critical error in pulse thread - exiting")
-                    break
-                time.sleep(0.5)  # Sleep to prevent tight loop
-
-            except Exception as e:
-                current_time = time.time()
-                # Limit error logging to prevent log spam
-                if current_time - last_error_time > 5:  # Reset error count after 5 seconds
-                    error_count = 0
-                    last_error_time = current_time
-
-                error_count += 1
-                if error_count <= 3:  # Log only first 3 errors in a 5 second window
-                    self.logging.log(LogLevel.Error, f"Error in pulse monitoring thread: {e}")
-
-                # Sleep after error to prevent tight loop
-                time.sleep(0.5)
-
-        self.logging.log(LogLevel.Debug, "Pulse audio monitoring thread exited")
-
-        # Clear thread reference when it exits
-        with self._lock:
-            if hasattr(self, 'pulse_thread') and self.pulse_thread is not None:
-                self.pulse_thread = None
+    def refresh_tick(self):
+        """Periodic refresh, run once a second while this is the current page"""
+        if self._is_being_destroyed:
+            return False
+        # refresh_audio_state spreads its work by counter, which counts the
+        # 100ms steps of the monitor thread this replaced
+        self.refresh_audio_state(self._refresh_counter)
+        self._refresh_counter += 10
+        return True
 
     def refresh_audio_state(self, counter):
         """Update audio state based on a counter (to distribute heavy operations)"""
@@ -601,12 +492,12 @@ class VolumeTab(Gtk.Box):
 
             # Update main volume if not being adjusted by user and on output tab
             if not updating_volume and (current_page == 0 or counter % 4 == 0):
-                self.volume_scale.set_value(get_volume(self.logging))
+                get_volume_async(self.logging, self._show_volume)
                 self.update_mute_button()
 
             # Update mic volume if not being adjusted by user and on input tab
             if not updating_mic and (current_page == 1 or counter % 4 == 0):
-                self.mic_scale.set_value(get_mic_volume(self.logging))
+                get_mic_volume_async(self.logging, self._show_mic_volume)
                 self.update_mic_mute_button()
 
             # Distribute heavier operations across different refresh cycles
@@ -626,20 +517,58 @@ class VolumeTab(Gtk.Box):
 
         return False  # Don't repeat via GLib (we're manually scheduling)
 
+    def _show_volume(self, volume):
+        """Move the volume slider, unless the user is dragging it"""
+        if not self._is_being_destroyed and not self._volume_change_timeout_id:
+            self.volume_scale.set_value(volume)
+
+    def _show_mic_volume(self, volume):
+        """Move the mic slider, unless the user is dragging it"""
+        if not self._is_being_destroyed and not self._mic_volume_change_timeout_id:
+            self.mic_scale.set_value(volume)
+
+    def get_snapshot(self):
+        """View model for the snapshot cache: default devices and their levels"""
+        volume = int(self.volume_scale.get_value())
+        mic_volume = int(self.mic_scale.get_value())
+        return {
+            "summary": [
+                {
+                    "icon": "audio-volume-muted-symbolic" if volume == 0 else "audio-volume-high-symbolic",
+                    "title": self.output_combo.get_active_text() or self.txt.volume_speakers,
+                    "subtitle": f"{self.txt.volume_speaker_volume}: {volume}%",
+                },
+                {
+                    "icon": "microphone-sensitivity-muted-symbolic" if mic_volume == 0 else "audio-input-microphone-symbolic",
+                    "title": self.input_combo.get_active_text() or self.txt.microphone_tab_microphone,
+                    "subtitle": f"{self.txt.microphone_tab_volume}: {mic_volume}%",
+                },
+            ],
+        }
+
     def update_device_lists(self):
         """Update output and input device lists and sync dropdown with the actual default sink."""
+        self.logging.log(LogLevel.Info, "Updating audio device lists...")
+
+        # Each list is shown once both the default device and the list are known
+        get_default_device_async("sink", self.logging, lambda current_sink: get_sinks_async(
+            self.logging, lambda sinks: self._show_sinks(current_sink, sinks)
+        ))
+        get_default_device_async("source", self.logging, lambda current_source: get_sources_async(
+            self.logging, lambda sources: self._show_sources(current_source, sources)
+        ))
+
+    def _show_sinks(self, current_sink, sinks):
+        """Fill the output dropdown and select the default sink"""
+        if self._is_being_destroyed:
+            return
         try:
-            self.logging.log(LogLevel.Info, "Updating audio device lists...")
-
-            # Get the currently active sink
-            current_sink = subprocess.getoutput("pactl get-default-sink").strip()
             self.logging.log(
                 LogLevel.Info, f"Current active output sink: {current_sink}"
             )
 
             # Output devices (speakers/headphones)
             self.output_combo.remove_all()
-            sinks = get_sinks(self.logging)
 
             if not sinks:
                 self.logging.log(LogLevel.Warn, "No output sinks found!")
@@ -661,15 +590,20 @@ class VolumeTab(Gtk.Box):
                 else:
                     self.output_combo.set_active(0)  # Default to first item
 
-            # Get the currently active input source (microphone)
-            current_source = subprocess.getoutput("pactl get-default-source").strip()
+        except Exception as e:
+            self.logging.log(LogLevel.Error, f"Failed updating output devices: {e}")
+
+    def _show_sources(self, current_source, sources):
+        """Fill the input dropdown and select the default source"""
+        if self._is_being_destroyed:
+            return
+        try:
             self.logging.log(
                 LogLevel.Info, f"Current active input source: {current_source}"
             )
 
             # Input devices (microphones)
             self.input_combo.remove_all()
-            sources = get_sources(self.logging)
 
             if not sources:
                 self.logging.log(LogLevel.Warn, "No input sources found!")
@@ -695,7 +629,7 @@ class VolumeTab(Gtk.Box):
                     self.input_combo.set_active(0)  # Default to first item
 
         except Exception as e:
-            self.logging.log(LogLevel.Error, f"Failed updating device lists: {e}")
+            self.logging.log(LogLevel.Error, f"Failed updating input devices: {e}")
 
     def update_mute_buttons(self):
         """Update mute button labels"""
@@ -706,7 +640,11 @@ class VolumeTab(Gtk.Box):
 
     def update_mute_button(self):
         """Update speaker mute button icon"""
-        speaker_muted = get_mute_state(self.logging)
+        get_mute_state_async(self.logging, self._show_speaker_muted)
+
+    def _show_speaker_muted(self, speaker_muted):
+        if self._is_being_destroyed:
+            return
         if speaker_muted:
             mute_icon = Gtk.Image.new_from_icon_name(
                 "audio-volume-muted-symbolic", Gtk.IconSize.BUTTON
@@ -730,12 +668,23 @@ class VolumeTab(Gtk.Box):
 
     def update_application_list(self):
         """Update application volume controls"""
+        def on_apps(apps):
+            if apps:
+                get_sinks_async(self.logging, lambda sinks: self._show_applications(apps, sinks))
+            else:
+                self._show_applications(apps, [])
+
+        get_applications_async(self.logging, on_apps)
+
+    def _show_applications(self, apps, sinks):
+        """Rebuild the application cards"""
+        if self._is_being_destroyed:
+            return
+
         # Remove existing controls
         for child in self.app_box.get_children():
             self.app_box.remove(child)
 
-        apps = get_applications(self.logging)
-
         if not apps:
             # Show "No applications playing audio" message
             no_apps_label = Gtk.Label()
@@ -747,18 +696,15 @@ class VolumeTab(Gtk.Box):
             self.app_box.show_all()
             return
 
-        # Get sinks once and prepare sink options
-        sinks = get_sinks(self.logging)
-        sink_options = [(s["name"], s["description"]) for s in sinks] if sinks else []
-
         for app in apps:
-            card = self._create_app_output_card(app, sink_options)
+            card = self._create_app_output_card(app, sinks)
             self.app_box.pack_start(card, False, True, 0)
 
         self.app_box.show_all()
 
-    def _create_app_output_card(self, app, sink_options):
+    def _create_app_output_card(self, app, sinks):
         """Create a UI card widget for a single application's output"""
+        sink_options = [(s["name"], s["description"]) for s in sinks]
         card = Gtk.Frame()
         card.set_shadow_type(Gtk.ShadowType.ETCHED_IN)
         card.set_margin_bottom(8)
@@ -791,9 +737,8 @@ class VolumeTab(Gtk.Box):
         scale.connect("value-changed", self.on_app_volume_changed, app["id"])
         controls_box.pack_start(scale, True, True, 0)
 
-        app_muted = get_application_mute_state(app["id"], self.logging)
         app_mute_button = Gtk.Button()
-        if app_muted:
+        if app.get("muted", False):
             mute_icon = Gtk.Image.new_from_icon_name("audio-volume-muted-symbolic", Gtk.IconSize.BUTTON)
             app_mute_button.set_tooltip_text(self.txt.app_output_unmute)
         else:
@@ -816,9 +761,7 @@ class VolumeTab(Gtk.Box):
         for sink_name, sink_desc in sink_options:
             output_combo.append(sink_name, sink_desc)
 
-        current_sink_name = ""
-        if "sink" in app:
-            current_sink_name = get_sink_name_by_id(app["sink"], self.logging)
+        current_sink_name = next((s["name"] for s in sinks if s["id"] == app.get("sink")), "")
 
         # Set active sink
         active_found = False
@@ -902,10 +845,10 @@ class VolumeTab(Gtk.Box):
         """Update volume displays"""
         try:
             # Update main volume
-            self.volume_scale.set_value(get_volume(self.logging))
+            get_volume_async(self.logging, self._show_volume)
 
             # Update mic volume
-            self.mic_scale.set_value(get_mic_volume(self.logging))
+            get_mic_volume_async(self.logging, self._show_mic_volume)
 
             # Update mute buttons
             self.update_mute_buttons()
@@ -937,8 +880,8 @@ class VolumeTab(Gtk.Box):
             # Update the volume immediately when user changes slider
             set_volume(value, self.logging)
             # Force update of mute button to ensure it's in sync when unmuting via volume change
-            if value > 0 and get_mute_state(self.logging):
-                GLib.idle_add(self.update_mute_button)
+            if value > 0:
+                self.update_mute_button()
 
         # Reset the timeout ID
         self._volume_change_timeout_id = None
@@ -1117,7 +1060,11 @@ class VolumeTab(Gtk.Box):
 
     def update_mic_mute_button(self):
         """Update microphone mute button"""
-        mic_muted = get_mic_mute_state(self.logging)
+        get_mic_mute_state_async(self.logging, self._show_mic_muted)
+
+    def _show_mic_muted(self, mic_muted):
+        if self._is_being_destroyed:
+            return
         if mic_muted:
             mute_icon = Gtk.Image.new_from_icon_name(
                 "microphone-disabled-symbolic", Gtk.IconSize.BUTTON
@@ -1132,12 +1079,18 @@ class VolumeTab(Gtk.Box):
 
     def update_mic_application_list(self):
         """Update microphone application list"""
+        get_source_outputs_async(self.logging, self._show_mic_applications)
+
+    def _show_mic_applications(self, mic_apps):
+        """Rebuild the microphone application cards"""
+        if self._is_being_destroyed:
+            return
+
         # Remove existing controls
         for child in self.mic_app_box.get_children():
             self.mic_app_box.remove(child)
 
         # Add controls for each application using microphone
-        mic_apps = get_source_outputs(self.logging)
         if not mic_apps:
             # Show "No applications using microphone" message
             no_mic_apps_label = Gtk.Label()
@@ -1199,7 +1152,7 @@ class VolumeTab(Gtk.Box):
                 controls_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
 
                 # Volume slider
-                volume = get_application_mic_volume(app["id"], self.logging)
+                volume = app.get("volume", 100)
                 scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 0, 100, 1)
                 self._configure_slider(scale)
                 scale.set_value(volume)
@@ -1207,9 +1160,8 @@ class VolumeTab(Gtk.Box):
                 controls_box.pack_start(scale, True, True, 0)
 
                 # Mic mute button
-                app_mic_muted = get_application_mic_mute_state(app["id"], self.logging)
                 app_mic_mute_button = Gtk.Button()
-                if app_mic_muted:
+                if app.get("muted", False):
                     mute_icon = Gtk.Image.new_from_icon_name("microphone-disabled-symbolic", Gtk.IconSize.BUTTON)
                     app_mic_mute_button.set_tooltip_text(self.txt.app_input_unmute)
                 else:
@@ -1233,19 +1185,16 @@ class VolumeTab(Gtk.Box):
             self.logging.log(
                 LogLevel.Info, "Volume tab is being destroyed, cleaning up resources"
             )
-            self.stop_pulse_monitoring()
+            self._is_being_destroyed = True
 
         self.connect("destroy", on_destroy)
 
     def __del__(self):
         """Clean up resources when tab is destroyed"""
-        self.stop_pulse_monitoring()
-        # Clean up any other resources
         self.logging.log(LogLevel.Debug, "Volume tab resources cleaned up")
 
     def on_destroy(self, widget):
         """Clean up resources when tab is destroyed"""
-        self.stop_pulse_monitoring()
         # Cancel any pending timeouts
         if hasattr(self, "_volume_change_timeout_id") and self._volume_change_timeout_id:
             GLib.source_remove(self._volume_change_timeout_id)
@@ -3,9 +3,12 @@
 import traceback
 import gi # type: ignore
 import threading
+import time
 
+from utils.capabilities import get_capability_registry
+from utils.commands import get_command_runner
 from utils.logger import LogLevel, Logger
-import subprocess
+from utils.scheduler import get_refresh_scheduler
 
 from utils.translations import Translation
 
@@ -21,9 +24,7 @@ from tools.wifi import (
     disconnect_network,
     forget_network,
     get_network_speed,
-    get_connection_info,
-    generate_wifi_qrcode,
-    wifi_supported
+    get_wifi_share_cache,
 )
 
 class WiFiTab(Gtk.Box):
@@ -48,7 +49,14 @@ class WiFiTab(Gtk.Box):
         # Track tab visibility status
         self.tab_visible = False
 
-        if not wifi_supported:
+        # Last network list shown, kept for the snapshot cache
+        self.networks = []
+        # Share dialog info is being fetched
+        self.qr_loading = False
+
+        # Cached from the last probe, hardware never probed counts as present
+        self.wifi_supported = get_capability_registry(self.logging).has_hardware("Wi-Fi") is not False
+        if not self.wifi_supported:
             self.logging.log(LogLevel.Warn, "WiFi is not supported on this machine")
 
         # Create header box with title and refresh button
@@ -113,7 +121,7 @@ class WiFiTab(Gtk.Box):
         self.refresh_button.connect("leave-notify-event", self.on_refresh_leave)
 
         # Disable refresh button if WiFi is not supported
-        if not wifi_supported:
+        if not self.wifi_supported:
             self.refresh_button.set_sensitive(False)
 
         header_box.pack_end(self.refresh_button, False, False, 0)
@@ -140,7 +148,7 @@ class WiFiTab(Gtk.Box):
         power_label.set_halign(Gtk.Align.START)
         self.power_switch = Gtk.Switch()
 
-        if wifi_supported:
+        if self.wifi_supported:
             self.power_switch.set_active(get_wifi_status(self.logging))
             self.power_switch.connect("notify::active", self.on_power_switched)
         else:
@@ -215,12 +223,13 @@ class WiFiTab(Gtk.Box):
         # Initial network list population is now deferred
         # self.update_network_list()  <- This line is removed
 
-        # Store network speed timer ID so we can stop it when tab is hidden
-        self.network_speed_timer_id = None
-
         # Previous speed values for calculation
         self.prev_rx_bytes = 0
         self.prev_tx_bytes = 0
+        self.prev_speed_time = 0.0
+
+        # Network speed updates only run while this is the current page
+        get_refresh_scheduler(self.logging).add(self, 1, self.update_network_speed)
 
         self.connect('key-press-event', self.on_key_press)
         
@@ -264,10 +273,6 @@ class WiFiTab(Gtk.Box):
         
         self.update_network_list()
 
-        # Start network speed updates when tab becomes visible
-        if self.network_speed_timer_id is None:
-            self.network_speed_timer_id = GLib.timeout_add_seconds(1, self.update_network_speed)
-
         return False
 
     def on_tab_hidden(self, widget):
@@ -275,11 +280,6 @@ class WiFiTab(Gtk.Box):
         self.logging.log(LogLevel.Info, "WiFi tab became hidden")
         self.tab_visible = False
 
-        # Stop network speed updates when tab is hidden
-        if self.network_speed_timer_id is not None:
-            GLib.source_remove(self.network_speed_timer_id)
-            self.network_speed_timer_id = None
-
         return False
 
     def load_networks(self):
@@ -308,7 +308,8 @@ class WiFiTab(Gtk.Box):
         box.pack_start(label, True, True, 0)
 
         row.add(box)
-        self.networks_box.add(row)
+        # On top of any networks restored from the snapshot
+        self.networks_box.insert(row, 0)
         self.networks_box.show_all()
 
         # Start network scan in background thread
@@ -336,6 +337,7 @@ class WiFiTab(Gtk.Box):
             for child in self.networks_box.get_children():
                 self.networks_box.remove(child)
 
+            self.networks = networks
             if not networks:
                 self._show_no_networks_info()
                 return False
@@ -361,7 +363,7 @@ class WiFiTab(Gtk.Box):
         box.set_margin_top(10)
         box.set_margin_bottom(10)
 
-        result = subprocess.run(["nmcli", "-t", "-f", "DEVICE,TYPE", "device"], capture_output=True, text=True)
+        result = get_command_runner(self.logging).run(["nmcli", "-t", "-f", "DEVICE,TYPE", "device"])
         wifi_interfaces = [line for line in result.stdout.split('\n') if "wifi" in line]
 
         if not wifi_interfaces:
@@ -441,23 +443,23 @@ class WiFiTab(Gtk.Box):
         index = len(self.networks_box.get_children()) - 1
         GLib.timeout_add(30 * index, add_animation_with_delay, row, index)
 
-    def _create_signal_icon(self, network):
+    def _get_signal_icon_name(self, network):
         try:
             signal_strength = int(network.get("signal", 0))
         except (ValueError, TypeError):
             signal_strength = 0
         if signal_strength >= 80:
-            icon_name = "network-wireless-signal-excellent-symbolic"
+            return "network-wireless-signal-excellent-symbolic"
         elif signal_strength >= 60:
-            icon_name = "network-wireless-signal-good-symbolic"
+            return "network-wireless-signal-good-symbolic"
         elif signal_strength >= 40:
-            icon_name = "network-wireless-signal-ok-symbolic"
+            return "network-wireless-signal-ok-symbolic"
         elif signal_strength > 0:
-            icon_name = "network-wireless-signal-weak-symbolic"
-        else:
-            icon_name = "network-wireless-signal-none-symbolic"
-        signal_icon = Gtk.Image.new_from_icon_name(icon_name, Gtk.IconSize.MENU)
-        return signal_icon
+            return "network-wireless-signal-weak-symbolic"
+        return "network-wireless-signal-none-symbolic"
+
+    def _create_signal_icon(self, network):
+        return Gtk.Image.new_from_icon_name(self._get_signal_icon_name(network), Gtk.IconSize.MENU)
 
     def _create_network_info_box(self, network):
         info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3)
@@ -533,6 +535,29 @@ class WiFiTab(Gtk.Box):
 
         return False  # Required for GLib.idle_add
 
+    def get_snapshot(self):
+        """View model for the snapshot cache: the last scanned networks"""
+        if not self.networks:
+            return None
+        connected_text = getattr(self.txt, "connected", "Connected")
+        return {
+            "networks": self.networks,
+            "summary": [
+                {
+                    "icon": self._get_signal_icon_name(network),
+                    "title": network["ssid"],
+                    "subtitle": connected_text if network["in_use"] else f"{network.get('signal', 0)}%",
+                }
+                for network in self._sort_networks(self.networks)[:8]
+            ],
+        }
+
+    def restore_snapshot(self, snapshot):
+        """Show the networks from the last session until a scan completes"""
+        networks = snapshot.get("networks")
+        if networks and not self.networks:
+            self._update_networks_in_ui(networks)
+
     def update_network_list(self):
         """Update the list of WiFi networks"""
         self.logging.log(LogLevel.Info, "Refreshing WiFi networks list")
@@ -584,15 +609,19 @@ class WiFiTab(Gtk.Box):
 
         rx_bytes = speed["rx_bytes"]
         tx_bytes = speed["tx_bytes"]
+        now = time.monotonic()
 
-        if self.prev_rx_bytes > 0 and self.prev_tx_bytes > 0:
-            rx_speed = (rx_bytes - self.prev_rx_bytes) / 1024 / 1024  # Convert to Mbps
-            tx_speed = (tx_bytes - self.prev_tx_bytes) / 1024 / 1024  # Convert to Mbps
+        # Updates pause while the tab is hidden, so divide by the real interval
+        elapsed = now - self.prev_speed_time
+        if self.prev_rx_bytes > 0 and self.prev_tx_bytes > 0 and elapsed > 0:
+            rx_speed = (rx_bytes - self.prev_rx_bytes) / elapsed / 1024 / 1024  # Convert to Mbps
+            tx_speed = (tx_bytes - self.prev_tx_bytes) / elapsed / 1024 / 1024  # Convert to Mbps
             self.download_label.set_text(f"Download: {rx_speed:.1f} Mbps")
             self.upload_label.set_text(f"Upload: {tx_speed:.1f} Mbps")
 
         self.prev_rx_bytes = rx_bytes
         self.prev_tx_bytes = tx_bytes
+        self.prev_speed_time = now
 
         return True  # Continue the timer
 
@@ -921,122 +950,123 @@ class WiFiTab(Gtk.Box):
             """Show a qr code dialog for current network"""
             # Get current network
             current_network = self.get_current_network()
-            if current_network:
-                # create a dialog
-                try:
-                    connection_info = get_connection_info(current_network["ssid"], self.logging)
-
-                    # generate qr code for wifi
-                    qr_path = generate_wifi_qrcode(
-                        current_network["ssid"],
-                        connection_info.get("password", ""),
-                        current_network["security"],
-                        self.logging
-                    )
-
-                    # use hardcoded fallback title text to avoid missing translation attribute diagnostics
-                    dialog_title = getattr(self.txt, "wifi_share_title", "Share WiFi")
-
-                    qr_dialog = Gtk.Dialog(
-                        title=dialog_title,
-                        parent=self.get_toplevel(),
-                        flags=Gtk.DialogFlags.MODAL,
-                    )
-                    qr_dialog.set_default_size(0,0)
-                    qr_dialog.set_position(Gtk.WindowPosition.CENTER_ON_PARENT)
-
-                    # header
-                    header_bar = Gtk.HeaderBar()
-                    header_bar.set_show_close_button(True)
-                    header_bar.set_title(dialog_title)
-                    qr_dialog.set_titlebar(header_bar)
-
-                    # content area
-                    content_area = qr_dialog.get_content_area()
-                    content_area.set_spacing(10)
-                    content_area.set_margin_top(10)
-                    content_area.set_margin_bottom(10)
-                    content_area.set_margin_start(10)
-                    content_area.set_margin_end(10)
-
-                    # for qr code image
-                    top_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
-                    top_box.set_margin_bottom(20)
-
-                    # image holder
-                    qr_button = Gtk.Button()
-                    qr_button.set_size_request(124,124)
-                    qr_button.set_relief(Gtk.ReliefStyle.NONE)
-                    qr_button.get_style_context().add_class("qr_image_holder")
-                    top_box.pack_start(qr_button, False, False, 0)
-
-                    # fallback for wifi_share_scan
-                    scan_text = getattr(self.txt, "wifi_share_scan", "Scan this QR code to join")
-                    scan_label = Gtk.Label(label=scan_text)
-                    scan_label.get_style_context().add_class("scan_label")
-                    top_box.pack_start(scan_label, False, False, 0)
-
-                    if qr_path:
-                        qr_image = Gtk.Image()
-                        qr_image.set_size_request(120, 120)
-                        qr_image.set_margin_top(8)
-                        qr_image.set_margin_bottom(8)
-                        qr_image.set_from_file(qr_path)
-                        qr_button.add(qr_image)
-                    else:
-                        error_label = Gtk.Label(label="Failed to generate QR code")
-                        qr_button.add(error_label)
-
-                    content_area.pack_start(top_box, False, True, 0)
-
-                    # network details
-                    bottom_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3)
-                    bottom_box.set_margin_top(1)
-
-                    # network name
-                    ssid_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-                    ssid_box.set_size_request(320, 50)
-                    ssid_box.get_style_context().add_class("ssid-box")
-
-                    ssid_label_text = getattr(self.txt, "wifi_network_name", "Network name")
-                    ssid_label = Gtk.Label(label=ssid_label_text)
-                    ssid_label.get_style_context().add_class("dimmed-label")
-                    ssid_label.set_markup(f"<b>{ssid_label_text}</b>")
-                    ssid_label.set_halign(Gtk.Align.START)
-
-                    ssid_name = Gtk.Label(label=current_network["ssid"])
-                    ssid_name.get_style_context().add_class("dimmed-label")
-                    ssid_name.set_halign(Gtk.Align.START)
-                    ssid_box.pack_start(ssid_label, False, False, 0)
-                    ssid_box.pack_start(ssid_name, False, False, 0)
-
-                    # network password
-                    security_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-                    security_box.set_size_request(320, 50)
-                    security_box.get_style_context().add_class("secrity-box")
-
-                    wifi_password_text = getattr(self.txt, "wifi_password", "Password")
-                    security_label = Gtk.Label(label=wifi_password_text)
-                    security_label.get_style_context().add_class("dimmed-label")
-                    security_label.set_markup(f"<b>{wifi_password_text}</b>")
-                    security_label.set_halign(Gtk.Align.START)
-
-                    passwd = Gtk.Label(label=connection_info.get("password", "Hidden"))
-                    passwd.get_style_context().add_class("dimmed-label")
-                    passwd.set_halign(Gtk.Align.START)
-                    security_box.pack_start(security_label, False, False, 0)
-                    security_box.pack_start(passwd, False, False, 0)
-
-                    # add to bottom box
-                    bottom_box.pack_start(ssid_box, False, False, 0)
-                    bottom_box.pack_start(security_box, False, False, 0)
-
-                    content_area.pack_start(bottom_box, False, True, 0)
-
-                    qr_dialog.show_all()
-                    qr_dialog.run()
-                    qr_dialog.destroy()
+            if current_network and not self.qr_loading:
+                # nmcli --show-secrets and rendering run off the main thread,
+                # both are cached so reopening the dialog is immediate
+                self.qr_loading = True
+                get_wifi_share_cache(self.logging).load_async(
+                    current_network["ssid"],
+                    current_network["security"],
+                    lambda info, pixbuf: self._open_qr_dialog(current_network, info, pixbuf),
+                )
 
-                except Exception as e:
-                    self.logging.log(LogLevel.Error, f"failed to open qr code dialog: {e}")
-                    traceback.print_exc()
+    def _open_qr_dialog(self, current_network, connection_info, qr_pixbuf):
+        self.qr_loading = False
+        # create a dialog
+        try:
+            # use hardcoded fallback title text to avoid missing translation attribute diagnostics
+            dialog_title = getattr(self.txt, "wifi_share_title", "Share WiFi")
+
+            qr_dialog = Gtk.Dialog(
+                title=dialog_title,
+                parent=self.get_toplevel(),
+                flags=Gtk.DialogFlags.MODAL,
+            )
+            qr_dialog.set_default_size(0,0)
+            qr_dialog.set_position(Gtk.WindowPosition.CENTER_ON_PARENT)
+
+            # header
+            header_bar = Gtk.HeaderBar()
+            header_bar.set_show_close_button(True)
+            header_bar.set_title(dialog_title)
+            qr_dialog.set_titlebar(header_bar)
+
+            # content area
+            content_area = qr_dialog.get_content_area()
+            content_area.set_spacing(10)
+            content_area.set_margin_top(10)
+            content_area.set_margin_bottom(10)
+            content_area.set_margin_start(10)
+            content_area.set_margin_end(10)
+
+            # for qr code image
+            top_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
+            top_box.set_margin_bottom(20)
+
+            # image holder
+            qr_button = Gtk.Button()
+            qr_button.set_size_request(124,124)
+            qr_button.set_relief(Gtk.ReliefStyle.NONE)
+            qr_button.get_style_context().add_class("qr_image_holder")
+            top_box.pack_start(qr_button, False, False, 0)
+
+            # fallback for wifi_share_scan
+            scan_text = getattr(self.txt, "wifi_share_scan", "Scan this QR code to join")
+            scan_label = Gtk.Label(label=scan_text)
+            scan_label.get_style_context().add_class("scan_label")
+            top_box.pack_start(scan_label, False, False, 0)
+
+            if qr_pixbuf is not None:
+                qr_image = Gtk.Image()
+                qr_image.set_size_request(120, 120)
+                qr_image.set_margin_top(8)
+                qr_image.set_margin_bottom(8)
+                qr_image.set_from_pixbuf(qr_pixbuf)
+                qr_button.add(qr_image)
+            else:
+                error_label = Gtk.Label(label="Failed to generate QR code")
+                qr_button.add(error_label)
+
+            content_area.pack_start(top_box, False, True, 0)
+
+            # network details
+            bottom_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3)
+            bottom_box.set_margin_top(1)
+
+            # network name
+            ssid_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+            ssid_box.set_size_request(320, 50)
+            ssid_box.get_style_context().add_class("ssid-box")
+
+            ssid_label_text = getattr(self.txt, "wifi_network_name", "Network name")
+            ssid_label = Gtk.Label(label=ssid_label_text)
+            ssid_label.get_style_context().add_class("dimmed-label")
+            ssid_label.set_markup(f"<b>{ssid_label_text}</b>")
+            ssid_label.set_halign(Gtk.Align.START)
+
+            ssid_name = Gtk.Label(label=current_network["ssid"])
+            ssid_name.get_style_context().add_class("dimmed-label")
+            ssid_name.set_halign(Gtk.Align.START)
+            ssid_box.pack_start(ssid_label, False, False, 0)
+            ssid_box.pack_start(ssid_name, False, False, 0)
+
+            # network password
+            security_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+            security_box.set_size_request(320, 50)
+            security_box.get_style_context().add_class("secrity-box")
+
+            wifi_password_text = getattr(self.txt, "wifi_password", "Password")
+            security_label = Gtk.Label(label=wifi_password_text)
+            security_label.get_style_context().add_class("dimmed-label")
+            security_label.set_markup(f"<b>{wifi_password_text}</b>")
+            security_label.set_halign(Gtk.Align.START)
+
+            passwd = Gtk.Label(label=connection_info.get("password", "Hidden"))
+            passwd.get_style_context().add_class("dimmed-label")
+            passwd.set_halign(Gtk.Align.START)
+            security_box.pack_start(security_label, False, False, 0)
+            security_box.pack_start(passwd, False, False, 0)
+
+            # add to bottom box
+            bottom_box.pack_start(ssid_box, False, False, 0)
+            bottom_box.pack_start(security_box, False, False, 0)
+
+            content_area.pack_start(bottom_box, False, True, 0)
+
+            qr_dialog.show_all()
+            qr_dialog.run()
+            qr_dialog.destroy()
+
+        except Exception as e:
+            self.logging.log(LogLevel.Error, f"failed to open qr code dialog: {e}")
+            traceback.print_exc()
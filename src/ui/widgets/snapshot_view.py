@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+import gi  # type: ignore
+
+gi.require_version("Gtk", "3.0")
+gi.require_version("Pango", "1.0")
+from gi.repository import Gtk, Pango  # type: ignore
+
+
+class SnapshotView(Gtk.Box):
+    """Placeholder page showing a tab's last known state
+
+    Renders the "summary" rows of a snapshot ({"icon", "title", "subtitle"})
+    with plain labels, so it needs neither the tab's module nor any live
+    data. It is replaced by the real tab once the tab loader builds it.
+    """
+
+    def __init__(self, snapshot: dict, updating_text: str = "Updating..."):
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=10)
+        self.set_margin_start(15)
+        self.set_margin_end(15)
+        self.set_margin_top(15)
+        self.set_margin_bottom(15)
+
+        status_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        spinner = Gtk.Spinner()
+        spinner.start()
+        status_box.pack_start(spinner, False, False, 0)
+        status_label = Gtk.Label(label=updating_text)
+        status_label.get_style_context().add_class("dim-label")
+        status_box.pack_start(status_label, False, False, 0)
+        self.pack_start(status_box, False, False, 0)
+
+        rows = Gtk.ListBox()
+        rows.set_selection_mode(Gtk.SelectionMode.NONE)
+        for item in snapshot.get("summary", []):
+            rows.add(self.create_row(item))
+        self.pack_start(rows, False, True, 0)
+
+    def create_row(self, item: dict) -> Gtk.ListBoxRow:
+        row = Gtk.ListBoxRow()
+        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        box.set_margin_start(10)
+        box.set_margin_end(10)
+        box.set_margin_top(6)
+        box.set_margin_bottom(6)
+
+        icon = Gtk.Image.new_from_icon_name(
+            item.get("icon") or "image-missing-symbolic", Gtk.IconSize.LARGE_TOOLBAR
+        )
+        box.pack_start(icon, False, False, 0)
+
+        text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3)
+        title = Gtk.Label(label=str(item.get("title", "")))
+        title.set_halign(Gtk.Align.START)
+        title.set_ellipsize(Pango.EllipsizeMode.END)
+        text_box.pack_start(title, False, True, 0)
+
+        subtitle_text = item.get("subtitle")
+        if subtitle_text:
+            subtitle = Gtk.Label(label=str(subtitle_text))
+            subtitle.set_halign(Gtk.Align.START)
+            subtitle.get_style_context().add_class("dim-label")
+            text_box.pack_start(subtitle, False, True, 0)
+
+        box.pack_start(text_box, True, True, 0)
+        row.add(box)
+        return row
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
-import subprocess
 import gi  # type: ignore
+from utils.commands import get_command_runner
 from utils.logger import LogLevel, Logger
 
 gi.require_version("Gtk", "3.0")
@@ -81,17 +81,15 @@ class WiFiNetworkRow(Gtk.ListBoxRow):
 
         if self.is_connected:
             try:
-                active_connections = subprocess.getoutput(
-                    "nmcli -t -f NAME,DEVICE connection show --active"
+                # One call for every active connection's type instead of one per connection
+                active_connections = get_command_runner(logging).getoutput(
+                    ["nmcli", "-t", "-f", "NAME,TYPE", "connection", "show", "--active"]
                 ).split("\n")
                 for conn in active_connections:
                     if ":" in conn:
-                        name = conn.split(":")[0]
-                        conn_type = subprocess.getoutput(
-                            f"nmcli -t -f TYPE connection show '{name}'"
-                        )
-                        if "wifi" in conn_type:
-                            return name
+                        name, conn_type = conn.rsplit(":", 1)
+                        if "wireless" in conn_type or "wifi" in conn_type:
+                            return name.replace("\\:", ":")
                 return parts[1]
             except Exception as e:
                 logging.log(
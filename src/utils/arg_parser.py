@@ -15,6 +15,20 @@ def sprint(file: Optional[TextIO], *args) -> None:
     print(*args, file=file, flush=True)
 
 
+# Tab selection flags, checked in order
+TAB_FLAGS: List[Tuple[str, Tuple[str, str]]] = [
+    ("Volume", ("-V", "--volume")),
+    ("Volume", ("-v", "")),
+    ("Wi-Fi", ("-w", "--wifi")),
+    ("Autostart", ("-a", "--autostart")),
+    ("Bluetooth", ("-b", "--bluetooth")),
+    ("Battery", ("-B", "--battery")),
+    ("Display", ("-d", "--display")),
+    ("Power", ("-p", "--power")),
+    ("USBGuard", ("-u", "--usbguard")),
+]
+
+
 class ArgParse:
     def __init__(self, args: List[str]) -> None:
         self.__bin: str = ""
@@ -128,6 +142,17 @@ class ArgParse:
                     return next_arg["option"]
         return None
 
+    def get_requested_tab(self) -> Optional[str]:
+        """get the tab selected with a tab selection flag
+
+        Returns:
+            Optional[str]: the tab name, or None if no tab was requested
+        """
+        for tab_name, flags in TAB_FLAGS:
+            if self.find_arg(flags):
+                return tab_name
+        return None
+
     def arg_print(self, msg: str) -> None:
         sprint(self.__help_stream, msg)
 
@@ -159,7 +184,9 @@ class ArgParse:
 
         # Usage
         self.arg_print(f"{BOLD}USAGE:{RESET}")
-        self.arg_print(f"  {WHITE}better-control {GRAY}[options]{RESET}\n")
+        self.arg_print(f"  {WHITE}better-control {GRAY}[options]{RESET}")
+        self.arg_print(f"  {WHITE}better-control ctl {GRAY}[--json] <command>{RESET}   Changes settings without opening the window,")
+        self.arg_print(f"                                          see {WHITE}better-control ctl --help{RESET}\n")
 
         # Options header
         self.arg_print(f"{BOLD}OPTIONS:{RESET}")
@@ -170,7 +197,15 @@ class ArgParse:
         self.arg_print(f"  {GREEN}-f, --force{RESET}                     Makes the app force to have all dependencies installed")
         self.arg_print(f"  {GREEN}-s, --size{RESET} {YELLOW}<intxint>{RESET}            Sets a custom window size")
         self.arg_print(f"  {GREEN}-L, --lang{RESET}                      Sets the language of the app (en,es,pt)")
-        self.arg_print(f"  {GREEN}-m, --minimal{RESET}                   Hides the notebook tabs and only shows the selected tab content\n")
+        self.arg_print(f"  {GREEN}-m, --minimal{RESET}                   Hides the notebook tabs and only shows the selected tab content")
+        self.arg_print(f"  {GREEN}-D, --daemon{RESET}                    Stays running in the background, later launches raise the")
+        self.arg_print("                                  window on the requested tab instead of starting again")
+        self.arg_print(f"  {GREEN}-O, --osd{RESET}                       Runs only a small popup that shows volume, mic mute and")
+        self.arg_print("                                  brightness changes, without the window")
+        self.arg_print(f"  {GREEN}-S, --sample-startup{RESET}            Records how long autostart apps take to start, run it at")
+        self.arg_print("                                  login; --daemon and --osd do this too")
+        self.arg_print(f"  {GREEN}-P, --profile-startup{RESET} {YELLOW}[file]{RESET}   Prints a startup timing breakdown after the first frame,")
+        self.arg_print("                                  and writes a Chrome trace to the file if one is given\n")
 
         # Tab selection options
         self.arg_print(f"{BOLD}{UNDERLINE}Tab Selection:{RESET}")
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import dbus
+import dbus.mainloop.glib
+
+from utils.logger import LogLevel, Logger
+
+DBUS_PROP_IFACE = "org.freedesktop.DBus.Properties"
+DBUS_OM_IFACE = "org.freedesktop.DBus.ObjectManager"
+
+_lock = threading.RLock()
+_buses: Dict[str, dbus.Bus] = {}
+_properties: Dict[Tuple, "PropertiesCache"] = {}
+_object_managers: Dict[Tuple, "ObjectManagerMirror"] = {}
+
+
+def _get_bus(bus_type: str) -> dbus.Bus:
+    with _lock:
+        bus = _buses.get(bus_type)
+        if bus is None:
+            if not _buses:
+                # Once per process, before the first connection is made, so
+                # every connection is dispatched from the GLib main loop
+                dbus.mainloop.glib.threads_init()
+                dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
+            bus = dbus.SystemBus() if bus_type == "system" else dbus.SessionBus()
+            _buses[bus_type] = bus
+        return bus
+
+
+def get_system_bus() -> dbus.Bus:
+    """Get the process-wide system bus connection
+
+    Raises:
+        dbus.DBusException: if the bus can't be reached
+    """
+    return _get_bus("system")
+
+
+def get_session_bus() -> dbus.Bus:
+    """Get the process-wide session bus connection
+
+    Raises:
+        dbus.DBusException: if the bus can't be reached
+    """
+    return _get_bus("session")
+
+
+class PropertiesCache:
+    """Local copy of one interface's properties on one object
+
+    Filled by a single GetAll on first read and kept current from
+    PropertiesChanged, so reads cost no bus round trip. Properties the
+    service only invalidates are fetched with Get on their next read. The
+    copy is dropped when the service's owner changes.
+
+    Signals arrive on the main loop, reads may come from any thread.
+    """
+
+    def __init__(self, logging: Logger, bus: dbus.Bus, service: str, path: str, interface: str):
+        self.logging = logging
+        self.bus = bus
+        self.service = service
+        self.path = path
+        self.interface = interface
+        self._values: Optional[Dict] = None
+        self._invalidated = set()
+        self._listeners: List[Callable[[Dict, List[str]], None]] = []
+        self._lock = threading.Lock()
+
+        bus.add_signal_receiver(
+            self._on_properties_changed, "PropertiesChanged", DBUS_PROP_IFACE, service, path
+        )
+        bus.watch_name_owner(service, self._on_owner_changed)
+
+    def _proxy(self) -> dbus.Interface:
+        return dbus.Interface(
+            self.bus.get_object(self.service, self.path, introspect=False), DBUS_PROP_IFACE
+        )
+
+    def get_all(self) -> Dict:
+        """All properties, fetched once
+
+        Raises:
+            dbus.DBusException: if the first fetch fails
+        """
+        with self._lock:
+            if self._values is not None:
+                return dict(self._values)
+
+        values = dict(self._proxy().GetAll(self.interface))
+        self.logging.log(LogLevel.Debug, f"GetAll {self.interface} on {self.path}")
+        with self._lock:
+            if self._values is None:
+                self._values = values
+            return dict(self._values)
+
+    def get(self, name: str, default=None):
+        values = self.get_all()
+        if name not in self._invalidated:
+            return values.get(name, default)
+
+        try:
+            value = self._proxy().Get(self.interface, name)
+        except dbus.DBusException:
+            return default
+        with self._lock:
+            if self._values is not None:
+                self._values[name] = value
+            self._invalidated.discard(name)
+        return value
+
+    def set(self, name: str, value) -> None:
+        """Set a property, the cached value is updated right away
+
+        Raises:
+            dbus.DBusException: if the service refuses the value
+        """
+        self._proxy().Set(self.interface, name, value)
+        with self._lock:
+            if self._values is not None:
+                self._values[name] = value
+            self._invalidated.discard(name)
+
+    def connect(self, callback: Callable[[Dict, List[str]], None]) -> None:
+        """Call callback(changed, invalidated) on the main loop after each change"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def disconnect(self, callback: Callable[[Dict, List[str]], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _on_properties_changed(self, interface, changed, invalidated) -> None:
+        if interface != self.interface:
+            return
+        with self._lock:
+            if self._values is not None:
+                self._values.update(changed)
+                for name in invalidated:
+                    self._values.pop(name, None)
+                    self._invalidated.add(str(name))
+            self._invalidated.difference_update(str(name) for name in changed)
+
+        for callback in list(self._listeners):
+            try:
+                callback(dict(changed), [str(name) for name in invalidated])
+            except Exception as e:
+                self.logging.log(LogLevel.Error, f"Error in {self.interface} properties callback: {e}")
+
+    def _on_owner_changed(self, owner: str) -> None:
+        with self._lock:
+            self._values = None
+            self._invalidated.clear()
+
+
+class ObjectManagerMirror:
+    """Local copy of every object a service exports through ObjectManager
+
+    One GetManagedObjects on first read, then InterfacesAdded,
+    InterfacesRemoved and PropertiesChanged keep it current, so listing
+    devices or reading their state costs no bus round trip. Like
+    PropertiesCache the copy is dropped and fetched again when the
+    service restarts.
+
+    Listeners are called as callback(path, interface, changed) on the main
+    loop. interface is None when the object went away, and path is None
+    when the whole mirror was reset.
+    """
+
+    def __init__(self, logging: Logger, bus: dbus.Bus, service: str, root: str = "/"):
+        self.logging = logging
+        self.bus = bus
+        self.service = service
+        self.root = root
+        self._objects: Optional[Dict[str, Dict[str, Dict]]] = None
+        self._listeners: List[Callable[[Optional[str], Optional[str], Dict], None]] = []
+        self._lock = threading.Lock()
+
+        bus.add_signal_receiver(
+            self._on_interfaces_added, "InterfacesAdded", DBUS_OM_IFACE, service, root
+        )
+        bus.add_signal_receiver(
+            self._on_interfaces_removed, "InterfacesRemoved", DBUS_OM_IFACE, service, root
+        )
+        bus.add_signal_receiver(
+            self._on_properties_changed, "PropertiesChanged", DBUS_PROP_IFACE, service,
+            path_keyword="path",
+        )
+        bus.watch_name_owner(service, self._on_owner_changed)
+
+    def _fetch(self) -> Dict[str, Dict[str, Dict]]:
+        with self._lock:
+            if self._objects is not None:
+                return self._objects
+
+        manager = dbus.Interface(
+            self.bus.get_object(self.service, self.root, introspect=False), DBUS_OM_IFACE
+        )
+        objects = {
+            str(path): {str(iface): dict(props) for iface, props in interfaces.items()}
+            for path, interfaces in manager.GetManagedObjects().items()
+        }
+        self.logging.log(LogLevel.Debug, f"GetManagedObjects on {self.service}: {len(objects)} objects")
+        with self._lock:
+            if self._objects is None:
+                self._objects = objects
+            return self._objects
+
+    def get_objects(self) -> Dict[str, Dict[str, Dict]]:
+        """{path: {interface: properties}} for every exported object
+
+        Raises:
+            dbus.DBusException: if the first fetch fails
+        """
+        objects = self._fetch()
+        with self._lock:
+            return {
+                path: {iface: dict(props) for iface, props in interfaces.items()}
+                for path, interfaces in objects.items()
+            }
+
+    def find(self, interface: str) -> List[Tuple[str, Dict]]:
+        """(path, properties) of every object implementing interface, by path"""
+        objects = self._fetch()
+        with self._lock:
+            return sorted(
+                (path, dict(interfaces[interface]))
+                for path, interfaces in objects.items()
+                if interface in interfaces
+            )
+
+    def get_properties(self, path: str, interface: str) -> Optional[Dict]:
+        objects = self._fetch()
+        with self._lock:
+            props = objects.get(path, {}).get(interface)
+            return dict(props) if props is not None else None
+
+    def connect(self, callback: Callable[[Optional[str], Optional[str], Dict], None]) -> None:
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def disconnect(self, callback: Callable[[Optional[str], Optional[str], Dict], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, path: Optional[str], interface: Optional[str], changed: Dict) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(path, interface, changed)
+            except Exception as e:
+                self.logging.log(LogLevel.Error, f"Error in {self.service} object callback: {e}")
+
+    def _on_interfaces_added(self, path, interfaces) -> None:
+        path = str(path)
+        with self._lock:
+            if self._objects is not None:
+                entry = self._objects.setdefault(path, {})
+                for iface, props in interfaces.items():
+                    entry[str(iface)] = dict(props)
+        for iface, props in interfaces.items():
+            self._notify(path, str(iface), dict(props))
+
+    def _on_interfaces_removed(self, path, interfaces) -> None:
+        path = str(path)
+        with self._lock:
+            if self._objects is not None and path in self._objects:
+                entry = self._objects[path]
+                for iface in interfaces:
+                    entry.pop(str(iface), None)
+                if not entry:
+                    del self._objects[path]
+        self._notify(path, None, {})
+
+    def _on_properties_changed(self, interface, changed, invalidated, path=None) -> None:
+        path = str(path)
+        interface = str(interface)
+        with self._lock:
+            if self._objects is None:
+                return
+            props = self._objects.get(path, {}).get(interface)
+            if props is None:
+                return
+            props.update(changed)
+            for name in invalidated:
+                props.pop(name, None)
+        self._notify(path, interface, dict(changed))
+
+    def _on_owner_changed(self, owner: str) -> None:
+        with self._lock:
+            had_objects = self._objects is not None
+            self._objects = None
+        if had_objects:
+            self.logging.log(LogLevel.Debug, f"{self.service} owner changed, dropping object mirror")
+            self._notify(None, None, {})
+
+
+def get_properties(logging: Logger, service: str, path: str, interface: str,
+                   bus_type: str = "system") -> PropertiesCache:
+    """Get or create the shared PropertiesCache for an object's interface
+
+    Raises:
+        dbus.DBusException: if the bus can't be reached
+    """
+    key = (bus_type, service, path, interface)
+    with _lock:
+        cache = _properties.get(key)
+        if cache is None:
+            cache = _properties[key] = PropertiesCache(
+                logging, _get_bus(bus_type), service, path, interface
+            )
+        return cache
+
+
+def get_object_manager(logging: Logger, service: str, root: str = "/",
+                       bus_type: str = "system") -> ObjectManagerMirror:
+    """Get or create the shared ObjectManagerMirror for a service
+
+    Raises:
+        dbus.DBusException: if the bus can't be reached
+    """
+    key = (bus_type, service, root)
+    with _lock:
+        mirror = _object_managers.get(key)
+        if mirror is None:
+            mirror = _object_managers[key] = ObjectManagerMirror(
+                logging, _get_bus(bus_type), service, root
+            )
+        return mirror
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.logger import LogLevel, Logger
+
+CAPABILITY_CACHE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "better-control",
+    "capabilities.json",
+)
+# Bump when the meaning of a cached entry changes
+CAPABILITY_VERSION = 1
+
+
+def _probe_wifi(logging: Logger) -> bool:
+    from tools.wifi import wifi_supported
+
+    return wifi_supported(logging)
+
+
+def _probe_battery(logging: Logger) -> bool:
+    from tools.globals import battery_supported
+
+    return bool(battery_supported(logging))
+
+
+def _probe_bluetooth(logging: Logger) -> bool:
+    from tools.bluetooth import get_bluetooth_manager
+
+    return get_bluetooth_manager(logging).bluetooth_supported()
+
+
+# Hardware a tab depends on, keyed by tab name
+HARDWARE_PROBES: Dict[str, Callable[[Logger], bool]] = {
+    "Wi-Fi": _probe_wifi,
+    "Battery": _probe_battery,
+    "Bluetooth": _probe_bluetooth,
+}
+
+
+class CapabilityRegistry:
+    """What this machine has: external commands and hardware
+
+    Probe results are kept in a small JSON cache so a launch answers from
+    it instead of searching PATH and running nmcli/upower/D-Bus probes
+    before the window can be shown.
+
+    A cached command path is trusted while the file is still there with
+    the same mtime, a single stat. Anything else is looked up again right
+    away, so a command that was just installed or removed is never
+    reported wrong. Hardware is served from the cache as is and probed
+    again by revalidate(), which runs in the background after startup.
+    Hardware that was never probed is reported as None.
+
+    Callbacks registered with connect() get (kind, name, value) on the
+    GLib main loop for every capability whose value changed, kind being
+    "binary" or "hardware".
+    """
+
+    def __init__(self, logging: Logger):
+        self.logging = logging
+        self.binaries: Dict[str, Dict[str, Any]] = {}
+        self.hardware: Dict[str, bool] = {}
+        self._listeners: List[Callable[[str, str, Any], None]] = []
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(CAPABILITY_CACHE, "r") as f:
+                data = json.load(f)
+            if data.get("version") != CAPABILITY_VERSION:
+                return
+            self.binaries = dict(data.get("binaries", {}))
+            self.hardware = {name: bool(value) for name, value in data.get("hardware", {}).items()}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logging.log(LogLevel.Warn, f"Ignoring unreadable capability cache: {e}")
+
+    def save(self) -> None:
+        """Write the cache if anything changed since it was read"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": CAPABILITY_VERSION,
+                "binaries": dict(self.binaries),
+                "hardware": dict(self.hardware),
+            }
+            self._dirty = False
+
+        directory = os.path.dirname(CAPABILITY_CACHE)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".capabilities-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, CAPABILITY_CACHE)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            self.logging.log(LogLevel.Warn, f"Failed to save capability cache: {e}")
+
+    def which(self, command: str) -> Optional[str]:
+        """Path of an external command, like shutil.which"""
+        entry = self.binaries.get(command)
+        if entry and entry.get("path"):
+            try:
+                if os.stat(entry["path"]).st_mtime == entry.get("mtime"):
+                    return entry["path"]
+            except OSError:
+                pass
+        return self._probe_binary(command)
+
+    def has_hardware(self, name: str) -> Optional[bool]:
+        """Cached presence of a tab's hardware, None if never probed"""
+        return self.hardware.get(name)
+
+    def revalidate(self) -> None:
+        """Probe every command and all hardware again
+
+        Blocks on the probes, run it off the main thread. Changes are
+        saved and announced to connect() callbacks.
+        """
+        for command in list(self.binaries):
+            self._probe_binary(command)
+
+        for name, probe in HARDWARE_PROBES.items():
+            try:
+                present = bool(probe(self.logging))
+            except Exception as e:
+                self.logging.log(LogLevel.Warn, f"Probing {name} hardware failed: {e}")
+                continue
+            with self._lock:
+                changed = self.hardware.get(name) != present
+                if changed:
+                    self.hardware[name] = present
+                    self._dirty = True
+            if changed:
+                self.logging.log(LogLevel.Info, f"{name} hardware {'found' if present else 'not found'}")
+                self._emit("hardware", name, present)
+
+        self.save()
+
+    def connect(self, callback: Callable[[str, str, Any], None]) -> None:
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def disconnect(self, callback: Callable[[str, str, Any], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _probe_binary(self, command: str) -> Optional[str]:
+        path = shutil.which(command)
+        mtime = None
+        if path:
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                path = None
+
+        entry = {"path": path, "mtime": mtime}
+        with self._lock:
+            previous = self.binaries.get(command)
+            if previous != entry:
+                self.binaries[command] = entry
+                self._dirty = True
+        # A first lookup isn't a change
+        if previous is not None and previous.get("path") != path:
+            self._emit("binary", command, path)
+        return path
+
+    def _emit(self, kind: str, name: str, value: Any) -> None:
+        if not self._listeners:
+            return
+        from gi.repository import GLib  # type: ignore
+
+        def deliver():
+            for callback in list(self._listeners):
+                try:
+                    callback(kind, name, value)
+                except Exception as e:
+                    self.logging.log(LogLevel.Error, f"Error in capability callback: {e}")
+            return False
+
+        GLib.idle_add(deliver)
+
+
+_capability_registry = None
+
+
+def get_capability_registry(logging: Logger) -> CapabilityRegistry:
+    """Get or create the global CapabilityRegistry instance"""
+    global _capability_registry
+    if _capability_registry is None:
+        _capability_registry = CapabilityRegistry(logging)
+    return _capability_registry
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, TextIO, Tuple
+
+from utils.logger import LogLevel, Logger
+
+# Seconds before a command is killed, long running ones (nmcli connection
+# up, pkexec) pass their own timeout
+DEFAULT_TIMEOUT = 5.0
+# Upper bound on commands run concurrently through run_async
+MAX_WORKERS = 4
+
+
+class CommandStats:
+    """Spawn count and latency of one command"""
+
+    __slots__ = ("name", "count", "failures", "timeouts", "total", "max")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            "command": self.name,
+            "count": self.count,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "total_ms": round(self.total * 1000, 1),
+            "avg_ms": round(self.total / self.count * 1000, 1) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 1),
+        }
+
+
+class CommandHandle:
+    """Returned by run_async, cancel() drops the callback and kills the
+    process once nobody else is waiting for its output"""
+
+    def __init__(self, runner: "CommandRunner", key: Tuple):
+        self._runner = runner
+        self._key = key
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        if not self.cancelled:
+            self.cancelled = True
+            self._runner._cancel(self._key, self)
+
+
+class _InFlight:
+    def __init__(self, key: Tuple):
+        self.key = key
+        self.process: Optional[subprocess.Popen] = None
+        self.waiters: List[Tuple[CommandHandle, Optional[Callable]]] = []
+        self.cancelled = False
+
+
+class CommandRunner:
+    """Runs external commands with timeouts and records what they cost
+
+    run() blocks the calling thread, but never longer than its timeout, so
+    a hung daemon can't freeze the UI indefinitely. run_async() runs the
+    command on a bounded pool and calls back on the GTK main thread;
+    identical commands already in flight share one process. Every spawn is
+    counted per command ("pactl get-sink-volume", "nmcli device", ...).
+
+    Commands are always argv lists, there is no shell.
+    """
+
+    def __init__(self, logging: Logger, max_workers: int = MAX_WORKERS):
+        self.logging = logging
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="command")
+        self.stats: Dict[str, CommandStats] = {}
+        self._in_flight: Dict[Tuple, _InFlight] = {}
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        args: Sequence[str],
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        check: bool = False,
+        input: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> subprocess.CompletedProcess:
+        """Run a command and wait for it, output is captured as text
+
+        A command that times out is killed and reported with returncode
+        -9 and the timeout in stderr, so callers that only look at the
+        returncode treat it as a failure.
+
+        Raises:
+            FileNotFoundError: if the executable doesn't exist
+            subprocess.CalledProcessError: if check is set and the command failed
+        """
+        result = self._execute(list(args), timeout, input, env)
+        if check and result.returncode != 0:
+            raise subprocess.CalledProcessError(result.returncode, result.args, result.stdout, result.stderr)
+        return result
+
+    def getoutput(self, args: Sequence[str], timeout: Optional[float] = DEFAULT_TIMEOUT) -> str:
+        """Like subprocess.getoutput: stdout and stderr, trailing newline removed
+
+        Returns an empty string if the executable doesn't exist.
+        """
+        try:
+            result = self._execute(list(args), timeout, None, None, merge_stderr=True)
+        except FileNotFoundError:
+            return ""
+        output = result.stdout or ""
+        return output[:-1] if output.endswith("\n") else output
+
+    def run_async(
+        self,
+        args: Sequence[str],
+        callback: Optional[Callable[[subprocess.CompletedProcess], None]] = None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        input: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        dedupe: bool = True,
+    ) -> CommandHandle:
+        """Run a command on the pool and pass the result to callback on the main thread
+
+        A missing executable is reported as returncode 127. With dedupe, a
+        call made while an identical command is running waits for that one
+        instead of spawning another.
+        """
+        key: Tuple = (tuple(args), input, tuple(sorted(env.items())) if env else None)
+        if not dedupe:
+            key += (object(),)
+
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            spawn = in_flight is None
+            if spawn:
+                in_flight = self._in_flight[key] = _InFlight(key)
+            handle = CommandHandle(self, key)
+            in_flight.waiters.append((handle, callback))
+
+        if spawn:
+            self.executor.submit(self._run_in_flight, in_flight, list(args), timeout, input, env)
+        return handle
+
+    def pending(self) -> int:
+        """Number of distinct async commands queued or running"""
+        with self._lock:
+            return len(self._in_flight)
+
+    def _run_in_flight(self, in_flight: _InFlight, args, timeout, input, env) -> None:
+        try:
+            result = self._execute(args, timeout, input, env, in_flight=in_flight)
+        except FileNotFoundError as e:
+            result = subprocess.CompletedProcess(args, 127, "", str(e))
+        except Exception as e:
+            result = subprocess.CompletedProcess(args, -1, "", str(e))
+
+        with self._lock:
+            self._in_flight.pop(in_flight.key, None)
+            waiters = [(h, cb) for h, cb in in_flight.waiters if not h.cancelled and cb is not None]
+
+        if waiters:
+            from gi.repository import GLib  # type: ignore
+
+            def deliver():
+                for handle, callback in waiters:
+                    if handle.cancelled:
+                        continue
+                    try:
+                        callback(result)
+                    except Exception as e:
+                        self.logging.log(LogLevel.Error, f"Callback for {self._name(args)} failed: {e}")
+                return False
+
+            GLib.idle_add(deliver)
+
+    def _cancel(self, key: Tuple, handle: CommandHandle) -> None:
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                return
+            if all(h.cancelled for h, _ in in_flight.waiters):
+                in_flight.cancelled = True
+                process = in_flight.process
+            else:
+                process = None
+        if process is not None and process.poll() is None:
+            process.kill()
+
+    def _execute(self, args: List[str], timeout, input, env, merge_stderr: bool = False,
+                 in_flight: Optional[_InFlight] = None) -> subprocess.CompletedProcess:
+        name = self._name(args)
+        if in_flight is not None and in_flight.cancelled:
+            return subprocess.CompletedProcess(args, -9, "", "cancelled")
+
+        start = time.monotonic()
+        timed_out = False
+        try:
+            process = subprocess.Popen(
+                args,
+                stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
+                text=True,
+                env=env,
+            )
+        except FileNotFoundError:
+            self._record(name, time.monotonic() - start, failed=True)
+            raise
+
+        if in_flight is not None:
+            with self._lock:
+                in_flight.process = process
+                if in_flight.cancelled:
+                    process.kill()
+        try:
+            stdout, stderr = process.communicate(input, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            process.kill()
+            stdout, stderr = process.communicate()
+            stderr = (stderr or "") + f"\nTimed out after {timeout}s"
+            self.logging.log(LogLevel.Warn, f"Command timed out after {timeout}s: {name}")
+
+        returncode = -9 if timed_out else process.returncode
+        self._record(name, time.monotonic() - start, failed=returncode != 0, timed_out=timed_out)
+        return subprocess.CompletedProcess(args, returncode, stdout, stderr)
+
+    def _name(self, args: Sequence[str]) -> str:
+        """Executable plus subcommand, without arguments that identify devices or networks"""
+        parts = [args[0]] if args else ["?"]
+        for arg in args[1:]:
+            if arg.startswith("-"):
+                continue
+            parts.append(arg)
+            break
+        return " ".join(parts)
+
+    def _record(self, name: str, duration: float, failed: bool, timed_out: bool = False) -> None:
+        with self._lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = CommandStats(name)
+            stats.count += 1
+            stats.total += duration
+            stats.max = max(stats.max, duration)
+            if failed:
+                stats.failures += 1
+            if timed_out:
+                stats.timeouts += 1
+
+    def get_stats(self) -> List[Dict]:
+        """Per-command counters, most expensive first"""
+        with self._lock:
+            stats = sorted(self.stats.values(), key=lambda s: s.total, reverse=True)
+            return [s.as_dict() for s in stats]
+
+    def print_stats(self, stream: TextIO) -> None:
+        stats = self.get_stats()
+        if not stats:
+            return
+        print("\nExternal commands (most expensive first)", file=stream)
+        print(f"{'count':>6} {'total ms':>9} {'avg ms':>8} {'max ms':>8} {'fail':>5}  command", file=stream)
+        for s in stats:
+            print(
+                f"{s['count']:6d} {s['total_ms']:9.1f} {s['avg_ms']:8.1f} {s['max_ms']:8.1f} "
+                f"{s['failures']:5d}  {s['command']}",
+                file=stream,
+            )
+        stream.flush()
+
+    def log_stats(self) -> None:
+        for s in self.get_stats():
+            self.logging.log(
+                LogLevel.Debug,
+                f"Command {s['command']}: {s['count']} runs, {s['total_ms']}ms total, "
+                f"{s['avg_ms']}ms avg, {s['max_ms']}ms max, {s['failures']} failed, {s['timeouts']} timed out",
+            )
+
+    def shutdown(self) -> None:
+        """Drop queued commands, the ones already running finish in the background"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+_command_runner = None
+
+
+def get_command_runner(logging: Logger) -> CommandRunner:
+    """Get or create the global CommandRunner instance"""
+    global _command_runner
+    if _command_runner is None:
+        _command_runner = CommandRunner(logging)
+    return _command_runner
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+
+import json
+import sys
+from typing import Any, Callable, Dict, List
+
+from utils.logger import Logger
+
+USAGE = """usage: better-control ctl [--json] [--local] <command>
+
+commands:
+  volume [get | set <0-100> | up [step] | down [step] | mute | unmute | toggle-mute]
+  mic [get | set <0-100> | mute | unmute | toggle-mute]
+  brightness [get | set <0-100> | up [step] | down [step]]
+  wifi [status | on | off | toggle]
+  bt [status | on | off | connect <mac> | disconnect <mac>]
+  power-profile [get | set <power-saver | balanced | performance>]
+
+  --json   print the result as JSON
+  --local  don't hand the command to a running daemon"""
+
+# Percent a bare up/down moves volume and brightness
+DEFAULT_STEP = 5
+
+
+class CtlError(Exception):
+    """A command that failed, or was used wrong when usage is set"""
+
+    def __init__(self, message: str, usage: bool = False):
+        super().__init__(message)
+        self.usage = usage
+
+
+def _run(args: List[str], logging: Logger) -> str:
+    from utils.commands import get_command_runner
+
+    try:
+        result = get_command_runner(logging).run(args)
+    except FileNotFoundError:
+        raise CtlError(f"{args[0]} is not installed")
+    if result.returncode != 0:
+        raise CtlError((result.stderr or result.stdout or f"{args[0]} failed").strip())
+    return result.stdout
+
+
+def _percent(args: List[str], index: int, default=None) -> int:
+    if len(args) <= index:
+        if default is None:
+            raise CtlError("missing a percentage", usage=True)
+        return default
+    try:
+        value = int(args[index].rstrip("%"))
+    except ValueError:
+        raise CtlError(f"not a percentage: {args[index]}", usage=True)
+    if not 0 <= value <= 100:
+        raise CtlError(f"out of range: {value}", usage=True)
+    return value
+
+
+def _audio(args: List[str], logging: Logger, device: str) -> Dict[str, Any]:
+    from tools import volume
+
+    if device == "sink":
+        target, key = "@DEFAULT_SINK@", "volume"
+        get_volume, get_mute = volume.get_volume, volume.get_mute_state
+    else:
+        target, key = "@DEFAULT_SOURCE@", "mic_volume"
+        get_volume, get_mute = volume.get_mic_volume, volume.get_mic_mute_state
+
+    action = args[0] if args else "get"
+    if action == "set":
+        _run(["pactl", f"set-{device}-volume", target, f"{_percent(args, 1)}%"], logging)
+    elif action in ("up", "down") and device == "sink":
+        step = _percent(args, 1, DEFAULT_STEP)
+        current = get_volume(logging)
+        new = min(100, current + step) if action == "up" else max(0, current - step)
+        _run(["pactl", f"set-{device}-volume", target, f"{new}%"], logging)
+    elif action in ("mute", "unmute", "toggle-mute"):
+        state = {"mute": "1", "unmute": "0", "toggle-mute": "toggle"}[action]
+        _run(["pactl", f"set-{device}-mute", target, state], logging)
+    elif action != "get":
+        raise CtlError(f"unknown action: {action}", usage=True)
+
+    return {key: get_volume(logging), "muted" if device == "sink" else "mic_muted": get_mute(logging)}
+
+
+def _get_brightness(logging: Logger) -> int:
+    # Not tools.display.get_brightness, which turns a failure into 0%
+    try:
+        current = int(_run(["brightnessctl", "g"], logging).strip())
+        maximum = int(_run(["brightnessctl", "m"], logging).strip())
+    except ValueError:
+        raise CtlError("brightnessctl gave no brightness")
+    return round(current * 100 / maximum) if maximum else 0
+
+
+def _brightness(args: List[str], logging: Logger) -> Dict[str, Any]:
+    action = args[0] if args else "get"
+    if action == "set":
+        _run(["brightnessctl", "s", f"{_percent(args, 1)}%"], logging)
+    elif action in ("up", "down"):
+        step = _percent(args, 1, DEFAULT_STEP)
+        _run(["brightnessctl", "s", f"{step}%+" if action == "up" else f"{step}%-"], logging)
+    elif action != "get":
+        raise CtlError(f"unknown action: {action}", usage=True)
+    return {"brightness": _get_brightness(logging)}
+
+
+def _wifi(args: List[str], logging: Logger) -> Dict[str, Any]:
+    action = args[0] if args else "status"
+    if action == "toggle":
+        enabled = _run(["nmcli", "radio", "wifi"], logging).strip().lower() == "enabled"
+        action = "off" if enabled else "on"
+    if action in ("on", "off"):
+        _run(["nmcli", "radio", "wifi", action], logging)
+    elif action != "status":
+        raise CtlError(f"unknown action: {action}", usage=True)
+    return {"wifi": _run(["nmcli", "radio", "wifi"], logging).strip().lower() == "enabled"}
+
+
+def _bluetooth(args: List[str], logging: Logger) -> Dict[str, Any]:
+    # bluetoothctl rather than tools.bluetooth, which needs GLib and D-Bus
+    action = args[0] if args else "status"
+    if action in ("on", "off"):
+        _run(["bluetoothctl", "power", action], logging)
+    elif action in ("connect", "disconnect"):
+        if len(args) < 2:
+            raise CtlError(f"{action} needs a device address", usage=True)
+        output = _run(["bluetoothctl", action, args[1]], logging)
+        if "successful" not in output.lower():
+            raise CtlError(output.strip().splitlines()[-1] if output.strip() else f"{action} failed")
+        return {"device": args[1], "connected": action == "connect"}
+    elif action != "status":
+        raise CtlError(f"unknown action: {action}", usage=True)
+
+    powered = "Powered: yes" in _run(["bluetoothctl", "show"], logging)
+    return {"bluetooth": powered}
+
+
+def _power_profile(args: List[str], logging: Logger) -> Dict[str, Any]:
+    action = args[0] if args else "get"
+    if action == "set":
+        if len(args) < 2:
+            raise CtlError("set needs a profile", usage=True)
+        _run(["powerprofilesctl", "set", args[1]], logging)
+    elif action != "get":
+        raise CtlError(f"unknown action: {action}", usage=True)
+    return {"power_profile": _run(["powerprofilesctl", "get"], logging).strip()}
+
+
+COMMANDS: Dict[str, Callable[[List[str], Logger], Dict[str, Any]]] = {
+    "volume": lambda args, logging: _audio(args, logging, "sink"),
+    "mic": lambda args, logging: _audio(args, logging, "source"),
+    "brightness": _brightness,
+    "wifi": _wifi,
+    "bt": _bluetooth,
+    "bluetooth": _bluetooth,
+    "power-profile": _power_profile,
+}
+
+
+def _show_osd(args: List[str], result: Dict[str, Any]) -> None:
+    """Let a running OSD show what a volume, mic or brightness change did"""
+    if len(args) < 2 or args[1] == "get":
+        return
+    if args[0] == "volume":
+        level = ("volume", result.get("volume"), result.get("muted", False))
+    elif args[0] == "mic":
+        level = ("mic", result.get("mic_volume"), result.get("mic_muted", False))
+    elif args[0] == "brightness":
+        level = ("brightness", result.get("brightness"), False)
+    else:
+        return
+    if not isinstance(level[1], int):
+        return
+
+    from utils.daemon import show_osd
+
+    show_osd(*level)
+
+
+def run_command(args: List[str], logging: Logger) -> Dict[str, Any]:
+    """Run a ctl command and return its result
+
+    Returns:
+        Dict[str, Any]: {"ok": True, ...state after the command} or
+            {"ok": False, "error": message}, with "usage" set for misuse
+    """
+    if not args or args[0] not in COMMANDS:
+        return {"ok": False, "error": f"unknown command: {args[0]}" if args else "no command", "usage": True}
+    try:
+        result = COMMANDS[args[0]](args[1:], logging)
+    except CtlError as e:
+        result = {"ok": False, "error": str(e)}
+        if e.usage:
+            result["usage"] = True
+        return result
+    return {"ok": True, **result}
+
+
+def main(argv: List[str]) -> int:
+    """Entry point for `better-control ctl`, returns the exit status"""
+    args = [arg for arg in argv if arg not in ("--json", "-j", "--local")]
+    as_json = "--json" in argv or "-j" in argv
+
+    if not args or args[0] in ("-h", "--help", "help"):
+        print(USAGE)
+        return 0 if args else 2
+
+    result = None
+    if "--local" not in argv:
+        from utils.daemon import forward_ctl
+
+        result = forward_ctl(args)
+    if result is None:
+        from utils.arg_parser import ArgParse
+
+        result = run_command(args, Logger(ArgParse(["better-control"])))
+    if result.get("ok"):
+        # Key bindings go through here, the OSD shows the change without polling for it
+        _show_osd(args, result)
+
+    if as_json:
+        print(json.dumps(result))
+    elif result.get("ok"):
+        values = {key: value for key, value in result.items() if key != "ok"}
+        for key, value in values.items():
+            if isinstance(value, bool):
+                value = ("on" if value else "off") if key in ("wifi", "bluetooth") else ("yes" if value else "no")
+            print(value if len(values) == 1 else f"{key}: {value}")
+    else:
+        print(f"better-control ctl: {result.get('error')}", file=sys.stderr)
+        if result.get("usage"):
+            print(USAGE, file=sys.stderr)
+
+    if result.get("ok"):
+        return 0
+    return 2 if result.get("usage") else 1
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.arg_parser import ArgParse
+
+BUS_NAME = "io.github.quantumvoid0.BetterControl"
+OBJECT_PATH = "/io/github/quantumvoid0/BetterControl"
+INTERFACE = "io.github.quantumvoid0.BetterControl"
+
+OSD_BUS_NAME = "io.github.quantumvoid0.BetterControl.OSD"
+OSD_OBJECT_PATH = "/io/github/quantumvoid0/BetterControl/OSD"
+OSD_INTERFACE = "io.github.quantumvoid0.BetterControl.OSD"
+
+
+def forward_to_daemon(arg_parser: ArgParse) -> bool:
+    """Hand this invocation to a running daemon
+
+    Only imports dbus, so it can run before GTK is loaded and a launch
+    that finds a daemon costs a bus round trip instead of a full startup.
+
+    Returns:
+        bool: True if a daemon took over and this process should exit
+    """
+    try:
+        import dbus
+
+        # Private, so the shared connection made later by utils.bus is
+        # created with the main loop attached
+        bus = dbus.SessionBus(private=True)
+        try:
+            if not bus.name_has_owner(BUS_NAME):
+                return False
+            proxy = bus.get_object(BUS_NAME, OBJECT_PATH, introspect=False)
+            dbus.Interface(proxy, INTERFACE).Show(arg_parser.get_requested_tab() or "", timeout=2)
+            return True
+        finally:
+            bus.close()
+    except Exception:
+        # Broken or unresponsive daemon, start normally instead
+        return False
+
+
+def forward_ctl(args: List[str]) -> Optional[Dict[str, Any]]:
+    """Run a ctl command in a running daemon
+
+    Returns:
+        Optional[Dict[str, Any]]: the command's result, or None if there is
+            no daemon and the command should run in this process
+    """
+    try:
+        import dbus
+    except ImportError:
+        return None
+
+    try:
+        bus = dbus.SessionBus(private=True)
+    except Exception:
+        return None
+    try:
+        if not bus.name_has_owner(BUS_NAME):
+            return None
+        proxy = bus.get_object(BUS_NAME, OBJECT_PATH, introspect=False)
+        reply = dbus.Interface(proxy, INTERFACE).Ctl(args, signature="as", timeout=30)
+        return json.loads(str(reply))
+    except Exception:
+        # Older or unresponsive daemon, run it here instead
+        return None
+    finally:
+        bus.close()
+
+
+def show_osd(kind: str, value: int, muted: bool = False) -> bool:
+    """Ask a running OSD to show a level that was just changed
+
+    Fire and forget, so ctl returns as soon as the message is queued.
+
+    Returns:
+        bool: True if an OSD is running
+    """
+    try:
+        import dbus
+        import dbus.lowlevel
+    except ImportError:
+        return False
+
+    try:
+        bus = dbus.SessionBus(private=True)
+    except Exception:
+        return False
+    try:
+        if not bus.name_has_owner(OSD_BUS_NAME):
+            return False
+        message = dbus.lowlevel.MethodCallMessage(OSD_BUS_NAME, OSD_OBJECT_PATH, OSD_INTERFACE, "Show")
+        message.append(kind, dbus.Int32(value), dbus.Boolean(muted), signature="sib")
+        message.set_no_reply(True)
+        bus.send_message(message)
+        bus.flush()
+        return True
+    except Exception:
+        return False
+    finally:
+        bus.close()
+
+
+def start_daemon_service(logging, show: Callable[[str], None], hide: Callable[[], None],
+                         quit: Callable[[], None]) -> Optional[object]:
+    """Claim the bus name and serve Show/Hide/Quit and ctl requests
+
+    Returns:
+        Optional[object]: the service object, which must be kept alive, or
+            None if the name is taken or the session bus is unavailable
+    """
+    from utils.logger import LogLevel
+
+    import threading
+
+    try:
+        import dbus
+        import dbus.service
+        from utils.bus import get_session_bus
+    except ImportError as e:
+        logging.log(LogLevel.Error, f"Daemon mode needs dbus-python: {e}")
+        return None
+
+    class DaemonService(dbus.service.Object):
+        def __init__(self, bus_name):
+            super().__init__(bus_name, OBJECT_PATH)
+            # Holds on to the name for as long as the service lives
+            self.bus_name = bus_name
+
+        @dbus.service.method(INTERFACE, in_signature="s", out_signature="")
+        def Show(self, tab_name):
+            logging.log(LogLevel.Info, f"Daemon asked to show tab: {tab_name or 'current'}")
+            show(str(tab_name))
+
+        @dbus.service.method(INTERFACE, in_signature="", out_signature="")
+        def Hide(self):
+            hide()
+
+        @dbus.service.method(INTERFACE, in_signature="", out_signature="")
+        def Quit(self):
+            quit()
+
+        @dbus.service.method(INTERFACE, in_signature="as", out_signature="s",
+                             async_callbacks=("reply", "error"))
+        def Ctl(self, args, reply, error):
+            from gi.repository import GLib  # type: ignore
+            from utils.ctl import run_command
+
+            args = [str(arg) for arg in args]
+            logging.log(LogLevel.Info, f"Daemon running ctl command: {' '.join(args[:2])}")
+
+            # Commands wait on external tools, keep the main loop free
+            def run():
+                try:
+                    result = json.dumps(run_command(args, logging))
+                except Exception as e:
+                    failure = e
+                    GLib.idle_add(lambda: error(failure) and False)
+                    return
+                GLib.idle_add(lambda: reply(result) and False)
+
+            threading.Thread(target=run, daemon=True).start()
+
+    try:
+        bus_name = dbus.service.BusName(BUS_NAME, get_session_bus(), do_not_queue=True)
+    except dbus.exceptions.NameExistsException:
+        logging.log(LogLevel.Warn, "Another Better Control daemon is already running")
+        return None
+    except Exception as e:
+        logging.log(LogLevel.Error, f"Failed to register daemon on the session bus: {e}")
+        return None
+
+    logging.log(LogLevel.Info, f"Daemon listening as {BUS_NAME}")
+    return DaemonService(bus_name)
+
+
+def start_osd_service(logging, show: Callable[[str, int, bool], None]) -> Optional[object]:
+    """Claim the OSD bus name and serve Show(kind, value, muted)
+
+    Returns:
+        Optional[object]: the service object, which must be kept alive, or
+            None if an OSD is already running or the session bus is unavailable
+    """
+    from utils.logger import LogLevel
+
+    try:
+        import dbus
+        import dbus.service
+        from utils.bus import get_session_bus
+    except ImportError as e:
+        logging.log(LogLevel.Error, f"OSD mode needs dbus-python: {e}")
+        return None
+
+    class OsdBusService(dbus.service.Object):
+        def __init__(self, bus_name):
+            super().__init__(bus_name, OSD_OBJECT_PATH)
+            self.bus_name = bus_name
+
+        @dbus.service.method(OSD_INTERFACE, in_signature="sib", out_signature="")
+        def Show(self, kind, value, muted):
+            show(str(kind), int(value), bool(muted))
+
+    try:
+        bus_name = dbus.service.BusName(OSD_BUS_NAME, get_session_bus(), do_not_queue=True)
+    except dbus.exceptions.NameExistsException:
+        logging.log(LogLevel.Warn, "Another Better Control OSD is already running")
+        return None
+    except Exception as e:
+        logging.log(LogLevel.Error, f"Failed to register OSD on the session bus: {e}")
+        return None
+
+    logging.log(LogLevel.Info, f"OSD listening as {OSD_BUS_NAME}")
+    return OsdBusService(bus_name)
@@ -1,5 +1,5 @@
-import shutil
 from typing import Optional
+from utils.capabilities import get_capability_registry
 from utils.logger import LogLevel, Logger
 
 DEPENDENCIES = [
@@ -54,7 +54,7 @@ def check_dependency(
     Returns:
         Optional[str]: Error message if dependency is missing, None otherwise
     """
-    if not shutil.which(command):
+    if not get_capability_registry(logging).which(command):
         error_msg = f"{name} is required but not installed!\n\nInstall it using:\n{install_instructions}"
         logging.log(LogLevel.Error, error_msg)
         return error_msg
@@ -64,6 +64,9 @@ def check_dependency(
 def check_all_dependencies(logging: Logger) -> bool:
     """Checks if all dependencies exist or not.
 
+    Paths found on an earlier launch are confirmed with a stat instead of
+    a PATH search.
+
     Returns:
         bool: returns false if there are dependencies missing, or return true
     """
@@ -71,4 +74,5 @@ def check_all_dependencies(logging: Logger) -> bool:
         check_dependency(cmd, name, inst, logging) for cmd, name, inst in DEPENDENCIES
     ]
     missing = [msg for msg in missing if msg]
+    get_capability_registry(logging).save()
     return not missing
@@ -1,13 +1,16 @@
 import datetime
 from enum import Enum
 from io import TextIOWrapper
+import atexit
 import os
+import queue
 import re
 import sys
+import threading
 import traceback
 from sys import stderr, stdout
 import time
-from typing import Dict, List, Optional, Pattern, Tuple
+from typing import Dict, List, Optional, Pattern, Set, TextIO, Tuple
 
 CRASH_LOG_DIR = os.path.join(
     os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
@@ -48,6 +51,57 @@ def get_current_time():
     return f"{now.minute:02}:{now.second:02}:{ms:03}"
 
 
+# Seconds between flushes of the log file
+LOG_FLUSH_INTERVAL = 1.0
+
+
+class LogWriter:
+    """Writes log lines to a file from a background thread
+
+    log() only queues the line, the thread writes whatever has queued up
+    and flushes at most every LOG_FLUSH_INTERVAL seconds, so logging
+    never waits for the disk. Pending lines are written at exit.
+    """
+
+    def __init__(self, file: TextIO):
+        self.file = file
+        self.queue: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self.run, name="log-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def write(self, line: str) -> None:
+        self.queue.put(line)
+
+    def run(self) -> None:
+        last_flush = time.monotonic()
+        dirty = False
+        while True:
+            try:
+                line = self.queue.get(timeout=LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                line = ""
+            if line is None:
+                break
+            if line:
+                self.file.write(line + "\n")
+                dirty = True
+            if dirty and time.monotonic() - last_flush >= LOG_FLUSH_INTERVAL:
+                self.file.flush()
+                last_flush = time.monotonic()
+                dirty = False
+        self.file.flush()
+
+    def close(self) -> None:
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join(timeout=2)
+        try:
+            self.file.close()
+        except Exception:
+            pass
+
+
 class Logger:
     def __init__(self, arg_parser: ArgParse) -> None:
         log_info: Pair[bool, Optional[str]] = Pair(False, None)
@@ -119,8 +173,37 @@ class Logger:
             (r'(auth[-_]?token=)[^\s]+', r'\1[REDACTED-TOKEN]'),
         ]
 
+        # One pass over the message instead of one re.sub per pattern. Each
+        # pattern is an alternative in its own named group, the match is
+        # then rewritten with that pattern's own replacement.
+        self.__redaction_rules: List[Tuple[Pattern, str]] = [
+            (re.compile(pattern, re.IGNORECASE), replacement)
+            for pattern, replacement in self.__redaction_patterns
+        ]
+        self.__redaction_regex: Pattern = re.compile(
+            "|".join(f"(?P<r{i}>{pattern})" for i, (pattern, _) in enumerate(self.__redaction_patterns)),
+            re.IGNORECASE,
+        )
+
+        # Levels that are printed, decided once so a disabled level costs
+        # a set lookup. Errors are only shown together with a log file.
+        self.__enabled: Set[LogLevel] = set()
+        if self.__log_file_name != "":
+            self.__enabled = {LogLevel.Error}
+            if self.__should_log:
+                self.__enabled = set(LogLevel)
+        elif self.__should_log:
+            if self.__log_level < 3:
+                self.__enabled.add(LogLevel.Warn)
+            if self.__log_level < 2:
+                self.__enabled.add(LogLevel.Info)
+            if self.__log_level < 1:
+                self.__enabled.add(LogLevel.Debug)
+
         # Initialize log file attribute
         self.__log_file = None
+        self.__writer: Optional[LogWriter] = None
+        self.__last_log_msg = ""
 
         if self.__log_file_name != "":
             if self.__log_file_name.isdigit():
@@ -135,11 +218,14 @@ class Logger:
                     self.__log_file = open(self.__log_file_name, "x")
                 else:
                     self.__log_file = open(self.__log_file_name, "a")
+                self.__writer = LogWriter(self.__log_file)
             else:
                 self.log(LogLevel.Error, "Invalid option for argument log")
 
     def __del__(self):
-        if hasattr(self, '_Logger__log_file') and self.__log_file is not None:
+        if getattr(self, '_Logger__writer', None) is not None:
+            self.__writer.close()
+        elif getattr(self, '_Logger__log_file', None) is not None:
             self.__log_file.close()
     
     def __redact_sensitive_info(self, message: str) -> str:
@@ -155,21 +241,33 @@ class Logger:
         if not self.__should_redact:
             return message
             
-        redacted_message = message
-        
-        # Apply each redaction pattern
-        for pattern, replacement in self.__redaction_patterns:
-            redacted_message = re.sub(pattern, replacement, redacted_message, flags=re.IGNORECASE)
-            
-        return redacted_message
+        def replace(match):
+            pattern, replacement = self.__redaction_rules[int(match.lastgroup[1:])]
+            return pattern.sub(replacement, match.group(0), count=1)
+
+        return self.__redaction_regex.sub(replace, message)
+
+    def is_enabled(self, log_level: LogLevel) -> bool:
+        """Whether messages at log_level are printed at all
 
-    def log(self, log_level: LogLevel, message: str):
+        For guarding debug output that is expensive to build.
+        """
+        return log_level in self.__enabled
+
+    def log(self, log_level: LogLevel, message: str, *args):
         """Logs messages to a stream based on user arg
 
         Args:
             log_level (LogLevel): the log level, which consists of Debug, Info, Warn, Error
-            message (str): the log message
+            message (str): the log message, a %-format string when args are given
+            *args: formatted into message only if the level is enabled
         """
+        if log_level not in self.__enabled:
+            return
+
+        if args:
+            message = message % args
+
         # Redact sensitive information
         redacted_message = self.__redact_sensitive_info(message)
         
@@ -183,24 +281,18 @@ class Logger:
 
         self.__last_log_msg = fmt
 
-        if log_level != LogLevel.Error and self.__should_log == False:
-            return
-
         if self.__log_file_name != "":
             self.__log_to_file(fmt)
             print(fmt, file=stderr)
-        elif log_level == LogLevel.Warn and self.__log_level < 3:
-            print(fmt, file=stdout)
-        elif log_level == LogLevel.Info and self.__log_level < 2:
-            print(fmt, file=stdout)
-        elif log_level == LogLevel.Debug and self.__log_level < 1:
+        else:
             print(fmt, file=stdout)
 
     def get_last_log_msg(self) -> str:
+        """The last message that was printed"""
         return self.__last_log_msg
 
     def __log_to_file(self, message: str):
-        if not hasattr(self, '_Logger__log_file') or self.__log_file is None:
+        if self.__writer is None:
             return
 
-        print(message, file=self.__log_file)
+        self.__writer.write(message)
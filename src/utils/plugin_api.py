@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+
+import threading
+from abc import ABC, abstractmethod
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from utils.commands import get_command_runner
+from utils.logger import LogLevel, Logger
+
+# Bumped only when something plugins rely on is removed or changes meaning
+API_VERSION = 1
+
+NM_SERVICE = "org.freedesktop.NetworkManager"
+NM_PATH = "/org/freedesktop/NetworkManager"
+NM_ACTIVE_CONNECTION_INTERFACE = "org.freedesktop.NetworkManager.Connection.Active"
+UPOWER_SERVICE = "org.freedesktop.UPower"
+UPOWER_DISPLAY_DEVICE = "/org/freedesktop/UPower/devices/DisplayDevice"
+UPOWER_DEVICE_INTERFACE = "org.freedesktop.UPower.Device"
+
+
+def _freeze(value):
+    """Read-only copy of a state value, plugins share it with each other"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class ObservableModel(ABC):
+    """Read-only state of one subsystem, shared by every plugin
+
+    The state is a mapping of plain values (numbers, strings, tuples and
+    read-only mappings). connect(callback) calls callback(model, changed)
+    on the main loop with the keys that changed. The model is only kept
+    up to date while something is connected, and every plugin shares that
+    one refresh: models backed by D-Bus follow the same cached objects as
+    the tabs and refresh on their signals, the others poll from the
+    refresh scheduler while the window is active.
+
+    Command methods never block, they take an optional callback(ok) called
+    on the main loop, and the model refreshes once a command has finished.
+    """
+
+    # Seconds between polls, None for models driven by D-Bus signals
+    interval: Optional[int] = None
+
+    def __init__(self, logging: Logger, name: str):
+        self.logging = logging
+        self.name = name
+        self._state: Dict[str, Any] = {}
+        self._listeners: List[Callable[["ObservableModel", List[str]], None]] = []
+        self._job_id: Optional[int] = None
+        self._refreshing = False
+        self._refresh_again = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> Mapping[str, Any]:
+        return MappingProxyType(dict(self._state))
+
+    def get(self, key: str, default=None):
+        return self._state.get(key, default)
+
+    def __getitem__(self, key: str):
+        return self._state[key]
+
+    def connect(self, callback: Callable[["ObservableModel", List[str]], None], owner=None) -> None:
+        """Follow changes, the state already known is passed to callback first
+
+        Args:
+            callback: called as callback(model, changed_keys)
+            owner: widget whose destruction disconnects the callback
+        """
+        if callback in self._listeners:
+            return
+        if owner is not None:
+            owner.connect("destroy", lambda *args: self.disconnect(callback))
+        self._listeners.append(callback)
+        if self._state:
+            from gi.repository import GLib  # type: ignore
+
+            GLib.idle_add(lambda: self._deliver(callback, list(self._state)))
+        if len(self._listeners) == 1:
+            self.start()
+        self.refresh()
+
+    def disconnect(self, callback: Callable[["ObservableModel", List[str]], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+            if not self._listeners:
+                self.stop()
+
+    def refresh(self) -> None:
+        """Fetch the state again in the background, concurrent requests share one fetch"""
+        with self._lock:
+            if self._refreshing:
+                self._refresh_again = True
+                return
+            self._refreshing = True
+        threading.Thread(target=self._fetch_thread, daemon=True).start()
+
+    @abstractmethod
+    def fetch(self) -> Dict[str, Any]:
+        """Read the current state, called off the main thread"""
+
+    def start(self) -> None:
+        """Begin following changes, called when the first listener connects"""
+        if self.interval is not None:
+            from utils.scheduler import get_refresh_scheduler
+
+            self._job_id = get_refresh_scheduler(self.logging).add(
+                None, self.interval, self._poll, name=f"{self.name} model"
+            )
+
+    def stop(self) -> None:
+        """Stop following changes, called when the last listener disconnects"""
+        if self._job_id is not None:
+            from utils.scheduler import get_refresh_scheduler
+
+            get_refresh_scheduler(self.logging).remove(self._job_id)
+            self._job_id = None
+
+    def _poll(self) -> bool:
+        self.refresh()
+        return True
+
+    def _fetch_thread(self) -> None:
+        from gi.repository import GLib  # type: ignore
+
+        while True:
+            try:
+                values = self.fetch()
+            except Exception as e:
+                self.logging.log(LogLevel.Warn, f"Refreshing {self.name} model failed: {e}")
+                values = None
+            if values is not None:
+                GLib.idle_add(self._update, values)
+            with self._lock:
+                if not self._refresh_again:
+                    self._refreshing = False
+                    return
+                self._refresh_again = False
+
+    def _update(self, values: Dict[str, Any]) -> bool:
+        changed = []
+        for key, value in values.items():
+            value = _freeze(value)
+            if key not in self._state or self._state[key] != value:
+                self._state[key] = value
+                changed.append(key)
+        if changed:
+            for callback in list(self._listeners):
+                self._deliver(callback, changed)
+        return False
+
+    def _deliver(self, callback, changed: List[str]) -> bool:
+        if callback in self._listeners:
+            try:
+                callback(self, changed)
+            except Exception as e:
+                self.logging.log(LogLevel.Error, f"Error in {self.name} model callback: {e}")
+        return False
+
+    def _run(self, args: List[str], callback: Optional[Callable[[bool], None]] = None, timeout: float = 5) -> None:
+        def done(result):
+            if result.returncode != 0:
+                self.logging.log(LogLevel.Warn, f"{' '.join(args[:2])} failed: {result.stderr.strip()}")
+            self.refresh()
+            if callback is not None:
+                callback(result.returncode == 0)
+
+        get_command_runner(self.logging).run_async(args, done, timeout=timeout, dedupe=False)
+
+    def _in_background(self, func: Callable[[], Any], callback: Optional[Callable[[bool], None]] = None) -> None:
+        from gi.repository import GLib  # type: ignore
+
+        def run():
+            try:
+                ok = func() is not False
+            except Exception as e:
+                self.logging.log(LogLevel.Warn, f"{self.name} command failed: {e}")
+                ok = False
+            self.refresh()
+            if callback is not None:
+                GLib.idle_add(lambda: callback(ok) and False)
+
+        threading.Thread(target=run, daemon=True).start()
+
+
+class AudioModel(ObservableModel):
+    """Default sink and source: volume, muted, mic_volume, mic_muted"""
+
+    interval = 1
+
+    def fetch(self) -> Dict[str, Any]:
+        from tools.volume import get_mic_mute_state, get_mic_volume, get_mute_state, get_volume
+
+        return {
+            "volume": get_volume(self.logging),
+            "muted": get_mute_state(self.logging),
+            "mic_volume": get_mic_volume(self.logging),
+            "mic_muted": get_mic_mute_state(self.logging),
+        }
+
+    def set_volume(self, value: int, callback: Optional[Callable[[bool], None]] = None) -> None:
+        self._run(["pactl", "set-sink-volume", "@DEFAULT_SINK@", f"{int(value)}%"], callback)
+
+    def toggle_mute(self, callback: Optional[Callable[[bool], None]] = None) -> None:
+        self._run(["pactl", "set-sink-mute", "@DEFAULT_SINK@", "toggle"], callback)
+
+    def set_mic_volume(self, value: int, callback: Optional[Callable[[bool], None]] = None) -> None:
+        self._run(["pactl", "set-source-volume", "@DEFAULT_SOURCE@", f"{int(value)}%"], callback)
+
+    def toggle_mic_mute(self, callback: Optional[Callable[[bool], None]] = None) -> None:
+        self._run(["pactl", "set-source-mute", "@DEFAULT_SOURCE@", "toggle"], callback)
+
+
+class NetworkModel(ObservableModel):
+    """NetworkManager: wifi_enabled, state, connectivity, connection (name of the primary one)"""
+
+    def _properties(self):
+        from utils.bus import get_properties
+
+        return get_properties(self.logging, NM_SERVICE, NM_PATH, NM_SERVICE)
+
+    def fetch(self) -> Dict[str, Any]:
+        from utils.bus import get_properties
+
+        props = self._properties().get_all()
+        connection = ""
+        primary = str(props.get("PrimaryConnection", "/"))
+        if primary != "/":
+            active = get_properties(self.logging, NM_SERVICE, primary, NM_ACTIVE_CONNECTION_INTERFACE)
+            connection = str(active.get("Id", ""))
+        return {
+            "wifi_enabled": bool(props.get("WirelessEnabled", False)),
+            "state": int(props.get("State", 0)),
+            "connectivity": int(props.get("Connectivity", 0)),
+            "connection": connection,
+        }
+
+    def start(self) -> None:
+        self._properties().connect(self._on_changed)
+
+    def stop(self) -> None:
+        self._properties().disconnect(self._on_changed)
+
+    def _on_changed(self, changed, invalidated) -> None:
+        self.refresh()
+
+    def set_wifi_enabled(self, enabled: bool, callback: Optional[Callable[[bool], None]] = None) -> None:
+        self._run(["nmcli", "radio", "wifi", "on" if enabled else "off"], callback)
+
+    def get_networks(self, callback: Callable[[List[Dict[str, str]]], None]) -> None:
+        """Scan results, passed to callback on the main loop"""
+        from gi.repository import GLib  # type: ignore
+        from tools.wifi import get_wifi_networks
+
+        def run():
+            networks = get_wifi_networks(self.logging)
+            GLib.idle_add(lambda: callback(networks) and False)
+
+        threading.Thread(target=run, daemon=True).start()
+
+
+class BluetoothModel(ObservableModel):
+    """BlueZ: powered and devices (mac, name, paired, connected, trusted, icon, path)"""
+
+    def _manager(self):
+        from tools.bluetooth import get_bluetooth_manager
+
+        return get_bluetooth_manager(self.logging)
+
+    def fetch(self) -> Dict[str, Any]:
+        manager = self._manager()
+        devices = [
+            {
+                "mac": str(device["mac"]),
+                "name": str(device["name"]),
+                "paired": bool(device["paired"]),
+                "connected": bool(device["connected"]),
+                "trusted": bool(device["trusted"]),
+                "icon": str(device["icon"]),
+                "path": str(device["path"]),
+            }
+            for device in manager.get_devices()
+        ]
+        return {"powered": manager.get_bluetooth_status(), "devices": devices}
+
+    def start(self) -> None:
+        manager = self._manager()
+        if manager.objects is not None:
+            manager.objects.connect(self._on_changed)
+
+    def stop(self) -> None:
+        manager = self._manager()
+        if manager.objects is not None:
+            manager.objects.disconnect(self._on_changed)
+
+    def _on_changed(self, path, interface, changed) -> None:
+        self.refresh()
+
+    def set_powered(self, enabled: bool, callback: Optional[Callable[[bool], None]] = None) -> None:
+        self._in_background(lambda: self._manager().set_bluetooth_power(enabled), callback)
+
+    def connect_device(self, path: str, callback: Optional[Callable[[bool], None]] = None) -> None:
+        self._manager().connect_device_async(path, callback or (lambda ok: None))
+
+    def disconnect_device(self, path: str, callback: Optional[Callable[[bool], None]] = None) -> None:
+        self._manager().disconnect_device_async(path, callback or (lambda ok: None))
+
+
+class BatteryModel(ObservableModel):
+    """UPower display device: present, percentage, state, time_to_empty, time_to_full
+
+    state is UPower's number (1 charging, 2 discharging, 4 fully charged),
+    times are in seconds.
+    """
+
+    def _properties(self):
+        from utils.bus import get_properties
+
+        return get_properties(self.logging, UPOWER_SERVICE, UPOWER_DISPLAY_DEVICE, UPOWER_DEVICE_INTERFACE)
+
+    def fetch(self) -> Dict[str, Any]:
+        props = self._properties().get_all()
+        return {
+            "present": bool(props.get("IsPresent", False)),
+            "percentage": float(props.get("Percentage", 0.0)),
+            "state": int(props.get("State", 0)),
+            "time_to_empty": int(props.get("TimeToEmpty", 0)),
+            "time_to_full": int(props.get("TimeToFull", 0)),
+        }
+
+    def start(self) -> None:
+        self._properties().connect(self._on_changed)
+
+    def stop(self) -> None:
+        self._properties().disconnect(self._on_changed)
+
+    def _on_changed(self, changed, invalidated) -> None:
+        self.refresh()
+
+
+class DisplayModel(ObservableModel):
+    """Backlight: brightness in percent"""
+
+    interval = 5
+
+    def fetch(self) -> Dict[str, Any]:
+        from tools.display import get_brightness
+
+        return {"brightness": get_brightness(self.logging)}
+
+    def set_brightness(self, value: int, callback: Optional[Callable[[bool], None]] = None) -> None:
+        self._run(["brightnessctl", "s", f"{int(value)}%"], callback)
+
+
+class PluginServices:
+    """What the application shares with plugins
+
+    A plugin tab whose constructor has a `services` parameter is given
+    this object. The models are created on first use and shared by every
+    plugin:
+
+        services.audio, services.network, services.bluetooth,
+        services.battery, services.display
+
+    Plugins can also reach it with get_plugin_services(logging).
+    """
+
+    version = API_VERSION
+
+    MODELS = {
+        "audio": AudioModel,
+        "network": NetworkModel,
+        "bluetooth": BluetoothModel,
+        "battery": BatteryModel,
+        "display": DisplayModel,
+    }
+
+    def __init__(self, logging: Logger):
+        self.logging = logging
+        self._models: Dict[str, ObservableModel] = {}
+
+    def get_model(self, name: str) -> ObservableModel:
+        """
+        Raises:
+            KeyError: if there is no model by that name
+        """
+        model = self._models.get(name)
+        if model is None:
+            model = self._models[name] = self.MODELS[name](self.logging, name)
+        return model
+
+    @property
+    def audio(self) -> AudioModel:
+        return self.get_model("audio")
+
+    @property
+    def network(self) -> NetworkModel:
+        return self.get_model("network")
+
+    @property
+    def bluetooth(self) -> BluetoothModel:
+        return self.get_model("bluetooth")
+
+    @property
+    def battery(self) -> BatteryModel:
+        return self.get_model("battery")
+
+    @property
+    def display(self) -> DisplayModel:
+        return self.get_model("display")
+
+
+_plugin_services = None
+
+
+def get_plugin_services(logging: Logger) -> PluginServices:
+    """Get or create the global PluginServices instance"""
+    global _plugin_services
+    if _plugin_services is None:
+        _plugin_services = PluginServices(logging)
+    return _plugin_services
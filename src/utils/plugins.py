@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from utils.logger import LogLevel, Logger
+from utils.profiler import get_startup_profiler
+from utils.settings import CONFIG_PATH, get_settings_store
+
+PLUGINS_DIR = os.path.join(CONFIG_PATH, "plugins")
+# Seconds a plugin may spend importing and constructing its tab, overridden
+# by "plugin_load_budget" in settings.json or "budget" in its manifest
+DEFAULT_LOAD_BUDGET = 0.25
+# Plugin modules are imported under this prefix, away from the app's own
+PLUGIN_MODULE_PREFIX = "better_control_plugin_"
+
+
+class PluginManifest:
+    """What is known about a plugin without importing it
+
+    Read from the file name and an optional <file>.json next to it:
+
+        {"name": "Example", "class": "ExampleTab", "label": "Example",
+         "icon": "applications-science-symbolic", "budget": 0.5}
+
+    Every key is optional. The class defaults to the file name in
+    PascalCase and the tab name to the class name without "Tab".
+    """
+
+    def __init__(self, path: str, data: Optional[Dict[str, Any]] = None):
+        data = data or {}
+        stem = os.path.splitext(os.path.basename(path))[0]
+        self.path = path
+        self.module_name = f"{PLUGIN_MODULE_PREFIX}{stem}"
+        self.class_name: str = data.get("class") or "".join(part.capitalize() for part in stem.split("_"))
+        default_name = self.class_name[:-3] if self.class_name.endswith("Tab") else self.class_name
+        self.name: str = data.get("name") or default_name or stem
+        self.label: str = data.get("label") or self.name
+        self.icon: str = data.get("icon") or "application-x-addon-symbolic"
+        self.budget: Optional[float] = data.get("budget")
+
+    @classmethod
+    def read(cls, path: str, logging: Logger) -> "PluginManifest":
+        manifest_path = os.path.splitext(path)[0] + ".json"
+        data = None
+        try:
+            with open(manifest_path, "r") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("not an object")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.log(LogLevel.Warn, f"Ignoring plugin manifest {manifest_path}: {e}")
+            data = None
+        return cls(path, data)
+
+
+class PluginHost:
+    """Finds plugin tabs at startup and builds each one when first shown
+
+    discover() only lists the plugins directory and reads manifests, no
+    plugin code runs before the window is up. create() imports the plugin
+    and constructs its tab, timing both. A plugin that raises is replaced
+    by an error page for this session and disabled; one that takes longer
+    than its budget keeps its tab for this session but is disabled for the
+    next launches. Disabled plugins are recorded with the reason under
+    "disabled_plugins" in settings.json, enable() takes them off the list.
+    """
+
+    def __init__(self, logging: Logger, directory: str = PLUGINS_DIR):
+        self.logging = logging
+        self.directory = directory
+        self.settings_store = get_settings_store(logging)
+        self.manifests: Dict[str, PluginManifest] = {}
+        # name -> {"import_ms", "construct_ms", "error"}
+        self.timings: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def disabled(self) -> Dict[str, str]:
+        return self.settings_store.get("disabled_plugins", {}) or {}
+
+    def get_budget(self, manifest: PluginManifest) -> float:
+        if manifest.budget is not None:
+            return float(manifest.budget)
+        return float(self.settings_store.get("plugin_load_budget", DEFAULT_LOAD_BUDGET))
+
+    def discover(self) -> List[PluginManifest]:
+        """Enabled plugins, sorted by file name"""
+        self.manifests = {}
+        try:
+            file_names = sorted(os.listdir(self.directory))
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            self.logging.log(LogLevel.Warn, f"Can't list plugins in {self.directory}: {e}")
+            return []
+
+        disabled = self.disabled
+        for file_name in file_names:
+            path = os.path.join(self.directory, file_name)
+            if not file_name.endswith(".py") or file_name.startswith(("_", ".")) or not os.path.isfile(path):
+                continue
+            manifest = PluginManifest.read(path, self.logging)
+            if manifest.name in disabled:
+                self.logging.log(LogLevel.Info, f"Plugin {manifest.name} is disabled: {disabled[manifest.name]}")
+                continue
+            if manifest.name in self.manifests:
+                self.logging.log(LogLevel.Warn, f"Skipping {path}, a plugin named {manifest.name} already exists")
+                continue
+            self.manifests[manifest.name] = manifest
+
+        if self.manifests:
+            self.logging.log(LogLevel.Info, f"Found plugins: {', '.join(self.manifests)}")
+        return list(self.manifests.values())
+
+    def is_plugin(self, tab_name: str) -> bool:
+        return tab_name in self.manifests
+
+    def create(self, tab_name: str, arg_parser=None):
+        """Import a plugin and construct its tab
+
+        Never raises, a failing plugin gets an error page instead.
+        """
+        manifest = self.manifests[tab_name]
+        timing = self.timings.setdefault(tab_name, {})
+        profiler = get_startup_profiler()
+
+        try:
+            start = time.monotonic()
+            with profiler.span(f"import plugin {tab_name}", "import"):
+                tab_class = self._import(manifest)
+            timing["import_ms"] = round((time.monotonic() - start) * 1000, 1)
+
+            constructed = time.monotonic()
+            with profiler.span(f"{tab_name} plugin tab", "tab"):
+                tab = tab_class(*self._constructor_args(tab_class, arg_parser))
+            timing["construct_ms"] = round((time.monotonic() - constructed) * 1000, 1)
+        except Exception as e:
+            timing["error"] = str(e)
+            self.logging.log(LogLevel.Error, f"Plugin {tab_name} failed to load: {e}")
+            self.disable(tab_name, f"failed to load: {e}")
+            return self._error_page(tab_name, str(e))
+
+        elapsed = time.monotonic() - start
+        budget = self.get_budget(manifest)
+        self.logging.log(
+            LogLevel.Info,
+            f"Plugin {tab_name}: import {timing['import_ms']}ms, construct {timing['construct_ms']}ms",
+        )
+        if elapsed > budget:
+            self.logging.log(
+                LogLevel.Warn,
+                f"Plugin {tab_name} took {elapsed * 1000:.0f}ms to load, over its {budget * 1000:.0f}ms budget",
+            )
+            self.disable(tab_name, f"took {elapsed * 1000:.0f}ms to load, budget is {budget * 1000:.0f}ms")
+        return tab
+
+    def _constructor_args(self, tab_class, arg_parser) -> List[Any]:
+        """Logger, then ArgParse and PluginServices if the constructor takes them"""
+        parameters = list(inspect.signature(tab_class).parameters)
+        args: List[Any] = [self.logging]
+        if "services" in parameters:
+            from utils.plugin_api import get_plugin_services
+
+            parameters.remove("services")
+            if len(parameters) >= 2:
+                args.append(arg_parser)
+            args.append(get_plugin_services(self.logging))
+        elif len(parameters) >= 2:
+            args.append(arg_parser)
+        return args
+
+    def disable(self, tab_name: str, reason: str) -> None:
+        disabled = dict(self.disabled)
+        disabled[tab_name] = reason
+        self.settings_store.set("disabled_plugins", disabled)
+
+    def enable(self, tab_name: str) -> None:
+        disabled = dict(self.disabled)
+        if disabled.pop(tab_name, None) is not None:
+            self.settings_store.set("disabled_plugins", disabled)
+
+    def _import(self, manifest: PluginManifest):
+        module = sys.modules.get(manifest.module_name)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(manifest.module_name, manifest.path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"can't import {manifest.path}")
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[manifest.module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[manifest.module_name]
+                raise
+
+        tab_class = getattr(module, manifest.class_name, None)
+        if tab_class is None:
+            raise ImportError(f"{manifest.path} has no class {manifest.class_name}")
+        return tab_class
+
+    def _error_page(self, tab_name: str, error: str):
+        from gi.repository import Gtk  # type: ignore
+
+        label = Gtk.Label(label=f"The {tab_name} plugin failed to load and has been disabled.\n\n{error}")
+        label.set_line_wrap(True)
+        label.set_selectable(True)
+        label.set_margin_top(20)
+        label.set_margin_bottom(20)
+        label.set_margin_start(20)
+        label.set_margin_end(20)
+        return label
+
+
+_plugin_host = None
+
+
+def get_plugin_host(logging: Logger) -> PluginHost:
+    """Get or create the global PluginHost instance"""
+    global _plugin_host
+    if _plugin_host is None:
+        _plugin_host = PluginHost(logging)
+    return _plugin_host
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, TextIO
+
+# Captured when this module is first imported, as early as possible
+PROFILER_ORIGIN = time.monotonic()
+PROFILER_ORIGIN_WALL = time.time()
+
+
+class StartupProfiler:
+    """Records monotonic spans from process start to the first frame
+
+    Recording is always on and costs a list append per span, so call sites
+    don't need to check a flag; the report is only produced when asked for
+    with --profile-startup.
+    """
+
+    def __init__(self):
+        self.events: List[Dict] = []
+        self.first_frame: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, name: str, start: float, end: float, category: str = "startup",
+               thread: Optional[str] = None) -> None:
+        """Record a finished span using time.monotonic() timestamps"""
+        with self._lock:
+            self.events.append({
+                "name": name,
+                "category": category,
+                "start": start - PROFILER_ORIGIN,
+                "end": end - PROFILER_ORIGIN,
+                "thread": thread or threading.current_thread().name,
+            })
+
+    @contextmanager
+    def span(self, name: str, category: str = "startup"):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.monotonic(), category)
+
+    def mark(self, name: str, category: str = "startup") -> None:
+        """Record an instant event"""
+        now = time.monotonic()
+        self.record(name, now, now, category)
+
+    def watch_first_draw(self, widget, callback: Optional[Callable[[], None]] = None) -> None:
+        """Mark the first time the widget draws, then call callback when idle"""
+        from gi.repository import GLib  # type: ignore
+
+        def on_draw(*args):
+            widget.disconnect(handler_id)
+            self.first_frame = time.monotonic() - PROFILER_ORIGIN
+            self.mark("first frame", "frame")
+            if callback:
+                GLib.idle_add(lambda: callback() and False)
+            return False
+
+        handler_id = widget.connect("draw", on_draw)
+
+    def get_process_start(self) -> float:
+        """Process creation time relative to the profiler origin (<= 0)"""
+        try:
+            import psutil
+            # create_time has clock tick resolution, never let it land after the origin
+            return min(0.0, psutil.Process(os.getpid()).create_time() - PROFILER_ORIGIN_WALL)
+        except Exception:
+            return 0.0
+
+    def print_report(self, stream: TextIO) -> None:
+        """Print spans sorted by start time with their offsets and durations"""
+        process_start = self.get_process_start()
+        with self._lock:
+            events = sorted(self.events, key=lambda e: (e["start"], -e["end"]))
+
+        print("\nStartup profile (ms since process start)", file=stream)
+        print(f"{'start':>9} {'duration':>9}  {'thread':<16} name", file=stream)
+        print(f"{0:9.1f} {-process_start * 1000:9.1f}  {'MainThread':<16} interpreter startup", file=stream)
+        for event in events:
+            duration = (event["end"] - event["start"]) * 1000
+            print(
+                f"{(event['start'] - process_start) * 1000:9.1f} "
+                f"{duration:9.1f}  {event['thread'][:16]:<16} {event['name']}",
+                file=stream,
+            )
+        if self.first_frame is not None:
+            print(
+                f"\nTime to first frame: {(self.first_frame - process_start) * 1000:.1f}ms",
+                file=stream,
+            )
+        stream.flush()
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write the spans as Chrome trace-event JSON (chrome://tracing, Perfetto)"""
+        process_start = self.get_process_start()
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+
+        thread_ids: Dict[str, int] = {"MainThread": 0}
+        trace_events = [{
+            "name": "interpreter startup", "cat": "startup", "ph": "X",
+            "ts": 0, "dur": -process_start * 1e6, "pid": pid, "tid": 0,
+        }]
+        for event in events:
+            tid = thread_ids.setdefault(event["thread"], len(thread_ids))
+            entry = {
+                "name": event["name"],
+                "cat": event["category"],
+                "ts": (event["start"] - process_start) * 1e6,
+                "pid": pid,
+                "tid": tid,
+            }
+            if event["end"] > event["start"]:
+                entry.update(ph="X", dur=(event["end"] - event["start"]) * 1e6)
+            else:
+                entry.update(ph="i", s="g")
+            trace_events.append(entry)
+
+        for thread, tid in thread_ids.items():
+            trace_events.append({
+                "name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                "args": {"name": thread},
+            })
+
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+
+
+_profiler = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """Get or create the global StartupProfiler instance"""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+    return _profiler
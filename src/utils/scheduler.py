@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+import itertools
+import time
+from typing import Callable, Dict, Optional
+
+from gi.repository import GLib  # type: ignore
+
+from utils.logger import LogLevel, Logger
+
+
+class RefreshJob:
+    __slots__ = ("job_id", "owner", "interval", "callback", "name", "due")
+
+    def __init__(self, job_id: int, owner, interval: int, callback: Callable[[], bool], name: str):
+        self.job_id = job_id
+        self.owner = owner
+        self.interval = interval
+        self.callback = callback
+        self.name = name
+        self.due = time.monotonic() + interval
+
+
+class RefreshScheduler:
+    """Runs the periodic refreshes of every tab from one batched tick
+
+    A job belongs to a widget, normally the tab that registered it, and only
+    runs while that widget is the current notebook page and the window is
+    shown and focused. All jobs are served by a single one second
+    timeout_add_seconds source, which GLib aligns with other second-based
+    timers, so jobs that fall due together cost one wakeup. The source is
+    removed whenever no job can run, a panel left open in the background
+    doesn't wake up at all. A job that fell due while paused runs on the
+    first tick after it becomes active again.
+
+    Callbacks follow GLib conventions: returning False removes the job.
+    """
+
+    TICK_SECONDS = 1
+
+    def __init__(self, logging: Logger):
+        self.logging = logging
+        self.jobs: Dict[int, RefreshJob] = {}
+        self.current_page = None
+        self.window_active = False
+        self.source_id: Optional[int] = None
+        self._ids = itertools.count(1)
+        self._watched_owners = set()
+
+    def add(self, owner, interval: float, callback: Callable[[], bool], name: str = "") -> int:
+        """Register a periodic job
+
+        Args:
+            owner: widget whose visibility gates the job, jobs are dropped
+                when it is destroyed. None runs whenever the window is active.
+            interval (float): seconds between runs, rounded to whole ticks
+            callback (Callable[[], bool]): the refresh, return False to stop
+            name (str): shown in debug logs
+
+        Returns:
+            int: job id for remove()
+        """
+        job_id = next(self._ids)
+        interval = max(self.TICK_SECONDS, int(round(interval)))
+        self.jobs[job_id] = RefreshJob(job_id, owner, interval, callback, name or callback.__name__)
+
+        if owner is not None and id(owner) not in self._watched_owners:
+            self._watched_owners.add(id(owner))
+            owner.connect("destroy", self.remove_owner)
+
+        self._update_source()
+        return job_id
+
+    def remove(self, job_id: Optional[int]) -> None:
+        if job_id is not None and self.jobs.pop(job_id, None) is not None:
+            self._update_source()
+
+    def remove_owner(self, owner) -> None:
+        """Drop every job registered by a widget"""
+        for job in list(self.jobs.values()):
+            if job.owner is owner:
+                del self.jobs[job.job_id]
+        self._watched_owners.discard(id(owner))
+        self._update_source()
+
+    def set_current_page(self, widget) -> None:
+        self.current_page = widget
+        self._update_source()
+
+    def set_window_active(self, active: bool) -> None:
+        if active != self.window_active:
+            self.logging.log(LogLevel.Debug, f"Periodic refreshes {'resumed' if active else 'paused'}")
+        self.window_active = active
+        self._update_source()
+
+    def is_job_active(self, job: RefreshJob) -> bool:
+        return self.window_active and (job.owner is None or job.owner is self.current_page)
+
+    def _update_source(self) -> None:
+        needed = any(self.is_job_active(job) for job in self.jobs.values())
+        if needed and self.source_id is None:
+            self.source_id = GLib.timeout_add_seconds(self.TICK_SECONDS, self._tick)
+        elif not needed and self.source_id is not None:
+            GLib.source_remove(self.source_id)
+            self.source_id = None
+
+    def _tick(self) -> bool:
+        # Half a tick of slack so scheduling jitter doesn't push a job a whole tick late
+        now = time.monotonic() + self.TICK_SECONDS / 2
+        for job in list(self.jobs.values()):
+            if job.job_id not in self.jobs or not self.is_job_active(job) or job.due > now:
+                continue
+            job.due = now - self.TICK_SECONDS / 2 + job.interval
+            try:
+                keep = job.callback()
+            except Exception as e:
+                self.logging.log(LogLevel.Error, f"Periodic refresh {job.name} failed: {e}")
+                keep = True
+            if keep is False:
+                self.jobs.pop(job.job_id, None)
+
+        if any(self.is_job_active(job) for job in self.jobs.values()):
+            return True
+        self.source_id = None
+        return False
+
+
+_refresh_scheduler = None
+
+
+def get_refresh_scheduler(logging: Logger) -> RefreshScheduler:
+    """Get or create the global RefreshScheduler instance"""
+    global _refresh_scheduler
+    if _refresh_scheduler is None:
+        _refresh_scheduler = RefreshScheduler(logging)
+    return _refresh_scheduler
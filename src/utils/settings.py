@@ -1,13 +1,29 @@
 #!/usr/bin/env python3
 
+import atexit
+import copy
 import json
 import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
 from utils.logger import LogLevel, Logger
 
 CONFIG_DIR = os.environ.get("XDG_CONFIG_HOME", os.path.expanduser("~/.config"))
 CONFIG_PATH = os.path.join(CONFIG_DIR, "better-control")
 SETTINGS_FILE = os.path.join(CONFIG_PATH, "settings.json")
 
+# Seconds a change waits for further changes before the file is written
+WRITE_DELAY = 0.5
+
+DEFAULT_SETTINGS = {
+    "visibility": {},
+    "positions": {},
+    "usbguard_hidden_devices": [],
+    "language": "en"
+}
+
 def ensure_config_dir(logging: Logger) -> None:
     """Ensure the config directory exists
 
@@ -21,79 +37,237 @@ def ensure_config_dir(logging: Logger) -> None:
     except Exception as e:
         logging.log(LogLevel.Error, f"Error creating config directory: {e}")
 
-def load_settings(logging: Logger) -> dict:
-    """Load settings from the settings file with validation"""
-    ensure_config_dir(logging)
-    default_settings = {
-        "visibility": {},
-        "positions": {},
-        "usbguard_hidden_devices": [],
-        "language": "en"
-    }
+def parse_settings(content: str, logging: Logger) -> Optional[dict]:
+    """Parse settings.json content, filling in missing defaults
+
+    Returns:
+        Optional[dict]: the settings, or None if the content isn't a settings object
+    """
+    content = content.strip()
+    if not content.startswith('{'):
+        content = '{' + content  # Fix malformed JSON
+    settings = json.loads(content)
 
+    if not isinstance(settings, dict):
+        logging.log(LogLevel.Warn, "Invalid settings format - using defaults")
+        return None
+
+    for key in DEFAULT_SETTINGS:
+        if key not in settings:
+            settings[key] = copy.deepcopy(DEFAULT_SETTINGS[key])
+            logging.log(LogLevel.Info, f"Added missing setting: {key}")
+    return settings
+
+def read_settings_file(logging: Logger) -> dict:
+    """Load settings from the settings file with validation"""
     if not os.path.exists(SETTINGS_FILE):
         logging.log(LogLevel.Info, "Using default settings (file not found)")
-        return default_settings
+        return copy.deepcopy(DEFAULT_SETTINGS)
 
     try:
         with open(SETTINGS_FILE, 'r') as f:
-            content = f.read().strip()
-            if not content.startswith('{'):
-                content = '{' + content  # Fix malformed JSON
-            settings = json.loads(content)
-            logging.log(LogLevel.Info, f"Loaded settings from {SETTINGS_FILE}")
-            
-        if not isinstance(settings, dict):
-            logging.log(LogLevel.Warn, "Invalid settings format - using defaults")
-            return default_settings
-            
-        for key in default_settings:
-            if key not in settings:
-                settings[key] = default_settings[key]
-                logging.log(LogLevel.Info, f"Added missing setting: {key}")
-                
-        return settings
-        
+            settings = parse_settings(f.read(), logging)
+        logging.log(LogLevel.Info, f"Loaded settings from {SETTINGS_FILE}")
+        return settings if settings is not None else copy.deepcopy(DEFAULT_SETTINGS)
     except Exception as e:
         logging.log(LogLevel.Error, f"Error loading settings: {e}")
-        return default_settings
+        return copy.deepcopy(DEFAULT_SETTINGS)
 
-def save_settings(settings: dict, logging: Logger) -> bool:
-    """Save settings to the settings file with atomic write and validation"""
-    try:
+
+class SettingsStore:
+    """The settings, read once and kept in memory
+
+    `settings` is the one dict every part of the application reads and
+    edits; commit() after editing it. Changes are written behind: the file
+    is replaced atomically (fsync and rename) WRITE_DELAY seconds after the
+    last change, so a burst of edits such as dragging the blue light slider
+    costs one write. Pending changes are written at exit.
+
+    watch() follows edits made to the file by hand. Callbacks registered
+    with connect() are called with (key, value) for every top level key
+    that changed, by a commit or by such an edit.
+    """
+
+    def __init__(self, logging: Logger):
+        self.logging = logging
         ensure_config_dir(logging)
-        
-        if not isinstance(settings, dict):
-            logging.log(LogLevel.Error, "Invalid settings - not a dictionary")
-            return False
-            
-        default_settings = {
-            "visibility": {},
-            "positions": {},
-            "usbguard_hidden_devices": [],
-            "language": "en"
-        }
-        for key in default_settings:
-            if key not in settings:
-                settings[key] = default_settings[key]
-
-        temp_path = SETTINGS_FILE + '.tmp'
-        with open(temp_path, 'w') as f:
-            json.dump(settings, f, indent=4)
-        
-
-        with open(temp_path, 'r') as f:
-            json.load(f) 
-            
-        os.replace(temp_path, SETTINGS_FILE)
-        logging.log(LogLevel.Info, f"Settings saved successfully to {SETTINGS_FILE}")
+        self.settings: Dict[str, Any] = read_settings_file(logging)
+        # What was last announced and queued for writing, never mutated
+        self._committed: Dict[str, Any] = copy.deepcopy(self.settings)
+        self._dirty = False
+        self._written_text: Optional[str] = None
+        self._listeners: Dict[str, List[Callable[[str, Any], None]]] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._monitor = None
+        atexit.register(self.flush)
+
+    def get(self, key: str, default=None):
+        return self.settings.get(key, default)
+
+    def set(self, key: str, value) -> None:
+        self.settings[key] = value
+        self.commit()
+
+    def commit(self, settings: Optional[dict] = None) -> None:
+        """Announce and schedule writing whatever changed since the last commit
+
+        Args:
+            settings (Optional[dict]): a separate settings dict to merge in
+                first, for callers that built their own
+        """
+        if settings is not None and settings is not self.settings:
+            self.settings.update(settings)
+        for key, value in DEFAULT_SETTINGS.items():
+            self.settings.setdefault(key, copy.deepcopy(value))
+
+        changed = self._changed_keys()
+        if not changed:
+            return
+        with self._lock:
+            self._committed = copy.deepcopy(self.settings)
+            self._dirty = True
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(WRITE_DELAY, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+        self._emit(changed)
+
+    def flush(self) -> bool:
+        """Write pending changes now
+
+        Returns:
+            bool: False if writing failed
+        """
+        # Writes are serialized, commits only wait for the snapshot below
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return True
+                self._dirty = False
+                text = json.dumps(self._committed, indent=4)
+
+            try:
+                os.makedirs(CONFIG_PATH, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=CONFIG_PATH, prefix=".settings-", suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w") as f:
+                        f.write(text)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, SETTINGS_FILE)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+            except Exception as e:
+                self.logging.log(LogLevel.Error, f"Error saving settings: {e}")
+                with self._lock:
+                    self._dirty = True
+                return False
+
+            self._written_text = text
+        self.logging.log(LogLevel.Info, f"Settings saved successfully to {SETTINGS_FILE}")
         return True
-        
-    except Exception as e:
-        logging.log(LogLevel.Error, f"Error saving settings: {e}")
+
+    def connect(self, key: str, callback: Callable[[str, Any], None]) -> None:
+        """Call callback(key, value) whenever the top level key changes"""
+        listeners = self._listeners.setdefault(key, [])
+        if callback not in listeners:
+            listeners.append(callback)
+
+    def disconnect(self, key: str, callback: Callable[[str, Any], None]) -> None:
+        listeners = self._listeners.get(key, [])
+        if callback in listeners:
+            listeners.remove(callback)
+
+    def watch(self) -> None:
+        """Reload the settings when the file is edited outside the application
+
+        Needs a running GLib main loop, callbacks are called from it.
+        """
+        if self._monitor is not None:
+            return
+        try:
+            from gi.repository import Gio  # type: ignore
+
+            self._monitor = Gio.File.new_for_path(SETTINGS_FILE).monitor_file(
+                Gio.FileMonitorFlags.NONE, None
+            )
+            self._monitor.connect("changed", self._on_file_changed)
+        except Exception as e:
+            self.logging.log(LogLevel.Warn, f"Not watching settings file: {e}")
+
+    def _changed_keys(self) -> List[str]:
+        keys = set(self.settings) | set(self._committed)
+        return [key for key in keys if self.settings.get(key) != self._committed.get(key)]
+
+    def _emit(self, changed: List[str]) -> None:
+        for key in changed:
+            for callback in list(self._listeners.get(key, [])):
+                try:
+                    callback(key, self.settings.get(key))
+                except Exception as e:
+                    self.logging.log(LogLevel.Error, f"Error in settings callback for {key}: {e}")
+
+    def _on_file_changed(self, monitor, file, other_file, event_type) -> None:
+        from gi.repository import Gio  # type: ignore
+
+        if event_type not in (
+            Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+            Gio.FileMonitorEvent.CREATED,
+        ):
+            return
         try:
-            if 'temp_path' in locals() and os.path.exists(temp_path):
-                os.unlink(temp_path)
-        except:
-            pass
+            with open(SETTINGS_FILE, "r") as f:
+                text = f.read()
+            if text == self._written_text:
+                # Our own write
+                return
+            settings = parse_settings(text, self.logging)
+        except Exception as e:
+            self.logging.log(LogLevel.Warn, f"Ignoring unreadable settings file change: {e}")
+            return
+        if settings is None:
+            return
+
+        self.logging.log(LogLevel.Info, "Settings file changed on disk, reloading")
+        self._written_text = text
+        # Replace the contents, not the dict, every holder keeps seeing it
+        self.settings.clear()
+        self.settings.update(settings)
+        changed = self._changed_keys()
+        with self._lock:
+            self._committed = copy.deepcopy(self.settings)
+        self._emit(changed)
+
+
+_settings_store = None
+
+
+def get_settings_store(logging: Logger) -> SettingsStore:
+    """Get or create the global SettingsStore instance"""
+    global _settings_store
+    if _settings_store is None:
+        _settings_store = SettingsStore(logging)
+    return _settings_store
+
+def load_settings(logging: Logger) -> dict:
+    """Get the shared settings dict
+
+    Served from memory, edits to it are saved with save_settings().
+    """
+    return get_settings_store(logging).settings
+
+def save_settings(settings: dict, logging: Logger) -> bool:
+    """Commit settings, the file is written shortly after"""
+    if not isinstance(settings, dict):
+        logging.log(LogLevel.Error, "Invalid settings - not a dictionary")
         return False
+
+    get_settings_store(logging).commit(settings)
+    return True
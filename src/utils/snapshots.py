@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Dict, Optional
+
+from utils.logger import LogLevel, Logger
+
+SNAPSHOT_DIR = os.path.expanduser("~/.cache/better-control/snapshots")
+# Bump when the layout of the stored view models changes
+SNAPSHOT_VERSION = 1
+# Older snapshots are more misleading than an empty placeholder
+SNAPSHOT_MAX_AGE = 7 * 24 * 3600
+
+
+class SnapshotCache:
+    """Last known view model of each tab, kept between launches
+
+    A tab that implements get_snapshot() returns a JSON-serialisable dict
+    when the window closes. On the next launch the dict is handed back
+    before any live data has loaded: its "summary" rows (icon, title,
+    subtitle) fill the tab's placeholder on the first frame, and the tab's
+    restore_snapshot() gets the whole dict once it has been built.
+    """
+
+    def __init__(self, logging: Logger, directory: str = SNAPSHOT_DIR):
+        self.logging = logging
+        self.directory = directory
+        self._snapshots: Dict[str, Optional[dict]] = {}
+
+    def get_path(self, tab_name: str) -> str:
+        file_name = re.sub(r"[^a-z0-9]+", "-", tab_name.lower()).strip("-")
+        return os.path.join(self.directory, f"{file_name}.json")
+
+    def load(self, tab_name: str) -> Optional[dict]:
+        """Get a tab's snapshot, reading it from disk once per process"""
+        if tab_name in self._snapshots:
+            return self._snapshots[tab_name]
+
+        snapshot = None
+        try:
+            with open(self.get_path(tab_name), "r") as f:
+                data = json.load(f)
+            if (
+                data.get("version") == SNAPSHOT_VERSION
+                and time.time() - data.get("saved_at", 0) < SNAPSHOT_MAX_AGE
+                and isinstance(data.get("view"), dict)
+            ):
+                snapshot = data["view"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logging.log(LogLevel.Warn, f"Ignoring unreadable {tab_name} snapshot: {e}")
+
+        self._snapshots[tab_name] = snapshot
+        return snapshot
+
+    def save(self, tab_name: str, view: dict) -> bool:
+        """Store a tab's view model atomically
+
+        The file is written next to its final path and renamed over it, so a
+        crash mid-write leaves the previous snapshot intact.
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".snapshot-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(
+                        {"version": SNAPSHOT_VERSION, "saved_at": time.time(), "view": view},
+                        f,
+                    )
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.get_path(tab_name))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            self.logging.log(LogLevel.Warn, f"Failed to save {tab_name} snapshot: {e}")
+            return False
+
+        self._snapshots[tab_name] = view
+        return True
+
+
+_snapshot_cache = None
+
+
+def get_snapshot_cache(logging: Logger) -> SnapshotCache:
+    """Get or create the global SnapshotCache instance"""
+    global _snapshot_cache
+    if _snapshot_cache is None:
+        _snapshot_cache = SnapshotCache(logging)
+    return _snapshot_cache
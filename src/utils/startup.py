@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from utils.logger import LogLevel, Logger
+from utils.profiler import get_startup_profiler
+
+
+class StartupTask:
+    """A single named init step and its timing"""
+
+    def __init__(self, name: str, func: Callable[[], Any], deps: Sequence[str], background: bool):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.background = background
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.start: Optional[float] = None
+        self.end: Optional[float] = None
+        self.thread = ""
+        self.done = threading.Event()
+
+    @property
+    def duration(self) -> float:
+        if self.start is None or self.end is None:
+            return 0.0
+        return self.end - self.start
+
+
+class StartupScheduler:
+    """Runs init tasks as a dependency graph
+
+    Tasks are declared with the names of the tasks they need. Background
+    tasks run in their own thread as soon as their dependencies finish,
+    main-thread tasks run in declaration order on the thread calling run(),
+    waiting only for the dependencies they declared. Every task records
+    when it started and how long it took.
+    """
+
+    def __init__(self, logging: Logger):
+        self.logging = logging
+        self.tasks: Dict[str, StartupTask] = {}
+        self.origin = time.monotonic()
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        deps: Sequence[str] = (),
+        background: bool = False,
+    ) -> None:
+        """Declare a task
+
+        Args:
+            name (str): unique task name
+            func (Callable[[], Any]): the task, its return value is kept as the result
+            deps (Sequence[str]): tasks that have to finish first, they must
+                already be declared which keeps the graph acyclic
+            background (bool): run off the main thread
+        """
+        if name in self.tasks:
+            raise ValueError(f"Startup task '{name}' declared twice")
+        for dep in deps:
+            if dep not in self.tasks:
+                raise ValueError(f"Startup task '{name}' depends on unknown task '{dep}'")
+        self.tasks[name] = StartupTask(name, func, deps, background)
+
+    def _execute(self, task: StartupTask) -> None:
+        for dep in task.deps:
+            self.tasks[dep].done.wait()
+
+        task.thread = threading.current_thread().name
+        task.start = time.monotonic()
+        try:
+            task.result = task.func()
+        except Exception as e:
+            task.error = e
+            self.logging.log(LogLevel.Error, f"Startup task '{task.name}' failed: {e}")
+        finally:
+            task.end = time.monotonic()
+            get_startup_profiler().record(task.name, task.start, task.end, "task", task.thread)
+            task.done.set()
+
+    def run(self) -> None:
+        """Start background tasks and run main-thread tasks
+
+        Returns once every main-thread task finished, background tasks that
+        nothing on the main thread waits for may still be running. An
+        exception raised by a main-thread task is re-raised here.
+        """
+        for task in self.tasks.values():
+            if task.background:
+                threading.Thread(
+                    target=self._execute, args=(task,), name=task.name, daemon=True
+                ).start()
+
+        for task in self.tasks.values():
+            if task.background:
+                continue
+            self._execute(task)
+            if task.error is not None:
+                raise task.error
+
+    def wait(self, name: str, timeout: Optional[float] = None) -> bool:
+        """Wait for a task to finish, returns False on timeout"""
+        return self.tasks[name].done.wait(timeout)
+
+    def result(self, name: str) -> Any:
+        """Get a finished task's return value, waiting for it if needed"""
+        task = self.tasks[name]
+        task.done.wait()
+        return task.result
+
+    def timings(self) -> List[Dict[str, Any]]:
+        """Finished tasks with start offsets and durations in seconds"""
+        return [
+            {
+                "name": task.name,
+                "start": task.start - self.origin,
+                "duration": task.duration,
+                "thread": task.thread,
+                "background": task.background,
+            }
+            for task in sorted(self.tasks.values(), key=lambda t: t.start or 0)
+            if task.start is not None and task.end is not None
+        ]
+
+    def log_timings(self) -> None:
+        for timing in self.timings():
+            self.logging.log(
+                LogLevel.Debug,
+                f"Startup task {timing['name']}: +{timing['start'] * 1000:.1f}ms, "
+                f"took {timing['duration'] * 1000:.1f}ms ({timing['thread']})",
+            )